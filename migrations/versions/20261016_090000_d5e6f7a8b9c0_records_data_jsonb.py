@@ -0,0 +1,74 @@
+"""Store record data as JSONB with GIN index and indexed fields
+
+Converts records.data from JSON text to native JSONB so filters and
+sorts can run in PostgreSQL, adds a jsonb_path_ops GIN index for
+containment lookups, and adds fields.is_indexed which opts a field into
+a per-field expression index (created by the field service).
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7g8h9
+Create Date: 2026-10-16 09:00:00.000000+00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic
+revision: str = 'd5e6f7a8b9c0'
+down_revision: Union[str, None] = 'c4d5e6f7g8h9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Convert record payloads to native JSONB
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data DROP DEFAULT")
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data TYPE jsonb USING data::jsonb")
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data SET DEFAULT '{}'::jsonb")
+
+    # GIN index for containment (data @> '{"field_id": value}') lookups
+    op.create_index(
+        'ix_records_data_gin',
+        'records',
+        ['data'],
+        unique=False,
+        schema='pybase',
+        postgresql_using='gin',
+        postgresql_ops={'data': 'jsonb_path_ops'},
+    )
+
+    # Opt-in flag for per-field expression indexes
+    op.add_column(
+        'fields',
+        sa.Column('is_indexed', sa.Boolean(), nullable=False, server_default=sa.false()),
+        schema='pybase',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    # Drop per-field expression indexes created by the field service
+    op.execute(
+        """
+        DO $$
+        DECLARE idx record;
+        BEGIN
+            FOR idx IN
+                SELECT indexname FROM pg_indexes
+                WHERE schemaname = 'pybase' AND indexname LIKE 'ix\\_records\\_f\\_%'
+            LOOP
+                EXECUTE format('DROP INDEX IF EXISTS pybase.%I', idx.indexname);
+            END LOOP;
+        END $$;
+        """
+    )
+
+    op.drop_column('fields', 'is_indexed', schema='pybase')
+    op.drop_index('ix_records_data_gin', table_name='records', schema='pybase')
+
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data DROP DEFAULT")
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data TYPE text USING data::text")
+    op.execute("ALTER TABLE pybase.records ALTER COLUMN data SET DEFAULT '{}'")
@@ -0,0 +1,68 @@
+"""Add lookup indexes for existing unique constraints
+
+Creates the per-field expression index used by unique constraint
+lookups (ix_records_u_<field id>) for constraints that existed before
+the constraint service started creating them. Each index only covers
+the live records of the constrained field's table and is built
+concurrently, outside the migration transaction.
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-16 10:00:00.000000+00:00
+"""
+
+from typing import Sequence, Union
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import op
+
+# Revision identifiers, used by Alembic
+revision: str = 'e6f7a8b9c0d1'
+down_revision: Union[str, None] = 'd5e6f7a8b9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    conn = op.get_bind()
+    constraints = conn.execute(
+        sa.text(
+            "SELECT uc.field_id, uc.case_sensitive, f.table_id "
+            "FROM pybase.unique_constraints uc "
+            "JOIN pybase.fields f ON f.id = uc.field_id"
+        )
+    ).fetchall()
+
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction,
+    # and a plain CREATE INDEX would block writes to records while it builds
+    with op.get_context().autocommit_block():
+        for field_id, case_sensitive, table_id in constraints:
+            key = f"data ->> '{field_id}'"
+            if not case_sensitive:
+                key = f"lower({key})"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"ix_records_u_{UUID(str(field_id)).hex} "
+                f"ON pybase.records (({key})) "
+                f"WHERE deleted_at IS NULL AND table_id = '{UUID(str(table_id))}'"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute(
+        """
+        DO $$
+        DECLARE idx record;
+        BEGIN
+            FOR idx IN
+                SELECT indexname FROM pg_indexes
+                WHERE schemaname = 'pybase' AND indexname LIKE 'ix\\_records\\_u\\_%'
+            LOOP
+                EXECUTE format('DROP INDEX IF EXISTS pybase.%I', idx.indexname);
+            END LOOP;
+        END $$;
+        """
+    )
@@ -0,0 +1,61 @@
+"""Add full-text and trigram search indexes for records
+
+Adds records.search_vector, a generated tsvector over the string and
+number values of the record payload (field IDs excluded), with a GIN
+index, and a pg_trgm GIN index over the same values for substring
+matching. Both back the PostgreSQL search fallback used when
+Meilisearch is unavailable.
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-16 11:00:00.000000+00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers, used by Alembic
+revision: str = 'f7a8b9c0d1e2'
+down_revision: Union[str, None] = 'e6f7a8b9c0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Values of a record payload at any depth, without keys
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION pybase.record_search_text(data jsonb) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(string_agg(value #>> '{}', ' '), '')
+            FROM jsonb_path_query(
+                data, 'strict $.** ? (@.type() == "string" || @.type() == "number")'
+            ) AS value
+        $$
+        """
+    )
+
+    op.execute(
+        "ALTER TABLE pybase.records ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS "
+        "(to_tsvector('simple'::regconfig, pybase.record_search_text(data))) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_records_search_vector ON pybase.records USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX ix_records_search_text_trgm ON pybase.records "
+        "USING gin (pybase.record_search_text(data) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("DROP INDEX IF EXISTS pybase.ix_records_search_text_trgm")
+    op.execute("DROP INDEX IF EXISTS pybase.ix_records_search_vector")
+    op.execute("ALTER TABLE pybase.records DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP FUNCTION IF EXISTS pybase.record_search_text(jsonb)")
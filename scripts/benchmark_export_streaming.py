@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for streaming record exports.
+
+Exports synthetic records through ``ExportService``'s format streamers and
+checks the process's peak RSS stays under a fixed ceiling. Database pages
+are simulated: ``_iter_record_batches`` is replaced with a generator that
+builds one page of records at a time, the way the keyset-paged query
+returns them, so the benchmark runs without PostgreSQL.
+
+Usage:
+    python scripts/benchmark_export_streaming.py --records 1000000 --format csv
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pybase.services.export_service import ExportService  # noqa: E402
+
+FORMATS = ("csv", "json", "xml", "xlsx")
+
+FIELDS = [
+    SimpleNamespace(id="fld_name", name="Name", field_type="text"),
+    SimpleNamespace(id="fld_sku", name="SKU", field_type="text"),
+    SimpleNamespace(id="fld_qty", name="Quantity", field_type="number"),
+    SimpleNamespace(id="fld_price", name="Price", field_type="currency"),
+    SimpleNamespace(id="fld_tags", name="Tags", field_type="multi_select"),
+]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class SyntheticExportService(ExportService):
+    """ExportService reading synthetic pages instead of the database."""
+
+    def __init__(self, num_records: int):
+        self.num_records = num_records
+
+    async def _iter_record_batches(
+        self,
+        db: Any,
+        table_id: Any,
+        view_filters: Any = None,
+        view_sorts: Any = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        table_id = str(table_id)
+        created_at = datetime.now(timezone.utc)
+        for start in range(0, self.num_records, batch_size):
+            records = [
+                SimpleNamespace(
+                    id=f"rec{i:08d}",
+                    table_id=table_id,
+                    data=json.dumps(
+                        {
+                            "fld_name": f"Part {i}",
+                            "fld_sku": f"SKU-{i:08d}",
+                            "fld_qty": i % 100,
+                            "fld_price": round(i * 0.37 % 1000, 2),
+                            "fld_tags": ["steel", "m6"] if i % 2 else ["nylon"],
+                        }
+                    ),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+                for i in range(start, min(start + batch_size, self.num_records))
+            ]
+            yield [self._record_to_export_dict(record) for record in records]
+
+
+async def run_export(num_records: int, export_format: str, batch_size: int) -> int:
+    """Stream an export, discarding the output, and return its size in bytes."""
+    service = SyntheticExportService(num_records)
+    streamers = {
+        "csv": service._stream_csv,
+        "json": service._stream_json,
+        "xml": service._stream_xml,
+        "xlsx": service._stream_excel,
+    }
+    total_bytes = 0
+    async for chunk in streamers[export_format](None, uuid4(), FIELDS, batch_size):
+        total_bytes += len(chunk)
+    return total_bytes
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark streaming export memory use")
+    parser.add_argument("--records", type=int, default=1000000, help="Number of records")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="Export format")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Records per page")
+    parser.add_argument(
+        "--max-rss-mb", type=float, default=256.0, help="Peak RSS ceiling in MiB"
+    )
+    args = parser.parse_args()
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    total_bytes = asyncio.run(run_export(args.records, args.format, args.batch_size))
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_mb()
+
+    print(f"Records:     {args.records}")
+    print(f"Format:      {args.format}")
+    print(f"Output:      {total_bytes / (1024 * 1024):.1f} MiB")
+    print(f"Time:        {elapsed:.2f} s ({args.records / elapsed:,.0f} records/s)")
+    print(f"Peak RSS:    {peak:.1f} MiB (baseline {baseline:.1f} MiB)")
+
+    if peak > args.max_rss_mb:
+        print(f"FAIL: peak RSS exceeds {args.max_rss_mb:.0f} MiB ceiling")
+        return 1
+    print(f"OK: peak RSS under {args.max_rss_mb:.0f} MiB ceiling")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for compiled and vectorized formula evaluation.
+
+Evaluates a set of formulas over in-memory records with the AST
+tree-walker (``FormulaEvaluator``), with compiled closures
+(``compile_formula``) and column-at-a-time (``VectorizedEvaluator``),
+checks all produce the same results, and reports the timings.
+
+Usage:
+    python scripts/benchmark_formula_compiler.py --records 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pybase.formula.compiler import compile_formula  # noqa: E402
+from pybase.formula.evaluator import FormulaEvaluator  # noqa: E402
+from pybase.formula.parser import FormulaParser  # noqa: E402
+from pybase.formula.vectorized import VectorizedEvaluator  # noqa: E402
+
+FORMULAS = [
+    "{price} * {quantity}",
+    "ROUND({price} * {quantity} * (1 - {discount}), 2)",
+    'IF({quantity} > 10, "bulk", "single")',
+    '{name} & " (" & {sku} & ")"',
+    "{price} > 50 AND {quantity} >= 5",
+]
+
+
+def format_time(seconds: float) -> str:
+    """Format time to human-readable format."""
+    if seconds < 0.001:
+        return f"{seconds * 1000000:.2f} µs"
+    elif seconds < 1.0:
+        return f"{seconds * 1000:.2f} ms"
+    else:
+        return f"{seconds:.2f} s"
+
+
+def build_rows(num_records: int) -> list[dict[str, Any]]:
+    """Create record field values."""
+    rng = random.Random(42)
+    return [
+        {
+            "price": round(rng.uniform(1, 100), 2),
+            "quantity": rng.randint(1, 20),
+            "discount": rng.choice([0, 0.05, 0.1]),
+            "name": f"Part {i}",
+            "sku": f"SKU-{i:06d}",
+        }
+        for i in range(num_records)
+    ]
+
+
+def run_tree_walker(formula: str, rows: list[dict[str, Any]]) -> list[Any]:
+    """Evaluate with the AST tree-walker."""
+    ast = FormulaParser().parse(formula)
+    evaluator = FormulaEvaluator()
+    return [evaluator.evaluate(ast, fields) for fields in rows]
+
+
+def run_compiled(formula: str, rows: list[dict[str, Any]]) -> list[Any]:
+    """Evaluate with the compiled formula."""
+    compiled = compile_formula(formula)
+    return [compiled(fields) for fields in rows]
+
+
+def run_vectorized(formula: str, rows: list[dict[str, Any]]) -> list[Any]:
+    """Evaluate column-at-a-time."""
+    return VectorizedEvaluator().evaluate(FormulaParser().parse(formula), rows)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark formula evaluation strategies")
+    parser.add_argument("--records", type=int, default=100000, help="Number of records")
+    args = parser.parse_args()
+
+    rows = build_rows(args.records)
+
+    print(f"Records: {args.records}")
+    print(
+        f"{'Formula':<52} {'Tree-walker':>12} {'Compiled':>12} {'Vectorized':>12} "
+        f"{'Speedup':>8}"
+    )
+    total_walker = total_compiled = total_vectorized = 0.0
+    for formula in FORMULAS:
+        start = time.perf_counter()
+        expected = run_tree_walker(formula, rows)
+        walker_time = time.perf_counter() - start
+
+        compile_formula.cache_clear()
+        start = time.perf_counter()
+        actual = run_compiled(formula, rows)
+        compiled_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = run_vectorized(formula, rows)
+        vectorized_time = time.perf_counter() - start
+
+        if actual != expected or vectorized != expected:
+            print(f"Result mismatch for {formula}")
+            return 1
+
+        total_walker += walker_time
+        total_compiled += compiled_time
+        total_vectorized += vectorized_time
+        best = min(compiled_time, vectorized_time)
+        print(
+            f"{formula[:52]:<52} {format_time(walker_time):>12} "
+            f"{format_time(compiled_time):>12} {format_time(vectorized_time):>12} "
+            f"{walker_time / best:>7.1f}x"
+        )
+
+    best = min(total_compiled, total_vectorized)
+    print(
+        f"{'Total':<52} {format_time(total_walker):>12} "
+        f"{format_time(total_compiled):>12} {format_time(total_vectorized):>12} "
+        f"{total_walker / best:>7.1f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
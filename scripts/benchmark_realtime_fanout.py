@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Fan-out benchmark for realtime channel broadcasts.
+
+Subscribes thousands of simulated WebSocket clients to one channel and
+broadcasts events through ``ConnectionManager``. Each client's send takes
+a small simulated network delay and a fraction of the clients are slow.
+Reports the time to queue each broadcast for every subscriber and the
+time until every fast client has received all events, which must not
+depend on the slow clients. Redis is disabled; only local fan-out is
+measured.
+
+Usage:
+    python scripts/benchmark_realtime_fanout.py --subscribers 5000 --events 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pybase.realtime.manager import ConnectionManager  # noqa: E402
+from pybase.schemas.realtime import EventType, RecordChangeEvent  # noqa: E402
+
+CHANNEL = "table:benchmark"
+
+
+class Delivery:
+    """Tracks how many clients still expect frames."""
+
+    def __init__(self) -> None:
+        self.pending = 0
+        self.done = asyncio.Event()
+
+    def expect(self, clients: int) -> None:
+        self.pending = clients
+        self.done.clear()
+
+    def client_done(self) -> None:
+        self.pending -= 1
+        if self.pending == 0:
+            self.done.set()
+
+
+class SimulatedWebSocket:
+    """WebSocket whose sends take a fixed delay."""
+
+    def __init__(self, delay: float, delivery: Delivery | None = None) -> None:
+        self.delay = delay
+        self.delivery = delivery
+        self.received = 0
+        self.expected = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.received += 1
+        if self.delivery is not None and self.received == self.expected:
+            self.delivery.client_done()
+
+
+async def run_fanout(
+    subscribers: int,
+    events: int,
+    send_delay: float,
+    slow_fraction: float,
+    slow_delay: float,
+) -> dict[str, float]:
+    """Broadcast events to one channel and measure fan-out and delivery times."""
+    manager = ConnectionManager()
+    delivery = Delivery()
+    num_slow = int(subscribers * slow_fraction)
+    fast = []
+    for i in range(subscribers):
+        if i < num_slow:
+            ws = SimulatedWebSocket(slow_delay)
+        else:
+            ws = SimulatedWebSocket(send_delay, delivery)
+            fast.append(ws)
+        connection = await manager.connect(ws, f"user{i}", f"User {i}")
+        await manager.subscribe(connection.connection_id, CHANNEL)
+
+    # Wait for the connect and subscribe confirmations
+    delivery.expect(len(fast))
+    for ws in fast:
+        ws.expected = 2
+    await delivery.done.wait()
+
+    delivery.expect(len(fast))
+    for ws in fast:
+        ws.expected = 2 + events
+
+    fanout_times = []
+    start = time.perf_counter()
+    for i in range(events):
+        event = RecordChangeEvent(
+            event=EventType.RECORD_UPDATED,
+            table_id="benchmark",
+            record_id=f"rec{i}",
+            data={"fld_name": f"Part {i}", "fld_qty": i},
+            changed_fields=["fld_name", "fld_qty"],
+            changed_by="benchmark",
+        )
+        broadcast_start = time.perf_counter()
+        await manager.broadcast_to_channel(CHANNEL, event)
+        fanout_times.append(time.perf_counter() - broadcast_start)
+
+    await delivery.done.wait()
+    delivered = time.perf_counter() - start
+
+    stats = manager.get_stats()
+    await manager.shutdown()
+    return {
+        "fanout_mean": statistics.mean(fanout_times),
+        "fanout_max": max(fanout_times),
+        "delivered": delivered,
+        "connections": stats["total_connections"],
+    }
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark realtime channel fan-out")
+    parser.add_argument("--subscribers", type=int, default=5000, help="Channel subscribers")
+    parser.add_argument("--events", type=int, default=20, help="Events to broadcast")
+    parser.add_argument(
+        "--send-delay", type=float, default=0.001, help="Seconds per send for normal clients"
+    )
+    parser.add_argument(
+        "--slow-fraction", type=float, default=0.01, help="Fraction of clients that are slow"
+    )
+    parser.add_argument(
+        "--slow-delay", type=float, default=5.0, help="Seconds per send for slow clients"
+    )
+    parser.add_argument(
+        "--max-delivery-s",
+        type=float,
+        default=5.0,
+        help="Ceiling for every fast client to receive all events",
+    )
+    args = parser.parse_args()
+
+    with patch("pybase.realtime.manager.REDIS_AVAILABLE", False):
+        result = asyncio.run(
+            run_fanout(
+                args.subscribers,
+                args.events,
+                args.send_delay,
+                args.slow_fraction,
+                args.slow_delay,
+            )
+        )
+
+    print(f"Subscribers:   {args.subscribers} ({args.slow_fraction:.0%} slow)")
+    print(f"Events:        {args.events}")
+    print(
+        f"Fan-out:       {result['fanout_mean'] * 1000:.2f} ms mean, "
+        f"{result['fanout_max'] * 1000:.2f} ms max per broadcast"
+    )
+    num_slow = int(args.subscribers * args.slow_fraction)
+    sequential = args.events * (
+        (args.subscribers - num_slow) * args.send_delay + num_slow * args.slow_delay
+    )
+    print(f"Delivered:     {result['delivered']:.2f} s to every fast client")
+    print(f"Sequential:    {sequential:.0f} s minimum if each send awaited the previous one")
+    print(f"Connections:   {result['connections']} still open")
+
+    if result["delivered"] > args.max_delivery_s:
+        print(f"FAIL: delivery exceeds {args.max_delivery_s:.1f} s ceiling")
+        return 1
+    print(f"OK: delivery under {args.max_delivery_s:.1f} s ceiling")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for parsed-record caching on in-Python aggregation paths.
+
+Runs aggregation, grouping and pivot passes over in-memory records (the
+access pattern of code that aggregates loaded records in Python) and
+reports how many times ``Record.data`` is parsed, with the per-instance
+parse cache and with the legacy behaviour of re-parsing on every access.
+
+Usage:
+    python scripts/benchmark_record_parsing.py --records 5000 --fields 20
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pybase.models.record import Record  # noqa: E402
+
+
+def format_time(seconds: float) -> str:
+    """Format time to human-readable format."""
+    if seconds < 0.001:
+        return f"{seconds * 1000000:.2f} µs"
+    elif seconds < 1.0:
+        return f"{seconds * 1000:.2f} ms"
+    else:
+        return f"{seconds:.2f} s"
+
+
+def build_records(num_records: int, num_fields: int) -> list[Record]:
+    """Create records with a group, a column and numeric fields."""
+    rng = random.Random(42)
+    records = []
+    for i in range(num_records):
+        data: dict[str, Any] = {
+            "group": f"g{rng.randint(0, 19)}",
+            "column": f"c{rng.randint(0, 9)}",
+            "amount": rng.uniform(0, 1000),
+        }
+        for f in range(num_fields):
+            data[f"field_{f}"] = f"value {i}-{f}"
+        records.append(Record(table_id="00000000-0000-0000-0000-000000000000", data=json.dumps(data)))
+    return records
+
+
+def run_analytics(records: list[Record]) -> None:
+    """Sum, group-average and pivot-sum ``amount``, reading each record per pass."""
+    sum(record.get_all_values().get("amount", 0) for record in records)
+
+    groups: dict[str, list[float]] = {}
+    for record in records:
+        data = record.get_all_values()
+        groups.setdefault(data.get("group"), []).append(data.get("amount", 0))
+    {group: sum(values) / len(values) for group, values in groups.items()}
+
+    pivot: dict[tuple[str, str], float] = {}
+    for record in records:
+        data = record.get_all_values()
+        cell = (data.get("group"), data.get("column"))
+        pivot[cell] = pivot.get(cell, 0) + data.get("amount", 0)
+
+
+def legacy_parsed_values(record: Record) -> dict[str, Any]:
+    """Pre-cache behaviour: parse ``data`` on every access."""
+    try:
+        return json.loads(record.data)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
+
+def measure(records: list[Record], cached: bool) -> tuple[int, float]:
+    """Run analytics once and return (parse count, elapsed seconds)."""
+    for record in records:
+        record.__dict__.pop("_data_cache", None)
+
+    with mock.patch("pybase.models.record.json.loads", wraps=json.loads) as loads:
+        if cached:
+            start = time.perf_counter()
+            run_analytics(records)
+            elapsed = time.perf_counter() - start
+        else:
+            with mock.patch.object(Record, "_parsed_values", legacy_parsed_values):
+                start = time.perf_counter()
+                run_analytics(records)
+                elapsed = time.perf_counter() - start
+        return loads.call_count, elapsed
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark record parse caching")
+    parser.add_argument("--records", type=int, default=5000, help="Number of records")
+    parser.add_argument("--fields", type=int, default=20, help="Extra fields per record")
+    args = parser.parse_args()
+
+    records = build_records(args.records, args.fields)
+
+    legacy_parses, legacy_time = measure(records, cached=False)
+    cached_parses, cached_time = measure(records, cached=True)
+
+    print(f"Records: {args.records}, fields per record: {args.fields + 3}")
+    print(f"{'Mode':<10} {'Parses':>10} {'Time':>12}")
+    print(f"{'legacy':<10} {legacy_parses:>10} {format_time(legacy_time):>12}")
+    print(f"{'cached':<10} {cached_parses:>10} {format_time(cached_time):>12}")
+    if cached_parses:
+        print(f"Parse reduction: {legacy_parses / cached_parses:.1f}x")
+    if cached_time:
+        print(f"Speedup: {legacy_time / cached_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
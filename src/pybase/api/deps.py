@@ -4,13 +4,17 @@ FastAPI dependency injection functions.
 Provides reusable dependencies for authentication, database sessions, etc.
 """
 
-from typing import Annotated
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Any, Hashable
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from pybase.cache.auth_cache import PrincipalCache
 from pybase.core.exceptions import (
     AuthenticationError,
     InvalidAPIKeyError,
@@ -19,13 +23,51 @@ from pybase.core.exceptions import (
     UserNotFoundError,
 )
 from pybase.core.security import verify_api_key, verify_token
+from pybase.db.base import utc_now
 from pybase.db.session import get_db
 from pybase.models.user import APIKey, User
+from pybase.services.api_key_usage import get_api_key_usage_buffer
 
 
 # HTTP Bearer token security scheme
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Principals resolved from tokens and API keys, so repeat requests skip the
+# user query (and the API key hash check)
+_principals = PrincipalCache()
+
+
+@dataclass(frozen=True)
+class _APIKeyPrincipal:
+    """Cached result of a successful API key check."""
+
+    api_key_id: str
+    expires_at: datetime | None
+    user: dict[str, Any]
+
+
+def _user_columns(user: User) -> dict[str, Any]:
+    """Column values of a user, enough to rebuild it without a query."""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+async def _cached_user(db: AsyncSession, columns: dict[str, Any]) -> User:
+    """Attach a cached user to the session as if it had been loaded."""
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def _load_active_user(db: AsyncSession, user_id: str) -> User | None:
+    result = await db.execute(
+        select(User).where(
+            User.id == user_id,
+            User.is_active == True,
+            User.deleted_at == None,
+        )
+    )
+    return result.scalar_one_or_none()
+
 
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -34,6 +76,9 @@ async def get_current_user(
     """
     Get the current authenticated user from JWT token.
 
+    Users are cached per token (jti) for a short time, so repeat requests
+    with the same token do not query the database.
+
     Args:
         db: Database session
         credentials: HTTP Bearer credentials
@@ -61,15 +106,16 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Tokens without a jti (old format) are not cached
+    key: Hashable | None = PrincipalCache.token_key(payload.jti) if payload.jti else None
+    if key is not None:
+        columns = await _principals.get(key)
+        if columns is not None:
+            return await _cached_user(db, columns)
+
     # Get user from database
-    result = await db.execute(
-        select(User).where(
-            User.id == payload.sub,
-            User.is_active == True,
-            User.deleted_at == None,
-        )
-    )
-    user = result.scalar_one_or_none()
+    generation = _principals.generation
+    user = await _load_active_user(db, payload.sub)
 
     if user is None:
         raise HTTPException(
@@ -78,6 +124,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if key is not None:
+        _principals.set(key, _user_columns(user), user.id, generation, jti=payload.jti)
     return user
 
 
@@ -129,6 +177,9 @@ async def get_user_from_api_key(
     """
     Get user from API key header.
 
+    Successful checks are cached per key for a short time, skipping the
+    key hash verification and user query on repeat requests.
+
     Args:
         db: Database session
         x_api_key: API key from header
@@ -142,7 +193,16 @@ async def get_user_from_api_key(
     # Extract prefix for lookup
     prefix = x_api_key[:12] if len(x_api_key) > 12 else x_api_key
 
+    key = PrincipalCache.api_key_key(prefix, x_api_key)
+    principal = await _principals.get(key)
+    if principal is not None:
+        if principal.expires_at is not None and principal.expires_at < utc_now():
+            return None
+        get_api_key_usage_buffer().record(principal.api_key_id)
+        return await _cached_user(db, principal.user)
+
     # Find API key by prefix
+    generation = _principals.generation
     result = await db.execute(
         select(APIKey).where(
             APIKey.key_prefix == prefix,
@@ -163,19 +223,15 @@ async def get_user_from_api_key(
         return None
 
     # Get the user
-    result = await db.execute(
-        select(User).where(
-            User.id == api_key.user_id,
-            User.is_active == True,
-            User.deleted_at == None,
-        )
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_active_user(db, api_key.user_id)
 
     if user:
-        # Update API key usage
-        api_key.update_usage()
-        await db.commit()
+        # Usage is written in batches rather than committed per request
+        get_api_key_usage_buffer().record(api_key.id)
+        principal = _APIKeyPrincipal(
+            api_key_id=api_key.id, expires_at=api_key.expires_at, user=_user_columns(user)
+        )
+        _principals.set(key, principal, user.id, generation, api_key_id=api_key.id)
 
     return user
 
@@ -221,6 +277,19 @@ async def get_current_user_or_api_key(
     )
 
 
+async def invalidate_principals(scope: str, entity_id: str) -> None:
+    """Drop cached principals after a user or API key change.
+
+    Call after committing the change, so no worker caches the old state again.
+
+    Args:
+        scope: "user" or "api_key"
+        entity_id: ID of the changed user or API key
+
+    """
+    await _principals.invalidate(scope, str(entity_id))
+
+
 # Type aliases for cleaner dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentUserOptional = Annotated[User | None, Depends(get_current_user_optional)]
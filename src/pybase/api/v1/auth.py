@@ -11,7 +11,7 @@ from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pybase.api.deps import CurrentUser, DbSession
+from pybase.api.deps import CurrentUser, DbSession, invalidate_principals
 from pybase.core.config import settings
 from pybase.core.security import (
     create_token_pair,
@@ -315,6 +315,7 @@ async def change_password(
     # Update password
     current_user.hashed_password = hash_password(request.new_password)
     await db.commit()
+    await invalidate_principals("user", current_user.id)
 
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
@@ -7,7 +7,6 @@ Handles single and batch indexing of CAD models for multi-modal similarity searc
 import asyncio
 import tempfile
 import uuid
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -16,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.api.deps import CurrentUser, DbSession
 from pybase.core.logging import get_logger
+from pybase.db.ann_index import get_cad_vector_index
 from pybase.services.cad_indexing_pipeline import (
     BatchIndexingResult,
     CADIndexingPipeline,
@@ -712,7 +712,7 @@ async def delete_model(
     stmt = select(CADModel).where(
         CADModel.id == model_uuid,
         CADModel.user_id == str(current_user.id),
-        CADModel.is_deleted.is_(False),
+        CADModel.deleted_at.is_(None),
     )
     result = await db.execute(stmt)
     model = result.scalar_one_or_none()
@@ -724,6 +724,9 @@ async def delete_model(
         )
 
     # Soft delete
-    model.is_deleted = True
-    model.deleted_at = datetime.now(timezone.utc)
+    model.soft_delete()
     await db.commit()
+
+    ann_index = get_cad_vector_index()
+    if ann_index is not None:
+        ann_index.remove_model(str(model.id))
@@ -21,7 +21,7 @@ from pybase.core.exceptions import (
     PermissionDeniedError,
     ValidationError,
 )
-from pybase.realtime import get_connection_manager
+from pybase.realtime import get_realtime_batcher
 from pybase.schemas.batch import (
     BatchOperationResponse,
     BatchRecordCreate,
@@ -543,7 +543,7 @@ async def export_records(
     format: Annotated[
         str,
         Query(
-            description="Export format (csv, json, xlsx, or xml)",
+            description="Export format (csv, json, xlsx, xml, parquet, or arrow)",
         ),
     ] = "csv",
     batch_size: Annotated[
@@ -578,12 +578,19 @@ async def export_records(
             description="Flatten linked record data into export (embed linked record values)",
         ),
     ] = False,
+    all_linked_records: Annotated[
+        bool,
+        Query(
+            description="When flattening, include every linked record (comma-separated) "
+            "instead of only the first",
+        ),
+    ] = False,
 ):
     """
     Export records from a table.
 
     Streams export data for large datasets efficiently.
-    Supports CSV, JSON, Excel (.xlsx), and XML formats.
+    Supports CSV, JSON, Excel (.xlsx), XML, Parquet and Arrow IPC formats.
     Can filter by specific fields, apply view filters/sorts, include attachments,
     and flatten linked record data.
     Returns 202 to indicate async processing has started.
@@ -601,7 +608,7 @@ async def export_records(
 
     # Validate format
     format = format.lower()
-    valid_formats = ["csv", "json", "xlsx", "xml"]
+    valid_formats = ["csv", "json", "xlsx", "xml", "parquet", "arrow"]
     if format not in valid_formats:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -644,6 +651,7 @@ async def export_records(
             view_id=view_uuid,
             include_attachments=include_attachments,
             flatten_linked_records=flatten_linked_records,
+            all_linked_records=all_linked_records,
         ):
             yield chunk
 
@@ -653,6 +661,8 @@ async def export_records(
         "json": "application/json",
         "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         "xml": "application/xml",
+        "parquet": "application/vnd.apache.parquet",
+        "arrow": "application/vnd.apache.arrow.file",
     }
     media_type = media_types.get(format, "application/octet-stream")
     filename = f"export_{table_id}.{format}"
@@ -1104,7 +1114,7 @@ async def _emit_record_event(
 
     """
     try:
-        manager = get_connection_manager()
+        batcher = get_realtime_batcher()
 
         # Prepare record data (exclude for deleted events)
         record_data = None
@@ -1134,12 +1144,13 @@ async def _emit_record_event(
             changed_by=user_id,
         )
 
-        # Broadcast to table channel (all users viewing the table)
+        # Queue for the table channel (all users viewing the table); changes
+        # within the batch window are merged into one batch event
         table_channel = f"table:{table_id}"
-        await manager.broadcast_to_channel(table_channel, event)
+        await batcher.emit(table_channel, event)
 
         logger.debug(
-            f"Emitted {event_type.value} event for record {record_id} to channel: {table_channel}"
+            f"Queued {event_type.value} event for record {record_id} to channel: {table_channel}"
         )
 
     except Exception as e:
@@ -1163,7 +1174,7 @@ async def _emit_batch_record_event(
 
     """
     try:
-        manager = get_connection_manager()
+        batcher = get_realtime_batcher()
 
         # Create event
         event = RecordBatchChangeEvent(
@@ -1174,12 +1185,13 @@ async def _emit_batch_record_event(
             changed_by=user_id,
         )
 
-        # Broadcast to table channel (all users viewing the table)
+        # Queue for the table channel (all users viewing the table); changes
+        # within the batch window are merged into one batch event
         table_channel = f"table:{table_id}"
-        await manager.broadcast_to_channel(table_channel, event)
+        await batcher.emit(table_channel, event)
 
         logger.debug(
-            f"Emitted {event_type.value} event for {len(record_ids)} records to channel: {table_channel}"
+            f"Queued {event_type.value} event for {len(record_ids)} records to channel: {table_channel}"
         )
 
     except Exception as e:
@@ -1222,6 +1234,8 @@ async def create_export_job(
     - xlsx: Excel spreadsheet
     - json: JSON array of records
     - xml: XML format with schema
+    - parquet: Apache Parquet (columnar, typed)
+    - arrow: Apache Arrow IPC file (columnar, typed)
 
     **Export Options:**
     - field_ids: List of field IDs to include (exports all if not specified)
@@ -1620,6 +1634,8 @@ async def download_export_file(
         "json": "application/json",
         "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         "xml": "application/xml",
+        "parquet": "application/vnd.apache.parquet",
+        "arrow": "application/vnd.apache.arrow.file",
     }
     media_type = media_types.get(job_model.export_format, "application/octet-stream")
 
@@ -1680,7 +1696,7 @@ async def create_scheduled_export(
     **Request Body:**
     - table_id: Table ID to export (required)
     - schedule: Cron schedule expression (required)
-    - format: Export format - csv, xlsx, json, xml (default: csv)
+    - format: Export format - csv, xlsx, json, xml, parquet, arrow (default: csv)
     - name: Optional name for the scheduled export
     - description: Optional description
     - view_id: Optional view ID for filtering
@@ -1734,7 +1750,7 @@ async def create_scheduled_export(
 
     # Validate export format
     format_str = scheduled_export_data.get("format", "csv")
-    valid_formats = ["csv", "xlsx", "json", "xml"]
+    valid_formats = ["csv", "xlsx", "json", "xml", "parquet", "arrow"]
     if format_str.lower() not in valid_formats:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
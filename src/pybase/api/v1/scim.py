@@ -13,7 +13,7 @@ from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pybase.api.deps import CurrentSuperuser, DbSession
+from pybase.api.deps import CurrentSuperuser, DbSession, invalidate_principals
 from pybase.models.user import User
 from pybase.schemas.scim import (
     SCIMErrorDetail,
@@ -373,6 +373,8 @@ async def update_user(
         user.email = user_data.emails[0].value
 
     await db.commit()
+    # Deactivation and email changes must reach cached principals
+    await invalidate_principals("user", user.id)
     await db.refresh(user)
 
     return _user_to_scim(user)
@@ -425,6 +427,8 @@ async def patch_user(
         user.email = user_data.emails[0].value
 
     await db.commit()
+    # Deactivation and email changes must reach cached principals
+    await invalidate_principals("user", user.id)
     await db.refresh(user)
 
     return _user_to_scim(user)
@@ -463,6 +467,7 @@ async def delete_user(
     user.deleted_at = datetime.utcnow()
 
     await db.commit()
+    await invalidate_principals("user", user.id)
 
 
 # =============================================================================
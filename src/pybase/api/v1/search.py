@@ -15,6 +15,7 @@ from pybase.schemas.search import (
     IndexStats,
     IndexUpdate,
     ReindexRequest,
+    ReindexStatus,
     SearchRequest,
     SearchResponse,
 )
@@ -289,8 +290,10 @@ async def reindex_base(
     """
     Reindex all records in a base.
 
-    Triggers reindexing of all tables and records in the specified base.
-    This operation runs asynchronously and may take time for large bases.
+    Runs a keyset-paged reindex job over every table of the base. An
+    unfinished job resumes from its checkpoint; with ``shadow`` the base is
+    rebuilt into a separate index that replaces the live one atomically.
+    Progress is available from ``GET /indexes/base/{base_id}/reindex``.
     """
     try:
         base_uuid = UUID(base_id)
@@ -302,46 +305,60 @@ async def reindex_base(
 
     from sqlalchemy import select
     from pybase.models.table import Table
-
-    service = get_search_service(db)
+    from pybase.services.search_reindex import REINDEX_COMPLETED, SearchReindexer
 
     # Get all tables in the base
-    stmt = select(Table).where(Table.base_id == base_uuid)
+    stmt = (
+        select(Table.id)
+        .where(Table.base_id == base_uuid, Table.deleted_at.is_(None))
+        .order_by(Table.id)
+    )
     result = await db.execute(stmt)
-    tables = result.scalars().all()
+    table_ids = [str(table_id) for table_id in result.scalars().all()]
 
-    if not tables:
+    if not table_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No tables found in base {base_id}",
         )
 
-    # Reindex each table
-    success_count = 0
-    for table in tables:
-        success = await service.index_table(
-            base_id=str(base_uuid),
-            table_id=str(table.id),
-            batch_size=reindex_data.batch_size,
-        )
-        if success:
-            success_count += 1
+    checkpoint = await SearchReindexer(db).reindex(
+        base_id=str(base_uuid),
+        table_ids=table_ids,
+        batch_size=reindex_data.batch_size,
+        shadow=reindex_data.shadow,
+        resume=reindex_data.resume,
+    )
 
-    if success_count == len(tables):
-        return IndexResponse(
-            success=True,
-            message=f"Reindexing completed for {success_count} tables in base {base_id}",
-            index_name=f"pybase:base:{base_id}",
-        )
-    elif success_count > 0:
-        return IndexResponse(
-            success=True,
-            message=f"Reindexing partially completed: {success_count}/{len(tables)} tables",
-            index_name=f"pybase:base:{base_id}",
-        )
-    else:
+    if checkpoint.status != REINDEX_COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to reindex base",
+            detail=f"Failed to reindex base after {checkpoint.indexed}/{checkpoint.total} "
+            "records; retry to resume from the checkpoint",
         )
 
+    return IndexResponse(
+        success=True,
+        message=f"Reindexed {checkpoint.indexed} records in {len(table_ids)} tables "
+        f"of base {base_id}",
+        index_name=f"pybase:base:{base_id}",
+    )
+
+
+@router.get("/indexes/base/{base_id}/reindex", response_model=ReindexStatus)
+async def get_reindex_status(
+    base_id: str,
+    current_user: CurrentUser,
+) -> ReindexStatus:
+    """
+    Get the progress of the latest reindex job of a base.
+    """
+    from pybase.services.search_reindex import ReindexCheckpointStore
+
+    checkpoint = await ReindexCheckpointStore().load(base_id, "all")
+    if checkpoint is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No reindex job found for base {base_id}",
+        )
+    return ReindexStatus(**checkpoint.to_dict())
@@ -10,7 +10,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy import select
 
-from pybase.api.deps import CurrentUser, CurrentSuperuser, DbSession
+from pybase.api.deps import CurrentUser, CurrentSuperuser, DbSession, invalidate_principals
 from pybase.core.security import generate_api_key, hash_api_key
 from pybase.models.user import APIKey, User
 
@@ -106,6 +106,7 @@ async def update_my_profile(
         current_user.avatar_url = request.avatar_url
 
     await db.commit()
+    await invalidate_principals("user", current_user.id)
     await db.refresh(current_user)
 
     return current_user
@@ -204,6 +205,7 @@ async def delete_api_key(
 
     await db.delete(api_key)
     await db.commit()
+    await invalidate_principals("api_key", key_id)
 
 
 @router.patch("/me/api-keys/{key_id}", response_model=APIKeyResponse)
@@ -238,6 +240,7 @@ async def update_api_key(
         api_key.is_active = is_active
 
     await db.commit()
+    await invalidate_principals("api_key", key_id)
     await db.refresh(api_key)
 
     return api_key
@@ -325,6 +328,7 @@ async def deactivate_user(
 
     user.is_active = False
     await db.commit()
+    await invalidate_principals("user", user_id)
     await db.refresh(user)
 
     return user
@@ -355,6 +359,7 @@ async def activate_user(
 
     user.is_active = True
     await db.commit()
+    await invalidate_principals("user", user_id)
     await db.refresh(user)
 
     return user
@@ -429,7 +429,7 @@ async def get_view_data(
         )
 
     # Get view data with filters/sorts applied
-    records, total = await view_service.get_view_data(
+    result = await view_service.get_view_data_page(
         db=db,
         view_id=view_id,
         user_id=str(current_user.id),
@@ -438,18 +438,17 @@ async def get_view_data(
         override_filters=request.override_filters,
         override_sorts=request.override_sorts,
         search=request.search,
+        cursor=request.cursor,
     )
 
-    # Calculate has_more flag
-    has_more = (request.page * request.page_size) < total
-
     return ViewDataResponse(
         view_id=view_uuid,
-        records=records,
-        total=total,
+        records=result["records"],
+        total=result["total"],
         page=request.page,
         page_size=request.page_size,
-        has_more=has_more,
+        has_more=result["has_more"],
+        next_cursor=result["next_cursor"],
     )
 
 
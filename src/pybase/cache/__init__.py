@@ -1,6 +1,17 @@
 """Cache layer for PyBase."""
 
+from pybase.cache.access_cache import AccessCache
 from pybase.cache.chart_cache import ChartCache
+from pybase.cache.invalidation import InvalidationChannel
+from pybase.cache.local_cache import LocalCache
 from pybase.cache.record_cache import RecordCache
+from pybase.cache.table_charts_cache import TableChartsCache
 
-__all__ = ["ChartCache", "RecordCache"]
+__all__ = [
+    "AccessCache",
+    "ChartCache",
+    "InvalidationChannel",
+    "LocalCache",
+    "RecordCache",
+    "TableChartsCache",
+]
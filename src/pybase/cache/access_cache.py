@@ -0,0 +1,126 @@
+"""In-process cache of resolved table access."""
+
+from typing import Any, Optional
+
+from pybase.cache.invalidation import InvalidationChannel
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Approximate in-memory size of one resolution (ids and role)
+ENTRY_SIZE = 512
+
+# Resolutions shared by every AccessCache in this worker
+local_access = LocalCache(
+    "table_access",
+    max_entries=settings.access_cache_max_entries,
+    max_bytes=settings.access_cache_max_entries * ENTRY_SIZE,
+    ttl=settings.access_cache_ttl,
+)
+
+SCOPES = ("table", "base", "workspace", "user")
+
+
+class AccessCache:
+    """Short-lived cache of (user, table) access resolutions.
+
+    Entries are tagged with their table, base, workspace and user. Changes
+    to any of them (membership, role, deletion) are invalidated on every
+    worker through ``INVALIDATION_CHANNEL`` (see ``InvalidationChannel``).
+    """
+
+    INVALIDATION_CHANNEL = "cache:access:invalidate"
+
+    @staticmethod
+    def _key(table_id: str, user_id: str) -> tuple[str, str]:
+        return (str(table_id), str(user_id))
+
+    @property
+    def generation(self) -> int:
+        """Invalidation generation, observed before resolving access."""
+        return local_access.generation
+
+    async def get(self, table_id: str, user_id: str) -> Optional[Any]:
+        """Get a cached access resolution.
+
+        Args:
+            table_id: Table ID
+            user_id: User ID
+
+        Returns:
+            Cached resolution, or None if missing, expired or not subscribed
+
+        """
+        if not await invalidations.ensure_subscribed():
+            return None
+        return local_access.get(self._key(table_id, user_id))
+
+    def set(
+        self,
+        table_id: str,
+        user_id: str,
+        value: Any,
+        base_id: str,
+        workspace_id: str,
+        generation: int,
+    ) -> None:
+        """Cache an access resolution.
+
+        Args:
+            table_id: Table ID
+            user_id: User ID
+            value: Resolution to cache
+            base_id: Base of the table
+            workspace_id: Workspace of the base
+            generation: Generation observed before resolving (drops the value
+                if an invalidation happened meanwhile)
+
+        """
+        if not invalidations.subscribed:
+            return
+        tags = (
+            f"table:{table_id}",
+            f"base:{base_id}",
+            f"workspace:{workspace_id}",
+            f"user:{user_id}",
+        )
+        local_access.set(
+            self._key(table_id, user_id), value, ENTRY_SIZE, tags=tags, generation=generation
+        )
+
+    async def invalidate(self, scope: str, entity_id: str) -> None:
+        """Drop cached access for a table, base, workspace or user everywhere.
+
+        Args:
+            scope: "table", "base", "workspace" or "user"
+            entity_id: ID of the changed entity
+
+        """
+        await invalidations.publish(scope, entity_id)
+
+
+def handle_invalidation(message: dict[str, Any]) -> None:
+    """Drop cached access named by an invalidation message.
+
+    Registered as the pub/sub handler for ``AccessCache.INVALIDATION_CHANNEL``.
+
+    Args:
+        message: Message with "scope" (one of ``SCOPES``) and "id"
+
+    """
+    scope = message.get("scope")
+    entity_id = message.get("id")
+    if scope not in SCOPES or not entity_id:
+        return
+
+    dropped = local_access.invalidate_tag(f"{scope}:{entity_id}")
+    if dropped:
+        logger.debug(f"Dropped {dropped} cached table access entries for {scope} {entity_id}")
+
+
+# Keeps local_access in sync across workers
+invalidations = InvalidationChannel(
+    AccessCache.INVALIDATION_CHANNEL, handle_invalidation, local_access
+)
@@ -0,0 +1,308 @@
+"""In-process caches for authentication: resolved principals and the token blacklist."""
+
+import asyncio
+import hashlib
+import math
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from pybase.cache.invalidation import InvalidationChannel
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Approximate in-memory size of one principal (user columns and key metadata)
+ENTRY_SIZE = 2048
+
+# Principals shared by every PrincipalCache in this worker
+local_principals = LocalCache(
+    "principals",
+    max_entries=settings.auth_cache_max_entries,
+    max_bytes=settings.auth_cache_max_entries * ENTRY_SIZE,
+    ttl=settings.auth_cache_ttl,
+)
+
+# "jwt" invalidations blacklist a token id, the others drop a user or API key
+SCOPES = ("user", "api_key", "jwt")
+
+
+class BloomFilter:
+    """Fixed-size bloom filter of strings.
+
+    Membership tests never give false negatives; false positives happen at
+    roughly ``error_rate`` once ``capacity`` items are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize an empty filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False positive rate at capacity
+
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: two 64-bit halves of one digest give all k positions
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class TokenBlacklistFilter:
+    """Local bloom filter of blacklisted token ids (jti), synced through Redis.
+
+    The filter is built by scanning the Redis blacklist and kept current by
+    "jwt" invalidations published when a token is blacklisted. A token
+    missing from the filter is certainly not blacklisted, so the Redis
+    lookup is only needed for the rare possible match. Bloom filters cannot
+    drop items, so the filter is rebuilt every ``resync_interval`` seconds
+    to forget expired blacklist entries.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        resync_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the filter (unsynced until the first ``sync``).
+
+        Args:
+            capacity: Blacklisted tokens the filter is sized for
+            error_rate: Target false positive rate
+            resync_interval: Seconds between rebuilds from Redis
+            clock: Monotonic clock, overridable for tests
+
+        """
+        self.capacity = capacity or settings.token_blacklist_filter_capacity
+        self.error_rate = error_rate or settings.token_blacklist_filter_error_rate
+        self.resync_interval = resync_interval or settings.token_blacklist_resync_seconds
+        self._clock = clock
+        self._filter: Optional[BloomFilter] = None
+        self._synced_at = 0.0
+        # Token ids blacklisted while a sync is scanning Redis
+        self._added_during_sync: Optional[list[str]] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the filter has been built from Redis."""
+        return self._filter is not None
+
+    def add(self, jti: str) -> None:
+        """Record a blacklisted token id."""
+        if self._filter is not None:
+            self._filter.add(jti)
+        if self._added_during_sync is not None:
+            self._added_during_sync.append(jti)
+
+    def reset(self) -> None:
+        """Forget the filter so lookups go to Redis until the next sync."""
+        self._filter = None
+        self._synced_at = 0.0
+
+    async def sync(self, redis_client: Any, prefix: str) -> None:
+        """Rebuild the filter from the blacklist keys in Redis.
+
+        Args:
+            redis_client: Redis client (with decoded responses)
+            prefix: Blacklist key prefix; keys are ``<prefix>:<jti>``
+
+        """
+        self._added_during_sync = []
+        try:
+            jtis = [
+                key[len(prefix) + 1 :]
+                async for key in redis_client.scan_iter(match=f"{prefix}:*", count=1000)
+            ]
+            bloom = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+            for jti in jtis + self._added_during_sync:
+                bloom.add(jti)
+        finally:
+            self._added_during_sync = None
+
+        self._filter = bloom
+        self._synced_at = self._clock()
+        logger.debug(f"Token blacklist filter synced with {len(jtis)} entries")
+
+    async def excludes(self, redis_client: Any, prefix: str, jti: str) -> bool:
+        """Check whether a token id is certainly not blacklisted.
+
+        Schedules a background (re)build when the filter is missing or due
+        for a rebuild. Until it is built, or while this worker is not
+        subscribed to blacklist updates, nothing is excluded and callers
+        check Redis.
+
+        Args:
+            redis_client: Redis client used for the rebuild
+            prefix: Blacklist key prefix
+            jti: Token id
+
+        Returns:
+            True if the token is not blacklisted, False if Redis must be checked
+
+        """
+        if not await invalidations.ensure_subscribed():
+            return False
+
+        if self._clock() - self._synced_at >= self.resync_interval or self._filter is None:
+            self._start_sync(redis_client, prefix)
+
+        return self._filter is not None and jti not in self._filter
+
+    def _start_sync(self, redis_client: Any, prefix: str) -> None:
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        self._sync_task = asyncio.get_running_loop().create_task(
+            self._sync_safely(redis_client, prefix)
+        )
+
+    async def _sync_safely(self, redis_client: Any, prefix: str) -> None:
+        try:
+            await self.sync(redis_client, prefix)
+        except Exception as e:
+            # Keep the previous filter (or none); retried on a later check
+            logger.warning(f"Error syncing token blacklist filter: {e}")
+            self._synced_at = self._clock()
+
+
+# Blacklisted token ids of this worker
+blacklist_filter = TokenBlacklistFilter()
+
+
+class PrincipalCache:
+    """Short-lived cache of authenticated principals.
+
+    Keys identify a credential (a token jti, or an API key prefix and the
+    hash of the full key); values hold what is needed to rebuild the user
+    without querying the database. Entries are tagged with their user and
+    API key. Changes to either (deactivation, password change, key
+    revocation) and token blacklisting are published on
+    ``INVALIDATION_CHANNEL`` through the realtime Redis pub/sub, and every
+    worker drops the affected entries when it receives them (see
+    ``InvalidationChannel``).
+    """
+
+    INVALIDATION_CHANNEL = "cache:auth:invalidate"
+
+    @staticmethod
+    def token_key(jti: str) -> tuple[str, str]:
+        """Cache key of an access token."""
+        return ("jwt", str(jti))
+
+    @staticmethod
+    def api_key_key(prefix: str, full_key: str) -> tuple[str, str, str]:
+        """Cache key of an API key (the full key itself is never stored)."""
+        return ("api_key", prefix, hashlib.sha256(full_key.encode()).hexdigest())
+
+    @property
+    def generation(self) -> int:
+        """Invalidation generation, observed before loading a principal."""
+        return local_principals.generation
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached principal.
+
+        Args:
+            key: Credential key (``token_key`` or ``api_key_key``)
+
+        Returns:
+            Cached principal, or None if missing, expired or not subscribed
+
+        """
+        if not await invalidations.ensure_subscribed():
+            return None
+        return local_principals.get(key)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        user_id: str,
+        generation: int,
+        api_key_id: Optional[str] = None,
+        jti: Optional[str] = None,
+    ) -> None:
+        """Cache a principal.
+
+        Args:
+            key: Credential key
+            value: Principal to cache
+            user_id: User the credential belongs to
+            generation: Generation observed before loading (drops the value
+                if an invalidation happened meanwhile)
+            api_key_id: API key ID, for API key credentials
+            jti: Token id, for access tokens
+
+        """
+        if not invalidations.subscribed:
+            return
+        tags = [f"user:{user_id}"]
+        if api_key_id is not None:
+            tags.append(f"api_key:{api_key_id}")
+        if jti is not None:
+            tags.append(f"jwt:{jti}")
+        local_principals.set(key, value, ENTRY_SIZE, tags=tags, generation=generation)
+
+    async def invalidate(self, scope: str, entity_id: str) -> None:
+        """Drop cached principals for a user, API key or token everywhere.
+
+        Args:
+            scope: "user", "api_key" or "jwt" (blacklists the token id)
+            entity_id: ID of the changed entity
+
+        """
+        await invalidations.publish(scope, entity_id)
+
+
+def handle_invalidation(message: dict[str, Any]) -> None:
+    """Drop cached principals named by an invalidation message.
+
+    Registered as the pub/sub handler for ``PrincipalCache.INVALIDATION_CHANNEL``.
+    "jwt" messages also add the token id to the blacklist filter.
+
+    Args:
+        message: Message with "scope" (one of ``SCOPES``) and "id"
+
+    """
+    scope = message.get("scope")
+    entity_id = message.get("id")
+    if scope not in SCOPES or not entity_id:
+        return
+
+    if scope == "jwt":
+        blacklist_filter.add(entity_id)
+    dropped = local_principals.invalidate_tag(f"{scope}:{entity_id}")
+    if dropped:
+        logger.debug(f"Dropped {dropped} cached principals for {scope} {entity_id}")
+
+
+# Keeps local_principals and the blacklist filter in sync across workers
+invalidations = InvalidationChannel(
+    PrincipalCache.INVALIDATION_CHANNEL,
+    handle_invalidation,
+    local_principals,
+    reset=blacklist_filter.reset,
+)
@@ -19,12 +19,17 @@ class ChartCache:
     for expensive analytics computations. Cache keys are based on chart_id
     and data_request parameters to ensure proper cache isolation.
 
+    Invalidation is versioned: keys embed the current generation of the
+    chart and of its source table, so invalidating bumps a counter instead
+    of scanning the keyspace and stale entries expire through their TTL.
+
     Cache TTL: Configurable per chart (default 5 minutes / 300 seconds)
     """
 
     # Default cache TTL in seconds
     DEFAULT_TTL = 300
     DATA_CACHE_PREFIX = "chart:data"
+    VERSION_PREFIX = "chart:version"
 
     def __init__(self) -> None:
         """Initialize Redis cache client."""
@@ -56,22 +61,69 @@ class ChartCache:
             await self._redis.close()
             self._redis = None
 
+    def chart_version_key(self, chart_id: str) -> str:
+        """Get the generation counter key for a chart."""
+        return f"{self.VERSION_PREFIX}:chart:{chart_id}"
+
+    def table_version_key(self, table_id: str) -> str:
+        """Get the generation counter key for a chart source table."""
+        return f"{self.VERSION_PREFIX}:table:{table_id}"
+
     def generate_cache_key(
         self,
         chart_id: str,
         data_request_hash: str,
+        chart_version: int = 0,
+        table_version: int = 0,
     ) -> str:
         """Generate cache key for chart data query.
 
         Args:
             chart_id: Chart ID
             data_request_hash: Hash of data request parameters
+            chart_version: Current generation of the chart
+            table_version: Current generation of the chart's source table
 
         Returns:
             Cache key string
 
         """
-        return f"{self.DATA_CACHE_PREFIX}:{chart_id}:{data_request_hash}"
+        return (
+            f"{self.DATA_CACHE_PREFIX}:{chart_id}:{chart_version}:"
+            f"{table_version}:{data_request_hash}"
+        )
+
+    async def _versioned_cache_key(
+        self,
+        redis_client: Redis,
+        chart_id: str,
+        table_id: Optional[str],
+        data_request: Optional[dict[str, Any]],
+    ) -> str:
+        """Build the cache key for the current chart and table generations.
+
+        Args:
+            redis_client: Redis client
+            chart_id: Chart ID
+            table_id: Optional source table ID
+            data_request: Optional data request parameters
+
+        Returns:
+            Cache key string
+
+        """
+        version_keys = [self.chart_version_key(chart_id)]
+        if table_id:
+            version_keys.append(self.table_version_key(table_id))
+        versions = await redis_client.mget(version_keys)
+        chart_version = versions[0]
+        table_version = versions[1] if table_id else None
+        return self.generate_cache_key(
+            chart_id,
+            self._hash_data_request(data_request),
+            chart_version=int(chart_version or 0),
+            table_version=int(table_version or 0),
+        )
 
     def _hash_data_request(self, data_request: Optional[dict[str, Any]]) -> str:
         """Generate hash from data request parameters.
@@ -94,12 +146,14 @@ class ChartCache:
         self,
         chart_id: str,
         data_request: Optional[dict[str, Any]] = None,
+        table_id: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Get cached chart data.
 
         Args:
             chart_id: Chart ID
             data_request: Optional data request parameters
+            table_id: Optional source table ID, so table writes invalidate the entry
 
         Returns:
             Cached chart data dict or None if not cached
@@ -110,8 +164,9 @@ class ChartCache:
             if not redis_client:
                 return None
 
-            data_request_hash = self._hash_data_request(data_request)
-            cache_key = self.generate_cache_key(chart_id, data_request_hash)
+            cache_key = await self._versioned_cache_key(
+                redis_client, chart_id, table_id, data_request
+            )
             cached_data = await redis_client.get(cache_key)
 
             if cached_data:
@@ -131,6 +186,7 @@ class ChartCache:
         data: dict[str, Any],
         data_request: Optional[dict[str, Any]] = None,
         ttl: int = DEFAULT_TTL,
+        table_id: Optional[str] = None,
     ) -> bool:
         """Cache chart data.
 
@@ -139,6 +195,7 @@ class ChartCache:
             data: Chart data to cache
             data_request: Optional data request parameters
             ttl: Time to live in seconds
+            table_id: Optional source table ID, so table writes invalidate the entry
 
         Returns:
             True if cached successfully, False otherwise
@@ -149,8 +206,9 @@ class ChartCache:
             if not redis_client:
                 return False
 
-            data_request_hash = self._hash_data_request(data_request)
-            cache_key = self.generate_cache_key(chart_id, data_request_hash)
+            cache_key = await self._versioned_cache_key(
+                redis_client, chart_id, table_id, data_request
+            )
 
             # Serialize chart data for caching
             cache_data = {
@@ -181,7 +239,8 @@ class ChartCache:
     async def invalidate_chart_cache(self, chart_id: str) -> None:
         """Invalidate all cache entries for a chart.
 
-        Called when chart configuration or source data changes.
+        Called when chart configuration or source data changes. Bumps the
+        chart's generation so existing entries are no longer addressed.
 
         Args:
             chart_id: Chart ID to invalidate cache for
@@ -192,31 +251,56 @@ class ChartCache:
             if not redis_client:
                 return
 
-            pattern = f"{self.DATA_CACHE_PREFIX}:{chart_id}:*"
-            keys = []
+            version = await redis_client.incr(self.chart_version_key(chart_id))
+            logger.debug(f"Invalidated cache for chart {chart_id} (version {version})")
+
+        except Exception as e:
+            logger.warning(f"Error invalidating chart cache: {e}")
+
+    async def get_table_version(self, table_id: str) -> Optional[int]:
+        """Get the current generation of a chart source table.
+
+        Args:
+            table_id: Table ID
 
-            async for key in redis_client.scan_iter(match=pattern):
-                keys.append(key)
+        Returns:
+            Table generation, or None if Redis is unavailable
 
-            if keys:
-                await redis_client.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache entries for chart {chart_id}")
+        """
+        try:
+            redis_client = await self.get_redis()
+            if not redis_client:
+                return None
+
+            version = await redis_client.get(self.table_version_key(table_id))
+            return int(version or 0)
 
         except Exception as e:
-            logger.warning(f"Error invalidating chart cache: {e}")
+            logger.warning(f"Error getting chart table version: {e}")
+            return None
 
-    async def invalidate_table_cache(self, table_id: str) -> None:
+    async def invalidate_table_cache(self, table_id: str) -> Optional[int]:
         """Invalidate all cache entries for charts using a table.
 
-        Called when table data changes.
-
-        Note: This requires tracking which charts use which tables.
-        Currently, this is a placeholder for future implementation.
+        Called when table data changes. Bumps the table's generation, which
+        every chart built on the table embeds in its cache keys.
 
         Args:
             table_id: Table ID to invalidate cache for
 
+        Returns:
+            New table generation, or None if Redis is unavailable
+
         """
-        # TODO: Implement table-to-chart mapping for cache invalidation
-        # This would require maintaining a reverse index of charts -> tables
-        logger.debug(f"Table cache invalidation requested for table {table_id} (not yet implemented)")
+        try:
+            redis_client = await self.get_redis()
+            if not redis_client:
+                return None
+
+            version = await redis_client.incr(self.table_version_key(table_id))
+            logger.debug(f"Invalidated chart cache for table {table_id} (version {version})")
+            return int(version)
+
+        except Exception as e:
+            logger.warning(f"Error invalidating chart table cache: {e}")
+            return None
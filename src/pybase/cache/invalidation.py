@@ -0,0 +1,103 @@
+"""Cross-worker invalidation of in-process caches through Redis pub/sub."""
+
+from typing import Any, Callable, Optional
+
+from pybase.cache.local_cache import LocalCache
+from pybase.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class InvalidationChannel:
+    """Pub/sub channel keeping a worker-local cache in sync across workers.
+
+    Invalidations are applied to this worker by ``handler`` and published
+    on ``channel`` through the realtime Redis pub/sub; every other worker
+    applies them when it receives them. Caches only serve local entries
+    while this worker is subscribed (``ensure_subscribed``), and the TTL
+    bounds staleness if a message is lost.
+
+    When the pub/sub listener stops, messages published meanwhile are
+    missed: the subscription is dropped and the cache cleared, so entries
+    are not served again until the worker has subscribed anew.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        handler: Callable[[dict[str, Any]], None],
+        cache: LocalCache,
+        reset: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Initialize channel (unsubscribed until the first ``ensure_subscribed``).
+
+        Args:
+            channel: Redis channel invalidations are published on
+            handler: Applies an invalidation message to this worker
+            cache: Local cache the channel keeps in sync
+            reset: Drops any other state derived from the messages when the
+                subscription is lost
+
+        """
+        self.channel = channel
+        self.handler = handler
+        self.cache = cache
+        self.reset = reset
+        # Whether this worker listens for invalidations (enables the cache)
+        self.subscribed = False
+
+    async def ensure_subscribed(self) -> bool:
+        """Subscribe this worker to the channel.
+
+        Returns:
+            True if invalidations will be received and the cache is usable
+
+        """
+        if self.subscribed:
+            return True
+
+        try:
+            from pybase.realtime.redis_pubsub import get_pubsub_manager
+
+            pubsub = get_pubsub_manager()
+            pubsub.off_message(self.channel, self.handler)
+            pubsub.on_message(self.channel, self.handler)
+            pubsub.off_listener_stopped(self._listener_stopped)
+            pubsub.on_listener_stopped(self._listener_stopped)
+            if not await pubsub.subscribe(self.channel):
+                return False
+            if not await pubsub.start_listener():
+                return False
+        except Exception as e:
+            logger.warning(f"Error subscribing to {self.channel}: {e}")
+            return False
+
+        self.subscribed = True
+        return True
+
+    async def publish(self, scope: str, entity_id: str) -> None:
+        """Apply an invalidation here and publish it to the other workers.
+
+        Args:
+            scope: Kind of the changed entity (e.g. "table")
+            entity_id: ID of the changed entity
+
+        """
+        message = {"event": "invalidate", "scope": scope, "id": str(entity_id)}
+        self.handler(message)
+
+        try:
+            from pybase.realtime.redis_pubsub import get_pubsub_manager
+
+            await get_pubsub_manager().publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Error publishing to {self.channel}: {e}")
+
+    def _listener_stopped(self) -> None:
+        if not self.subscribed:
+            return
+        self.subscribed = False
+        self.cache.clear()
+        if self.reset is not None:
+            self.reset()
+        logger.debug(f"Dropped cache {self.cache.name}: {self.channel} listener stopped")
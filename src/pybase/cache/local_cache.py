@@ -0,0 +1,182 @@
+"""Bounded in-process LRU cache used in front of Redis."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Optional
+
+from pybase.metrics import local_cache_counter
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class LocalCache:
+    """Size-bounded LRU cache living in the worker process.
+
+    Entries are evicted least-recently-used first once either the entry
+    count or the total size exceeds its limit, and expire after ``ttl``
+    seconds. Each entry can carry tags (e.g. ``table:<id>``) so a group of
+    entries can be dropped together without scanning the cache.
+
+    ``generation`` increases on every invalidation. Callers that load a
+    value asynchronously can snapshot it first and pass it to ``set`` so a
+    value read before a concurrent invalidation is not cached.
+
+    Not safe for use across threads; it is meant to be shared by the
+    coroutines of a single event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name: Cache name, used as the metrics label
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total size of entries in bytes
+            ttl: Seconds an entry stays valid
+            clock: Monotonic clock, overridable for tests
+
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._tags: dict[str, set[Hashable]] = {}
+        self._size = 0
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached entries."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                self._remove(key)
+            local_cache_counter.labels(cache=self.name, event="miss").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        local_cache_counter.labels(cache=self.name, event="hit").inc()
+        return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        tags: Iterable[str] = (),
+        generation: Optional[int] = None,
+    ) -> bool:
+        """Cache a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the value in bytes (e.g. its serialized length)
+            tags: Tags the entry can be invalidated by
+            generation: Generation observed before the value was loaded
+
+        Returns:
+            True if cached, False if the value is larger than the whole cache
+            or an invalidation happened since ``generation``
+
+        """
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return False
+        if generation is not None and generation != self.generation:
+            return False
+
+        entry = _Entry(value, size, self._clock() + self.ttl, tuple(tags))
+        self._entries[key] = entry
+        self._size += size
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            local_cache_counter.labels(cache=self.name, event="evict").inc()
+        return True
+
+    def tagged(self, tag: str) -> list[Any]:
+        """Get the unexpired values carrying a tag, without marking them used.
+
+        Args:
+            tag: Tag to look up
+
+        Returns:
+            List of cached values
+
+        """
+        now = self._clock()
+        values = []
+        for key in self._tags.get(tag, ()):
+            entry = self._entries[key]
+            if entry.expires_at > now:
+                values.append(entry.value)
+        return values
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Drop every entry carrying a tag.
+
+        Args:
+            tag: Tag to invalidate
+
+        Returns:
+            Number of entries dropped
+
+        """
+        self.generation += 1
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.generation += 1
+        self._entries.clear()
+        self._tags.clear()
+        self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
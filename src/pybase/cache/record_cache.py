@@ -1,16 +1,34 @@
 """Redis caching for record queries."""
 
 import json
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
+from pybase.cache.invalidation import InvalidationChannel
+from pybase.cache.local_cache import LocalCache
 from pybase.core.config import settings
 from pybase.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Pages decoded from Redis, shared by every RecordCache in this worker
+local_pages = LocalCache(
+    "record_list",
+    max_entries=settings.record_cache_local_max_entries,
+    max_bytes=settings.record_cache_local_max_bytes,
+    ttl=settings.record_cache_local_ttl,
+)
+
+
+class CacheVersions(NamedTuple):
+    """Generations a page is read under (see ``RecordCache.get_versions``)."""
+
+    table: int
+    user: int
+    local: int
+
 
 class RecordCache:
     """Redis cache for record queries.
@@ -19,17 +37,47 @@ class RecordCache:
     for large datasets. Cache keys are based on table_id, user_id,
     cursor, and page_size to ensure proper cache isolation.
 
+    Invalidation is versioned: every key embeds the current generation of
+    its table and user, and invalidating bumps a single counter instead of
+    scanning the keyspace. Entries from older generations are never read
+    again and expire through their TTL. Callers read the generations with
+    ``get_versions`` before loading a page from the database and store it
+    under them, so a page loaded before a write is never cached under the
+    generation that follows it.
+
+    Hot pages are also held in an in-process LRU (``local_pages``) so repeat
+    hits skip Redis and JSON decoding. Invalidations are published on
+    ``INVALIDATION_CHANNEL`` through the realtime Redis pub/sub, and every
+    worker drops the affected local pages when it receives them (see
+    ``InvalidationChannel``).
+
     Cache TTL: 5 minutes (300 seconds) by default
     """
 
     # Cache TTL in seconds
     DEFAULT_TTL = 300
     LIST_CACHE_PREFIX = "record:list"
+    VERSION_PREFIX = "record:version"
+    # Generation of queries not scoped to a table; bumped by every table write
+    ALL_TABLES = "all"
+    INVALIDATION_CHANNEL = "cache:record:invalidate"
 
     def __init__(self) -> None:
         """Initialize Redis cache client."""
         self._redis: Optional[Redis] = None
 
+    @staticmethod
+    def _local_key(
+        table_id: Optional[str], user_id: str, cursor: Optional[str], page_size: int
+    ) -> tuple:
+        """Get the in-process cache key for a page."""
+        return (table_id or RecordCache.ALL_TABLES, user_id, page_size, cursor)
+
+    @staticmethod
+    def _local_tags(table_id: Optional[str], user_id: str) -> tuple[str, str]:
+        """Get the invalidation tags of a page in the in-process cache."""
+        return (f"table:{table_id or RecordCache.ALL_TABLES}", f"user:{user_id}")
+
     async def get_redis(self) -> Redis:
         """Get or create Redis connection.
 
@@ -56,12 +104,30 @@ class RecordCache:
             await self._redis.close()
             self._redis = None
 
+    def table_version_key(self, table_id: Optional[str]) -> str:
+        """Get the generation counter key for a table.
+
+        Args:
+            table_id: Optional table ID (None for queries across all tables)
+
+        Returns:
+            Version key string
+
+        """
+        return f"{self.VERSION_PREFIX}:table:{table_id or self.ALL_TABLES}"
+
+    def user_version_key(self, user_id: str) -> str:
+        """Get the generation counter key for a user."""
+        return f"{self.VERSION_PREFIX}:user:{user_id}"
+
     def generate_cache_key(
         self,
         table_id: Optional[str],
         user_id: str,
         cursor: Optional[str] = None,
         page_size: int = 20,
+        table_version: int = 0,
+        user_version: int = 0,
     ) -> str:
         """Generate cache key for record list query.
 
@@ -70,14 +136,50 @@ class RecordCache:
             user_id: User ID
             cursor: Optional pagination cursor
             page_size: Page size
+            table_version: Current generation of the table
+            user_version: Current generation of the user
 
         Returns:
             Cache key string
 
         """
-        table_part = table_id if table_id else "all"
+        table_part = table_id if table_id else self.ALL_TABLES
         cursor_part = cursor if cursor else "none"
-        return f"{self.LIST_CACHE_PREFIX}:{user_id}:{table_part}:{page_size}:{cursor_part}"
+        return (
+            f"{self.LIST_CACHE_PREFIX}:{user_id}:{user_version}:"
+            f"{table_part}:{table_version}:{page_size}:{cursor_part}"
+        )
+
+    async def _read_versions(
+        self, redis_client: Redis, table_id: Optional[str], user_id: str
+    ) -> CacheVersions:
+        """Read the current table and user generations."""
+        local = local_pages.generation
+        table_version, user_version = await redis_client.mget(
+            self.table_version_key(table_id), self.user_version_key(user_id)
+        )
+        return CacheVersions(int(table_version or 0), int(user_version or 0), local)
+
+    async def get_versions(self, table_id: Optional[str], user_id: str) -> Optional[CacheVersions]:
+        """Get the current generations, to be read before loading a page.
+
+        Args:
+            table_id: Optional table ID
+            user_id: User ID
+
+        Returns:
+            Generations to pass to ``set_cached_records``, or None if Redis
+            is unavailable
+
+        """
+        try:
+            redis_client = await self.get_redis()
+            if not redis_client:
+                return None
+            return await self._read_versions(redis_client, table_id, user_id)
+        except Exception as e:
+            logger.warning(f"Error reading record cache versions: {e}")
+            return None
 
     async def get_cached_records(
         self,
@@ -99,16 +201,36 @@ class RecordCache:
 
         """
         try:
+            use_local = await invalidations.ensure_subscribed()
+            local_key = self._local_key(table_id, user_id, cursor, page_size)
+            if use_local:
+                page = local_pages.get(local_key)
+                if page is not None:
+                    return page
+                generation = local_pages.generation
+
             redis_client = await self.get_redis()
             if not redis_client:
                 return None
 
-            cache_key = self.generate_cache_key(table_id, user_id, cursor, page_size)
+            versions = await self._read_versions(redis_client, table_id, user_id)
+            cache_key = self.generate_cache_key(
+                table_id, user_id, cursor, page_size, versions.table, versions.user
+            )
             cached_data = await redis_client.get(cache_key)
 
             if cached_data:
                 logger.debug(f"Cache hit: {cache_key}")
-                return json.loads(cached_data)
+                page = json.loads(cached_data)
+                if use_local:
+                    local_pages.set(
+                        local_key,
+                        page,
+                        len(cached_data),
+                        self._local_tags(table_id, user_id),
+                        generation=generation,
+                    )
+                return page
             else:
                 logger.debug(f"Cache miss: {cache_key}")
                 return None
@@ -125,6 +247,7 @@ class RecordCache:
         cursor: Optional[str] = None,
         page_size: int = 20,
         ttl: int = DEFAULT_TTL,
+        versions: Optional[CacheVersions] = None,
     ) -> bool:
         """Cache records for a query.
 
@@ -135,6 +258,8 @@ class RecordCache:
             cursor: Optional pagination cursor
             page_size: Page size
             ttl: Time to live in seconds
+            versions: Generations read (``get_versions``) before the records
+                were loaded; the current ones if omitted
 
         Returns:
             True if cached successfully, False otherwise
@@ -145,7 +270,11 @@ class RecordCache:
             if not redis_client:
                 return False
 
-            cache_key = self.generate_cache_key(table_id, user_id, cursor, page_size)
+            if versions is None:
+                versions = await self._read_versions(redis_client, table_id, user_id)
+            cache_key = self.generate_cache_key(
+                table_id, user_id, cursor, page_size, versions.table, versions.user
+            )
 
             # Serialize records for caching
             cache_data = {
@@ -164,8 +293,18 @@ class RecordCache:
                 "has_more": data.get("has_more", False),
             }
 
-            await redis_client.setex(cache_key, ttl, json.dumps(cache_data))
+            payload = json.dumps(cache_data)
+            await redis_client.setex(cache_key, ttl, payload)
             logger.debug(f"Cached data: {cache_key} (TTL: {ttl}s)")
+
+            if await invalidations.ensure_subscribed():
+                local_pages.set(
+                    self._local_key(table_id, user_id, cursor, page_size),
+                    cache_data,
+                    len(payload),
+                    self._local_tags(table_id, user_id),
+                    generation=versions.local,
+                )
             return True
 
         except Exception as e:
@@ -176,6 +315,9 @@ class RecordCache:
         """Invalidate all cache entries for a table.
 
         Called when records in a table are created, updated, or deleted.
+        Bumps the table's generation (and the cross-table one) so existing
+        entries are no longer addressed; they expire through their TTL.
+        Local pages are then dropped on every worker.
 
         Args:
             table_id: Table ID to invalidate cache for
@@ -183,26 +325,25 @@ class RecordCache:
         """
         try:
             redis_client = await self.get_redis()
-            if not redis_client:
-                return
-
-            pattern = f"{self.LIST_CACHE_PREFIX}:*:{table_id}:*"
-            keys = []
+            if redis_client:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.incr(self.table_version_key(table_id))
+                    pipe.incr(self.table_version_key(None))
+                    version, _ = await pipe.execute()
 
-            async for key in redis_client.scan_iter(match=pattern):
-                keys.append(key)
-
-            if keys:
-                await redis_client.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache entries for table {table_id}")
+                logger.debug(f"Invalidated cache for table {table_id} (version {version})")
 
         except Exception as e:
             logger.warning(f"Error invalidating table cache: {e}")
 
+        await invalidations.publish("table", table_id)
+
     async def invalidate_user_cache(self, user_id: str) -> None:
         """Invalidate all cache entries for a user.
 
-        Called when user permissions change.
+        Called when user permissions change. Bumps the user's generation so
+        existing entries are no longer addressed, then drops local pages on
+        every worker.
 
         Args:
             user_id: User ID to invalidate cache for
@@ -210,18 +351,39 @@ class RecordCache:
         """
         try:
             redis_client = await self.get_redis()
-            if not redis_client:
-                return
+            if redis_client:
+                version = await redis_client.incr(self.user_version_key(user_id))
+                logger.debug(f"Invalidated cache for user {user_id} (version {version})")
 
-            pattern = f"{self.LIST_CACHE_PREFIX}:{user_id}:*"
-            keys = []
+        except Exception as e:
+            logger.warning(f"Error invalidating user cache: {e}")
 
-            async for key in redis_client.scan_iter(match=pattern):
-                keys.append(key)
+        await invalidations.publish("user", user_id)
 
-            if keys:
-                await redis_client.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache entries for user {user_id}")
 
-        except Exception as e:
-            logger.warning(f"Error invalidating user cache: {e}")
+def handle_invalidation(message: dict[str, Any]) -> None:
+    """Drop in-process pages named by an invalidation message.
+
+    Registered as the pub/sub handler for ``RecordCache.INVALIDATION_CHANNEL``.
+    Table invalidations also drop queries not scoped to a table.
+
+    Args:
+        message: Message with "scope" ("table" or "user") and "id"
+
+    """
+    scope = message.get("scope")
+    entity_id = message.get("id")
+    if scope not in ("table", "user") or not entity_id:
+        return
+
+    dropped = local_pages.invalidate_tag(f"{scope}:{entity_id}")
+    if scope == "table":
+        dropped += local_pages.invalidate_tag(f"table:{RecordCache.ALL_TABLES}")
+    if dropped:
+        logger.debug(f"Dropped {dropped} local record pages for {scope} {entity_id}")
+
+
+# Keeps local_pages in sync across workers
+invalidations = InvalidationChannel(
+    RecordCache.INVALIDATION_CHANNEL, handle_invalidation, local_pages
+)
@@ -0,0 +1,97 @@
+"""In-process cache of the charts built on each table."""
+
+from typing import Any, Optional
+
+from pybase.cache.invalidation import InvalidationChannel
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+
+# Approximate in-memory size of one table's chart IDs
+ENTRY_SIZE = 256
+
+# Mappings shared by every TableChartsCache in this worker
+local_table_charts = LocalCache(
+    "table_charts",
+    max_entries=settings.table_charts_cache_max_entries,
+    max_bytes=settings.table_charts_cache_max_entries * ENTRY_SIZE,
+    ttl=settings.table_charts_cache_ttl,
+)
+
+
+class TableChartsCache:
+    """Cache of table ID -> IDs of the live charts reading from it.
+
+    Record changes look the mapping up to emit chart data events, so the
+    emit path does not query the database. Creating, duplicating and
+    deleting charts are published on ``INVALIDATION_CHANNEL`` through the
+    realtime Redis pub/sub, and every worker drops the table's entry when
+    it receives them (see ``InvalidationChannel``).
+    """
+
+    INVALIDATION_CHANNEL = "cache:table_charts:invalidate"
+
+    @property
+    def generation(self) -> int:
+        """Invalidation generation, observed before loading a mapping."""
+        return local_table_charts.generation
+
+    async def get(self, table_id: str) -> Optional[tuple[str, ...]]:
+        """Get the cached chart IDs of a table.
+
+        Args:
+            table_id: Table ID
+
+        Returns:
+            Chart IDs, or None if missing, expired or not subscribed
+
+        """
+        if not await invalidations.ensure_subscribed():
+            return None
+        return local_table_charts.get(str(table_id))
+
+    def set(self, table_id: str, chart_ids: tuple[str, ...], generation: int) -> None:
+        """Cache the chart IDs of a table.
+
+        Args:
+            table_id: Table ID
+            chart_ids: IDs of the table's live charts
+            generation: Generation observed before loading (drops the value
+                if an invalidation happened meanwhile)
+
+        """
+        if not invalidations.subscribed:
+            return
+        table_id = str(table_id)
+        local_table_charts.set(
+            table_id, chart_ids, ENTRY_SIZE, tags=(f"table:{table_id}",), generation=generation
+        )
+
+    async def invalidate(self, table_id: str) -> None:
+        """Drop a table's cached chart IDs everywhere.
+
+        Args:
+            table_id: Table whose charts changed
+
+        """
+        await invalidations.publish("table", table_id)
+
+
+def handle_invalidation(message: dict[str, Any]) -> None:
+    """Drop the cached chart IDs named by an invalidation message.
+
+    Registered as the pub/sub handler for ``TableChartsCache.INVALIDATION_CHANNEL``.
+
+    Args:
+        message: Message with "scope" ("table") and "id"
+
+    """
+    table_id = message.get("id")
+    if message.get("scope") != "table" or not table_id:
+        return
+    local_table_charts.invalidate_tag(f"table:{table_id}")
+
+
+# Keeps local_table_charts in sync across workers
+invalidations = InvalidationChannel(
+    TableChartsCache.INVALIDATION_CHANNEL, handle_invalidation, local_table_charts
+)
@@ -86,6 +86,10 @@ class Settings(BaseSettings):
     db_pool_size: int = Field(default=20, description="Database connection pool size")
     db_max_overflow: int = Field(default=10, description="Max overflow connections")
     db_pool_timeout: int = Field(default=30, description="Pool timeout in seconds")
+    field_index_build_timeout: float = Field(
+        default=3600.0,
+        description="Seconds a background per-field index build may take before it is abandoned",
+    )
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -128,6 +132,80 @@ class Settings(BaseSettings):
     )
     redis_max_connections: int = Field(default=50, description="Max Redis connections")
 
+    # In-process record page cache in front of Redis (per API worker)
+    record_cache_local_max_entries: int = Field(
+        default=1024, description="Max record list pages held in the in-process cache"
+    )
+    record_cache_local_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Max serialized size in bytes of the in-process record cache",
+    )
+    record_cache_local_ttl: int = Field(
+        default=30,
+        description="Seconds a page stays in the in-process cache (bounds staleness "
+        "if an invalidation message is lost)",
+    )
+
+    # In-process table access cache (per API worker)
+    access_cache_max_entries: int = Field(
+        default=10_000, description="Max (user, table) access resolutions held in process"
+    )
+    access_cache_ttl: float = Field(
+        default=10.0,
+        description="Seconds a resolved table access stays cached (bounds staleness "
+        "if an invalidation message is lost)",
+    )
+
+    # In-process authentication fast path (per API worker)
+    auth_cache_max_entries: int = Field(
+        default=10_000, description="Max authenticated principals (token/API key) held in process"
+    )
+    auth_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a resolved principal stays cached (bounds staleness if an "
+        "invalidation message is lost)",
+    )
+    token_blacklist_filter_capacity: int = Field(
+        default=100_000, description="Blacklisted tokens the in-process bloom filter is sized for"
+    )
+    token_blacklist_filter_error_rate: float = Field(
+        default=0.001,
+        description="Target false positive rate of the blacklist bloom filter (false "
+        "positives are confirmed against Redis)",
+    )
+    token_blacklist_resync_seconds: float = Field(
+        default=300.0,
+        description="Seconds between rebuilds of the blacklist bloom filter from Redis "
+        "(drops expired entries)",
+    )
+    api_key_usage_flush_seconds: float = Field(
+        default=30.0, description="Seconds between batched writes of API key usage"
+    )
+
+    # In-process table -> chart IDs mapping used by realtime chart events
+    table_charts_cache_max_entries: int = Field(
+        default=10_000, description="Max tables whose chart IDs are held in process"
+    )
+    table_charts_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a table's chart IDs stay cached (bounds staleness if an "
+        "invalidation message is lost)",
+    )
+
+    # In-process chart aggregate snapshots (per API worker)
+    chart_snapshot_max_entries: int = Field(
+        default=256, description="Max chart aggregate snapshots held in process"
+    )
+    chart_snapshot_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Max estimated size in bytes of the chart aggregate snapshots",
+    )
+    chart_snapshot_refresh_seconds: int = Field(
+        default=300,
+        description="Seconds before a chart snapshot is fully recomputed (repairs drift "
+        "from incremental updates)",
+    )
+
     @field_validator("redis_url", mode="before")
     @classmethod
     def validate_redis_url(cls, v: str, info) -> str:
@@ -229,6 +307,16 @@ class Settings(BaseSettings):
         """Get max upload size in bytes."""
         return self.max_upload_size_mb * 1024 * 1024
 
+    # Exports
+    export_linked_record_cache_max_entries: int = Field(
+        default=10000,
+        description="Max linked records kept in memory while flattening an export",
+    )
+    export_linked_record_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Max size in bytes of the linked records kept while flattening an export",
+    )
+
     # ==========================================================================
     # Authentication Settings
     # ==========================================================================
@@ -476,6 +564,47 @@ class Settings(BaseSettings):
         default=300, description="Extraction timeout in seconds"
     )
 
+    # In-process ANN index for CAD similarity search (pgvector is the fallback)
+    vector_index_enabled: bool = Field(
+        default=False, description="Answer CAD similarity queries from an in-process ANN index"
+    )
+    vector_index_path: str = Field(
+        default="./data/vector_index", description="Directory of memory-mapped index snapshots"
+    )
+    vector_index_nprobe: int = Field(
+        default=32, description="Inverted lists scanned per ANN query (recall/latency tradeoff)"
+    )
+    vector_index_rebuild_fraction: float = Field(
+        default=0.1,
+        description="Pending changes, relative to the snapshot size, that trigger a rebuild",
+    )
+    vector_index_max_staleness_seconds: float = Field(
+        default=300.0, description="Seconds a change may wait before triggering a rebuild"
+    )
+
+    # Near-duplicate aware cache of vector search results
+    vector_cache_tolerance: float = Field(
+        default=0.995, description="Cosine similarity at which a cached query is reused"
+    )
+    vector_cache_signature_bits: int = Field(
+        default=16, description="SimHash bits keying cached queries (fewer = coarser buckets)"
+    )
+    vector_cache_probe_bits: int = Field(
+        default=2, description="Least certain signature bits whose flips are also probed"
+    )
+    vector_cache_ttl_seconds: float = Field(
+        default=3600.0, description="Seconds cached vector search results stay valid"
+    )
+    vector_cache_max_entries: int = Field(
+        default=10_000, description="Max queries in the in-process vector search cache"
+    )
+    vector_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Max bytes of the in-process vector search cache"
+    )
+    vector_cache_stats_flush_seconds: float = Field(
+        default=30.0, description="Seconds between batched vector cache access statistics writes"
+    )
+
     @property
     def werk24_enabled(self) -> bool:
         """Check if Werk24 extraction is enabled."""
@@ -486,6 +615,24 @@ class Settings(BaseSettings):
     # ==========================================================================
     meilisearch_url: str | None = Field(default=None, description="Meilisearch URL")
     meilisearch_api_key: str | None = Field(default=None, description="Meilisearch API key")
+    search_index_flush_seconds: float = Field(
+        default=1.0, description="Seconds between flushes of the record indexing queue"
+    )
+    search_index_batch_size: int = Field(
+        default=500, description="Records per Meilisearch indexing request"
+    )
+    search_index_max_pending: int = Field(
+        default=100_000,
+        description="Max records waiting to be indexed per worker before the oldest are dropped",
+    )
+    search_reindex_max_in_flight: int = Field(
+        default=4, description="Max reindex batches awaiting Meilisearch at a time"
+    )
+    search_index_max_attempts: int = Field(
+        default=5,
+        description="Flushes a queued record that cannot be found is retried for before "
+        "it is removed from the index",
+    )
 
     @property
     def search_enabled(self) -> bool:
@@ -516,6 +663,27 @@ class Settings(BaseSettings):
     prometheus_port: int = Field(default=9090, description="Prometheus metrics port")
     prometheus_path: str = Field(default="/metrics", description="Prometheus metrics endpoint path")
 
+    # ==========================================================================
+    # Realtime (WebSocket) Settings
+    # ==========================================================================
+    realtime_send_queue_size: int = Field(
+        default=256, description="Max frames waiting to be sent to one WebSocket connection"
+    )
+    realtime_slow_consumer_policy: str = Field(
+        default="drop_oldest",
+        description="What to do when a connection's send queue is full: 'drop_oldest' "
+        "(discard its oldest queued frame) or 'disconnect'",
+    )
+    realtime_send_timeout: float = Field(
+        default=10.0,
+        description="Seconds a single WebSocket send may take before the connection is closed",
+    )
+    realtime_batch_window_ms: int = Field(
+        default=50,
+        description="Milliseconds record and chart events are buffered per channel and "
+        "merged before broadcasting (0 broadcasts immediately)",
+    )
+
     # ==========================================================================
     # Rate Limiting
     # ==========================================================================
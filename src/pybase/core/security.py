@@ -13,7 +13,7 @@ from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from pybase.core.config import settings
-from pybase.core.session_store import RedisSessionStore
+from pybase.core.session_store import get_session_store
 
 
 # Password hashing context using bcrypt
@@ -246,9 +246,8 @@ async def verify_token(token: str, token_type: str = "access") -> TokenPayload |
 
     # Check if token is blacklisted
     if payload.jti:
-        session_store = RedisSessionStore()
         try:
-            is_blacklisted = await session_store.is_token_blacklisted(payload.jti)
+            is_blacklisted = await get_session_store().is_token_blacklisted(payload.jti)
             if is_blacklisted:
                 return None
         except Exception:
@@ -7,6 +7,7 @@ from typing import Any, Optional
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
+from pybase.cache.auth_cache import PrincipalCache, blacklist_filter
 from pybase.core.config import settings
 from pybase.core.logging import get_logger
 
@@ -109,6 +110,10 @@ class RedisSessionStore:
                 logger.warning("Redis unavailable, allowing token (fail open)")
                 return False
 
+            # Tokens missing from the local bloom filter are not blacklisted
+            if await blacklist_filter.excludes(redis_client, self.BLACKLIST_PREFIX, token_jti):
+                return False
+
             blacklist_key = self.generate_blacklist_key(token_jti)
             blacklisted = await redis_client.exists(blacklist_key)
 
@@ -167,6 +172,8 @@ class RedisSessionStore:
                 ttl_seconds,
                 json.dumps(blacklist_data),
             )
+            # Update the blacklist filter and drop the cached principal everywhere
+            await PrincipalCache().invalidate("jwt", token_jti)
 
             logger.info(
                 f"Token {token_jti} blacklisted for user {user_id} "
@@ -430,3 +437,14 @@ class RedisSessionStore:
         # Redis automatically handles TTL expiration
         # This method exists for API compatibility and potential future use
         return 0
+
+
+_store: Optional[RedisSessionStore] = None
+
+
+def get_session_store() -> RedisSessionStore:
+    """Get the process-wide session store (one Redis connection pool per worker)."""
+    global _store
+    if _store is None:
+        _store = RedisSessionStore()
+    return _store
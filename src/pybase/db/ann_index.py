@@ -0,0 +1,734 @@
+"""
+In-process approximate nearest-neighbour index for CAD model embeddings.
+
+A NumPy inverted-file (IVF) index per embedding modality, used by
+``VectorSearchService`` to answer "find similar part" queries without a
+round trip to pgvector. Vectors are L2-normalized so inner product equals
+cosine similarity (the ``<=>`` metric of the pgvector path).
+
+The built index is a set of ``.npy`` arrays with the vectors of each
+inverted list stored contiguously, so snapshots are memory-mapped on
+load: worker startup costs a few ``open`` calls, and a query only pages
+in the lists it probes.
+
+Updates are incremental: upserts and removals go to an in-memory delta
+(searched exhaustively) and mask the superseded rows of the snapshot.
+Once the delta grows past ``vector_index_rebuild_fraction`` of the
+snapshot (or is older than ``vector_index_max_staleness_seconds``) the
+index is rebuilt off the event loop and a new snapshot is written; other
+processes pick it up within ``reload_interval``. Snapshots are written
+under a file lock, and changes are folded into the latest snapshot on
+disk, so concurrent writers don't drop each other's updates.
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+from pybase.db.session import AsyncSessionLocal
+from pybase.models.cad_model import CADModel, CADModelEmbedding
+
+logger = get_logger(__name__)
+
+# Modality -> column the vectors are loaded from
+MODALITY_COLUMNS = {
+    "sdf_latent": CADModel.deepsdf_latent,
+    "fused": CADModelEmbedding.fused_embedding,
+    "text": CADModelEmbedding.clip_text_embedding,
+    "image": CADModelEmbedding.clip_image_embedding,
+}
+MODALITIES = tuple(MODALITY_COLUMNS)
+
+# Training points per inverted list used for k-means
+_TRAINING_POINTS_PER_LIST = 64
+_KMEANS_ITERATIONS = 10
+# Rows scored per matrix product (bounds temporary memory)
+_CHUNK_ROWS = 65536
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the nearest centroid of each row, computed in chunks."""
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _CHUNK_ROWS):
+        chunk = vectors[start:start + _CHUNK_ROWS]
+        assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_centroids(vectors: np.ndarray, nlist: int, seed: int) -> np.ndarray:
+    """Spherical k-means over a sample of the vectors."""
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(vectors), nlist * _TRAINING_POINTS_PER_LIST)
+    sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=nlist)
+        # Re-seed empty lists with random points
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """Immutable inverted-file index over unit vectors (cosine similarity).
+
+    Rows are sorted by inverted list: list ``i`` holds rows
+    ``offsets[i]:offsets[i + 1]`` of ``vectors`` and ``ids``.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+    ) -> None:
+        """Initialize index.
+
+        Args:
+            centroids: Unit centroid of each inverted list, shape (nlist, dim)
+            offsets: Start row of each list plus the total, shape (nlist + 1,)
+            vectors: Unit vectors sorted by list, shape (n, dim)
+            ids: Model ID of each row, shape (n,)
+
+        """
+        self.centroids = centroids
+        self.offsets = offsets
+        self.vectors = vectors
+        self.ids = ids
+        self._positions: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        """Vector dimension."""
+        return int(self.vectors.shape[1])
+
+    @property
+    def positions(self) -> dict[str, int]:
+        """Model ID -> row, built on first use."""
+        if self._positions is None:
+            self._positions = {str(model_id): row for row, model_id in enumerate(self.ids)}
+        return self._positions
+
+    @classmethod
+    def build(
+        cls,
+        ids: list[str],
+        vectors: np.ndarray,
+        nlist: int | None = None,
+        seed: int = 0,
+    ) -> "IVFIndex":
+        """Train the coarse quantizer and bucket the vectors.
+
+        Args:
+            ids: Model ID of each vector
+            vectors: Vectors, shape (n, dim)
+            nlist: Number of inverted lists (default ``sqrt(n)``)
+            seed: Random seed for k-means
+
+        Returns:
+            Built index
+
+        """
+        vectors = _normalize(vectors)
+        n = len(ids)
+        if nlist is None:
+            nlist = int(np.sqrt(n))
+        nlist = max(1, min(nlist, n))
+
+        centroids = _train_centroids(vectors, nlist, seed) if n else np.zeros(
+            (1, vectors.shape[1] if vectors.ndim == 2 else 0), dtype=np.float32
+        )
+        assignments = _assign(vectors, centroids) if n else np.zeros(0, dtype=np.int32)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=len(centroids))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        id_array = np.asarray(ids, dtype=str) if n else np.zeros(0, dtype="U1")
+        return cls(centroids, offsets, vectors[order], id_array[order])
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        nprobe: int,
+        exclude: set[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the rows most similar to a unit query vector.
+
+        Args:
+            query: Unit query vector
+            k: Number of results
+            nprobe: Number of inverted lists to scan
+            exclude: Model IDs to skip (superseded or removed rows)
+
+        Returns:
+            (model_id, cosine similarity) pairs, most similar first
+
+        """
+        if not len(self) or k <= 0:
+            return []
+
+        nprobe = max(1, min(nprobe, len(self.centroids)))
+        probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        spans = [
+            (int(self.offsets[i]), int(self.offsets[i + 1]))
+            for i in probe
+            if self.offsets[i + 1] > self.offsets[i]
+        ]
+        if not spans:
+            return []
+        # Lists are contiguous, so each list is one sequential read of the file
+        rows = np.concatenate([np.arange(start, end) for start, end in spans])
+        scores = np.concatenate([self.vectors[start:end] @ query for start, end in spans])
+
+        wanted = min(len(scores), k + len(exclude or ()))
+        top = np.argpartition(-scores, wanted - 1)[:wanted]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for position in top:
+            model_id = str(self.ids[rows[position]])
+            if exclude and model_id in exclude:
+                continue
+            results.append((model_id, float(scores[position])))
+            if len(results) == k:
+                break
+        return results
+
+    def save(self, directory: Path) -> None:
+        """Write the index arrays to a directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "centroids.npy", self.centroids)
+        np.save(directory / "offsets.npy", self.offsets)
+        np.save(directory / "vectors.npy", np.ascontiguousarray(self.vectors))
+        np.save(directory / "ids.npy", self.ids)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "IVFIndex":
+        """Load an index written by ``save``.
+
+        Args:
+            directory: Snapshot directory
+            mmap: Memory-map the vectors instead of reading them
+
+        Returns:
+            Loaded index
+
+        """
+        return cls(
+            np.load(directory / "centroids.npy"),
+            np.load(directory / "offsets.npy"),
+            np.load(directory / "vectors.npy", mmap_mode="r" if mmap else None),
+            np.load(directory / "ids.npy"),
+        )
+
+
+class VectorIndex:
+    """IVF snapshot of one modality plus the in-memory delta of later changes."""
+
+    def __init__(self, modality: str, base: IVFIndex | None = None) -> None:
+        """Initialize index.
+
+        Args:
+            modality: Embedding modality (see ``MODALITIES``)
+            base: Built snapshot, if any
+
+        """
+        self.modality = modality
+        self.base = base
+        self.version: str | None = None
+        # model_id -> unit vector upserted since the snapshot
+        self.delta: dict[str, np.ndarray] = {}
+        # Models removed since the snapshot
+        self.removed: set[str] = set()
+        self._delta_matrix: tuple[list[str], np.ndarray] | None = None
+        self._pending_since: float | None = None
+
+    def __len__(self) -> int:
+        base_rows = len(self.base) if self.base is not None else 0
+        return base_rows + len(self.delta)
+
+    @property
+    def pending(self) -> int:
+        """Number of changes not yet in the snapshot."""
+        return len(self.delta) + len(self.removed)
+
+    def upsert(self, model_id: str, vector: Iterable[float]) -> None:
+        """Add or replace the vector of a model."""
+        self.delta[str(model_id)] = _normalize(np.asarray(vector, dtype=np.float32))
+        self.removed.discard(str(model_id))
+        self._changed()
+
+    def remove(self, model_id: str) -> None:
+        """Remove a model from the index."""
+        in_delta = self.delta.pop(str(model_id), None) is not None
+        in_base = self.base is not None and str(model_id) in self.base.positions
+        if in_base:
+            self.removed.add(str(model_id))
+        if in_delta or in_base:
+            self._changed()
+
+    def search(self, query: np.ndarray, k: int, nprobe: int) -> list[tuple[str, float]]:
+        """Find the models most similar to a unit query vector.
+
+        Args:
+            query: Unit query vector
+            k: Number of results
+            nprobe: Inverted lists of the snapshot to scan
+
+        Returns:
+            (model_id, cosine similarity) pairs, most similar first
+
+        """
+        results: list[tuple[str, float]] = []
+        if self.base is not None:
+            exclude = self.removed | self.delta.keys() if self.pending else None
+            results = self.base.search(query, k, nprobe, exclude)
+
+        if self.delta:
+            ids, matrix = self._delta_vectors()
+            scores = matrix @ query
+            top = np.argsort(-scores)[:k]
+            results.extend((ids[i], float(scores[i])) for i in top)
+            results.sort(key=lambda item: item[1], reverse=True)
+        return results[:k]
+
+    def needs_rebuild(self, fraction: float, max_staleness: float) -> bool:
+        """Whether the delta is large or old enough to fold into a new snapshot."""
+        if not self.pending:
+            return False
+        base_rows = len(self.base) if self.base is not None else 0
+        if self.pending > fraction * base_rows:
+            return True
+        return (
+            self._pending_since is not None
+            and time.monotonic() - self._pending_since > max_staleness
+        )
+
+    def merged(self) -> tuple[list[str], np.ndarray]:
+        """All current (model_id, vector) pairs: live snapshot rows plus the delta."""
+        ids: list[str] = []
+        blocks: list[np.ndarray] = []
+        if self.base is not None and len(self.base):
+            stale = self.removed | self.delta.keys()
+            keep = np.array([str(model_id) not in stale for model_id in self.base.ids])
+            ids.extend(str(model_id) for model_id in self.base.ids[keep])
+            blocks.append(np.asarray(self.base.vectors)[keep])
+        if self.delta:
+            delta_ids, matrix = self._delta_vectors()
+            ids.extend(delta_ids)
+            blocks.append(matrix)
+        if not blocks:
+            return [], np.zeros((0, 0), dtype=np.float32)
+        return ids, np.concatenate(blocks)
+
+    def replace_base(
+        self,
+        base: IVFIndex,
+        folded_delta: dict[str, np.ndarray],
+        folded_removed: set[str],
+        version: str | None = None,
+    ) -> None:
+        """Swap in a rebuilt snapshot, keeping changes made while it was built.
+
+        Args:
+            base: New snapshot
+            folded_delta: Delta the snapshot was built from
+            folded_removed: Removals the snapshot was built from
+            version: Snapshot version written to disk
+
+        """
+        self.base = base
+        self.version = version
+        for model_id, vector in folded_delta.items():
+            if self.delta.get(model_id) is vector:
+                del self.delta[model_id]
+        self.removed -= folded_removed
+        if self.removed:
+            self.removed = {model_id for model_id in self.removed if model_id in base.positions}
+        self._delta_matrix = None
+        self._pending_since = time.monotonic() if self.pending else None
+
+    def _changed(self) -> None:
+        self._delta_matrix = None
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+
+    def _delta_vectors(self) -> tuple[list[str], np.ndarray]:
+        if self._delta_matrix is None:
+            ids = list(self.delta)
+            self._delta_matrix = (ids, np.stack([self.delta[i] for i in ids]))
+        return self._delta_matrix
+
+
+class CADVectorIndex:
+    """Per-modality in-process ANN indexes with on-disk snapshots.
+
+    Snapshots live in ``<path>/<modality>/<version>/``; the ``CURRENT``
+    file of a modality names the active version and is replaced
+    atomically, so readers never see a partially written snapshot.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        nprobe: int | None = None,
+        rebuild_fraction: float | None = None,
+        max_staleness: float | None = None,
+        reload_interval: float = 30.0,
+    ) -> None:
+        """Initialize index set.
+
+        Args:
+            path: Snapshot directory
+            nprobe: Inverted lists scanned per query
+            rebuild_fraction: Delta size (relative to the snapshot) that triggers a rebuild
+            max_staleness: Seconds a change may wait before triggering a rebuild
+            reload_interval: Seconds between checks for snapshots written by other processes
+
+        """
+        self.path = Path(path or settings.vector_index_path)
+        self.nprobe = nprobe or settings.vector_index_nprobe
+        self.rebuild_fraction = (
+            rebuild_fraction
+            if rebuild_fraction is not None
+            else settings.vector_index_rebuild_fraction
+        )
+        self.max_staleness = (
+            max_staleness
+            if max_staleness is not None
+            else settings.vector_index_max_staleness_seconds
+        )
+        self.reload_interval = reload_interval
+        self.indexes = {modality: VectorIndex(modality) for modality in MODALITIES}
+        self._last_reload_check = 0.0
+        self._rebuild_task: asyncio.Task | None = None
+        self._maintenance_task: asyncio.Task | None = None
+
+    def is_ready(self, modality: str) -> bool:
+        """Whether the modality has any vectors to search."""
+        self.reload_if_changed()
+        index = self.indexes.get(modality)
+        return index is not None and len(index) > 0
+
+    def search(
+        self,
+        modality: str,
+        query_vector: Iterable[float],
+        k: int,
+        nprobe: int | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find the models most similar to a query vector.
+
+        Args:
+            modality: Embedding modality
+            query_vector: Query vector (normalized here)
+            k: Number of results
+            nprobe: Inverted lists to scan (default from settings)
+
+        Returns:
+            (model_id, cosine similarity) pairs, most similar first
+
+        Raises:
+            ValueError: If the modality is unknown or the dimension doesn't match
+
+        """
+        if modality not in self.indexes:
+            raise ValueError(f"Unknown vector index modality: {modality}")
+        self.reload_if_changed()
+        query = _normalize(np.asarray(query_vector, dtype=np.float32).ravel())
+        index = self.indexes[modality]
+        if index.base is not None and len(index.base) and index.base.dim != len(query):
+            raise ValueError(
+                f"Query dimension {len(query)} doesn't match {modality} index ({index.base.dim})"
+            )
+        return index.search(query, k, nprobe or self.nprobe)
+
+    def update_model(self, model_id: str, vectors: dict[str, Any]) -> None:
+        """Apply the stored embeddings of a model to the indexes.
+
+        Args:
+            model_id: CAD model ID
+            vectors: Modality -> vector (None removes the model from that modality)
+
+        """
+        for modality, vector in vectors.items():
+            index = self.indexes.get(modality)
+            if index is None:
+                continue
+            if vector is None or len(vector) == 0:
+                index.remove(model_id)
+            else:
+                index.upsert(model_id, vector)
+        self.schedule_rebuild()
+
+    def remove_model(self, model_id: str) -> None:
+        """Remove a model from every modality."""
+        for index in self.indexes.values():
+            index.remove(model_id)
+        self.schedule_rebuild()
+
+    def schedule_rebuild(self) -> None:
+        """Start a background rebuild if a modality's delta has grown enough."""
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            return
+        stale = [
+            modality
+            for modality, index in self.indexes.items()
+            if index.needs_rebuild(self.rebuild_fraction, self.max_staleness)
+        ]
+        if not stale:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._rebuild_task = loop.create_task(self.rebuild(stale))
+
+    def start(self) -> None:
+        """Periodically reload snapshots and rebuild stale deltas (application startup).
+
+        Without it, staleness is only checked when a model changes and
+        snapshots of other processes are only loaded when a query comes in.
+        """
+        if self._maintenance_task is not None and not self._maintenance_task.done():
+            return
+        self._maintenance_task = asyncio.get_running_loop().create_task(self._maintain())
+
+    async def stop(self) -> None:
+        """Stop the periodic maintenance (application shutdown)."""
+        for task in (self._maintenance_task, self._rebuild_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._maintenance_task = None
+        self._rebuild_task = None
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                self.reload_if_changed()
+                self.schedule_rebuild()
+            except Exception as e:
+                logger.warning(f"CAD vector index maintenance failed: {e}")
+
+    async def rebuild(self, modalities: Iterable[str] | None = None) -> None:
+        """Fold the deltas into new snapshots (built off the event loop) and save them.
+
+        Args:
+            modalities: Modalities to rebuild (default: all with pending changes)
+
+        """
+        for modality in modalities or MODALITIES:
+            index = self.indexes[modality]
+            folded_delta = dict(index.delta)
+            folded_removed = set(index.removed)
+            ids, vectors = index.merged()
+            try:
+                base, version = await asyncio.to_thread(
+                    self._build_and_save,
+                    modality,
+                    ids,
+                    vectors,
+                    (index.version, folded_delta, folded_removed),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to rebuild {modality} vector index: {e}")
+                continue
+            index.replace_base(base, folded_delta, folded_removed, version)
+            logger.info(f"Rebuilt {modality} vector index with {len(base)} vectors")
+
+    async def load_from_database(self, db: AsyncSession, batch_size: int = 1000) -> None:
+        """Build every modality from the embeddings stored in PostgreSQL.
+
+        Args:
+            db: Database session
+            batch_size: Rows fetched per round trip
+
+        """
+        columns = [column.label(modality) for modality, column in MODALITY_COLUMNS.items()]
+        query = (
+            select(CADModel.id, *columns)
+            .outerjoin(CADModelEmbedding, CADModelEmbedding.cad_model_id == CADModel.id)
+            .where(CADModel.deleted_at.is_(None))
+            .execution_options(yield_per=batch_size)
+        )
+
+        collected: dict[str, tuple[list[str], list[Any]]] = {
+            modality: ([], []) for modality in MODALITIES
+        }
+        result = await db.stream(query)
+        async for row in result:
+            for modality in MODALITIES:
+                vector = getattr(row, modality)
+                if vector:
+                    collected[modality][0].append(str(row.id))
+                    collected[modality][1].append(vector)
+
+        for modality, (ids, vectors) in collected.items():
+            matrix = np.asarray(vectors, dtype=np.float32) if ids else np.zeros((0, 0))
+            base, version = await asyncio.to_thread(self._build_and_save, modality, ids, matrix)
+            index = self.indexes[modality]
+            index.replace_base(base, dict(index.delta), set(index.removed), version)
+
+    async def bootstrap(self) -> None:
+        """Build every modality from PostgreSQL in a session of its own."""
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.load_from_database(db)
+        except Exception as e:
+            logger.warning(f"Failed to build the CAD vector index: {e}")
+
+    def load(self, mmap: bool = True) -> bool:
+        """Load the current snapshot of every modality from disk.
+
+        Args:
+            mmap: Memory-map the vectors
+
+        Returns:
+            True if at least one modality was loaded
+
+        """
+        loaded = False
+        for modality, index in self.indexes.items():
+            version = self._current_version(modality)
+            if version is None or version == index.version:
+                loaded = loaded or index.base is not None
+                continue
+            try:
+                base = IVFIndex.load(self.path / modality / version, mmap=mmap)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load {modality} vector index {version}: {e}")
+                continue
+            index.replace_base(base, {}, set(), version)
+            loaded = True
+        return loaded
+
+    def reload_if_changed(self) -> None:
+        """Load snapshots written by other processes (at most every ``reload_interval``)."""
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        self._last_reload_check = now
+        self.load()
+
+    def _current_version(self, modality: str) -> str | None:
+        try:
+            return (self.path / modality / "CURRENT").read_text().strip() or None
+        except OSError:
+            return None
+
+    def _build_and_save(
+        self,
+        modality: str,
+        ids: list[str],
+        vectors: np.ndarray,
+        changes: tuple[str | None, dict[str, np.ndarray], set[str]] | None = None,
+    ) -> tuple[IVFIndex, str]:
+        """Build a snapshot, write it and make it current (runs in a worker thread).
+
+        Args:
+            modality: Embedding modality
+            ids: Model IDs of the snapshot
+            vectors: Unit vectors of the snapshot
+            changes: (version the delta applies to, delta, removals); if another
+                process has made a newer snapshot current, the delta and
+                removals are applied to that one instead of ``ids``/``vectors``
+
+        Returns:
+            Saved snapshot and its version
+
+        """
+        directory = self.path / modality
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._snapshot_lock(directory):
+            current = self._current_version(modality)
+            if changes is not None and current is not None and current != changes[0]:
+                latest = VectorIndex(modality, IVFIndex.load(directory / current))
+                latest.delta, latest.removed = changes[1], changes[2]
+                ids, vectors = latest.merged()
+
+            base = IVFIndex.build(ids, vectors)
+            version = f"{time.time_ns():x}-{os.getpid()}"
+            base.save(directory / version)
+            (directory / version / "manifest.json").write_text(
+                json.dumps({"modality": modality, "count": len(base), "dim": base.dim})
+            )
+
+            current_file = directory / f"CURRENT.{os.getpid()}.tmp"
+            current_file.write_text(version)
+            os.replace(current_file, directory / "CURRENT")
+            self._prune(directory, keep={version})
+        return IVFIndex.load(directory / version), version
+
+    @staticmethod
+    @contextmanager
+    def _snapshot_lock(directory: Path) -> Iterator[None]:
+        """Serialize snapshot writes of a modality across processes."""
+        with open(directory / "LOCK", "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _prune(directory: Path, keep: set[str], retain: int = 2) -> None:
+        """Delete old snapshots (open memory maps of them stay valid)."""
+        versions = sorted(
+            (entry for entry in directory.iterdir() if entry.is_dir()),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in versions[retain:]:
+            if entry.name not in keep:
+                shutil.rmtree(entry, ignore_errors=True)
+
+
+_index: CADVectorIndex | None = None
+
+
+def get_cad_vector_index() -> CADVectorIndex | None:
+    """Get the process-wide CAD vector index, or None if it is disabled."""
+    global _index
+    if not settings.vector_index_enabled:
+        return None
+    if _index is None:
+        _index = CADVectorIndex()
+        _index.load()
+    return _index
@@ -0,0 +1,53 @@
+"""
+Planner-based row count estimates.
+
+``SELECT count(*)`` over a selective full-text or substring match has to
+visit every matching row. For "about N results" counts the planner's
+estimate (``EXPLAIN``) is enough and costs a plan, not a scan.
+"""
+
+import json
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement (without executing it)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        """Initialize construct.
+
+        Args:
+            statement: Statement to plan
+
+        """
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_row_count(db: AsyncSession, query: Any) -> int:
+    """Estimate the number of rows a query returns from its plan.
+
+    Args:
+        db: Database session
+        query: SELECT statement (without LIMIT)
+
+    Returns:
+        Planner estimate of the number of rows
+
+    """
+    result = await db.execute(Explain(query))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
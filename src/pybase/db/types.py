@@ -0,0 +1,43 @@
+"""
+Custom SQLAlchemy column types.
+"""
+
+import json
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONBText(TypeDecorator[str]):
+    """
+    JSONB column exposed to Python as serialized JSON text.
+
+    The database stores native JSONB (so it can be indexed and queried
+    without casts) while model attributes keep their JSON string
+    representation. Dicts are also accepted when binding.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Any:
+        """Pass JSON text through as-is; serialize anything else."""
+
+        def process(value: Any) -> Any:
+            if value is None or isinstance(value, str):
+                return value
+            return json.dumps(value)
+
+        return process
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> Any:
+        """Return JSON text whether the driver decoded the value or not."""
+
+        def process(value: Any) -> Any:
+            if value is None or isinstance(value, str):
+                return value
+            return json.dumps(value)
+
+        return process
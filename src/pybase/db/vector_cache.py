@@ -0,0 +1,307 @@
+"""
+Near-duplicate aware cache of CAD similarity search results.
+
+Query vectors are keyed by a SimHash signature: the sign bits of their
+projections onto fixed random hyperplanes. Nearby vectors share most bits,
+so a lookup probes the query's signature plus the variants with its least
+certain bits flipped, and accepts a cached query whose cosine similarity
+to the new one is at least ``vector_cache_tolerance``. Repeated "find
+similar" clicks on near-identical embeddings then share one result set.
+
+Two layers:
+
+- an in-process ``LocalCache`` (LRU with TTL) holding the unit query
+  vector and results of each cached query, tagged by signature
+- the ``vector_search_cache`` table, one row per signature, shared by
+  workers and read in a single query for all probed signatures
+
+Reads never write. Access statistics (``access_count``/``accessed_at``)
+are accumulated in memory and flushed in one ``UPDATE`` per
+``vector_cache_stats_flush_seconds``.
+"""
+
+import hashlib
+import itertools
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fixed so signatures are stable across processes and restarts
+_HYPERPLANE_SEED = 0x5EED
+
+
+@lru_cache(maxsize=16)
+def _hyperplanes(bits: int, dim: int) -> np.ndarray:
+    """Random hyperplanes of a signature size and vector dimension."""
+    return np.random.default_rng(_HYPERPLANE_SEED).standard_normal((bits, dim)).astype(np.float32)
+
+
+def _unit(vector: Any) -> np.ndarray | None:
+    """Vector scaled to unit length, or None for the zero vector."""
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else None
+
+
+@dataclass(frozen=True)
+class CachedQuery:
+    """A cached query vector with its results."""
+
+    # Key of the signature row in vector_search_cache
+    query_hash: bytes
+    vector: np.ndarray
+    model_ids: list[Any]
+    distances: list[float]
+
+
+class VectorQueryCache:
+    """Two-layer semantic cache of vector search results."""
+
+    def __init__(
+        self,
+        tolerance: float | None = None,
+        signature_bits: int | None = None,
+        probe_bits: int | None = None,
+        local: LocalCache | None = None,
+        stats_flush_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            tolerance: Minimum cosine similarity for a cached query to match
+            signature_bits: Hyperplanes in a signature (fewer = coarser buckets)
+            probe_bits: Least certain bits whose flips are probed as well
+            local: In-process layer, created from settings if not given
+            stats_flush_interval: Seconds between access statistics flushes
+            clock: Monotonic clock, overridable for tests
+
+        """
+        self.tolerance = tolerance if tolerance is not None else settings.vector_cache_tolerance
+        self.signature_bits = signature_bits or settings.vector_cache_signature_bits
+        self.probe_bits = probe_bits if probe_bits is not None else settings.vector_cache_probe_bits
+        self.local = local or LocalCache(
+            "vector_search",
+            max_entries=settings.vector_cache_max_entries,
+            max_bytes=settings.vector_cache_max_bytes,
+            ttl=settings.vector_cache_ttl_seconds,
+        )
+        self.stats_flush_interval = (
+            stats_flush_interval
+            if stats_flush_interval is not None
+            else settings.vector_cache_stats_flush_seconds
+        )
+        self._clock = clock
+        # query_hash -> (hits, last access) not yet written to the table
+        self._pending_stats: dict[bytes, tuple[int, datetime]] = {}
+        self._last_flush = clock()
+
+    # ==========================================================================
+    # Keys
+    # ==========================================================================
+
+    def probe_hashes(self, scope: str, vector: np.ndarray) -> list[bytes]:
+        """Keys of the query's signature and of its nearest variants.
+
+        Args:
+            scope: Search the results belong to (method, filters, limit)
+            vector: Unit query vector
+
+        Returns:
+            Row keys, the query's own signature first
+
+        """
+        projections = _hyperplanes(self.signature_bits, len(vector)) @ vector
+        signature = projections > 0
+        uncertain = np.argsort(np.abs(projections))[: self.probe_bits]
+
+        hashes = []
+        for count in range(len(uncertain) + 1):
+            for flipped in itertools.combinations(uncertain, count):
+                variant = signature.copy()
+                variant[list(flipped)] ^= True
+                hashes.append(self._hash(scope, variant))
+        return hashes
+
+    @staticmethod
+    def _hash(scope: str, signature: np.ndarray) -> bytes:
+        return hashlib.sha256(scope.encode() + b"\0" + np.packbits(signature).tobytes()).digest()
+
+    # ==========================================================================
+    # Lookup and Store
+    # ==========================================================================
+
+    async def get(
+        self, session: AsyncSession, scope: str, vector: np.ndarray
+    ) -> CachedQuery | None:
+        """Find cached results of a near-identical query.
+
+        Args:
+            session: Database session (used on local misses and for stats flushes)
+            scope: Search the results belong to
+            vector: Query vector (any scale)
+
+        Returns:
+            The closest cached query within tolerance, or None
+
+        """
+        vector = _unit(vector)
+        if vector is None:
+            return None
+        hashes = self.probe_hashes(scope, vector)
+
+        cached = self._best(
+            vector, [entry for h in hashes for entry in self.local.tagged(h.hex())]
+        )
+        if cached is None:
+            cached = await self._load(session, hashes, vector)
+            if cached is not None:
+                self._remember(cached)
+        else:
+            # Mark as recently used in the LRU
+            self.local.get(cached.query_hash)
+
+        if cached is not None:
+            self._record_access(cached.query_hash)
+        await self.maybe_flush_stats(session)
+        return cached
+
+    async def put(
+        self,
+        session: AsyncSession,
+        scope: str,
+        vector: np.ndarray,
+        model_ids: list[Any],
+        distances: list[float],
+    ) -> None:
+        """Cache the results of a query under its signature.
+
+        Args:
+            session: Database session
+            scope: Search the results belong to
+            vector: Query vector (any scale)
+            model_ids: Result model IDs, best first
+            distances: Cosine distance of each result
+
+        """
+        vector = _unit(vector)
+        if vector is None:
+            return
+        query_hash = self.probe_hashes(scope, vector)[0]
+        cached = CachedQuery(query_hash, vector, list(model_ids), list(distances))
+        self._remember(cached)
+
+        await session.execute(text("""
+            INSERT INTO vector_search_cache
+            (query_hash, query_vector, result_ids, result_distances, created_at, accessed_at, access_count)
+            VALUES (:query_hash, :query_vector, :result_ids, :result_distances, NOW(), NOW(), 1)
+            ON CONFLICT (query_hash) DO UPDATE
+            SET query_vector = EXCLUDED.query_vector,
+                result_ids = EXCLUDED.result_ids,
+                result_distances = EXCLUDED.result_distances,
+                created_at = NOW(),
+                accessed_at = NOW()
+        """), {
+            "query_hash": query_hash,
+            "query_vector": vector.tolist(),
+            "result_ids": cached.model_ids,
+            "result_distances": cached.distances,
+        })
+
+    async def maybe_flush_stats(self, session: AsyncSession) -> None:
+        """Flush access statistics if the flush interval has passed."""
+        if self._clock() - self._last_flush >= self.stats_flush_interval:
+            await self.flush_stats(session)
+
+    async def flush_stats(self, session: AsyncSession) -> None:
+        """Write accumulated access statistics in a single statement."""
+        self._last_flush = self._clock()
+        if not self._pending_stats:
+            return
+        pending, self._pending_stats = self._pending_stats, {}
+
+        try:
+            await session.execute(text("""
+                UPDATE vector_search_cache AS c
+                SET access_count = c.access_count + s.hits,
+                    accessed_at = GREATEST(c.accessed_at, s.accessed_at)
+                FROM unnest(
+                    CAST(:hashes AS bytea[]),
+                    CAST(:hits AS integer[]),
+                    CAST(:accessed AS timestamptz[])
+                ) AS s(query_hash, hits, accessed_at)
+                WHERE c.query_hash = s.query_hash
+            """), {
+                "hashes": list(pending),
+                "hits": [hits for hits, _ in pending.values()],
+                "accessed": [accessed for _, accessed in pending.values()],
+            })
+        except Exception as e:
+            # Statistics only drive cleanup; losing a batch is harmless
+            logger.warning(f"Failed to flush vector cache statistics: {e}")
+
+    # ==========================================================================
+    # Internals
+    # ==========================================================================
+
+    def _best(self, vector: np.ndarray, candidates: list[CachedQuery]) -> CachedQuery | None:
+        best, best_similarity = None, self.tolerance
+        for candidate in candidates:
+            if candidate.vector.shape != vector.shape:
+                continue
+            similarity = float(candidate.vector @ vector)
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        return best
+
+    async def _load(
+        self, session: AsyncSession, hashes: list[bytes], vector: np.ndarray
+    ) -> CachedQuery | None:
+        result = await session.execute(text("""
+            SELECT query_hash, query_vector, result_ids, result_distances
+            FROM vector_search_cache
+            WHERE query_hash = ANY(:hashes)
+              AND created_at > NOW() - make_interval(secs => :ttl)
+        """), {"hashes": hashes, "ttl": self.local.ttl})
+
+        candidates = [
+            CachedQuery(
+                bytes(row.query_hash),
+                np.asarray(row.query_vector, dtype=np.float32),
+                list(row.result_ids or []),
+                list(row.result_distances or []),
+            )
+            for row in result.fetchall()
+        ]
+        return self._best(vector, candidates)
+
+    def _remember(self, cached: CachedQuery) -> None:
+        size = cached.vector.nbytes + 64 * len(cached.model_ids)
+        self.local.set(cached.query_hash, cached, size, tags=(cached.query_hash.hex(),))
+
+    def _record_access(self, query_hash: bytes) -> None:
+        hits, _ = self._pending_stats.get(query_hash, (0, None))
+        self._pending_stats[query_hash] = (hits + 1, datetime.now(timezone.utc))
+
+
+_cache: VectorQueryCache | None = None
+
+
+def get_vector_query_cache() -> VectorQueryCache:
+    """Get the process-wide vector query cache."""
+    global _cache
+    if _cache is None:
+        _cache = VectorQueryCache()
+    return _cache
@@ -15,6 +15,9 @@ from sqlalchemy.exc import DataError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.logging import get_logger
+from pybase.db.ann_index import CADVectorIndex, get_cad_vector_index
+from pybase.db.vector_cache import VectorQueryCache, get_vector_query_cache
+from pybase.metrics import vector_search_counter
 
 logger = get_logger(__name__)
 
@@ -51,7 +54,9 @@ class VectorSearchService:
     Service for executing optimized vector similarity searches.
 
     Uses pgvector HNSW indexes with adaptive ef_search parameters
-    for optimal performance/recall tradeoff.
+    for optimal performance/recall tradeoff. When the in-process ANN index
+    is enabled and loaded, shape candidates come from it instead and only
+    the reranking runs in SQL.
     """
 
     # Default index parameters from CosCAD optimization
@@ -64,8 +69,18 @@ class VectorSearchService:
     CLIP_DIM = 512
     GEOMETRY_DIM = 1024
 
-    def __init__(self, session: AsyncSession):
+    # Shape candidates reranked per query (the pgvector path's candidate CTE)
+    CANDIDATE_POOL = 1000
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        ann_index: CADVectorIndex | None = None,
+        query_cache: VectorQueryCache | None = None,
+    ):
         self.session = session
+        self.ann_index = ann_index if ann_index is not None else get_cad_vector_index()
+        self.query_cache = query_cache or get_vector_query_cache()
 
     async def multi_modal_search(
         self,
@@ -86,6 +101,13 @@ class VectorSearchService:
             allow_empty=False,
         )
 
+        if self.ann_index is not None and self.ann_index.is_ready("sdf_latent"):
+            results = await self._ann_multi_modal_search(query_vector, params)
+            if results is not None:
+                vector_search_counter.labels(path="ann").inc()
+                return results
+        vector_search_counter.labels(path="pgvector").inc()
+
         # Set adaptive ef_search if specified
         if params.ef_search:
             await self._set_ef_search(params.ef_search)
@@ -156,6 +178,93 @@ class VectorSearchService:
             for row in rows
         ]
 
+    async def _ann_multi_modal_search(
+        self,
+        query_vector: list[float],
+        params: VectorSearchParams,
+    ) -> list[VectorSearchResult] | None:
+        """
+        Multi-modal search with shape candidates from the in-process ANN index.
+
+        Returns:
+            Results, or None if filters left too few candidates to be sure the
+            pgvector path wouldn't find more
+
+        Raises:
+            VectorValidationError: If the query doesn't match the index dimension
+        """
+        try:
+            # Probing a few lists is sub-millisecond; no need to leave the loop
+            candidates = self.ann_index.search("sdf_latent", query_vector, self.CANDIDATE_POOL)
+        except ValueError as e:
+            raise VectorValidationError(str(e))
+
+        matches = [
+            (model_id, similarity)
+            for model_id, similarity in candidates
+            if similarity > params.min_similarity
+        ]
+        if not matches:
+            return []
+
+        # The ORM schema stores embeddings as float8[], so the B-Rep cosine
+        # similarity is computed over the arrays rather than with pgvector
+        sql = text("""
+            SELECT
+                c.model_id,
+                cm.category_label AS part_family,
+                cm.material,
+                cm.mass_kg,
+                c.shape_similarity,
+                c.shape_rank,
+                0.7 * c.shape_similarity + 0.3 * COALESCE((
+                    SELECT sum(v.a * v.b) / NULLIF(sqrt(sum(v.a * v.a) * sum(v.b * v.b)), 0)
+                    FROM unnest(e.brep_graph_embedding, CAST(:query_vector AS float8[]))
+                        AS v(a, b)
+                    WHERE cardinality(e.brep_graph_embedding)
+                        = cardinality(CAST(:query_vector AS float8[]))
+                ), 0.5) AS composite_score
+            FROM unnest(CAST(:model_ids AS uuid[]), CAST(:similarities AS float8[]))
+                WITH ORDINALITY AS c(model_id, shape_similarity, shape_rank)
+            JOIN cad_models cm ON cm.id = c.model_id
+            LEFT JOIN cad_model_embeddings e
+                ON e.cad_model_id = cm.id AND e.deleted_at IS NULL
+            WHERE cm.deleted_at IS NULL
+              AND (CAST(:material_filter AS text) IS NULL OR cm.material = :material_filter)
+              AND (CAST(:part_family AS text) IS NULL OR cm.category_label = :part_family)
+            ORDER BY composite_score DESC
+            LIMIT :limit
+        """)
+
+        try:
+            result = await self.session.execute(sql, {
+                "query_vector": query_vector,
+                "model_ids": [model_id for model_id, _ in matches],
+                "similarities": [similarity for _, similarity in matches],
+                "material_filter": params.material_filter,
+                "part_family": params.part_family_filter,
+                "limit": params.limit,
+            })
+        except DataError as e:
+            raise VectorValidationError(f"Invalid query vector: {e}")
+
+        rows = result.fetchall()
+        filtered = params.material_filter is not None or params.part_family_filter is not None
+        if filtered and len(rows) < params.limit and len(candidates) == self.CANDIDATE_POOL:
+            return None
+
+        return [
+            VectorSearchResult(
+                model_id=row.model_id,
+                similarity=row.composite_score,
+                part_family=row.part_family,
+                material=row.material,
+                mass_kg=row.mass_kg,
+                metadata={"shape_similarity": row.shape_similarity, "rank": row.shape_rank},
+            )
+            for row in rows
+        ]
+
     async def text_to_cad_search(
         self,
         text_embedding: list[float] | np.ndarray,
@@ -412,101 +521,70 @@ class VectorSearchService:
         self,
         query_vector: list[float] | np.ndarray,
         limit: int = 20,
+        scope: str = "default",
     ) -> list[VectorSearchResult] | None:
         """
         Check vector search cache for cached results.
 
-        Returns cached results if found and fresh, None otherwise.
+        Near-identical queries (within ``vector_cache_tolerance`` cosine
+        similarity) share cached results. Reads do not write; access
+        statistics are flushed in batches.
+
+        Args:
+            query_vector: Query vector
+            limit: Max results to return
+            scope: Search the results belong to (e.g. method and filters)
+
+        Returns:
+            Cached results if found and fresh, None otherwise
 
         Raises:
             VectorValidationError: If query vector is invalid
         """
-        import hashlib
-
-        # Validate vector before creating hash
         normalized_vector = self._validate_and_normalize_vector(
             query_vector,
             expected_dim=None,  # Any dimension acceptable for cache
             allow_empty=False,
         )
 
-        query_hash = hashlib.sha256(str(normalized_vector).encode()).digest()
-
-        sql = text("""
-            SELECT
-                result_ids,
-                result_distances,
-                accessed_at,
-                access_count
-            FROM vector_search_cache
-            WHERE query_hash = :query_hash
-            LIMIT 1
-        """)
-
-        result = await self.session.execute(sql, {"query_hash": query_hash})
-        row = result.first()
-
-        if not row:
+        cached = await self.query_cache.get(self.session, scope, normalized_vector)
+        if cached is None:
             return None
 
-        # Update access tracking
-        await self.session.execute(text("""
-            UPDATE vector_search_cache
-            SET accessed_at = NOW(),
-                access_count = access_count + 1
-            WHERE query_hash = :query_hash
-        """), {"query_hash": query_hash})
-
-        # Parse cached results
-        model_ids = row.result_ids or []
-        distances = row.result_distances or []
-
         return [
-            VectorSearchResult(
-                model_id=model_id,
-                similarity=1.0 - (distances[i] if i < len(distances) else 0.0),
-            )
-            for i, model_id in enumerate(model_ids[:limit])
+            VectorSearchResult(model_id=model_id, similarity=1.0 - distance)
+            for model_id, distance in zip(cached.model_ids[:limit], cached.distances)
         ]
 
     async def cache_results(
         self,
         query_vector: list[float] | np.ndarray,
         results: list[VectorSearchResult],
+        scope: str = "default",
     ) -> None:
         """Cache search results for future queries.
 
+        Args:
+            query_vector: Query vector
+            results: Search results, best first
+            scope: Search the results belong to (e.g. method and filters)
+
         Raises:
             VectorValidationError: If query vector is invalid
         """
-        import hashlib
-
         normalized_vector = self._validate_and_normalize_vector(
             query_vector,
             expected_dim=None,
             allow_empty=False,
         )
 
-        query_hash = hashlib.sha256(str(normalized_vector).encode()).digest()
-
-        model_ids = [r.model_id for r in results]
-        distances = [1.0 - r.similarity for r in results]
-
-        sql = text("""
-            INSERT INTO vector_search_cache
-            (query_hash, query_vector, result_ids, result_distances, created_at, accessed_at, access_count)
-            VALUES (:query_hash, :query_vector, :result_ids, :result_distances, NOW(), NOW(), 1)
-            ON CONFLICT (query_hash) DO UPDATE
-            SET accessed_at = NOW(),
-                access_count = vector_search_cache.access_count + 1
-        """)
-
-        await self.session.execute(sql, {
-            "query_hash": query_hash,
-            "query_vector": list(normalized_vector),
-            "result_ids": model_ids,
-            "result_distances": distances,
-        })
+        await self.query_cache.put(
+            self.session,
+            scope,
+            normalized_vector,
+            [r.model_id for r in results],
+            [1.0 - r.similarity for r in results],
+        )
 
     async def _set_ef_search(self, ef_search: int) -> None:
         """Set HNSW ef_search parameter for current session."""
@@ -11,7 +11,6 @@ from pybase.fields.base import BaseFieldTypeHandler
 
 # Late imports to avoid circular dependencies
 _parser = None
-_evaluator = None
 
 
 def _get_parser():
@@ -24,14 +23,11 @@ def _get_parser():
     return _parser
 
 
-def _get_evaluator():
-    """Lazy load evaluator."""
-    global _evaluator
-    if _evaluator is None:
-        from pybase.formula.evaluator import FormulaEvaluator
+def _compile_formula(formula: str):
+    """Lazy load the compiler and get the compiled formula (LRU cached)."""
+    from pybase.formula.compiler import compile_formula
 
-        _evaluator = FormulaEvaluator()
-    return _evaluator
+    return compile_formula(formula)
 
 
 class FormulaFieldHandler(BaseFieldTypeHandler):
@@ -55,9 +51,6 @@ class FormulaFieldHandler(BaseFieldTypeHandler):
 
     field_type = "formula"
 
-    # Parsed formula cache (formula_string -> AST)
-    _formula_cache: dict[str, Any] = {}
-
     @classmethod
     def serialize(cls, value: Any) -> Any:
         """
@@ -177,16 +170,8 @@ class FormulaFieldHandler(BaseFieldTypeHandler):
         options = options or {}
 
         try:
-            # Parse formula (with caching)
-            if formula not in cls._formula_cache:
-                parser = _get_parser()
-                cls._formula_cache[formula] = parser.parse(formula)
-
-            ast = cls._formula_cache[formula]
-
-            # Evaluate
-            evaluator = _get_evaluator()
-            result = evaluator.evaluate(ast, fields)
+            # Compile formula (bounded cache keyed by formula text) and evaluate
+            result = _compile_formula(formula)(fields)
 
             # Apply result type conversion
             result_type = options.get("result_type", "auto")
@@ -197,6 +182,40 @@ class FormulaFieldHandler(BaseFieldTypeHandler):
             # Return None for invalid formulas in safe mode
             return None
 
+    @classmethod
+    def compute_many(
+        cls,
+        formula: str,
+        rows: list[dict[str, Any]],
+        options: dict[str, Any] | None = None,
+    ) -> list[Any]:
+        """
+        Compute formula values for many records at once.
+
+        Used when recomputing a formula over a whole table: the formula is
+        parsed once and evaluated column-at-a-time.
+
+        Args:
+            formula: Formula expression string
+            rows: Field values of each record
+            options: Field options (for result formatting)
+
+        Returns:
+            Computed formula results, in row order
+        """
+        from pybase.formula.vectorized import evaluate_columns
+
+        options = options or {}
+
+        try:
+            results = evaluate_columns(_get_parser().parse(formula), rows)
+        except Exception:
+            # Return None for invalid formulas in safe mode
+            return [None] * len(rows)
+
+        result_type = options.get("result_type", "auto")
+        return [cls._convert_result(result, result_type, options) for result in results]
+
     @classmethod
     def _convert_result(
         cls,
@@ -13,12 +13,19 @@ This module provides a complete formula evaluation system supporting:
 
 from pybase.formula.parser import FormulaParser
 from pybase.formula.evaluator import FormulaEvaluator
+from pybase.formula.compiler import FormulaCompiler, compile_formula, evaluate_many
+from pybase.formula.vectorized import VectorizedEvaluator, evaluate_columns
 from pybase.formula.functions import FORMULA_FUNCTIONS, register_function
 from pybase.formula.dependencies import FormulaDependencyGraph
 
 __all__ = [
     "FormulaParser",
     "FormulaEvaluator",
+    "FormulaCompiler",
+    "compile_formula",
+    "evaluate_many",
+    "VectorizedEvaluator",
+    "evaluate_columns",
     "FORMULA_FUNCTIONS",
     "register_function",
     "FormulaDependencyGraph",
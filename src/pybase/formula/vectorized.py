@@ -0,0 +1,500 @@
+"""Column-at-a-time formula evaluation for PyBase.
+
+Evaluates a parsed formula AST over many records at once. Field values
+are extracted into columns; numeric and boolean subtrees run as NumPy
+array operations with a blank mask standing in for ``None``. Anything
+that cannot be vectorized exactly (text, dates, mixed-type columns and
+most functions) falls back to the scalar operator or function, applied
+element by element, so results match ``FormulaEvaluator``. Numbers
+computed on arrays are returned as floats.
+"""
+
+from typing import Any, Callable, Sequence
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from pybase.formula.compiler import FormulaCompiler, negate, scalar_binary_operators
+from pybase.formula.functions import FORMULA_FUNCTIONS
+from pybase.formula.parser import (
+    BinaryOpNode,
+    BooleanNode,
+    FieldRefNode,
+    FunctionCallNode,
+    NumberNode,
+    StringNode,
+    UnaryOpNode,
+)
+
+NUMBER = "number"
+BOOLEAN = "boolean"
+OBJECT = "object"
+
+_MISSING = object()
+
+
+class _Column:
+    """Values of one AST node across all rows.
+
+    ``number`` and ``boolean`` columns hold an array in ``values`` and a
+    ``blank`` mask; ``object`` columns hold Python values in ``objects``.
+    Leaf columns keep the original Python values in ``objects`` too, so
+    they are returned unchanged. ``constant`` is the node's value when it
+    is the same for every row.
+    """
+
+    __slots__ = ("kind", "values", "blank", "objects", "constant", "_number")
+
+    def __init__(self, kind, values=None, blank=None, objects=None, constant=_MISSING):
+        self.kind = kind
+        self.values = values
+        self.blank = blank
+        self.objects = objects
+        self.constant = constant
+        self._number = _MISSING
+
+    def to_objects(self) -> list[Any]:
+        """Get the column as Python values (None for blanks)."""
+        if self.objects is None:
+            if not self.blank.any():
+                self.objects = self.values.tolist()
+            else:
+                self.objects = [
+                    None if blank else value
+                    for value, blank in zip(self.values.tolist(), self.blank.tolist(), strict=True)
+                ]
+        return self.objects
+
+
+class VectorizedEvaluator:
+    """
+    Evaluates formula ASTs over many records at once.
+
+    Falls back to compiled per-row evaluation when NumPy is not installed.
+    """
+
+    def __init__(self):
+        """Initialize evaluator with the scalar operator implementations."""
+        self._scalar_ops = scalar_binary_operators()
+        self._vector_functions: dict[str, Callable[[int, list[_Column]], _Column | None]] = {
+            "IF": self._fn_if,
+            "ROUND": self._fn_round,
+            "ABS": self._fn_abs,
+            "SQRT": self._fn_sqrt,
+            "INT": self._fn_int,
+            "MOD": self._fn_mod,
+            "SUM": self._fn_sum,
+            "AVG": self._fn_avg,
+            "AVERAGE": self._fn_avg,
+            "MIN": self._fn_min,
+            "MAX": self._fn_max,
+            "AND": self._fn_and,
+            "OR": self._fn_or,
+            "NOT": self._fn_not,
+        }
+
+    def evaluate(self, ast: Any, rows: Sequence[dict[str, Any]]) -> list[Any]:
+        """
+        Evaluate an AST against many records.
+
+        Args:
+            ast: Parsed formula AST
+            rows: Field values of each record
+
+        Returns:
+            Results, in row order (None for rows whose evaluation failed)
+
+        Raises:
+            ValueError: If the AST contains an unknown operator
+        """
+        if not NUMPY_AVAILABLE:
+            compiled = FormulaCompiler().compile(ast)
+            results = []
+            for fields in rows:
+                try:
+                    results.append(compiled(fields))
+                except Exception:
+                    results.append(None)
+            return results
+
+        errors = np.zeros(len(rows), dtype=bool)
+        field_columns: dict[str, _Column] = {}
+        with np.errstate(all="ignore"):
+            column = self._eval(ast, rows, field_columns, errors)
+
+        n = len(rows)
+        if column.constant is not _MISSING:
+            results = [column.constant] * n
+        else:
+            results = list(column.to_objects())
+        for i in np.flatnonzero(errors).tolist():
+            results[i] = None
+        return results
+
+    # ==========================================================================
+    # Node Evaluation
+    # ==========================================================================
+
+    def _eval(
+        self,
+        node: Any,
+        rows: Sequence[dict[str, Any]],
+        field_columns: dict[str, _Column],
+        errors: "np.ndarray",
+    ) -> _Column:
+        """Evaluate an AST node into a column."""
+        n = len(rows)
+
+        if isinstance(node, (NumberNode, StringNode, BooleanNode)):
+            return self._constant(node.value, n)
+
+        if isinstance(node, FieldRefNode):
+            column = field_columns.get(node.field_name)
+            if column is None:
+                column = self._leaf([fields.get(node.field_name) for fields in rows])
+                field_columns[node.field_name] = column
+            return column
+
+        if isinstance(node, FunctionCallNode):
+            func = FORMULA_FUNCTIONS.get(node.name)
+            if func is None:
+                return self._constant(None, n)
+            args = [self._eval(arg, rows, field_columns, errors) for arg in node.arguments]
+            vector_function = self._vector_functions.get(node.name)
+            if vector_function is not None:
+                column = vector_function(n, args)
+                if column is not None:
+                    return column
+            return self._map_function(func, n, args)
+
+        if isinstance(node, BinaryOpNode):
+            op = self._scalar_ops.get(node.operator)
+            if op is None:
+                raise ValueError(f"Unknown operator: {node.operator}")
+            left = self._eval(node.left, rows, field_columns, errors)
+            right = self._eval(node.right, rows, field_columns, errors)
+            column = self._binary(node.operator, left, right)
+            if column is not None:
+                return column
+            return self._map_operator(op, [left, right], errors)
+
+        if isinstance(node, UnaryOpNode):
+            operand = self._eval(node.operand, rows, field_columns, errors)
+            if node.operator == "-":
+                number = self._as_number(operand)
+                if number is not None:
+                    return _Column(NUMBER, -number.values, number.blank)
+                return self._map_operator(negate, [operand], errors)
+            if node.operator == "NOT":
+                return _Column(BOOLEAN, ~self._truth(operand), np.zeros(n, dtype=bool))
+            raise ValueError(f"Unknown unary operator: {node.operator}")
+
+        # Unknown node type, evaluates to itself
+        return self._constant(node, n)
+
+    def _binary(self, op: str, left: _Column, right: _Column) -> _Column | None:
+        """Vectorize a binary operation, or return None to fall back."""
+        if op in ("AND", "OR"):
+            combine = np.logical_and if op == "AND" else np.logical_or
+            truth = combine(self._truth(left), self._truth(right))
+            return _Column(BOOLEAN, truth, np.zeros(len(truth), dtype=bool))
+
+        if op not in ("+", "-", "*", "/", "%", "=", "!=", "<", ">", "<=", ">="):
+            return None
+
+        lnum = self._as_number(left)
+        rnum = self._as_number(right)
+        if lnum is None or rnum is None:
+            return None
+        lv, lb = lnum.values, lnum.blank
+        rv, rb = rnum.values, rnum.blank
+
+        if op == "+":
+            # A blank operand yields the other operand unchanged
+            values = np.where(lb, rv, np.where(rb, lv, lv + rv))
+            return _Column(NUMBER, values, lb & rb)
+        if op == "-":
+            return _Column(NUMBER, lv - rv, lb | rb)
+        if op == "*":
+            return _Column(NUMBER, lv * rv, lb | rb)
+        if op in ("/", "%"):
+            zero = rv == 0
+            divisor = np.where(zero, 1.0, rv)
+            values = lv / divisor if op == "/" else np.mod(lv, divisor)
+            return _Column(NUMBER, values, lb | rb | zero)
+
+        present = ~lb & ~rb
+        equal = (present & (lv == rv)) | (lb & rb)
+        if op == "=":
+            result = equal
+        elif op == "!=":
+            result = ~equal
+        elif op == "<":
+            result = present & (lv < rv)
+        elif op == ">":
+            result = present & (lv > rv)
+        elif op == "<=":
+            result = equal | (present & (lv < rv))
+        else:
+            result = equal | (present & (lv > rv))
+        return _Column(BOOLEAN, result, np.zeros(len(result), dtype=bool))
+
+    # ==========================================================================
+    # Vectorized Functions
+    # ==========================================================================
+
+    def _fn_if(self, n: int, args: list[_Column]) -> _Column | None:
+        if len(args) not in (2, 3):
+            return None
+        condition = self._truth(args[0])
+        if_true = args[1]
+        if_false = args[2] if len(args) == 3 else self._constant(None, n)
+
+        if if_true.kind == if_false.kind and if_true.kind in (NUMBER, BOOLEAN):
+            return _Column(
+                if_true.kind,
+                np.where(condition, if_true.values, if_false.values),
+                np.where(condition, if_true.blank, if_false.blank),
+            )
+        true_values = if_true.to_objects()
+        false_values = if_false.to_objects()
+        return _Column(
+            OBJECT,
+            objects=[
+                t if c else f
+                for c, t, f in zip(condition.tolist(), true_values, false_values, strict=True)
+            ],
+        )
+
+    def _fn_round(self, _n: int, args: list[_Column]) -> _Column | None:
+        if len(args) not in (1, 2):
+            return None
+        value = self._as_number(args[0])
+        decimals = args[1].constant if len(args) == 2 else 0
+        if value is None or decimals is _MISSING or decimals is None:
+            return None
+        try:
+            decimals = int(decimals)
+        except (ValueError, TypeError):
+            return None
+        # Python's round() is correctly rounded; np.round is not always
+        values = np.array(
+            [round(v, decimals) for v in value.values.tolist()], dtype=float
+        )
+        return _Column(NUMBER, values, value.blank)
+
+    def _fn_abs(self, _n: int, args: list[_Column]) -> _Column | None:
+        value = self._single_number(args)
+        if value is None:
+            return None
+        return _Column(NUMBER, np.abs(value.values), value.blank)
+
+    def _fn_sqrt(self, _n: int, args: list[_Column]) -> _Column | None:
+        value = self._single_number(args)
+        if value is None:
+            return None
+        negative = value.values < 0
+        return _Column(
+            NUMBER, np.sqrt(np.where(negative, 0.0, value.values)), value.blank | negative
+        )
+
+    def _fn_int(self, _n: int, args: list[_Column]) -> _Column | None:
+        value = self._single_number(args)
+        if value is None:
+            return None
+        return _Column(
+            NUMBER, np.trunc(value.values), value.blank | ~np.isfinite(value.values)
+        )
+
+    def _fn_mod(self, _n: int, args: list[_Column]) -> _Column | None:
+        if len(args) != 2:
+            return None
+        return self._binary("%", args[0], args[1])
+
+    def _fn_sum(self, n: int, args: list[_Column]) -> _Column | None:
+        numbers = self._all_numbers(args)
+        if numbers is None:
+            return None
+        total = np.zeros(n, dtype=float)
+        for number in numbers:
+            total = total + np.where(number.blank, 0.0, number.values)
+        return _Column(NUMBER, total, np.zeros(n, dtype=bool))
+
+    def _fn_avg(self, n: int, args: list[_Column]) -> _Column | None:
+        numbers = self._all_numbers(args)
+        if numbers is None:
+            return None
+        total = np.zeros(n, dtype=float)
+        count = np.zeros(n, dtype=float)
+        for number in numbers:
+            total = total + np.where(number.blank, 0.0, number.values)
+            count = count + ~number.blank
+        empty = count == 0
+        return _Column(NUMBER, total / np.where(empty, 1.0, count), empty)
+
+    def _fn_min(self, n: int, args: list[_Column]) -> _Column | None:
+        return self._reduce(np.fmin, n, args)
+
+    def _fn_max(self, n: int, args: list[_Column]) -> _Column | None:
+        return self._reduce(np.fmax, n, args)
+
+    def _fn_and(self, n: int, args: list[_Column]) -> _Column | None:
+        if any(arg.kind == OBJECT for arg in args):
+            return None
+        result = np.ones(n, dtype=bool)
+        for arg in args:
+            result &= self._truth(arg)
+        return _Column(BOOLEAN, result, np.zeros(n, dtype=bool))
+
+    def _fn_or(self, n: int, args: list[_Column]) -> _Column | None:
+        if any(arg.kind == OBJECT for arg in args):
+            return None
+        result = np.zeros(n, dtype=bool)
+        for arg in args:
+            result |= self._truth(arg)
+        return _Column(BOOLEAN, result, np.zeros(n, dtype=bool))
+
+    def _fn_not(self, n: int, args: list[_Column]) -> _Column | None:
+        if len(args) != 1:
+            return None
+        return _Column(BOOLEAN, ~self._truth(args[0]), np.zeros(n, dtype=bool))
+
+    # ==========================================================================
+    # Column Helpers
+    # ==========================================================================
+
+    @staticmethod
+    def _constant(value: Any, n: int) -> _Column:
+        """Column holding the same value in every row."""
+        if isinstance(value, bool):
+            column = _Column(BOOLEAN, np.full(n, value), np.zeros(n, dtype=bool))
+        elif isinstance(value, (int, float)):
+            column = _Column(NUMBER, np.full(n, float(value)), np.zeros(n, dtype=bool))
+        else:
+            column = _Column(OBJECT)
+        column.objects = [value] * n
+        column.constant = value
+        return column
+
+    @staticmethod
+    def _leaf(objects: list[Any]) -> _Column:
+        """Column of field values, typed when every value allows it."""
+        types = set(map(type, objects))
+        has_blanks = type(None) in types
+        types.discard(type(None))
+
+        if types and types <= {bool}:
+            kind, fill, dtype = BOOLEAN, False, bool
+        elif types <= {int, float}:
+            kind, fill, dtype = NUMBER, 0.0, float
+        else:
+            return _Column(OBJECT, objects=objects)
+
+        if has_blanks:
+            blank = np.array([value is None for value in objects], dtype=bool)
+            values = np.array([fill if value is None else value for value in objects], dtype=dtype)
+        else:
+            blank = np.zeros(len(objects), dtype=bool)
+            values = np.array(objects, dtype=dtype)
+        return _Column(kind, values, blank, objects)
+
+    @staticmethod
+    def _as_number(column: _Column) -> _Column | None:
+        """View a column as numbers, or None if any value is not numeric."""
+        if column.kind == NUMBER:
+            return column
+        if column._number is not _MISSING:
+            return column._number
+
+        number = None
+        if column.kind == BOOLEAN:
+            number = _Column(NUMBER, column.values.astype(float), column.blank)
+        elif all(value is None or isinstance(value, (int, float)) for value in column.objects):
+            blank = np.array([value is None for value in column.objects], dtype=bool)
+            values = np.array(
+                [0.0 if value is None else float(value) for value in column.objects], dtype=float
+            )
+            number = _Column(NUMBER, values, blank)
+        column._number = number
+        return number
+
+    @staticmethod
+    def _truth(column: _Column) -> "np.ndarray":
+        """Python truthiness of each value."""
+        if column.kind == NUMBER:
+            return ~column.blank & (column.values != 0)
+        if column.kind == BOOLEAN:
+            return ~column.blank & column.values
+        return np.fromiter(
+            (bool(value) for value in column.objects), dtype=bool, count=len(column.objects)
+        )
+
+    def _single_number(self, args: list[_Column]) -> _Column | None:
+        if len(args) != 1:
+            return None
+        return self._as_number(args[0])
+
+    def _all_numbers(self, args: list[_Column]) -> list[_Column] | None:
+        numbers = [self._as_number(arg) for arg in args]
+        if not numbers or any(number is None for number in numbers):
+            return None
+        return numbers
+
+    def _reduce(self, reducer, n: int, args: list[_Column]) -> _Column | None:
+        numbers = self._all_numbers(args)
+        if numbers is None:
+            return None
+        result = np.full(n, np.nan)
+        for number in numbers:
+            result = reducer(result, np.where(number.blank, np.nan, number.values))
+        return _Column(NUMBER, result, np.isnan(result))
+
+    @staticmethod
+    def _map_function(func: Callable, n: int, args: list[_Column]) -> _Column:
+        """Apply a scalar function row by row (errors yield None)."""
+        results = []
+        for values in zip(*[arg.to_objects() for arg in args], strict=True) if args else [()] * n:
+            try:
+                results.append(func(*values))
+            except Exception:
+                results.append(None)
+        return _Column(OBJECT, objects=results)
+
+    @staticmethod
+    def _map_operator(op: Callable, operands: list[_Column], errors: "np.ndarray") -> _Column:
+        """Apply a scalar operator row by row, flagging rows that raise."""
+        rows = zip(*[operand.to_objects() for operand in operands], strict=True)
+        try:
+            return _Column(OBJECT, objects=[op(*values) for values in rows])
+        except Exception:
+            pass
+
+        # Some row raised; redo row by row to isolate it
+        results = []
+        rows = zip(*[operand.to_objects() for operand in operands], strict=True)
+        for i, values in enumerate(rows):
+            try:
+                results.append(op(*values))
+            except Exception:
+                errors[i] = True
+                results.append(None)
+        return _Column(OBJECT, objects=results)
+
+
+def evaluate_columns(ast: Any, rows: Sequence[dict[str, Any]]) -> list[Any]:
+    """
+    Convenience function to evaluate a formula over many records.
+
+    Args:
+        ast: Parsed formula AST
+        rows: Field values of each record
+
+    Returns:
+        Results, in row order
+    """
+    return VectorizedEvaluator().evaluate(ast, rows)
@@ -4,6 +4,7 @@ PyBase FastAPI Application Entry Point.
 This module creates and configures the FastAPI application instance.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -16,8 +17,13 @@ from pybase.api.v1 import router as v1_router
 from pybase.core.config import settings
 from pybase.core.exceptions import PyBaseException
 from pybase.core.logging import get_logger, setup_logging
+from pybase.db.ann_index import get_cad_vector_index
 from pybase.db.session import close_db, init_db
 from pybase.middleware.prometheus_middleware import PrometheusMiddleware
+from pybase.realtime import get_realtime_batcher
+from pybase.services.api_key_usage import get_api_key_usage_buffer
+from pybase.services.field_index_builder import get_field_index_builder
+from pybase.services.search_index_queue import get_search_index_queue
 
 logger = get_logger(__name__)
 
@@ -40,10 +46,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    # Build the CAD vector index from PostgreSQL if there is no snapshot yet;
+    # similarity search uses pgvector until it is ready
+    vector_index_task = None
+    vector_index = get_cad_vector_index()
+    if vector_index is not None:
+        if not vector_index.load():
+            vector_index_task = asyncio.create_task(vector_index.bootstrap())
+        vector_index.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    if vector_index_task is not None:
+        vector_index_task.cancel()
+    if vector_index is not None:
+        await vector_index.stop()
+    await get_search_index_queue().stop()
+    await get_api_key_usage_buffer().stop()
+    await get_field_index_builder().stop()
+    await get_realtime_batcher().flush()
     await close_db()
 
 
@@ -57,6 +57,68 @@ cache_operation_counter = Counter(
     ["operation", "status"],
 )
 
+# In-process cache tier metrics
+# Labels: cache (cache name), event (hit, miss, evict)
+local_cache_counter = Counter(
+    "local_cache_events_total",
+    "Total number of in-process cache hits, misses and evictions",
+    ["cache", "event"],
+)
+
+# Search indexing queue metrics
+# Labels: event (enqueued, coalesced, indexed, deleted, failed, dropped)
+search_index_counter = Counter(
+    "search_index_events_total",
+    "Total number of records queued, coalesced, indexed or dropped by the search index queue",
+    ["event"],
+)
+
+# Full reindex progress
+# Labels: event (indexed, removed, failed)
+search_reindex_counter = Counter(
+    "search_reindex_records_total",
+    "Total number of records indexed or removed by full reindex jobs, and failed jobs",
+    ["event"],
+)
+
+# CAD similarity search
+# Labels: path (ann, pgvector)
+vector_search_counter = Counter(
+    "vector_search_queries_total",
+    "Total number of CAD similarity queries by the path that answered them",
+    ["path"],
+)
+
+# Realtime fan-out
+# Depth of a connection's send queue when a frame is queued
+websocket_send_queue_histogram = Histogram(
+    "websocket_send_queue_depth",
+    "Frames already waiting in a WebSocket connection's send queue when a frame is queued",
+    buckets=(0, 1, 4, 16, 64, 128, 256, 512),
+)
+
+# Time to serialize an event and queue it for every subscriber of a channel
+websocket_fanout_histogram = Histogram(
+    "websocket_fanout_duration_seconds",
+    "Time to fan an event out to the send queues of a channel's local subscribers",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# Labels: event (sent, dropped, slow_disconnect, failed)
+websocket_frame_counter = Counter(
+    "websocket_frames_total",
+    "Total number of WebSocket frames sent, dropped for slow consumers, or failed",
+    ["event"],
+)
+
+# Realtime event coalescing
+# Labels: event (received, sent)
+realtime_batch_counter = Counter(
+    "realtime_batch_events_total",
+    "Total number of realtime events received by the batcher and broadcast after merging",
+    ["event"],
+)
+
 __all__ = [
     "api_request_counter",
     "api_latency_histogram",
@@ -65,4 +127,12 @@ __all__ = [
     "websocket_connections_gauge",
     "db_query_duration_histogram",
     "cache_operation_counter",
+    "local_cache_counter",
+    "search_index_counter",
+    "search_reindex_counter",
+    "vector_search_counter",
+    "websocket_send_queue_histogram",
+    "websocket_fanout_histogram",
+    "websocket_frame_counter",
+    "realtime_batch_counter",
 ]
@@ -48,6 +48,8 @@ class ExportFormat(str, Enum):
     XLSX = "xlsx"
     JSON = "json"
     XML = "xml"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
 
 # =============================================================================
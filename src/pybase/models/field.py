@@ -154,6 +154,14 @@ class Field(SoftDeleteModel):
         nullable=False,
     )
 
+    # Query performance
+    # Indexed fields get a typed btree expression index on record data
+    is_indexed: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+    )
+
     # System fields
     is_primary: Mapped[bool] = mapped_column(
         Boolean,
@@ -1,16 +1,19 @@
 """
 Record model - stores actual data rows in a table.
 
-Records store field values as JSON for flexibility.
+Records store field values as JSONB for flexibility.
 """
 
-from typing import TYPE_CHECKING, Any
+import json
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from sqlalchemy import ForeignKey, Index, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DDL, Column, Computed, ForeignKey, Index, event, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+from sqlalchemy.orm.attributes import flag_modified
 
 from pybase.db.base import SoftDeleteModel
+from pybase.db.types import JSONBText
 
 if TYPE_CHECKING:
     from pybase.models.comment import Comment
@@ -18,6 +21,34 @@ if TYPE_CHECKING:
     from pybase.models.user import User
 
 
+# Text search configuration of records.search_vector (no stemming or stop
+# words, so part numbers and codes are matched as typed)
+SEARCH_TEXT_CONFIG = "simple"
+
+# Immutable SQL function concatenating the string and number values of a
+# record payload (at any depth, keys excluded). Backs the generated
+# search_vector column and the trigram index used for substring search.
+RECORD_SEARCH_TEXT_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_search_text(data jsonb) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(value #>> '{}', ' '), '')
+    FROM jsonb_path_query(
+        data, 'strict $.** ? (@.type() == "string" || @.type() == "number")'
+    ) AS value
+$$
+"""
+
+
+class _ParsedData(NamedTuple):
+    """Parsed field values memoized on a record instance."""
+
+    # The ``data`` string the values were parsed from
+    raw: Any
+    values: dict[str, Any]
+    # Values were changed via set_field_value and not yet serialized
+    dirty: bool
+
+
 class Record(SoftDeleteModel):
     """
     Record model - a single row in a table.
@@ -36,15 +67,25 @@ class Record(SoftDeleteModel):
         index=True,
     )
 
-    # Field values (JSON stored as text)
+    # Field values (native JSONB, exposed as JSON text)
     # Format: {"field_id": value, ...}
     # Values are stored in their JSON representation
     data: Mapped[str] = mapped_column(
-        Text,
+        JSONBText,
         nullable=False,
         default="{}",
     )
 
+    # Full-text search document, maintained by PostgreSQL. Not mapped on
+    # the model (see __mapper_args__) so it is never loaded or returned
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_TEXT_CONFIG}'::regconfig, record_search_text(data))",
+            persisted=True,
+        ),
+    )
+
     # Audit trail
     created_by_id: Mapped[str | None] = mapped_column(
         UUID(as_uuid=False),
@@ -97,11 +138,50 @@ class Record(SoftDeleteModel):
         Index("ix_records_table_created", "table_id", "created_at"),
         Index("ix_records_created_by", "created_by_id"),
         Index("ix_records_deleted_by", "deleted_by_id"),
+        Index(
+            "ix_records_data_gin",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+        Index("ix_records_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_records_search_text_trgm",
+            func.record_search_text(text("data")).label("search_text"),
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
     )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     def __repr__(self) -> str:
         return f"<Record {self.id} in table {self.table_id}>"
 
+    def _parsed_values(self) -> dict[str, Any]:
+        """
+        Get the parsed field values, parsing ``data`` at most once.
+
+        The parsed dict is memoized per instance and keyed on the ``data``
+        string it came from, so reloading or reassigning ``data`` makes
+        the next call re-parse.
+
+        Returns:
+            Memoized dictionary of field_id -> value
+        """
+        cached: _ParsedData | None = self.__dict__.get("_data_cache")
+        raw = self.data
+        if cached is not None and (cached.dirty or cached.raw is raw):
+            return cached.values
+
+        try:
+            values = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            values = {}
+        if not isinstance(values, dict):
+            values = {}
+        self.__dict__["_data_cache"] = _ParsedData(raw, values, False)
+        return values
+
     def get_field_value(self, field_id: str) -> Any:
         """
         Get value for a specific field.
@@ -112,31 +192,23 @@ class Record(SoftDeleteModel):
         Returns:
             Field value or None if not set
         """
-        import json
-
-        try:
-            data = json.loads(self.data)
-            return data.get(field_id)
-        except (json.JSONDecodeError, TypeError):
-            return None
+        return self._parsed_values().get(field_id)
 
     def set_field_value(self, field_id: str, value: Any) -> None:
         """
         Set value for a specific field.
 
+        The change is applied to the parsed values; ``data`` is
+        re-serialized on flush (or by calling ``sync_data``).
+
         Args:
             field_id: ID of the field
             value: Value to set
         """
-        import json
-
-        try:
-            data = json.loads(self.data)
-        except (json.JSONDecodeError, TypeError):
-            data = {}
-
-        data[field_id] = value
-        self.data = json.dumps(data)
+        values = self._parsed_values()
+        values[field_id] = value
+        self.__dict__["_data_cache"] = _ParsedData(self.data, values, True)
+        flag_modified(self, "data")
 
     def get_all_values(self) -> dict:
         """
@@ -145,9 +217,41 @@ class Record(SoftDeleteModel):
         Returns:
             Dictionary of field_id -> value
         """
-        import json
+        return dict(self._parsed_values())
 
-        try:
-            return json.loads(self.data)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+    def sync_data(self) -> None:
+        """Serialize pending set_field_value changes into ``data``."""
+        cached: _ParsedData | None = self.__dict__.get("_data_cache")
+        if cached is None or not cached.dirty:
+            return
+        raw = json.dumps(cached.values)
+        self.data = raw
+        self.__dict__["_data_cache"] = _ParsedData(raw, cached.values, False)
+
+
+event.listen(
+    Record.__table__,
+    "before_create",
+    DDL(RECORD_SEARCH_TEXT_FUNCTION).execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Record.data, "set")
+def _invalidate_parsed_data(target: Record, value: Any, oldvalue: Any, initiator: Any) -> None:
+    """Drop memoized values when ``data`` is assigned directly."""
+    target.__dict__.pop("_data_cache", None)
+
+
+@event.listens_for(Record, "refresh")
+@event.listens_for(Record, "expire")
+def _discard_parsed_data(target: Record, *args: Any) -> None:
+    """Drop memoized values (including pending changes) on refresh/expire."""
+    target.__dict__.pop("_data_cache", None)
+
+
+@event.listens_for(Session, "before_flush")
+def _serialize_pending_record_data(session: Session, flush_context: Any, instances: Any) -> None:
+    """Write pending set_field_value changes back to ``data`` before flushing."""
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Record):
+            obj.sync_data()
@@ -3,8 +3,10 @@
 Provides:
 - ConnectionManager: Handles WebSocket connections, subscriptions, broadcasting
 - PresenceService: Tracks user presence, cell focus, cursor positions
+- RealtimeBatcher: Coalesces record and chart events per channel
 """
 
+from pybase.realtime.batcher import RealtimeBatcher, get_realtime_batcher
 from pybase.realtime.manager import Connection, ConnectionManager, get_connection_manager
 from pybase.realtime.presence import PresenceService, get_presence_service
 
@@ -14,4 +16,6 @@ __all__ = [
     "get_connection_manager",
     "PresenceService",
     "get_presence_service",
+    "RealtimeBatcher",
+    "get_realtime_batcher",
 ]
@@ -0,0 +1,203 @@
+"""Coalescing of record-change realtime events.
+
+A bulk edit used to broadcast one event per record, plus a chart data
+event per change, to every client viewing the table. Events emitted
+through ``RealtimeBatcher`` are buffered per channel for
+``realtime_batch_window_ms`` and merged before broadcasting:
+
+- record events of the same kind (created, updated, deleted) by the same
+  user become one ``RecordBatchChangeEvent``; a record changed several
+  times counts once, and a window holding a single record change sends
+  that event unchanged
+- chart data events for a table become one event listing every affected
+  chart once
+- other events are broadcast as they are, in order
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+from pybase.metrics import realtime_batch_counter
+from pybase.schemas.realtime import (
+    BaseEvent,
+    ChartDataChangeEvent,
+    EventType,
+    RecordBatchChangeEvent,
+    RecordChangeEvent,
+)
+
+logger = get_logger(__name__)
+
+# Record event type -> (kind, batch event type)
+_RECORD_KINDS: dict[EventType, tuple[str, EventType]] = {
+    EventType.RECORD_CREATED: ("created", EventType.RECORD_BATCH_CREATED),
+    EventType.RECORD_BATCH_CREATED: ("created", EventType.RECORD_BATCH_CREATED),
+    EventType.RECORD_UPDATED: ("updated", EventType.RECORD_BATCH_UPDATED),
+    EventType.RECORD_BATCH_UPDATED: ("updated", EventType.RECORD_BATCH_UPDATED),
+    EventType.RECORD_DELETED: ("deleted", EventType.RECORD_BATCH_DELETED),
+    EventType.RECORD_BATCH_DELETED: ("deleted", EventType.RECORD_BATCH_DELETED),
+}
+
+_events_received = realtime_batch_counter.labels(event="received")
+_events_sent = realtime_batch_counter.labels(event="sent")
+
+
+class _ChannelBatch:
+    """Events buffered for one channel, merged as they arrive."""
+
+    def __init__(self) -> None:
+        # Group key -> merged state, in order of each group's first event
+        self.groups: dict[tuple, Any] = {}
+        self._passthrough = 0
+
+    def add(self, event: BaseEvent) -> None:
+        if isinstance(event, (RecordChangeEvent, RecordBatchChangeEvent)) and (
+            event.event in _RECORD_KINDS
+        ):
+            kind, _ = _RECORD_KINDS[event.event]
+            key = ("record", kind, event.table_id, event.changed_by)
+            # record_id -> latest single-record event (None if from a batch)
+            records = self.groups.setdefault(key, {})
+            if isinstance(event, RecordChangeEvent):
+                records.pop(event.record_id, None)
+                records[event.record_id] = event
+            else:
+                for record_id in event.record_ids:
+                    records.pop(record_id, None)
+                    records[record_id] = None
+        elif isinstance(event, ChartDataChangeEvent):
+            key = ("chart", event.table_id, event.changed_by)
+            # Dict as an ordered set of chart IDs
+            self.groups.setdefault(key, {}).update(dict.fromkeys(event.chart_ids))
+        else:
+            self._passthrough += 1
+            self.groups[("event", self._passthrough)] = event
+
+    def events(self) -> list[BaseEvent]:
+        """Merged events, in order of each group's first event."""
+        merged: list[BaseEvent] = []
+        for key, value in self.groups.items():
+            if key[0] == "event":
+                merged.append(value)
+            elif key[0] == "chart":
+                _, table_id, changed_by = key
+                merged.append(
+                    ChartDataChangeEvent(
+                        table_id=table_id, chart_ids=list(value), changed_by=changed_by
+                    )
+                )
+            else:
+                merged.append(self._record_event(key, value))
+        return merged
+
+    @staticmethod
+    def _record_event(key: tuple, records: dict[str, Optional[RecordChangeEvent]]) -> BaseEvent:
+        _, kind, table_id, changed_by = key
+        if len(records) == 1:
+            (event,) = records.values()
+            if event is not None:
+                return event
+
+        batch_type = next(batch for k, batch in _RECORD_KINDS.values() if k == kind)
+        return RecordBatchChangeEvent(
+            event=batch_type,
+            table_id=table_id,
+            record_ids=list(records),
+            count=len(records),
+            changed_by=changed_by,
+        )
+
+
+class RealtimeBatcher:
+    """Buffers realtime events per channel and broadcasts them merged."""
+
+    def __init__(self, manager: Any = None, window: Optional[float] = None) -> None:
+        """Initialize batcher.
+
+        Args:
+            manager: Connection manager to broadcast through (the global one
+                if not given)
+            window: Seconds events are buffered per channel
+
+        """
+        self._manager = manager
+        self.window = settings.realtime_batch_window_ms / 1000 if window is None else window
+        self._pending: dict[str, _ChannelBatch] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        # Running flushes, referenced until done
+        self._flushes: set[asyncio.Task] = set()
+
+    @property
+    def manager(self) -> Any:
+        """Connection manager events are broadcast through."""
+        if self._manager is None:
+            from pybase.realtime.manager import get_connection_manager
+
+            self._manager = get_connection_manager()
+        return self._manager
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def emit(self, channel: str, event: BaseEvent) -> None:
+        """Queue an event for a channel, broadcasting it when the window closes.
+
+        Args:
+            channel: Target channel (e.g. "table:<id>")
+            event: Event to broadcast
+
+        """
+        _events_received.inc()
+        if self.window <= 0:
+            _events_sent.inc()
+            await self.manager.broadcast_to_channel(channel, event)
+            return
+
+        batch = self._pending.get(channel)
+        if batch is None:
+            batch = self._pending[channel] = _ChannelBatch()
+            self._timers[channel] = asyncio.get_running_loop().call_later(
+                self.window, self._start_flush, channel
+            )
+        batch.add(event)
+
+    async def flush(self) -> None:
+        """Broadcast everything buffered now (e.g. on shutdown)."""
+        for channel in list(self._pending):
+            await self.flush_channel(channel)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def flush_channel(self, channel: str) -> None:
+        """Broadcast the merged events buffered for a channel."""
+        timer = self._timers.pop(channel, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(channel, None)
+        if batch is None:
+            return
+
+        for event in batch.events():
+            _events_sent.inc()
+            try:
+                await self.manager.broadcast_to_channel(channel, event)
+            except Exception as e:
+                logger.error(f"Failed to broadcast batched event to {channel}: {e}")
+
+    def _start_flush(self, channel: str) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush_channel(channel))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+
+_batcher: Optional[RealtimeBatcher] = None
+
+
+def get_realtime_batcher() -> RealtimeBatcher:
+    """Get the process-wide realtime batcher."""
+    global _batcher
+    if _batcher is None:
+        _batcher = RealtimeBatcher()
+    return _batcher
@@ -6,6 +6,19 @@ Handles:
 - Message broadcasting
 - Connection heartbeats
 
+Outgoing events are serialized once per send or broadcast into a text
+frame. Each connection has a bounded send queue drained by its own writer
+task, so fanning an event out only queues the shared frame and one slow
+client cannot stall delivery to the rest of the channel. When a queue is
+full, the ``realtime_slow_consumer_policy`` setting decides whether the
+oldest queued frame is dropped or the connection is closed.
+
+Broadcasts are also published to Redis on ``realtime:{channel}`` for the
+other instances. Each instance subscribes to a channel's Redis channel
+only while it has local subscribers to it, so an instance receives the
+traffic of the channels its clients watch rather than of the whole
+cluster.
+
 Supported channel types:
 - workspace:{workspace_id} - Workspace-level updates
 - base:{base_id} - Base-level updates (tables, dashboards)
@@ -16,16 +29,21 @@ Supported channel types:
 """
 
 import asyncio
-import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 from uuid import uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from pybase.core.config import settings
+from pybase.metrics import (
+    websocket_fanout_histogram,
+    websocket_frame_counter,
+    websocket_send_queue_histogram,
+)
 from pybase.schemas.realtime import (
     BaseEvent,
     ConnectEvent,
@@ -42,11 +60,20 @@ logger = logging.getLogger(__name__)
 
 # Import Redis pub/sub manager - will be available if Redis is configured
 try:
-    from pybase.realtime.redis_pubsub import RedisPubSubManager
+    from pybase.realtime.redis_pubsub import RedisPubSubManager, get_pubsub_manager
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     RedisPubSubManager = None  # type: ignore
+    get_pubsub_manager = None  # type: ignore
+
+# WebSocket close code sent to clients that cannot keep up ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+_frames_sent = websocket_frame_counter.labels(event="sent")
+_frames_dropped = websocket_frame_counter.labels(event="dropped")
+_frames_slow_disconnect = websocket_frame_counter.labels(event="slow_disconnect")
+_frames_failed = websocket_frame_counter.labels(event="failed")
 
 
 @dataclass
@@ -62,6 +89,13 @@ class Connection:
     last_ping: datetime
     subscriptions: set[str] = field(default_factory=set)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Serialized frames waiting for the writer task
+    send_queue: Optional[asyncio.Queue] = None
+    writer_task: Optional[asyncio.Task] = None
+    # Set once a disconnect has been scheduled; no more frames are queued
+    closing: bool = False
+    # Monotonic time the frame being sent was handed to the WebSocket
+    send_started: Optional[float] = None
 
     @property
     def is_alive(self) -> bool:
@@ -114,6 +148,16 @@ class ConnectionManager:
         self._instance_id: Optional[str] = None
         # Track if Redis listener has been started
         self._redis_listener_started = False
+        # Channels whose Redis channel this instance is subscribed to
+        self._redis_channels: set[str] = set()
+        # Serializes Redis subscription changes
+        self._redis_lock = asyncio.Lock()
+        # Backpressure settings for per-connection send queues
+        self._send_queue_size = settings.realtime_send_queue_size
+        self._slow_consumer_policy = settings.realtime_slow_consumer_policy
+        self._send_timeout = settings.realtime_send_timeout
+        # Task closing connections whose sends are stuck
+        self._watchdog: Optional[asyncio.Task] = None
 
     def _get_next_color(self) -> str:
         """Get the next user color in rotation."""
@@ -132,7 +176,6 @@ class ConnectionManager:
 
         if self._redis_pubsub is None:
             try:
-                from pybase.realtime.redis_pubsub import get_pubsub_manager
                 self._redis_pubsub = get_pubsub_manager()
 
                 # Generate instance ID for this server instance
@@ -141,12 +184,6 @@ class ConnectionManager:
                 hostname = socket.gethostname()
                 self._instance_id = f"{hostname}-{uuid4().hex[:8]}"
 
-                # Register message handler for cross-instance messages
-                self._redis_pubsub.on_message(
-                    f"{RedisPubSubManager.REALTIME_CHANNEL_PREFIX}:*",
-                    self._handle_redis_message
-                )
-
                 # Start the listener if not already started
                 if not self._redis_listener_started:
                     await self._redis_pubsub.start_listener()
@@ -160,6 +197,54 @@ class ConnectionManager:
 
         return self._redis_pubsub
 
+    @staticmethod
+    def _redis_channel(channel: str) -> str:
+        """Get the Redis channel carrying a channel's cross-instance messages."""
+        return f"{RedisPubSubManager.REALTIME_CHANNEL_PREFIX}:{channel}"
+
+    async def _update_redis_interest(self, channels: Iterable[str]) -> None:
+        """Subscribe to or unsubscribe from the Redis channels of channels.
+
+        A channel's Redis channel is subscribed while the channel has local
+        subscribers; its subscriber set acts as the reference count. The
+        subscriptions are reconciled against that state, so concurrent
+        subscribes and unsubscribes settle on the right one, and a failed
+        Redis subscribe is retried on the channel's next local subscribe.
+
+        Args:
+            channels: Channels whose local subscribers changed
+        """
+        if not REDIS_AVAILABLE:
+            return
+
+        redis_manager = await self._ensure_redis()
+        if not redis_manager:
+            return
+
+        async with self._redis_lock:
+            subscribed = False
+            for channel in channels:
+                wanted = channel in self._channel_subscribers
+                if wanted == (channel in self._redis_channels):
+                    continue
+
+                redis_channel = self._redis_channel(channel)
+                if wanted:
+                    redis_manager.on_message(redis_channel, self._handle_redis_message)
+                    if await redis_manager.subscribe(redis_channel):
+                        self._redis_channels.add(channel)
+                        subscribed = True
+                    else:
+                        redis_manager.off_message(redis_channel, self._handle_redis_message)
+                else:
+                    self._redis_channels.discard(channel)
+                    redis_manager.off_message(redis_channel, self._handle_redis_message)
+                    await redis_manager.unsubscribe(redis_channel)
+
+            # The listener stops when it has no subscriptions left
+            if subscribed:
+                await redis_manager.start_listener()
+
     async def _handle_redis_message(self, message: dict[str, Any]) -> None:
         """Handle incoming Redis pub/sub message from another instance.
 
@@ -181,20 +266,18 @@ class ConnectionManager:
                 logger.warning(f"Invalid Redis message: {message}")
                 return
 
-            # Deserialize event using Pydantic
-            event = BaseEvent.model_validate(event_data)
+            # Relay the frame the publishing instance serialized; messages
+            # without one are deserialized using Pydantic
+            frame = message.get("frame")
+            if frame is None:
+                frame = self._serialize(BaseEvent.model_validate(event_data))
 
             # Broadcast to local connections subscribed to this channel
             # Don't send back to the original connection if specified
-            connection_ids = self._channel_subscribers.get(channel, set())
-            for conn_id in connection_ids:
-                if conn_id == exclude_connection:
-                    continue
-                await self.send_to_connection(conn_id, event)
+            sent = self._fan_out(channel, frame, exclude_connection)
 
             logger.debug(
-                f"Relayed Redis message to {len(connection_ids)} local connections "
-                f"for channel {channel}"
+                f"Relayed Redis message to {sent} local connections for channel {channel}"
             )
 
         except Exception as e:
@@ -229,7 +312,10 @@ class ConnectionManager:
             user_color=self._get_next_color(),
             connected_at=now,
             last_ping=now,
+            send_queue=asyncio.Queue(maxsize=self._send_queue_size),
         )
+        connection.writer_task = asyncio.create_task(self._write_frames(connection))
+        self._ensure_watchdog()
 
         async with self._lock:
             self._connections[connection_id] = connection
@@ -258,19 +344,34 @@ class ConnectionManager:
             reason: Optional disconnect reason
         """
         async with self._lock:
-            connection = self._connections.pop(connection_id, None)
+            connection = self._connections.get(connection_id)
             if not connection:
                 return
 
+            # Unsubscribe from all channels
+            channels = list(connection.subscriptions)
+            for channel in channels:
+                await self._unsubscribe_internal(connection_id, channel)
+
+            del self._connections[connection_id]
+
             # Remove from user connections
             if connection.user_id in self._user_connections:
                 self._user_connections[connection.user_id].discard(connection_id)
                 if not self._user_connections[connection.user_id]:
                     del self._user_connections[connection.user_id]
 
-            # Unsubscribe from all channels
-            for channel in list(connection.subscriptions):
-                await self._unsubscribe_internal(connection_id, channel)
+        await self._update_redis_interest(channels)
+
+        # Stop the writer; frames still queued are discarded
+        connection.closing = True
+        writer = connection.writer_task
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        queue = connection.send_queue
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
 
         logger.info(f"WebSocket disconnected: {connection_id} (reason: {reason})")
 
@@ -295,6 +396,8 @@ class ConnectionManager:
                 self._channel_subscribers[channel] = set()
             self._channel_subscribers[channel].add(connection_id)
 
+        await self._update_redis_interest((channel,))
+
         # Send confirmation
         await self.send_to_connection(
             connection_id,
@@ -321,6 +424,7 @@ class ConnectionManager:
             result = await self._unsubscribe_internal(connection_id, channel)
 
         if result:
+            await self._update_redis_interest((channel,))
             await self.send_to_connection(
                 connection_id,
                 UnsubscribedEvent(channel=channel),
@@ -344,6 +448,131 @@ class ConnectionManager:
         logger.debug(f"Connection {connection_id} unsubscribed from {channel}")
         return True
 
+    @staticmethod
+    def _serialize(event: BaseEvent) -> str:
+        """Serialize an event into a WebSocket text frame."""
+        return WebSocketMessage.from_event(event).model_dump_json()
+
+    def _enqueue(self, connection: Connection, frame: str) -> bool:
+        """Queue a frame for a connection's writer, applying the slow consumer policy.
+
+        Args:
+            connection: Target connection
+            frame: Serialized frame (shared by every recipient of a broadcast)
+
+        Returns:
+            True if queued, False if the connection is closing or was closed
+            for being too slow
+        """
+        if connection.closing or connection.send_queue is None:
+            return False
+
+        queue = connection.send_queue
+        websocket_send_queue_histogram.observe(queue.qsize())
+        if queue.full():
+            if self._slow_consumer_policy == "disconnect":
+                _frames_slow_disconnect.inc()
+                self._schedule_disconnect(connection, "slow consumer", SLOW_CONSUMER_CLOSE_CODE)
+                return False
+            queue.get_nowait()
+            queue.task_done()
+            _frames_dropped.inc()
+
+        queue.put_nowait(frame)
+        return True
+
+    def _fan_out(
+        self,
+        channel: str,
+        frame: str,
+        exclude_connection: Optional[str] = None,
+    ) -> int:
+        """Queue a frame for every local subscriber of a channel.
+
+        Returns:
+            Number of connections the frame was queued for
+        """
+        sent = 0
+        for conn_id in self._channel_subscribers.get(channel, ()):
+            if conn_id == exclude_connection:
+                continue
+            connection = self._connections.get(conn_id)
+            if connection is not None and self._enqueue(connection, frame):
+                sent += 1
+        return sent
+
+    async def _write_frames(self, connection: Connection) -> None:
+        """Writer task: send a connection's queued frames in order."""
+        queue = connection.send_queue
+        while True:
+            frame = await queue.get()
+            # Watched by _watch_sends instead of a timer per send
+            connection.send_started = time.monotonic()
+            try:
+                await connection.websocket.send_text(frame)
+                _frames_sent.inc()
+            except Exception as e:
+                reason = str(e) or type(e).__name__
+                logger.error(f"Failed to send to {connection.connection_id}: {reason}")
+                _frames_failed.inc()
+                # Connection may be dead, schedule disconnect
+                self._schedule_disconnect(connection, reason, SLOW_CONSUMER_CLOSE_CODE)
+                return
+            finally:
+                connection.send_started = None
+                queue.task_done()
+
+    def _ensure_watchdog(self) -> None:
+        if self._watchdog is not None and not self._watchdog.done():
+            return
+        self._watchdog = asyncio.create_task(self._watch_sends())
+
+    async def _watch_sends(self) -> None:
+        """Close connections whose current send has taken longer than the send timeout.
+
+        Checked every half timeout, so a stuck send is detected after 1 to
+        1.5 times ``realtime_send_timeout``.
+        """
+        while True:
+            await asyncio.sleep(self._send_timeout / 2)
+            deadline = time.monotonic() - self._send_timeout
+            for connection in list(self._connections.values()):
+                started = connection.send_started
+                if started is None or started > deadline or connection.closing:
+                    continue
+                logger.warning(f"Send to {connection.connection_id} timed out")
+                _frames_failed.inc()
+                if connection.writer_task is not None:
+                    connection.writer_task.cancel()
+                self._schedule_disconnect(connection, "send timeout", SLOW_CONSUMER_CLOSE_CODE)
+
+    def _schedule_disconnect(
+        self,
+        connection: Connection,
+        reason: str,
+        close_code: Optional[int] = None,
+    ) -> None:
+        """Disconnect a connection in the background (once)."""
+        if connection.closing:
+            return
+        connection.closing = True
+        asyncio.create_task(self._close(connection, reason, close_code))
+
+    async def _close(
+        self,
+        connection: Connection,
+        reason: str,
+        close_code: Optional[int] = None,
+    ) -> None:
+        await self.disconnect(connection.connection_id, reason)
+        if close_code is None:
+            return
+        try:
+            await connection.websocket.close(code=close_code, reason=reason[:120])
+        except Exception:
+            # Already closed by the client
+            pass
+
     async def send_to_connection(
         self,
         connection_id: str,
@@ -351,26 +580,20 @@ class ConnectionManager:
     ) -> bool:
         """Send an event to a specific connection.
 
+        The event is queued for the connection's writer task.
+
         Args:
             connection_id: Target connection ID
             event: Event to send
 
         Returns:
-            True if sent, False if connection not found
+            True if queued, False if connection not found or closing
         """
         connection = self._connections.get(connection_id)
         if not connection:
             return False
 
-        try:
-            message = WebSocketMessage.from_event(event)
-            await connection.websocket.send_json(message.model_dump(mode="json"))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send to {connection_id}: {e}")
-            # Connection may be dead, schedule disconnect
-            asyncio.create_task(self.disconnect(connection_id, str(e)))
-            return False
+        return self._enqueue(connection, self._serialize(event))
 
     async def send_to_user(self, user_id: str, event: BaseEvent) -> int:
         """Send an event to all connections of a user.
@@ -383,9 +606,11 @@ class ConnectionManager:
             Number of connections message was sent to
         """
         connection_ids = self._user_connections.get(user_id, set())
+        frame = self._serialize(event)
         sent = 0
         for conn_id in connection_ids:
-            if await self.send_to_connection(conn_id, event):
+            connection = self._connections.get(conn_id)
+            if connection is not None and self._enqueue(connection, frame):
                 sent += 1
         return sent
 
@@ -397,6 +622,9 @@ class ConnectionManager:
     ) -> int:
         """Broadcast an event to all subscribers of a channel.
 
+        The event is serialized once and the frame is queued for every local
+        subscriber, then published to Redis for the other instances.
+
         Args:
             channel: Target channel
             event: Event to broadcast
@@ -405,15 +633,12 @@ class ConnectionManager:
         Returns:
             Number of connections message was sent to
         """
-        connection_ids = self._channel_subscribers.get(channel, set())
-        sent = 0
+        started = time.perf_counter()
+        frame = self._serialize(event)
 
         # Send to local connections
-        for conn_id in connection_ids:
-            if conn_id == exclude_connection:
-                continue
-            if await self.send_to_connection(conn_id, event):
-                sent += 1
+        sent = self._fan_out(channel, frame, exclude_connection)
+        websocket_fanout_histogram.observe(time.perf_counter() - started)
 
         # Also publish to Redis for cross-instance broadcasting
         redis_manager = await self._ensure_redis()
@@ -424,12 +649,14 @@ class ConnectionManager:
                     "instance_id": self._instance_id,
                     "channel": channel,
                     "event": event.model_dump(mode="json"),
+                    "frame": frame,
                     "exclude_connection": exclude_connection,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
 
-                # Publish to Redis channel
-                redis_channel = f"{RedisPubSubManager.REALTIME_CHANNEL_PREFIX}:{channel}"
+                # Published to the channel's Redis channel; only instances
+                # with subscribers to the channel receive it
+                redis_channel = self._redis_channel(channel)
                 await redis_manager.publish(redis_channel, redis_message)
 
                 logger.debug(f"Published to Redis channel: {redis_channel}")
@@ -453,14 +680,21 @@ class ConnectionManager:
         Returns:
             Number of connections message was sent to
         """
+        frame = self._serialize(event)
         sent = 0
-        for conn_id in self._connections:
+        for conn_id, connection in self._connections.items():
             if conn_id == exclude_connection:
                 continue
-            if await self.send_to_connection(conn_id, event):
+            if self._enqueue(connection, frame):
                 sent += 1
         return sent
 
+    async def flush(self) -> None:
+        """Wait until every frame queued so far has been sent or discarded."""
+        for connection in list(self._connections.values()):
+            if connection.send_queue is not None and not connection.closing:
+                await connection.send_queue.join()
+
     async def handle_ping(self, connection_id: str) -> None:
         """Handle ping from client, update last_ping and send pong."""
         connection = self._connections.get(connection_id)
@@ -522,6 +756,12 @@ class ConnectionManager:
             "total_connections": self.connection_count,
             "total_users": self.user_count,
             "channels": {channel: len(subs) for channel, subs in self._channel_subscribers.items()},
+            "redis_channels": len(self._redis_channels),
+            "queued_frames": sum(
+                conn.send_queue.qsize()
+                for conn in self._connections.values()
+                if conn.send_queue is not None
+            ),
         }
 
     async def cleanup_dead_connections(self) -> int:
@@ -562,6 +802,16 @@ class ConnectionManager:
                 logger.warning(f"Error closing Redis pub/sub: {e}")
 
         self._redis_listener_started = False
+        self._redis_channels.clear()
+
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
+        for connection in self._connections.values():
+            connection.closing = True
+            if connection.writer_task is not None:
+                connection.writer_task.cancel()
+
         logger.info("ConnectionManager shut down")
 
 
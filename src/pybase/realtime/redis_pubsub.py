@@ -13,6 +13,7 @@ Supported channel patterns:
 """
 
 import asyncio
+import fnmatch
 import json
 import logging
 from typing import Any, Callable, Optional
@@ -46,6 +47,10 @@ class RedisPubSubManager:
         self._pubsub: Optional[redis.client.PubSub] = None
         self._listener_task: Optional[asyncio.Task] = None
         self._message_handlers: dict[str, list[Callable]] = {}
+        # Handler keys that are patterns, the only ones matched with fnmatch
+        self._handler_patterns: set[str] = set()
+        # Called when the listener stops and messages may be missed
+        self._stopped_handlers: list[Callable[[], None]] = []
         self._is_listening = False
         self._lock = asyncio.Lock()
 
@@ -216,6 +221,8 @@ class RedisPubSubManager:
         """
         if channel not in self._message_handlers:
             self._message_handlers[channel] = []
+            if _is_pattern(channel):
+                self._handler_patterns.add(channel)
         self._message_handlers[channel].append(handler)
         logger.debug(f"Registered handler for channel: {channel}")
 
@@ -232,6 +239,7 @@ class RedisPubSubManager:
         if handler is None:
             # Remove all handlers for this channel
             del self._message_handlers[channel]
+            self._handler_patterns.discard(channel)
             logger.debug(f"Removed all handlers for channel: {channel}")
         else:
             # Remove specific handler
@@ -241,9 +249,32 @@ class RedisPubSubManager:
                 # Clean up empty handler lists
                 if not self._message_handlers[channel]:
                     del self._message_handlers[channel]
+                    self._handler_patterns.discard(channel)
             except ValueError:
                 pass  # Handler not in list
 
+    def on_listener_stopped(self, handler: Callable[[], None]) -> None:
+        """Register a callback for when the listener stops.
+
+        Messages published while no listener runs are never received, so
+        state kept in sync by them can no longer be trusted.
+
+        Args:
+            handler: Callback function()
+        """
+        self._stopped_handlers.append(handler)
+
+    def off_listener_stopped(self, handler: Callable[[], None]) -> None:
+        """Unregister a listener stop callback.
+
+        Args:
+            handler: Callback to remove
+        """
+        try:
+            self._stopped_handlers.remove(handler)
+        except ValueError:
+            pass  # Handler not in list
+
     async def _handle_message(self, message: dict[str, Any]) -> None:
         """Handle an incoming Redis pub/sub message.
 
@@ -252,15 +283,27 @@ class RedisPubSubManager:
         """
         try:
             # Ignore non-message types
-            if message.get("type") not in ("message", "pmessage"):
+            message_type = message.get("type")
+            if message_type not in ("message", "pmessage"):
                 return
 
             # Extract channel and data
             channel = message.get("channel", "")
-            if message.get("type") == "pmessage":
+            if message_type == "pmessage":
                 # For pattern subscriptions, use the pattern matched
                 channel = message.get("pattern", channel)
 
+            # Handlers for the exact channel (or the matched pattern). Messages
+            # on exact subscriptions also go to handlers registered for
+            # patterns matching the channel.
+            handlers = list(self._message_handlers.get(channel, ()))
+            if message_type == "message":
+                for pattern in self._handler_patterns:
+                    if fnmatch.fnmatchcase(channel, pattern):
+                        handlers.extend(self._message_handlers[pattern])
+            if not handlers:
+                return
+
             data_str = message.get("data")
             if not data_str:
                 return
@@ -272,20 +315,6 @@ class RedisPubSubManager:
                 logger.warning(f"Failed to parse message from {channel}: {data_str}")
                 return
 
-            # Find and call handlers
-            # Check for exact channel match first
-            handlers = self._message_handlers.get(channel, [])
-
-            # Also check for pattern matches
-            for pattern, pattern_handlers in self._message_handlers.items():
-                if "*" in pattern:
-                    # Simple pattern matching (convert to glob-like pattern)
-                    # Redis pattern syntax: * matches any characters
-                    import fnmatch
-
-                    if fnmatch.fnmatch(channel, pattern):
-                        handlers.extend(pattern_handlers)
-
             # Call all handlers
             for handler in handlers:
                 try:
@@ -324,6 +353,11 @@ class RedisPubSubManager:
             logger.error(f"Redis pub/sub listener error: {e}")
         finally:
             self._is_listening = False
+            for handler in list(self._stopped_handlers):
+                try:
+                    handler()
+                except Exception as e:
+                    logger.error(f"Listener stop handler error: {e}")
             logger.info("Redis pub/sub listener stopped")
 
     async def start_listener(self) -> bool:
@@ -334,7 +368,7 @@ class RedisPubSubManager:
         """
         async with self._lock:
             if self._listener_task is not None and not self._listener_task.done():
-                logger.warning("Redis pub/sub listener already running")
+                logger.debug("Redis pub/sub listener already running")
                 return True
 
             try:
@@ -389,6 +423,7 @@ class RedisPubSubManager:
 
             # Clear handlers
             self._message_handlers.clear()
+            self._handler_patterns.clear()
             logger.info("Redis pub/sub manager closed")
 
     @property
@@ -402,6 +437,11 @@ class RedisPubSubManager:
         return self._is_listening
 
 
+def _is_pattern(channel: str) -> bool:
+    """Check whether a handler key is a glob-style channel pattern."""
+    return any(char in channel for char in "*?[")
+
+
 # Global pub/sub manager instance
 pubsub_manager = RedisPubSubManager()
 
@@ -20,6 +20,9 @@ class FieldBase(BaseModel):
     )
     is_required: bool = Field(default=False, description="Whether field is required")
     is_unique: bool = Field(default=False, description="Whether field values must be unique")
+    is_indexed: bool = Field(
+        default=False, description="Whether to index field values for fast filtering and sorting"
+    )
 
 
 class FieldCreate(FieldBase):
@@ -37,6 +40,9 @@ class FieldUpdate(BaseModel):
     options: Optional[dict[str, Any]] = Field(None, description="Type-specific options (JSON)")
     is_required: Optional[bool] = Field(None, description="Whether field is required")
     is_unique: Optional[bool] = Field(None, description="Whether field values must be unique")
+    is_indexed: Optional[bool] = Field(
+        None, description="Whether to index field values for fast filtering and sorting"
+    )
     width: Optional[int] = Field(None, ge=50, le=1000, description="Field width in pixels")
     is_visible: Optional[bool] = Field(None, description="Whether field is visible")
     is_primary: Optional[bool] = Field(None, description="Whether this is the primary field")
@@ -332,3 +332,31 @@ class ReindexRequest(BaseModel):
         le=10000,
         description="Number of records to index per batch",
     )
+    shadow: bool = Field(
+        default=False,
+        description="Rebuild into a shadow index and swap it in when done, so search "
+        "keeps serving the old index during the rebuild",
+    )
+    resume: bool = Field(
+        default=True,
+        description="Continue an unfinished reindex from its checkpoint",
+    )
+
+
+class ReindexStatus(BaseModel):
+    """Response schema for the progress of a reindex job."""
+
+    base_id: str = Field(..., description="Base being reindexed")
+    table_ids: list[str] = Field(..., description="Tables covered by the job")
+    scope: str = Field(..., description='"all" for a whole-base job, else the table ID')
+    shadow: bool = Field(..., description="Whether the job rebuilds a shadow index")
+    status: str = Field(..., description="running, completed or failed")
+    table_position: int = Field(..., description="Index of the table being reindexed")
+    last_record_id: Optional[str] = Field(None, description="Last record ID applied")
+    indexed: int = Field(..., description="Records indexed so far")
+    removed: int = Field(..., description="Deleted records removed from the index")
+    total: int = Field(..., description="Records to index")
+    progress: float = Field(..., description="Fraction of records indexed")
+    error: Optional[str] = Field(None, description="Error of a failed job")
+    started_at: str = Field(..., description="When the job started")
+    updated_at: str = Field(..., description="When the checkpoint was last saved")
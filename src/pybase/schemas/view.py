@@ -316,6 +316,9 @@ class ViewDataRequest(BaseModel):
     )
     override_sorts: Optional[list[SortRule]] = Field(None, description="Override view sorts")
     search: Optional[str] = Field(None, description="Search query across all fields")
+    cursor: Optional[str] = Field(
+        None, description="Keyset cursor from a previous response (overrides page)"
+    )
 
 
 class ViewDataResponse(BaseModel):
@@ -327,6 +330,7 @@ class ViewDataResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # =============================================================================
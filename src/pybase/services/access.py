@@ -0,0 +1,193 @@
+"""
+Table access resolution.
+
+Checking access to a table used to take four sequential round trips
+(table, base, workspace, membership). ``get_table_access`` resolves the
+whole chain and the user's role in one joined query and caches the
+result per (user, table) for a few seconds in process (``AccessCache``).
+Membership, role and deletion changes call ``invalidate_access``, which
+drops the affected entries on every worker through pub/sub.
+
+A request resolving access while the change is still uncommitted reads the
+old state and could cache it again, so changes made in a session are
+invalidated a second time once that session commits.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.cache.access_cache import AccessCache
+from pybase.core.exceptions import NotFoundError, PermissionDeniedError
+from pybase.models.base import Base
+from pybase.models.table import Table
+from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+
+_cache = AccessCache()
+
+# Session.info keys of the invalidations to repeat once a session's
+# transaction commits, and whether the session's listeners are registered
+_PENDING = "access_invalidations"
+_LISTENING = "access_invalidation_listening"
+
+# Post-commit invalidations in flight, referenced until done
+_tasks: set[asyncio.Task] = set()
+
+# Roles allowed to change data (everyone but commenters and viewers)
+EDITOR_ROLES = (WorkspaceRole.OWNER, WorkspaceRole.ADMIN, WorkspaceRole.EDITOR)
+ADMIN_ROLES = (WorkspaceRole.OWNER, WorkspaceRole.ADMIN)
+
+
+@dataclass(frozen=True)
+class TableAccess:
+    """A user's access to a table."""
+
+    table_id: str
+    base_id: str
+    workspace_id: str
+    # None if the user is not a member of the workspace
+    role: Optional[WorkspaceRole]
+
+    @property
+    def is_member(self) -> bool:
+        """Whether the user can access the table at all."""
+        return self.role is not None
+
+    def has_role(self, roles: Iterable[WorkspaceRole]) -> bool:
+        """Whether the user's role is one of ``roles``."""
+        return self.role is not None and self.role in tuple(roles)
+
+
+async def get_table_access(db: AsyncSession, table_id: str, user_id: str) -> TableAccess:
+    """Resolve a user's access to a table.
+
+    On a cache miss the table is loaded into the session along with the
+    rest of the chain, so a following ``db.get(Table, table_id)`` does not
+    hit the database.
+
+    Args:
+        db: Database session
+        table_id: Table ID
+        user_id: User ID
+
+    Returns:
+        Table access (``role`` is None for non-members)
+
+    Raises:
+        NotFoundError: If the table, its base or its workspace is missing or deleted
+
+    """
+    table_id, user_id = str(table_id), str(user_id)
+    cached = await _cache.get(table_id, user_id)
+    if cached is not None:
+        return cached
+
+    generation = _cache.generation
+    query = (
+        select(
+            Table,
+            Base.id.label("base_id"),
+            Base.deleted_at.label("base_deleted_at"),
+            Workspace.id.label("workspace_id"),
+            Workspace.deleted_at.label("workspace_deleted_at"),
+            WorkspaceMember.role,
+        )
+        .outerjoin(Base, Base.id == Table.base_id)
+        .outerjoin(Workspace, Workspace.id == Base.workspace_id)
+        .outerjoin(
+            WorkspaceMember,
+            and_(
+                WorkspaceMember.workspace_id == Workspace.id,
+                WorkspaceMember.user_id == user_id,
+            ),
+        )
+        .where(Table.id == table_id)
+    )
+    row = (await db.execute(query)).first()
+
+    if row is None or row.Table.is_deleted:
+        raise NotFoundError("Table not found")
+    if row.base_id is None or row.base_deleted_at is not None:
+        raise NotFoundError("Base not found")
+    if row.workspace_id is None or row.workspace_deleted_at is not None:
+        raise NotFoundError("Workspace not found")
+
+    access = TableAccess(
+        table_id=table_id,
+        base_id=str(row.base_id),
+        workspace_id=str(row.workspace_id),
+        role=WorkspaceRole(row.role) if row.role is not None else None,
+    )
+    _cache.set(
+        table_id, user_id, access, access.base_id, access.workspace_id, generation=generation
+    )
+    return access
+
+
+async def require_table_access(
+    db: AsyncSession,
+    table_id: str,
+    user_id: str,
+    roles: Optional[Iterable[WorkspaceRole]] = None,
+    message: str = "You don't have access to this table",
+) -> TableAccess:
+    """Resolve a user's access to a table and require membership (and a role).
+
+    The table, base, workspace and role are resolved in one query, cached
+    per worker. On a cache miss that query also loads the table into the
+    session, so callers can ``db.get(Table, table_id)`` afterwards, which
+    only hits the database when the check was served from cache.
+
+    Args:
+        db: Database session
+        table_id: Table ID
+        user_id: User ID
+        roles: Roles allowed (None for any member)
+        message: Error message if access is denied
+
+    Returns:
+        Table access
+
+    Raises:
+        NotFoundError: If the table, its base or its workspace is missing or deleted
+        PermissionDeniedError: If the user is not a member or lacks a required role
+
+    """
+    access = await get_table_access(db, table_id, user_id)
+    if not access.is_member or (roles is not None and not access.has_role(roles)):
+        raise PermissionDeniedError(message)
+    return access
+
+
+async def invalidate_access(scope: str, entity_id: str, db: Optional[AsyncSession] = None) -> None:
+    """Drop cached table access after a membership, role or deletion change.
+
+    Args:
+        scope: "table", "base", "workspace" or "user"
+        entity_id: ID of the changed entity
+        db: Session making the change; if given, the entries are dropped
+            again once its transaction commits
+
+    """
+    await _cache.invalidate(scope, str(entity_id))
+    if db is not None:
+        if not db.info.get(_LISTENING):
+            event.listen(db.sync_session, "after_commit", _after_commit)
+            event.listen(db.sync_session, "after_rollback", _after_rollback)
+            db.info[_LISTENING] = True
+        db.info.setdefault(_PENDING, []).append((scope, str(entity_id)))
+
+
+def _after_commit(session: Any) -> None:
+    loop = asyncio.get_running_loop()
+    for scope, entity_id in dict.fromkeys(session.info.pop(_PENDING, ())):
+        task = loop.create_task(_cache.invalidate(scope, entity_id))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+def _after_rollback(session: Any) -> None:
+    session.info.pop(_PENDING, None)
@@ -1,27 +1,38 @@
 """Analytics service for data aggregation and chart computations."""
 
-import json
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, case
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.exceptions import (
     NotFoundError,
-    PermissionDeniedError,
     ValidationError,
 )
-from pybase.models.base import Base
 from pybase.models.field import Field
-from pybase.models.record import Record
 from pybase.models.table import Table
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from pybase.services.access import require_table_access
+from pybase.services.analytics_query import (
+    AGGREGATION_TYPES,
+    MAX_PIVOT_COLUMNS,
+    AnalyticsQueryCompiler,
+    to_python_number,
+)
 
 
 class AnalyticsService:
-    """Service for analytics operations and data aggregation."""
+    """Service for analytics operations and data aggregation.
+
+    Filtering and aggregation are compiled to SQL over the JSONB record
+    data (see ``AnalyticsQueryCompiler``), so only aggregated rows are
+    loaded from the database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize analytics service."""
+        self.query_compiler = AnalyticsQueryCompiler()
 
     async def aggregate_field(
         self,
@@ -58,18 +69,14 @@ class AnalyticsService:
         field = await self._get_field(db, field_id, table_id)
 
         # Validate aggregation type
-        valid_aggregations = ["sum", "avg", "count", "min", "max", "median", "distinct_count"]
-        if aggregation_type not in valid_aggregations:
+        if aggregation_type not in AGGREGATION_TYPES:
             raise ValidationError(
-                f"Invalid aggregation type. Must be one of: {', '.join(valid_aggregations)}"
+                f"Invalid aggregation type. Must be one of: {', '.join(AGGREGATION_TYPES)}"
             )
 
-        # Get records
-        records = await self._get_filtered_records(db, table_id, filters)
-
-        # Perform aggregation
-        result = await self._perform_aggregation(
-            records, field.name, aggregation_type
+        # Aggregate in the database
+        result, record_count = await self._run_aggregate(
+            db, table_id, str(field.id), aggregation_type, filters
         )
 
         return {
@@ -78,7 +85,7 @@ class AnalyticsService:
             "field_name": field.name,
             "aggregation_type": aggregation_type,
             "value": result,
-            "record_count": len(records),
+            "record_count": record_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -127,15 +134,14 @@ class AnalyticsService:
                 f"value_field_id is required for {aggregation_type} aggregation"
             )
 
-        # Get records
-        records = await self._get_filtered_records(db, table_id, filters)
-
-        # Group and aggregate
-        groups = await self._group_and_aggregate(
-            records,
-            group_field.name,
-            value_field.name if value_field else None,
+        # Group and aggregate in the database
+        groups, record_count = await self._run_group_by(
+            db,
+            table_id,
+            str(group_field.id),
+            str(value_field.id) if value_field else None,
             aggregation_type,
+            filters,
             limit,
         )
 
@@ -152,7 +158,7 @@ class AnalyticsService:
             "aggregation_type": aggregation_type,
             "groups": groups,
             "total_groups": len(groups),
-            "record_count": len(records),
+            "record_count": record_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -205,16 +211,15 @@ class AnalyticsService:
                 f"value_field_id is required for {aggregation_type} aggregation"
             )
 
-        # Get records
-        records = await self._get_filtered_records(db, table_id, filters)
-
-        # Create pivot table
-        pivot_data = await self._create_pivot(
-            records,
-            row_field.name,
-            column_field.name if column_field else None,
-            value_field.name if value_field else None,
+        # Create pivot table in the database
+        pivot_data, record_count = await self._create_pivot(
+            db,
+            table_id,
+            str(row_field.id),
+            str(column_field.id) if column_field else None,
+            str(value_field.id) if value_field else None,
             aggregation_type,
+            filters,
         )
 
         return {
@@ -233,7 +238,7 @@ class AnalyticsService:
             } if value_field else None,
             "aggregation_type": aggregation_type,
             "data": pivot_data,
-            "record_count": len(records),
+            "record_count": record_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -289,17 +294,15 @@ class AnalyticsService:
         if group_field_id:
             group_field = await self._get_field(db, group_field_id, table_id)
 
-        # Get records
-        records = await self._get_filtered_records(db, table_id, filters)
-
-        # Compute chart data
-        chart_data = await self._compute_chart_series(
-            records,
-            x_field.name,
-            y_field.name if y_field else None,
-            group_field.name if group_field else None,
+        # Compute chart data in the database
+        chart_data, record_count = await self._compute_chart_series(
+            db,
+            table_id,
+            str(x_field.id),
+            str(y_field.id) if y_field else None,
+            str(group_field.id) if group_field else None,
             aggregation_type,
-            sorts,
+            filters,
             limit,
         )
 
@@ -319,7 +322,7 @@ class AnalyticsService:
             } if group_field else None,
             "aggregation_type": aggregation_type,
             "data": chart_data,
-            "record_count": len(records),
+            "record_count": record_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -351,15 +354,13 @@ class AnalyticsService:
         # Check table access
         table = await self._get_table_with_access(db, table_id, user_id)
 
-        # Get records
-        records = await self._get_filtered_records(db, table_id, filters)
-
-        # Compute statistics for each field
+        # Compute statistics for each field in the database
         stats = {}
+        record_count = None
         for field_id in field_ids:
             field = await self._get_field(db, field_id, table_id)
-            field_stats = await self._compute_field_statistics(
-                records, field.name, field.field_type
+            field_stats, record_count = await self._compute_field_statistics(
+                db, table_id, str(field.id), filters
             )
             stats[field_id] = {
                 "field_name": field.name,
@@ -367,10 +368,16 @@ class AnalyticsService:
                 "statistics": field_stats,
             }
 
+        if record_count is None:
+            count_query = select(func.count()).where(
+                *self.query_compiler.where(table_id, filters)
+            )
+            record_count = (await db.execute(count_query)).scalar_one()
+
         return {
             "table_id": table_id,
             "fields": stats,
-            "record_count": len(records),
+            "record_count": record_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
 
@@ -397,89 +404,13 @@ class AnalyticsService:
             PermissionDeniedError: If user doesn't have access
 
         """
+        await require_table_access(db, table_id, user_id)
+
         table = await db.get(Table, table_id)
         if not table or table.is_deleted:
             raise NotFoundError("Table not found")
-
-        # Check workspace access
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), user_id)
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
-
         return table
 
-    async def _get_base(
-        self,
-        db: AsyncSession,
-        base_id: str,
-    ) -> Base:
-        """Get base by ID.
-
-        Args:
-            db: Database session
-            base_id: Base ID
-
-        Returns:
-            Base
-
-        Raises:
-            NotFoundError: If base not found
-
-        """
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base not found")
-        return base
-
-    async def _get_workspace(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-    ) -> Workspace:
-        """Get workspace by ID.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-
-        Returns:
-            Workspace
-
-        Raises:
-            NotFoundError: If workspace not found
-
-        """
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace not found")
-        return workspace
-
-    async def _get_workspace_member(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-            user_id: User ID
-
-        Returns:
-            WorkspaceMember or None
-
-        """
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
     async def _get_field(
         self,
         db: AsyncSession,
@@ -509,314 +440,212 @@ class AnalyticsService:
 
         return field
 
-    async def _get_filtered_records(
+    async def _run_aggregate(
         self,
         db: AsyncSession,
         table_id: str,
+        key: str,
+        aggregation_type: str,
         filters: Optional[list[dict[str, Any]]] = None,
-    ) -> list[Record]:
-        """Get records with optional filters applied.
+    ) -> tuple[Any, int]:
+        """Aggregate one value over all matching records in the database.
 
         Args:
             db: Database session
             table_id: Table ID
+            key: Key of the value in the record data
+            aggregation_type: Type of aggregation
             filters: Optional filter conditions
 
         Returns:
-            List of records
+            Tuple of (aggregated value or None if no record has a value, record count)
 
         """
-        query = select(Record).where(
-            Record.table_id == table_id,
-            Record.deleted_at.is_(None),
-        )
-
-        # Apply filters if provided
-        # Note: Basic implementation - full filter logic would be more complex
-        if filters:
-            # Filters will be applied in memory for now
-            # Production implementation should use database-level filtering
-            pass
-
-        result = await db.execute(query)
-        records = list(result.scalars().all())
-
-        # Apply in-memory filters if provided
-        if filters:
-            records = self._apply_filters_in_memory(records, filters)
-
-        return records
-
-    def _apply_filters_in_memory(
-        self,
-        records: list[Record],
-        filters: list[dict[str, Any]],
-    ) -> list[Record]:
-        """Apply filters to records in memory.
-
-        Args:
-            records: List of records
-            filters: Filter conditions
-
-        Returns:
-            Filtered list of records
+        query = self.query_compiler.aggregate_query(table_id, key, aggregation_type, filters)
+        row = (await db.execute(query)).one()
+        if not row.value_count:
+            return None, row.record_count
+        if aggregation_type == "count":
+            return row.record_count, row.record_count
+        return to_python_number(row.value), row.record_count
 
-        """
-        filtered_records = []
-        for record in records:
-            data = record.get_all_values()
-            matches = True
-
-            for filter_condition in filters:
-                field_id = filter_condition.get("field_id")
-                operator = filter_condition.get("operator", "equals")
-                value = filter_condition.get("value")
-
-                record_value = data.get(field_id)
-
-                # Apply operator logic
-                if operator == "equals" and record_value != value:
-                    matches = False
-                    break
-                elif operator == "not_equals" and record_value == value:
-                    matches = False
-                    break
-                elif operator == "contains" and value not in str(record_value):
-                    matches = False
-                    break
-                elif operator == "greater_than":
-                    try:
-                        if float(record_value) <= float(value):
-                            matches = False
-                            break
-                    except (ValueError, TypeError):
-                        matches = False
-                        break
-                elif operator == "less_than":
-                    try:
-                        if float(record_value) >= float(value):
-                            matches = False
-                            break
-                    except (ValueError, TypeError):
-                        matches = False
-                        break
-
-            if matches:
-                filtered_records.append(record)
-
-        return filtered_records
-
-    async def _perform_aggregation(
+    async def _run_group_by(
         self,
-        records: list[Record],
-        field_name: str,
+        db: AsyncSession,
+        table_id: str,
+        group_key: str,
+        value_key: Optional[str],
         aggregation_type: str,
-    ) -> Any:
-        """Perform aggregation on field values.
+        filters: Optional[list[dict[str, Any]]],
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Group matching records in the database and aggregate each group.
 
         Args:
-            records: List of records
-            field_name: Name of field to aggregate
+            db: Database session
+            table_id: Table ID
+            group_key: Key to group by
+            value_key: Key to aggregate
             aggregation_type: Type of aggregation
+            filters: Optional filter conditions
+            limit: Maximum number of groups
 
         Returns:
-            Aggregated value
+            Tuple of (groups sorted by value descending, record count)
 
         """
-        values = []
-        for record in records:
-            data = record.get_all_values()
-            value = data.get(field_name)
-            if value is not None:
-                values.append(value)
-
-        if not values:
-            return None
+        query = self.query_compiler.group_query(
+            table_id, group_key, value_key, aggregation_type, filters, limit
+        )
+        rows = (await db.execute(query)).all()
+        groups = [
+            {
+                "group": self._group_label(row.group),
+                "value": to_python_number(row.value),
+                "count": row.count,
+            }
+            for row in rows
+        ]
+        return groups, self._total_records(rows)
 
-        if aggregation_type == "count":
-            return len(records)
-        elif aggregation_type == "distinct_count":
-            return len(set(values))
-        elif aggregation_type == "sum":
-            return sum(float(v) for v in values if self._is_numeric(v))
-        elif aggregation_type == "avg":
-            numeric_values = [float(v) for v in values if self._is_numeric(v)]
-            return sum(numeric_values) / len(numeric_values) if numeric_values else 0
-        elif aggregation_type == "min":
-            numeric_values = [float(v) for v in values if self._is_numeric(v)]
-            return min(numeric_values) if numeric_values else None
-        elif aggregation_type == "max":
-            numeric_values = [float(v) for v in values if self._is_numeric(v)]
-            return max(numeric_values) if numeric_values else None
-        elif aggregation_type == "median":
-            numeric_values = sorted([float(v) for v in values if self._is_numeric(v)])
-            if not numeric_values:
-                return None
-            n = len(numeric_values)
-            if n % 2 == 0:
-                return (numeric_values[n // 2 - 1] + numeric_values[n // 2]) / 2
-            else:
-                return numeric_values[n // 2]
-
-        return None
-
-    async def _group_and_aggregate(
+    async def _run_pivot(
         self,
-        records: list[Record],
-        group_field_name: str,
-        value_field_name: Optional[str],
+        db: AsyncSession,
+        table_id: str,
+        row_key: str,
+        column_key: str,
+        value_key: Optional[str],
         aggregation_type: str,
-        limit: int,
-    ) -> list[dict[str, Any]]:
-        """Group records and aggregate values.
+        filters: Optional[list[dict[str, Any]]],
+        column_limit: int = MAX_PIVOT_COLUMNS,
+    ) -> tuple[list[Any], list[Any], list[list[Any]], int]:
+        """Build a two-dimensional pivot in the database.
+
+        The distinct column values are fetched first, then a single grouped
+        query aggregates every cell of each row with ``FILTER`` clauses.
+        Empty cells are 0.
 
         Args:
-            records: List of records
-            group_field_name: Field name to group by
-            value_field_name: Field name to aggregate
+            db: Database session
+            table_id: Table ID
+            row_key: Key for pivot rows
+            column_key: Key for pivot columns
+            value_key: Key to aggregate
             aggregation_type: Type of aggregation
-            limit: Maximum number of groups
+            filters: Optional filter conditions
+            column_limit: Maximum number of (sorted) column values
 
         Returns:
-            List of grouped data
+            Tuple of (row labels, column labels, cell values, record count)
 
         """
-        groups = {}
-        for record in records:
-            data = record.get_all_values()
-            group_value = data.get(group_field_name)
-            if group_value is None:
-                group_value = "(empty)"
-
-            if group_value not in groups:
-                groups[group_value] = []
-            groups[group_value].append(record)
-
-        # Aggregate each group
-        result = []
-        for group_value, group_records in groups.items():
-            if aggregation_type == "count":
-                aggregated_value = len(group_records)
-            else:
-                aggregated_value = await self._perform_aggregation(
-                    group_records, value_field_name, aggregation_type
-                )
-
-            result.append({
-                "group": group_value,
-                "value": aggregated_value,
-                "count": len(group_records),
-            })
+        column_query = self.query_compiler.distinct_values_query(
+            table_id, column_key, filters, column_limit
+        )
+        column_values = list((await db.execute(column_query)).scalars().all())
+        if not column_values:
+            return [], [], [], 0
 
-        # Sort by value descending
-        result.sort(key=lambda x: x["value"] if x["value"] is not None else 0, reverse=True)
+        query = self.query_compiler.pivot_query(
+            table_id, row_key, column_key, column_values, value_key, aggregation_type, filters
+        )
+        rows = (await db.execute(query)).all()
 
-        return result[:limit]
+        values = []
+        for row in rows:
+            cells = [getattr(row, f"c{idx}") for idx in range(len(column_values))]
+            values.append([0 if cell is None else to_python_number(cell) for cell in cells])
+
+        return (
+            [self._group_label(row.row) for row in rows],
+            [self._group_label(value) for value in column_values],
+            values,
+            self._total_records(rows),
+        )
 
     async def _create_pivot(
         self,
-        records: list[Record],
-        row_field_name: str,
-        column_field_name: Optional[str],
-        value_field_name: Optional[str],
+        db: AsyncSession,
+        table_id: str,
+        row_key: str,
+        column_key: Optional[str],
+        value_key: Optional[str],
         aggregation_type: str,
-    ) -> dict[str, Any]:
+        filters: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[dict[str, Any], int]:
         """Create pivot table data structure.
 
         Args:
-            records: List of records
-            row_field_name: Field name for rows
-            column_field_name: Field name for columns
-            value_field_name: Field name to aggregate
+            db: Database session
+            table_id: Table ID
+            row_key: Key for pivot rows
+            column_key: Key for pivot columns
+            value_key: Key to aggregate
             aggregation_type: Type of aggregation
+            filters: Optional filter conditions
 
         Returns:
-            Pivot table data structure
+            Tuple of (pivot table data structure, record count)
 
         """
-        if not column_field_name:
+        if not column_key:
             # Simple one-dimensional pivot (just rows)
-            groups = await self._group_and_aggregate(
-                records, row_field_name, value_field_name, aggregation_type, 1000
+            groups, record_count = await self._run_group_by(
+                db, table_id, row_key, value_key, aggregation_type, filters, 1000
             )
             return {
                 "rows": [g["group"] for g in groups],
                 "columns": ["value"],
                 "values": [[g["value"]] for g in groups],
-            }
+            }, record_count
 
         # Two-dimensional pivot
-        pivot = {}
-        columns = set()
-
-        for record in records:
-            data = record.get_all_values()
-            row_value = data.get(row_field_name, "(empty)")
-            col_value = data.get(column_field_name, "(empty)")
-            columns.add(col_value)
-
-            if row_value not in pivot:
-                pivot[row_value] = {}
-            if col_value not in pivot[row_value]:
-                pivot[row_value][col_value] = []
-            pivot[row_value][col_value].append(record)
-
-        # Aggregate cells
-        rows = list(pivot.keys())
-        columns = sorted(list(columns))
-        values = []
-
-        for row_value in rows:
-            row_values = []
-            for col_value in columns:
-                cell_records = pivot[row_value].get(col_value, [])
-                if cell_records:
-                    if aggregation_type == "count":
-                        cell_value = len(cell_records)
-                    else:
-                        cell_value = await self._perform_aggregation(
-                            cell_records, value_field_name, aggregation_type
-                        )
-                else:
-                    cell_value = 0
-                row_values.append(cell_value)
-            values.append(row_values)
-
+        rows, columns, values, record_count = await self._run_pivot(
+            db,
+            table_id,
+            row_key,
+            column_key,
+            value_key,
+            aggregation_type,
+            filters,
+        )
         return {
             "rows": rows,
             "columns": columns,
             "values": values,
-        }
+        }, record_count
 
     async def _compute_chart_series(
         self,
-        records: list[Record],
-        x_field_name: str,
-        y_field_name: Optional[str],
-        group_field_name: Optional[str],
+        db: AsyncSession,
+        table_id: str,
+        x_key: str,
+        y_key: Optional[str],
+        group_key: Optional[str],
         aggregation_type: str,
-        sorts: Optional[list[dict[str, str]]],
+        filters: Optional[list[dict[str, Any]]],
         limit: int,
-    ) -> dict[str, Any]:
+    ) -> tuple[dict[str, Any], int]:
         """Compute chart data series.
 
         Args:
-            records: List of records
-            x_field_name: X-axis field name
-            y_field_name: Y-axis field name
-            group_field_name: Grouping field name
+            db: Database session
+            table_id: Table ID
+            x_key: Key for the X axis
+            y_key: Key for the Y axis
+            group_key: Key to split series by
             aggregation_type: Type of aggregation
-            sorts: Sort configuration
+            filters: Optional filter conditions
             limit: Maximum data points
 
         Returns:
-            Chart data with series
+            Tuple of (chart data with series, record count)
 
         """
-        if not group_field_name:
+        if not group_key:
             # Single series
-            groups = await self._group_and_aggregate(
-                records, x_field_name, y_field_name, aggregation_type, limit
+            groups, record_count = await self._run_group_by(
+                db, table_id, x_key, y_key, aggregation_type, filters, limit
             )
             return {
                 "labels": [g["group"] for g in groups],
@@ -824,145 +653,86 @@ class AnalyticsService:
                     "name": "Value",
                     "data": [g["value"] for g in groups],
                 }],
-            }
-
-        # Multiple series (grouped)
-        series_data = {}
-        labels = set()
-
-        for record in records:
-            data = record.get_all_values()
-            x_value = data.get(x_field_name, "(empty)")
-            group_value = data.get(group_field_name, "(empty)")
-            labels.add(x_value)
-
-            if group_value not in series_data:
-                series_data[group_value] = {}
-            if x_value not in series_data[group_value]:
-                series_data[group_value][x_value] = []
-            series_data[group_value][x_value].append(record)
-
-        # Aggregate series
-        labels = sorted(list(labels))[:limit]
-        series = []
-
-        for group_value, group_data in series_data.items():
-            series_values = []
-            for x_value in labels:
-                cell_records = group_data.get(x_value, [])
-                if cell_records:
-                    if aggregation_type == "count":
-                        value = len(cell_records)
-                    else:
-                        value = await self._perform_aggregation(
-                            cell_records, y_field_name, aggregation_type
-                        )
-                else:
-                    value = 0
-                series_values.append(value)
-
-            series.append({
-                "name": str(group_value),
-                "data": series_values,
-            })
-
+            }, record_count
+
+        # Multiple series (grouped): one pivot row per series, x values as columns
+        series_names, labels, values, record_count = await self._run_pivot(
+            db,
+            table_id,
+            group_key,
+            x_key,
+            y_key,
+            aggregation_type,
+            filters,
+            column_limit=limit,
+        )
+        series = [
+            {"name": str(name), "data": series_values}
+            for name, series_values in zip(series_names, values)
+        ]
         return {
             "labels": labels,
             "series": series,
-        }
+        }, record_count
 
     async def _compute_field_statistics(
         self,
-        records: list[Record],
-        field_name: str,
-        field_type: str,
-    ) -> dict[str, Any]:
-        """Compute statistical summary for a field.
+        db: AsyncSession,
+        table_id: str,
+        key: str,
+        filters: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[dict[str, Any], int]:
+        """Compute statistical summary for a field in the database.
 
         Args:
-            records: List of records
-            field_name: Field name
-            field_type: Field type
+            db: Database session
+            table_id: Table ID
+            key: Key of the field in the record data
+            filters: Optional filter conditions
 
         Returns:
-            Dictionary of statistics
+            Tuple of (dictionary of statistics, record count)
 
         """
-        values = []
-        for record in records:
-            data = record.get_all_values()
-            value = data.get(field_name)
-            if value is not None:
-                values.append(value)
+        query = self.query_compiler.statistics_query(table_id, key, filters)
+        row = (await db.execute(query)).one()
 
         stats = {
-            "count": len(values),
-            "null_count": len(records) - len(values),
+            "count": row.count,
+            "null_count": row.record_count - row.count,
         }
 
-        if not values:
-            return stats
+        if not row.count:
+            return stats, row.record_count
 
         # Numeric statistics
-        numeric_values = [float(v) for v in values if self._is_numeric(v)]
-        if numeric_values:
+        if row.numeric_count:
             stats.update({
-                "sum": sum(numeric_values),
-                "avg": sum(numeric_values) / len(numeric_values),
-                "min": min(numeric_values),
-                "max": max(numeric_values),
-                "median": self._calculate_median(numeric_values),
+                "sum": to_python_number(row.sum),
+                "avg": to_python_number(row.avg),
+                "min": to_python_number(row.min),
+                "max": to_python_number(row.max),
+                "median": to_python_number(row.median),
             })
 
         # Distinct values
-        stats["distinct_count"] = len(set(str(v) for v in values))
+        stats["distinct_count"] = row.distinct_count
 
         # Most common values (top 5)
-        value_counts = {}
-        for v in values:
-            v_str = str(v)
-            value_counts[v_str] = value_counts.get(v_str, 0) + 1
-
-        most_common = sorted(
-            value_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        common_query = self.query_compiler.most_common_query(table_id, key, filters)
+        common_rows = (await db.execute(common_query)).all()
         stats["most_common"] = [
-            {"value": v, "count": c} for v, c in most_common
+            {"value": common.value, "count": common.count} for common in common_rows
         ]
 
-        return stats
+        return stats, row.record_count
 
-    def _is_numeric(self, value: Any) -> bool:
-        """Check if value is numeric.
-
-        Args:
-            value: Value to check
-
-        Returns:
-            True if numeric, False otherwise
+    @staticmethod
+    def _group_label(value: Any) -> Any:
+        """Label used for a group, pivot row or column value."""
+        return "(empty)" if value is None else value
 
-        """
-        try:
-            float(value)
-            return True
-        except (ValueError, TypeError):
-            return False
-
-    def _calculate_median(self, values: list[float]) -> float:
-        """Calculate median of numeric values.
-
-        Args:
-            values: List of numeric values
-
-        Returns:
-            Median value
-
-        """
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        if n % 2 == 0:
-            return (sorted_values[n // 2 - 1] + sorted_values[n // 2]) / 2
-        else:
-            return sorted_values[n // 2]
+    @staticmethod
+    def _total_records(rows: list[Any]) -> int:
+        """Record count across all groups (from the ``record_count`` window column)."""
+        return int(rows[0].record_count) if rows else 0
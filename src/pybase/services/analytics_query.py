@@ -0,0 +1,412 @@
+"""
+SQL compilation of analytics aggregations over record data.
+
+Builds the aggregate, GROUP BY and pivot queries used by
+``AnalyticsService`` as expressions over the JSONB record payload, so
+aggregation runs inside PostgreSQL and only aggregated rows are returned.
+Filters are compiled with ``RecordQueryCompiler``.
+
+Values are read from the record payload by field ID, the key records
+are stored under and filters are compiled against. JSON null and missing
+keys are "empty", and numeric aggregations consider JSON numbers as well
+as strings that parse as numbers.
+"""
+
+import re
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Numeric, Select, and_, case, cast, func, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from pybase.core.exceptions import ValidationError
+from pybase.models.record import Record
+from pybase.services.record_query import RecordQueryCompiler, _inline
+
+AGGREGATION_TYPES = ("sum", "avg", "count", "min", "max", "median", "distinct_count")
+
+# Strings accepted as numbers (what ``float()`` parses, minus inf/nan)
+NUMERIC_TEXT_PATTERN = r"^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+_NUMERIC_TEXT_RE = re.compile(NUMERIC_TEXT_PATTERN)
+
+# Maximum number of distinct column values in a pivot table
+MAX_PIVOT_COLUMNS = 200
+
+# Analytics filter operators that have a different name in view filters
+FILTER_OPERATOR_ALIASES = {
+    "greater_than": "gt",
+    "less_than": "lt",
+}
+
+
+class AnalyticsQueryCompiler:
+    """
+    Compile analytics aggregations into SQL over ``records.data``.
+
+    Aggregates are built per value key: ``sum``/``avg``/``min``/``max``
+    over the numeric value, ``median`` as ``percentile_cont(0.5)``,
+    ``distinct_count`` as ``COUNT(DISTINCT)`` and ``count`` as the number
+    of matching records. Pivot cells use ``FILTER (WHERE ...)`` so one
+    grouped query returns a whole pivot row.
+    """
+
+    def __init__(self) -> None:
+        """Initialize compiler."""
+        self.records = RecordQueryCompiler()
+
+    # ==========================================================================
+    # Value Expressions
+    # ==========================================================================
+
+    def value(self, key: str) -> ColumnElement[Any]:
+        """JSONB value stored under a key (``data -> key``)."""
+        return self.records.field_value(key)
+
+    def text(self, key: str) -> ColumnElement[Any]:
+        """Text value stored under a key (``data ->> key``)."""
+        return self.records.field_text(key)
+
+    def is_present(self, key: str) -> ColumnElement[bool]:
+        """The key exists and is not JSON null."""
+        value = self.value(key)
+        return and_(value.is_not(None), func.jsonb_typeof(value) != _inline("null"))
+
+    def numeric(self, key: str) -> ColumnElement[Any]:
+        """Numeric value of a key: JSON numbers and numeric strings, else NULL."""
+        value = self.value(key)
+        value_text = self.text(key)
+        return case(
+            (func.jsonb_typeof(value) == _inline("number"), cast(value_text, Numeric)),
+            (
+                and_(
+                    func.jsonb_typeof(value) == _inline("string"),
+                    value_text.regexp_match(NUMERIC_TEXT_PATTERN),
+                ),
+                cast(value_text, Numeric),
+            ),
+        )
+
+    def group_key(self, key: str) -> ColumnElement[Any]:
+        """Grouping value of a key, with JSON null folded into SQL NULL.
+
+        Keys and constants are rendered inline so the same expression in
+        the select list and GROUP BY clause compiles to identical SQL.
+        """
+        return case((self.is_present(key), self.value(key)))
+
+    # ==========================================================================
+    # Aggregates
+    # ==========================================================================
+
+    def aggregate(
+        self,
+        aggregation_type: str,
+        key: str | None,
+        where: ColumnElement[bool] | None = None,
+    ) -> ColumnElement[Any]:
+        """Build an aggregate expression.
+
+        Args:
+            aggregation_type: Aggregation type (see ``AGGREGATION_TYPES``)
+            key: Value key to aggregate (ignored for ``count``)
+            where: Optional ``FILTER (WHERE ...)`` clause, used for pivot cells
+
+        Returns:
+            Aggregate SQL expression
+
+        Raises:
+            ValidationError: If the aggregation type is invalid or needs a key
+
+        """
+        if aggregation_type not in AGGREGATION_TYPES:
+            raise ValidationError(
+                f"Invalid aggregation type. Must be one of: {', '.join(AGGREGATION_TYPES)}"
+            )
+
+        if aggregation_type == "count":
+            expression = func.count()
+        elif key is None:
+            raise ValidationError(f"A value field is required for {aggregation_type} aggregation")
+        elif aggregation_type == "distinct_count":
+            expression = func.count(self.group_key(key).distinct())
+        elif aggregation_type == "median":
+            expression = func.percentile_cont(0.5).within_group(self.numeric(key))
+        else:
+            aggregate_func = getattr(func, aggregation_type)
+            expression = aggregate_func(self.numeric(key))
+
+        if where is not None:
+            expression = expression.filter(where)
+        return expression
+
+    # ==========================================================================
+    # Queries
+    # ==========================================================================
+
+    def where(
+        self,
+        table_id: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """Build the WHERE conditions selecting a table's filtered records.
+
+        Args:
+            table_id: Table ID
+            filters: Analytics filter conditions (``field_id``, ``operator``, ``value``)
+
+        Returns:
+            List of conditions to AND together
+
+        """
+        conditions = [
+            Record.table_id == table_id,
+            Record.deleted_at.is_(None),
+        ]
+        filter_clause = self.records.compile_filters(normalize_analytics_filters(filters))
+        if filter_clause is not None:
+            conditions.append(filter_clause)
+        return conditions
+
+    def aggregate_query(
+        self,
+        table_id: str,
+        key: str,
+        aggregation_type: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+    ) -> Select:
+        """Build a single-row query aggregating one key over all matching records.
+
+        Columns: ``value``, ``record_count`` and ``value_count`` (records
+        where the key is present).
+        """
+        return select(
+            self.aggregate(aggregation_type, key).label("value"),
+            func.count().label("record_count"),
+            func.count().filter(self.is_present(key)).label("value_count"),
+        ).where(*self.where(table_id, filters))
+
+    def group_query(
+        self,
+        table_id: str,
+        group_key: str,
+        value_key: str | None,
+        aggregation_type: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+        limit: int | None = None,
+    ) -> Select:
+        """Build a GROUP BY query ordered by aggregated value, largest first.
+
+        Columns: ``group``, ``value``, ``count`` (records in the group) and
+        ``record_count`` (records across all groups, before LIMIT).
+        """
+        group = self.group_key(group_key).label("group")
+        value = self.aggregate(aggregation_type, value_key)
+        query = (
+            select(
+                group,
+                value.label("value"),
+                func.count().label("count"),
+                func.sum(func.count()).over().label("record_count"),
+            )
+            .where(*self.where(table_id, filters))
+            .group_by(group)
+            .order_by(func.coalesce(value, 0).desc(), group.asc().nulls_last())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def distinct_values_query(
+        self,
+        table_id: str,
+        key: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+        limit: int = MAX_PIVOT_COLUMNS,
+    ) -> Select:
+        """Build a query listing the distinct grouping values of a key, sorted."""
+        group = self.group_key(key).label("value")
+        return (
+            select(group)
+            .where(*self.where(table_id, filters))
+            .group_by(group)
+            .order_by(group.asc().nulls_last())
+            .limit(limit)
+        )
+
+    def pivot_query(
+        self,
+        table_id: str,
+        row_key: str,
+        column_key: str,
+        column_values: Sequence[Any],
+        value_key: str | None,
+        aggregation_type: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+        limit: int | None = None,
+    ) -> Select:
+        """Build a pivot query with one ``FILTER`` aggregate per column value.
+
+        Columns: ``row``, one ``c<i>`` per entry of ``column_values`` (a
+        NULL entry selects records where the column key is empty),
+        ``count`` and ``record_count``.
+        """
+        row = self.group_key(row_key).label("row")
+        column = self.group_key(column_key)
+        cells = []
+        for idx, column_value in enumerate(column_values):
+            if column_value is None:
+                cell_filter = column.is_(None)
+            else:
+                cell_filter = column == RecordQueryCompiler.jsonb_literal(column_value)
+            cells.append(
+                self.aggregate(aggregation_type, value_key, where=cell_filter).label(f"c{idx}")
+            )
+
+        query = (
+            select(
+                row,
+                *cells,
+                func.count().label("count"),
+                func.sum(func.count()).over().label("record_count"),
+            )
+            .where(*self.where(table_id, filters))
+            .group_by(row)
+            .order_by(row.asc().nulls_last())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def statistics_query(
+        self,
+        table_id: str,
+        key: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+    ) -> Select:
+        """Build a single-row query with the summary statistics of a key."""
+        numeric = self.numeric(key)
+        return select(
+            func.count().label("record_count"),
+            func.count().filter(self.is_present(key)).label("count"),
+            func.count(numeric).label("numeric_count"),
+            func.sum(numeric).label("sum"),
+            func.avg(numeric).label("avg"),
+            func.min(numeric).label("min"),
+            func.max(numeric).label("max"),
+            func.percentile_cont(0.5).within_group(numeric).label("median"),
+            func.count(self.display_text(key).distinct()).label("distinct_count"),
+        ).where(*self.where(table_id, filters))
+
+    def most_common_query(
+        self,
+        table_id: str,
+        key: str,
+        filters: Sequence[dict[str, Any]] | None = None,
+        limit: int = 5,
+    ) -> Select:
+        """Build a query for the most common (text) values of a key."""
+        display = self.display_text(key).label("value")
+        return (
+            select(display, func.count().label("count"))
+            .where(*self.where(table_id, filters), self.is_present(key))
+            .group_by(display)
+            .order_by(func.count().desc(), display.asc())
+            .limit(limit)
+        )
+
+    def bucket_totals_query(
+        self,
+        table_id: str,
+        group_key: str,
+        value_key: str | None,
+    ) -> Select:
+        """Build a query with the count, numeric count and sum of each group.
+
+        Used to (re)build count/sum/avg chart snapshots in O(groups) rows.
+        """
+        group = self.group_key(group_key).label("group")
+        columns = [group, func.count().label("count")]
+        if value_key is not None:
+            numeric = self.numeric(value_key)
+            columns.append(func.count(numeric).label("numeric_count"))
+            columns.append(func.sum(numeric).label("sum"))
+        return select(*columns).where(*self.where(table_id)).group_by(group)
+
+    def bucket_values_query(
+        self,
+        table_id: str,
+        group_key: str,
+        value_key: str,
+    ) -> Select:
+        """Build a query with the multiplicity of each (group, value) pair.
+
+        Used to (re)build min/max/distinct_count chart snapshots, which
+        need every value to stay correct when records are removed.
+        """
+        group = self.group_key(group_key).label("group")
+        value = self.group_key(value_key).label("value")
+        return (
+            select(group, value, func.count().label("count"))
+            .where(*self.where(table_id))
+            .group_by(group, value)
+        )
+
+    def display_text(self, key: str) -> ColumnElement[Any]:
+        """Text form of a present value, used for distinct and most common values."""
+        return case((self.is_present(key), self.text(key)))
+
+
+def normalize_analytics_filters(
+    filters: Sequence[dict[str, Any]] | None,
+) -> list[dict[str, Any]]:
+    """Translate analytics filter conditions to view filter conditions.
+
+    Analytics filters are ANDed together and use ``greater_than`` /
+    ``less_than`` where view filters use ``gt`` / ``lt``.
+
+    Args:
+        filters: Analytics filter conditions
+
+    Returns:
+        Filter dicts accepted by ``RecordQueryCompiler.compile_filters``
+
+    """
+    normalized = []
+    for filter_cond in filters or []:
+        operator = filter_cond.get("operator", "equals")
+        normalized.append(
+            {
+                "field_id": filter_cond.get("field_id", ""),
+                "operator": FILTER_OPERATOR_ALIASES.get(operator, operator),
+                "value": filter_cond.get("value"),
+                "conjunction": "and",
+            }
+        )
+    return normalized
+
+
+def numeric_value(value: Any) -> float | None:
+    """Numeric value of a record value, by the same rule as ``numeric()`` in SQL.
+
+    Args:
+        value: Decoded JSON value
+
+    Returns:
+        Float for JSON numbers and numeric strings, otherwise None
+
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _NUMERIC_TEXT_RE.match(value):
+        return float(value)
+    return None
+
+
+def to_python_number(value: Any) -> Any:
+    """Convert NUMERIC results to float, leaving other values unchanged."""
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
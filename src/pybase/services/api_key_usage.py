@@ -0,0 +1,127 @@
+"""
+Buffered API key usage tracking.
+
+Authenticating with an API key used to update ``last_used_at`` and commit
+on every request. Usage is now recorded in memory, where repeated use of
+a key between flushes coalesces into one entry, and written by a
+background task every ``api_key_usage_flush_seconds`` in a single bulk
+UPDATE. Usage recorded since the last flush is written on shutdown.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import update
+
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+from pybase.db.base import utc_now
+from pybase.db.session import AsyncSessionLocal
+from pybase.models.user import APIKey
+
+logger = get_logger(__name__)
+
+
+class APIKeyUsageBuffer:
+    """In-memory last-use times of API keys, written to the database in batches."""
+
+    def __init__(
+        self,
+        session_factory: Any = AsyncSessionLocal,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        """Initialize buffer.
+
+        Args:
+            session_factory: Factory of database sessions for the writer
+            flush_interval: Seconds between flushes
+
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval or settings.api_key_usage_flush_seconds
+        # api_key_id -> (last used at, last used from)
+        self._pending: dict[str, tuple[datetime, Optional[str]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, api_key_id: str, ip_address: Optional[str] = None) -> None:
+        """Record that an API key was used and make sure the writer is running.
+
+        Args:
+            api_key_id: API key ID
+            ip_address: Client IP address, if known
+
+        """
+        api_key_id = str(api_key_id)
+        if ip_address is None and api_key_id in self._pending:
+            ip_address = self._pending[api_key_id][1]
+        self._pending[api_key_id] = (utc_now(), ip_address)
+        self._ensure_started()
+
+    async def flush(self) -> None:
+        """Write the buffered usage in one bulk UPDATE."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        rows = []
+        for api_key_id, (used_at, ip_address) in batch.items():
+            row = {"id": api_key_id, "last_used_at": used_at}
+            if ip_address is not None:
+                row["last_used_ip"] = ip_address
+            rows.append(row)
+
+        try:
+            async with self.session_factory() as session:
+                # ORM bulk UPDATE by primary key, sent as one executemany per
+                # set of updated columns
+                await session.execute(update(APIKey), rows)
+                await session.commit()
+        except Exception:
+            # Keep the usage for the next flush unless newer usage replaced it
+            for api_key_id, usage in batch.items():
+                self._pending.setdefault(api_key_id, usage)
+            raise
+
+    async def stop(self) -> None:
+        """Stop the writer after writing what is buffered (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush API key usage on shutdown: {e}")
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"API key usage flush failed: {e}")
+
+
+_buffer: Optional[APIKeyUsageBuffer] = None
+
+
+def get_api_key_usage_buffer() -> APIKeyUsageBuffer:
+    """Get the process-wide API key usage buffer."""
+    global _buffer
+    if _buffer is None:
+        _buffer = APIKeyUsageBuffer()
+    return _buffer
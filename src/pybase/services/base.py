@@ -13,6 +13,7 @@ from pybase.core.exceptions import (
 from pybase.models.base import Base
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.base import BaseCreate, BaseUpdate
+from pybase.services.access import invalidate_access
 
 
 class BaseService:
@@ -209,6 +210,7 @@ class BaseService:
             raise PermissionDeniedError("Only workspace owner can delete bases")
 
         base.is_deleted = True
+        await invalidate_access("base", base_id, db)
 
     async def _get_workspace(
         self,
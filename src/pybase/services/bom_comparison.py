@@ -11,13 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pybase.core.exceptions import (
     BadRequestError,
     NotFoundError,
-    PermissionDeniedError,
 )
-from pybase.models.base import Base
 from pybase.models.field import Field
 from pybase.models.record import Record
 from pybase.models.table import Table
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from pybase.services.access import require_table_access
 
 
 class BOMComparisonService:
@@ -361,47 +359,13 @@ class BOMComparisonService:
         user_id: str,
     ) -> Table:
         """Get table and verify user has access."""
+        await require_table_access(db, table_id, user_id)
+
         table = await db.get(Table, table_id)
         if not table or table.is_deleted:
             raise NotFoundError("Table not found")
-
-        # Check workspace access
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), user_id)
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
-
         return table
 
-    async def _get_base(self, db: AsyncSession, base_id: str) -> Base:
-        """Get base by ID."""
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base not found")
-        return base
-
-    async def _get_workspace(self, db: AsyncSession, workspace_id: str) -> Workspace:
-        """Get workspace by ID."""
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace not found")
-        return workspace
-
-    async def _get_workspace_member(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member."""
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
     async def _get_table_records(
         self,
         db: AsyncSession,
@@ -17,6 +17,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.logging import get_logger
+from pybase.db.ann_index import get_cad_vector_index
 from pybase.models.cad_model import (
     CADAssemblyRelation,
     CADManufacturingFeature,
@@ -605,11 +606,13 @@ class CADIndexingPipeline:
         model: CADModel,
         embeddings: dict[str, Any],
     ) -> None:
-        """Store embeddings in database with transaction isolation for HNSW updates."""
+        """Store embeddings in database with transaction isolation for HNSW updates.
+
+        Also applies them to the in-process ANN index (when enabled), so
+        similarity search sees the model without a full rebuild.
+        """
         # Use SELECT FOR UPDATE to prevent concurrent HNSW index conflicts
         # This ensures only one transaction can update the embedding at a time
-        from sqlalchemy import for_update
-
         stmt = select(CADModelEmbedding).where(
             CADModelEmbedding.cad_model_id == model.id
         ).with_for_update()
@@ -646,6 +649,18 @@ class CADIndexingPipeline:
             )
             db.add(emb_record)
 
+        ann_index = get_cad_vector_index()
+        if ann_index is not None:
+            ann_index.update_model(
+                str(model.id),
+                {
+                    "sdf_latent": model.deepsdf_latent,
+                    "fused": embeddings.get("fused_embedding"),
+                    "text": embeddings.get("text_embedding"),
+                    "image": embeddings.get("image_embedding"),
+                },
+            )
+
     async def _store_view_metadata(
         self,
         db: AsyncSession,
@@ -34,10 +34,56 @@ from pybase.schemas.chart import (
     PivotTableResponse,
 )
 from pybase.cache.chart_cache import ChartCache
+from pybase.cache.table_charts_cache import TableChartsCache
+from pybase.services.access import require_table_access
 from pybase.services.analytics import AnalyticsService
+from pybase.services.chart_snapshot import get_chart_snapshot_store
 
 logger = get_logger(__name__)
 
+_table_charts = TableChartsCache()
+
+
+async def get_table_chart_ids(db: AsyncSession, table_id: str) -> list[str]:
+    """Get the IDs of the live charts built on a table.
+
+    Cached per table in process (``TableChartsCache``), so the record
+    change path emitting chart events does not query the database.
+
+    Args:
+        db: Database session
+        table_id: Table ID
+
+    Returns:
+        Chart IDs
+
+    """
+    table_id = str(table_id)
+    cached = await _table_charts.get(table_id)
+    if cached is not None:
+        return list(cached)
+
+    generation = _table_charts.generation
+    result = await db.execute(
+        select(Chart.id).where(
+            Chart.table_id == table_id,
+            Chart.deleted_at.is_(None),
+        )
+    )
+    chart_ids = tuple(str(chart_id) for chart_id in result.scalars().all())
+    _table_charts.set(table_id, chart_ids, generation)
+    return list(chart_ids)
+
+
+async def invalidate_table_charts(table_id: str) -> None:
+    """Drop a table's cached chart IDs after a chart is created or deleted.
+
+    Args:
+        table_id: Table the chart reads from
+
+    """
+    await _table_charts.invalidate(str(table_id))
+
 
 class ChartService:
     """Service for chart operations."""
@@ -46,6 +92,7 @@ class ChartService:
         """Initialize chart service with analytics service and cache."""
         self.analytics_service = AnalyticsService()
         self.cache = ChartCache()
+        self.snapshots = get_chart_snapshot_store()
 
     async def create_chart(
         self,
@@ -124,6 +171,7 @@ class ChartService:
         db.add(chart)
         await db.commit()
         await db.refresh(chart)
+        await invalidate_table_charts(chart.table_id)
 
         return chart
 
@@ -313,6 +361,7 @@ class ChartService:
 
         # Invalidate cache for this chart
         await self.cache.invalidate_chart_cache(chart_id)
+        await invalidate_table_charts(chart.table_id)
 
     async def duplicate_chart(
         self,
@@ -379,6 +428,7 @@ class ChartService:
         db.add(duplicate)
         await db.commit()
         await db.refresh(duplicate)
+        await invalidate_table_charts(duplicate.table_id)
 
         return duplicate
 
@@ -423,7 +473,9 @@ class ChartService:
                 }
 
             # Try to get from cache
-            cached_data = await self.cache.get_cached_chart_data(chart_id, request_dict)
+            cached_data = await self.cache.get_cached_chart_data(
+                chart_id, request_dict, table_id=str(chart.table_id)
+            )
             if cached_data:
                 logger.debug(f"Using cached data for chart {chart_id}")
                 return ChartDataResponse(
@@ -471,6 +523,7 @@ class ChartService:
             data_config=data_config,
             filters=filters,
             sorts=sorts,
+            chart_id=chart_id,
         )
 
         # Update last refreshed timestamp
@@ -531,6 +584,7 @@ class ChartService:
                 data=cache_data,
                 data_request=request_dict,
                 ttl=chart.cache_duration,
+                table_id=str(chart.table_id),
             )
 
         return response
@@ -598,9 +652,13 @@ class ChartService:
         data_config: dict[str, Any],
         filters: list[dict[str, Any]],
         sorts: list[dict[str, Any]],
+        chart_id: Optional[str] = None,
     ) -> dict[str, Any]:
         """Compute chart data based on configuration.
 
+        Single-series charts without filters are served from the chart's
+        incrementally maintained snapshot when ``chart_id`` is given.
+
         Args:
             db: Database session
             user_id: User ID
@@ -609,6 +667,7 @@ class ChartService:
             data_config: Data configuration
             filters: Filter conditions
             sorts: Sort rules
+            chart_id: Chart ID, enables the aggregate snapshot
 
         Returns:
             Dictionary with chart data points and metadata
@@ -663,17 +722,26 @@ class ChartService:
             }
         else:
             # Single series chart
-            result = await self.analytics_service.compute_chart_data(
-                db=db,
-                user_id=user_id,
-                table_id=table_id,
-                x_field_id=str(x_field_id) if x_field_id else None,
-                y_field_id=str(y_field_id) if y_field_id else None,
-                group_by_field_id=str(group_by_field_id) if group_by_field_id else None,
-                aggregation_type=aggregation,
-                filters=filters,
-                limit=limit,
-            )
+            result = None
+            if chart_id and self.snapshots.supports(data_config, filters):
+                table_version = await self.cache.get_table_version(str(table_id))
+                if table_version is not None:
+                    result = await self.snapshots.get_chart_data(
+                        db, chart_id, str(table_id), data_config, table_version
+                    )
+
+            if result is None:
+                result = await self.analytics_service.compute_chart_data(
+                    db=db,
+                    user_id=user_id,
+                    table_id=table_id,
+                    x_field_id=str(x_field_id) if x_field_id else None,
+                    y_field_id=str(y_field_id) if y_field_id else None,
+                    group_by_field_id=str(group_by_field_id) if group_by_field_id else None,
+                    aggregation_type=aggregation,
+                    filters=filters,
+                    limit=limit,
+                )
 
             data_points = [
                 ChartDataPoint(label=point["label"], value=point["value"])
@@ -746,13 +814,13 @@ class ChartService:
             PermissionDeniedError: If user doesn't have access
 
         """
+        await require_table_access(
+            db, table_id, user_id, message="You don't have access to this workspace"
+        )
+
         table = await db.get(Table, table_id)
         if not table or table.is_deleted:
             raise NotFoundError("Table not found")
-
-        # Check workspace access
-        await self._check_workspace_access(db, table.base.workspace_id, user_id)
-
         return table
 
     async def _get_base_with_access(
@@ -0,0 +1,448 @@
+"""
+Incrementally maintained aggregate snapshots for charts.
+
+A snapshot holds the per-group aggregate state of a chart (counts, sums,
+min/max heaps, distinct value counts) so chart data can be read in
+O(groups) instead of aggregating the whole table. Record writes apply
+their before/after data to the snapshots of the table as deltas.
+
+Snapshots are versioned with the chart table generation kept in Redis by
+``ChartCache``: a delta is only applied when it advances a snapshot by
+exactly one generation, and a snapshot is only served while its
+generation is current. Writes made by other processes (or without
+deltas) therefore cause a rebuild instead of a wrong answer. Snapshots
+also expire after ``chart_snapshot_refresh_seconds``, so drift from
+rolled-back writes is repaired by a periodic full recompute.
+
+Only single-series charts without filters, using count, sum, avg, min,
+max or distinct_count, are snapshotted; other charts are computed by
+``AnalyticsService``.
+"""
+
+import heapq
+import json
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.cache.chart_cache import ChartCache
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+from pybase.services.analytics_query import (
+    AnalyticsQueryCompiler,
+    numeric_value,
+    to_python_number,
+)
+
+logger = get_logger(__name__)
+
+SNAPSHOT_AGGREGATIONS = frozenset({"count", "sum", "avg", "min", "max", "distinct_count"})
+
+# Aggregations that keep every value so they stay exact when records are removed
+VALUE_AGGREGATIONS = frozenset({"min", "max", "distinct_count"})
+
+# Rough in-memory cost of one group bucket or tracked value, for cache sizing
+SNAPSHOT_UNIT_BYTES = 200
+
+# A record change: (data before, data after); None for create/delete
+RecordChange = tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]
+
+
+def _value_id(value: Any) -> str:
+    """Stable identity of a JSON value, used for group and distinct keys."""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class AggregateBucket:
+    """Aggregate state of one chart group."""
+
+    __slots__ = ("label", "count", "numeric_count", "total", "values", "distinct", "_min", "_max")
+
+    def __init__(self, label: Any, track_values: bool = False, track_distinct: bool = False) -> None:
+        """Initialize bucket.
+
+        Args:
+            label: Group value
+            track_values: Keep numeric values and min/max heaps
+            track_distinct: Keep distinct value counts
+
+        """
+        self.label = label
+        self.count = 0
+        self.numeric_count = 0
+        self.total = 0.0
+        # Multiplicity of each numeric value; the heaps may hold stale
+        # entries, which are dropped lazily once their count reaches zero
+        self.values: Optional[Counter[float]] = Counter() if track_values else None
+        self.distinct: Optional[Counter[str]] = Counter() if track_distinct else None
+        self._min: list[float] = []
+        self._max: list[float] = []
+
+    @property
+    def units(self) -> int:
+        """Number of tracked state entries, for cache sizing."""
+        return 1 + len(self.values or ()) + len(self.distinct or ())
+
+    def add(self, value: Any, multiplicity: int = 1) -> None:
+        """Add (or with a negative multiplicity, remove) records with a value.
+
+        Args:
+            value: The records' value of the aggregated field (None if empty)
+            multiplicity: Number of records
+
+        """
+        self.count += multiplicity
+        if value is None:
+            return
+
+        if self.distinct is not None:
+            key = _value_id(value)
+            self.distinct[key] += multiplicity
+            if self.distinct[key] <= 0:
+                del self.distinct[key]
+
+        number = numeric_value(value)
+        if number is None:
+            return
+        self.numeric_count += multiplicity
+        self.total += number * multiplicity
+
+        if self.values is not None:
+            if number not in self.values:
+                heapq.heappush(self._min, number)
+                heapq.heappush(self._max, -number)
+            self.values[number] += multiplicity
+            if self.values[number] <= 0:
+                del self.values[number]
+
+    def min(self) -> Optional[float]:
+        """Smallest numeric value."""
+        while self._min and self._min[0] not in self.values:
+            heapq.heappop(self._min)
+        return self._min[0] if self._min else None
+
+    def max(self) -> Optional[float]:
+        """Largest numeric value."""
+        while self._max and -self._max[0] not in self.values:
+            heapq.heappop(self._max)
+        return -self._max[0] if self._max else None
+
+    def value(self, aggregation_type: str) -> Any:
+        """Aggregated value of the bucket.
+
+        Args:
+            aggregation_type: One of ``SNAPSHOT_AGGREGATIONS``
+
+        Returns:
+            Aggregated value, matching ``AnalyticsService`` results
+
+        """
+        if aggregation_type == "count":
+            return self.count
+        if aggregation_type == "distinct_count":
+            return len(self.distinct)
+        if aggregation_type == "min":
+            return self.min()
+        if aggregation_type == "max":
+            return self.max()
+        if not self.numeric_count:
+            return None
+        if aggregation_type == "sum":
+            return self.total
+        return self.total / self.numeric_count
+
+
+class ChartSnapshot:
+    """
+    Materialized per-group aggregate state of a chart.
+
+    Groups are keyed by the value of ``group_key`` in the record data and
+    aggregate the value of ``value_key``, with the same semantics as the
+    SQL aggregation in ``AnalyticsQueryCompiler``.
+    """
+
+    def __init__(
+        self,
+        group_key: str,
+        value_key: Optional[str],
+        aggregation_type: str,
+        table_version: int,
+    ) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            group_key: Record data key to group by (x axis)
+            value_key: Record data key to aggregate (y axis), None for count
+            aggregation_type: One of ``SNAPSHOT_AGGREGATIONS``
+            table_version: Chart table generation the snapshot reflects
+
+        """
+        self.group_key = group_key
+        self.value_key = value_key
+        self.aggregation_type = aggregation_type
+        self.table_version = table_version
+        self.buckets: dict[str, AggregateBucket] = {}
+        self.record_count = 0
+
+    def _bucket(self, group: Any) -> AggregateBucket:
+        key = _value_id(group)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = AggregateBucket(
+                group,
+                track_values=self.aggregation_type in ("min", "max"),
+                track_distinct=self.aggregation_type == "distinct_count",
+            )
+            self.buckets[key] = bucket
+        return bucket
+
+    def add_record(self, data: dict[str, Any], multiplicity: int = 1) -> None:
+        """Add (or with a negative multiplicity, remove) a record's data.
+
+        Args:
+            data: Record data
+            multiplicity: 1 to add, -1 to remove
+
+        """
+        group = data.get(self.group_key)
+        bucket = self._bucket(group)
+        value = data.get(self.value_key) if self.value_key else None
+        bucket.add(value, multiplicity)
+        self.record_count += multiplicity
+        if bucket.count <= 0:
+            del self.buckets[_value_id(group)]
+
+    def apply_changes(self, changes: Iterable[RecordChange]) -> None:
+        """Apply record changes.
+
+        Args:
+            changes: (data before, data after) pairs; None for create/delete
+
+        """
+        for before, after in changes:
+            if before is not None:
+                self.add_record(before, -1)
+            if after is not None:
+                self.add_record(after, 1)
+
+    @property
+    def units(self) -> int:
+        """Number of tracked state entries, for cache sizing."""
+        return 1 + sum(bucket.units for bucket in self.buckets.values())
+
+    def chart_data(self, limit: int) -> dict[str, Any]:
+        """Build chart data from the snapshot.
+
+        Groups are ordered by value, largest first, like
+        ``AnalyticsService.compute_chart_data``.
+
+        Args:
+            limit: Maximum number of data points
+
+        Returns:
+            Dict with ``data`` (label/value points), ``labels`` and ``total_records``
+
+        """
+        points = [
+            {
+                "label": "(empty)" if bucket.label is None else bucket.label,
+                "value": bucket.value(self.aggregation_type),
+            }
+            for bucket in self.buckets.values()
+        ]
+        points.sort(key=lambda point: str(point["label"]))
+        points.sort(
+            key=lambda point: point["value"] if point["value"] is not None else 0,
+            reverse=True,
+        )
+        points = points[:limit]
+        return {
+            "data": points,
+            "labels": [point["label"] for point in points],
+            "total_records": self.record_count,
+        }
+
+
+class ChartSnapshotStore:
+    """In-process store of chart snapshots, shared by the services of a worker."""
+
+    def __init__(
+        self,
+        cache: Optional[LocalCache] = None,
+        chart_cache: Optional[ChartCache] = None,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            cache: Snapshot cache, created from settings if not given
+            chart_cache: Chart cache holding the table generations
+
+        """
+        self.chart_cache = chart_cache or ChartCache()
+        self.cache = cache or LocalCache(
+            "chart_snapshot",
+            max_entries=settings.chart_snapshot_max_entries,
+            max_bytes=settings.chart_snapshot_max_bytes,
+            ttl=settings.chart_snapshot_refresh_seconds,
+        )
+        self.query_compiler = AnalyticsQueryCompiler()
+
+    @staticmethod
+    def supports(data_config: dict[str, Any], filters: Optional[list[dict[str, Any]]]) -> bool:
+        """Check whether a chart configuration can be served from a snapshot.
+
+        Args:
+            data_config: Chart data configuration
+            filters: Chart filters
+
+        Returns:
+            True for single-series, unfiltered charts with a supported aggregation
+
+        """
+        aggregation = data_config.get("aggregation", "count")
+        return (
+            not filters
+            and not data_config.get("series")
+            and not data_config.get("group_by_field_id")
+            and not data_config.get("date_range")
+            and bool(data_config.get("x_field_id"))
+            and aggregation in SNAPSHOT_AGGREGATIONS
+            and (aggregation == "count" or bool(data_config.get("y_field_id")))
+        )
+
+    @staticmethod
+    def snapshot_key(chart_id: str, data_config: dict[str, Any]) -> tuple[str, str, str, str]:
+        """Cache key of a chart snapshot; changes whenever the chart's axes or aggregation do."""
+        return (
+            str(chart_id),
+            str(data_config.get("x_field_id")),
+            str(data_config.get("y_field_id")),
+            data_config.get("aggregation", "count"),
+        )
+
+    async def get_chart_data(
+        self,
+        db: AsyncSession,
+        chart_id: str,
+        table_id: str,
+        data_config: dict[str, Any],
+        table_version: int,
+    ) -> dict[str, Any]:
+        """Get chart data from the chart's snapshot, rebuilding it if needed.
+
+        Args:
+            db: Database session
+            chart_id: Chart ID
+            table_id: Chart source table ID
+            data_config: Chart data configuration (must be ``supports``-ed)
+            table_version: Current chart table generation
+
+        Returns:
+            Chart data dict (see ``ChartSnapshot.chart_data``)
+
+        """
+        limit = data_config.get("limit", 100)
+        key = self.snapshot_key(chart_id, data_config)
+        snapshot: Optional[ChartSnapshot] = self.cache.get(key)
+        if snapshot is not None and snapshot.table_version == table_version:
+            return snapshot.chart_data(limit)
+
+        snapshot = await self.build_snapshot(db, table_id, data_config, table_version)
+        logger.debug(
+            f"Rebuilt snapshot for chart {chart_id} at table version {table_version} "
+            f"({len(snapshot.buckets)} groups)"
+        )
+
+        # Only keep the snapshot if no write happened while it was built;
+        # otherwise the next read rebuilds it at the newer generation
+        if await self.chart_cache.get_table_version(table_id) == table_version:
+            self.cache.set(
+                key,
+                snapshot,
+                size=snapshot.units * SNAPSHOT_UNIT_BYTES,
+                tags=[f"table:{table_id}"],
+            )
+        return snapshot.chart_data(limit)
+
+    async def build_snapshot(
+        self,
+        db: AsyncSession,
+        table_id: str,
+        data_config: dict[str, Any],
+        table_version: int,
+    ) -> ChartSnapshot:
+        """Fully recompute a chart snapshot from the database.
+
+        Args:
+            db: Database session
+            table_id: Chart source table ID
+            data_config: Chart data configuration
+            table_version: Chart table generation observed before the rebuild
+
+        Returns:
+            New snapshot
+
+        """
+        aggregation = data_config.get("aggregation", "count")
+        group_key = str(data_config["x_field_id"])
+        value_key = None
+        if aggregation != "count":
+            value_key = str(data_config["y_field_id"])
+
+        snapshot = ChartSnapshot(group_key, value_key, aggregation, table_version)
+
+        if aggregation in VALUE_AGGREGATIONS:
+            query = self.query_compiler.bucket_values_query(table_id, group_key, value_key)
+            for row in (await db.execute(query)).all():
+                snapshot._bucket(row.group).add(row.value, row.count)
+                snapshot.record_count += row.count
+            return snapshot
+
+        query = self.query_compiler.bucket_totals_query(table_id, group_key, value_key)
+        for row in (await db.execute(query)).all():
+            bucket = snapshot._bucket(row.group)
+            bucket.count = row.count
+            if value_key is not None:
+                bucket.numeric_count = row.numeric_count
+                bucket.total = to_python_number(row.sum) or 0.0
+            snapshot.record_count += row.count
+        return snapshot
+
+    def apply_record_changes(
+        self,
+        table_id: str,
+        table_version: Optional[int],
+        changes: list[RecordChange],
+    ) -> None:
+        """Apply record changes to the snapshots of a table.
+
+        Snapshots one generation behind ``table_version`` are updated and
+        advanced; any other snapshot is left to be rebuilt on its next read.
+
+        Args:
+            table_id: Table ID whose records changed
+            table_version: Table generation after the change (None if unknown)
+            changes: (data before, data after) pairs; None for create/delete
+
+        """
+        if table_version is None:
+            self.cache.invalidate_tag(f"table:{table_id}")
+            return
+
+        for snapshot in self.cache.tagged(f"table:{table_id}"):
+            if snapshot.table_version == table_version - 1:
+                snapshot.apply_changes(changes)
+                snapshot.table_version = table_version
+
+
+_store: Optional[ChartSnapshotStore] = None
+
+
+def get_chart_snapshot_store() -> ChartSnapshotStore:
+    """Get the process-wide chart snapshot store."""
+    global _store
+    if _store is None:
+        _store = ChartSnapshotStore()
+    return _store
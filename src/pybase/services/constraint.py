@@ -19,6 +19,7 @@ from pybase.models.unique_constraint import (
 )
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.constraint import UniqueConstraintCreate, UniqueConstraintUpdate
+from pybase.services.field_index_builder import UNIQUE_LOOKUP_INDEX, get_field_index_builder
 
 
 class ConstraintService:
@@ -77,6 +78,8 @@ class ConstraintService:
             error_message=constraint_data.error_message,
         )
         db.add(constraint)
+        # Lookup index is built in the background once committed
+        get_field_index_builder().schedule(db, constraint.field_id, UNIQUE_LOOKUP_INDEX)
         await db.commit()
         await db.refresh(constraint)
 
@@ -220,8 +223,15 @@ class ConstraintService:
                 raise ConflictError(f"Invalid constraint status: {constraint_data.status}")
             constraint.status = constraint_data.status
 
-        if constraint_data.case_sensitive is not None:
+        if (
+            constraint_data.case_sensitive is not None
+            and constraint_data.case_sensitive != constraint.case_sensitive
+        ):
+            # Lookup index expression depends on case sensitivity
             constraint.case_sensitive = constraint_data.case_sensitive
+            get_field_index_builder().schedule(
+                db, constraint.field_id, UNIQUE_LOOKUP_INDEX, rebuild=True
+            )
 
         if constraint_data.error_message is not None:
             constraint.error_message = constraint_data.error_message
@@ -259,6 +269,7 @@ class ConstraintService:
         if workspace.owner_id != user_id:
             raise PermissionDeniedError("Only workspace owner can delete constraints")
 
+        get_field_index_builder().schedule(db, constraint.field_id, UNIQUE_LOOKUP_INDEX)
         await db.delete(constraint)
         await db.commit()
 
@@ -0,0 +1,349 @@
+"""Columnar (Parquet and Arrow IPC) export writers.
+
+Export rows are converted to Arrow record batches using column types
+derived from the table's field types, and written incrementally so only
+the current batch (or Parquet row group) is held in memory. Values that
+don't fit a column's type are exported as null rather than failing the
+export.
+
+pyarrow is an optional dependency: ``pip install pybase[export]``.
+"""
+
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pa_ipc = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+from pybase.models.field import Field
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+# Rows buffered per Parquet row group (larger groups compress and scan better)
+PARQUET_ROW_GROUP_SIZE = 64 * 1024
+
+FLOAT_FIELD_TYPES = frozenset({"number", "currency", "percent", "duration"})
+INTEGER_FIELD_TYPES = frozenset({"rating", "autonumber"})
+BOOLEAN_FIELD_TYPES = frozenset({"checkbox"})
+DATE_FIELD_TYPES = frozenset({"date"})
+TIMESTAMP_FIELD_TYPES = frozenset({"datetime", "created_time", "last_modified_time"})
+LIST_FIELD_TYPES = frozenset({"multi_select"})
+
+
+def require_pyarrow() -> None:
+    """Check pyarrow is installed.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for Parquet and Arrow exports. "
+            "Install with: pip install pybase[export]"
+        )
+
+
+def arrow_type_for_field(field_type: Optional[str]) -> "pa.DataType":
+    """Get the Arrow column type for a field type.
+
+    Args:
+        field_type: Field type (``FieldType`` value)
+
+    Returns:
+        Arrow data type; field types without a natural mapping are strings
+
+    """
+    if field_type in FLOAT_FIELD_TYPES:
+        return pa.float64()
+    if field_type in INTEGER_FIELD_TYPES:
+        return pa.int64()
+    if field_type in BOOLEAN_FIELD_TYPES:
+        return pa.bool_()
+    if field_type in DATE_FIELD_TYPES:
+        return pa.date32()
+    if field_type in TIMESTAMP_FIELD_TYPES:
+        return pa.timestamp("us", tz="UTC")
+    if field_type in LIST_FIELD_TYPES:
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+def _blank(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if _blank(value) or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    number = _to_float(value)
+    if number is None or not number.is_integer():
+        return None
+    return int(number)
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if _blank(value):
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if _blank(value):
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    parsed = _to_datetime(value)
+    return parsed.date() if parsed else None
+
+
+def _to_list(value: Any) -> Optional[list[str]]:
+    if _blank(value):
+        return None
+    if isinstance(value, str):
+        # Rows carry list values JSON-encoded
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return [value]
+    if not isinstance(value, list):
+        value = [value]
+    return [item if isinstance(item, str) else json.dumps(item) for item in value]
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if _blank(value):
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _converter_for(data_type: "pa.DataType") -> Callable[[Any], Any]:
+    """Get the function converting export values to a column's Python type."""
+    if pa.types.is_floating(data_type):
+        return _to_float
+    if pa.types.is_integer(data_type):
+        return _to_int
+    if pa.types.is_boolean(data_type):
+        return _to_bool
+    if pa.types.is_date(data_type):
+        return _to_date
+    if pa.types.is_timestamp(data_type):
+        return _to_datetime
+    if pa.types.is_list(data_type):
+        return _to_list
+    return _to_string
+
+
+def build_arrow_schema(
+    fields: list[Field],
+    field_names: list[str],
+    linked_field_map: dict[str, Any],
+) -> "pa.Schema":
+    """Build the Arrow schema of an export.
+
+    Args:
+        fields: Exported table fields
+        field_names: Export column names, from ``_build_export_field_names``
+        linked_field_map: Mapping of expanded linked record column names to field info
+
+    Returns:
+        Arrow schema with one column per export column; flattened linked
+        record columns are strings
+
+    Raises:
+        ImportError: If pyarrow is not installed
+
+    """
+    require_pyarrow()
+    types_by_name = {field.name: field.field_type for field in fields}
+    columns = []
+    for name in field_names:
+        if name in linked_field_map:
+            columns.append(pa.field(name, pa.string()))
+        else:
+            columns.append(pa.field(name, arrow_type_for_field(types_by_name.get(name))))
+    return pa.schema(columns)
+
+
+class _ChunkSink:
+    """Write-only file object collecting output until it is drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and forget the output written so far."""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ColumnarExportWriter:
+    """
+    Incremental Parquet or Arrow IPC writer for export rows.
+
+    Arrow output is written one record batch per call; Parquet output is
+    buffered into row groups of ``row_group_size`` rows. Each call returns
+    the bytes that became available, so they can be streamed to the client.
+    """
+
+    def __init__(
+        self,
+        export_format: str,
+        schema: "pa.Schema",
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+    ) -> None:
+        """Initialize writer.
+
+        Args:
+            export_format: "parquet" or "arrow" (Arrow IPC file format)
+            schema: Arrow schema, from ``build_arrow_schema``
+            row_group_size: Rows per Parquet row group
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            ValueError: If the format is not columnar
+
+        """
+        require_pyarrow()
+        if export_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar export format: {export_format}")
+
+        self.export_format = export_format
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self._converters = [_converter_for(column.type) for column in schema]
+        self._sink = _ChunkSink()
+        self._pending: list["pa.RecordBatch"] = []
+        self._pending_rows = 0
+        if export_format == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, schema, compression="zstd")
+        else:
+            self._writer = pa_ipc.new_file(self._sink, schema)
+
+    def to_record_batch(self, rows: list[dict[str, Any]]) -> "pa.RecordBatch":
+        """Convert export rows to a record batch.
+
+        Args:
+            rows: Row dicts keyed by export column name
+
+        Returns:
+            Record batch matching the writer's schema
+
+        """
+        arrays = []
+        for column, convert in zip(self.schema, self._converters, strict=True):
+            name = column.name
+            values = [convert(row.get(name)) for row in rows]
+            arrays.append(pa.array(values, type=column.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def write_rows(self, rows: list[dict[str, Any]]) -> bytes:
+        """Write a batch of export rows.
+
+        Args:
+            rows: Row dicts keyed by export column name
+
+        Returns:
+            Output bytes produced so far (may be empty while a Parquet row
+            group is being filled)
+
+        """
+        if not rows:
+            return b""
+        batch = self.to_record_batch(rows)
+        if self.export_format == "arrow":
+            self._writer.write_batch(batch)
+            return self._sink.drain()
+
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        if self._pending_rows >= self.row_group_size:
+            self._flush_row_group()
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the file.
+
+        Returns:
+            Remaining output bytes, including the file footer
+
+        """
+        if self._pending:
+            self._flush_row_group()
+        self._writer.close()
+        return self._sink.drain()
+
+    def _flush_row_group(self) -> None:
+        table = pa.Table.from_batches(self._pending, schema=self.schema)
+        self._writer.write_table(table, row_group_size=table.num_rows)
+        self._pending = []
+        self._pending_rows = 0
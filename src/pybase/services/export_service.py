@@ -20,12 +20,22 @@ from openpyxl import Workbook
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pybase.core.exceptions import NotFoundError, PermissionDeniedError
-from pybase.models.base import Base
+from pybase.cache.local_cache import LocalCache
+from pybase.core.config import settings
+from pybase.core.exceptions import NotFoundError
 from pybase.models.field import Field
 from pybase.models.record import Record
-from pybase.models.table import Table
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from pybase.services.access import require_table_access
+from pybase.services.export_columnar import (
+    COLUMNAR_FORMATS,
+    ColumnarExportWriter,
+    build_arrow_schema,
+)
+from pybase.services.field_index import get_indexed_fields
+from pybase.services.record_query import RecordQueryCompiler
+
+# Size of the chunks yielded when streaming a finished file (e.g. .xlsx)
+EXPORT_CHUNK_SIZE = 64 * 1024
 
 
 class ExportService:
@@ -42,6 +52,7 @@ class ExportService:
         flatten_linked_records: bool = False,
         view_id: Optional[UUID] = None,
         include_attachments: bool = False,
+        all_linked_records: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         """Stream export of records from a table.
 
@@ -49,12 +60,14 @@ class ExportService:
             db: Database session
             table_id: Table ID to export from
             user_id: User ID requesting export
-            format: Export format ('csv', 'json', 'xlsx', or 'xml')
+            format: Export format ('csv', 'json', 'xlsx', 'xml', 'parquet' or 'arrow')
             batch_size: Number of records to fetch per batch
             field_ids: Optional list of field IDs to export. If None, exports all fields.
             flatten_linked_records: If True, fetch and embed linked record data in exports.
             view_id: Optional view ID to apply filters and sorts from.
             include_attachments: If True, include attachment files in export (as ZIP for non-JSON formats).
+            all_linked_records: If True, flattened linked record columns join the values of
+                every linked record instead of only the first.
 
         Yields:
             Chunks of export data as bytes
@@ -62,18 +75,10 @@ class ExportService:
         Raises:
             NotFoundError: If table or view not found
             PermissionDeniedError: If user doesn't have access to table
+            ImportError: If a Parquet or Arrow export is requested without pyarrow installed
 
         """
-        # Verify table exists and user has access
-        table = await db.get(Table, str(table_id))
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
+        await require_table_access(db, table_id, user_id)
 
         # Get table fields for column headers
         fields = await self._get_table_fields(db, str(table_id))
@@ -103,22 +108,33 @@ class ExportService:
 
         if format.lower() == "csv":
             async for chunk in self._stream_csv(
-                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments
+                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments,
+                all_linked_records=all_linked_records,
             ):
                 yield chunk
         elif format.lower() == "json":
             async for chunk in self._stream_json(
-                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments
+                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments,
+                all_linked_records=all_linked_records,
             ):
                 yield chunk
         elif format.lower() in ("xlsx", "excel"):
             async for chunk in self._stream_excel(
-                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments
+                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments,
+                all_linked_records=all_linked_records,
             ):
                 yield chunk
         elif format.lower() == "xml":
             async for chunk in self._stream_xml(
-                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments
+                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments,
+                all_linked_records=all_linked_records,
+            ):
+                yield chunk
+        elif format.lower() in COLUMNAR_FORMATS:
+            async for chunk in self._stream_columnar(
+                db, table_id, fields, batch_size, flatten_linked_records, view_filters, view_sorts, include_attachments,
+                all_linked_records=all_linked_records,
+                export_format=format.lower(),
             ):
                 yield chunk
         else:
@@ -134,6 +150,7 @@ class ExportService:
         view_filters: Optional[list[dict]] = None,
         view_sorts: Optional[list[dict]] = None,
         include_attachments: bool = False,
+        all_linked_records: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         """Stream records as CSV.
 
@@ -146,6 +163,7 @@ class ExportService:
             view_filters: Optional filters from view to apply.
             view_sorts: Optional sorts from view to apply.
             include_attachments: If True, include attachment files in export.
+            all_linked_records: If True, flattened columns list every linked record.
 
         Yields:
             CSV data chunks as bytes
@@ -167,24 +185,20 @@ class ExportService:
 
         yield header.encode("utf-8")
 
-        # Fetch all records and apply view filters/sorts if provided
-        records_data = await self._fetch_and_filter_records(
-            db, table_id, view_filters, view_sorts
-        )
-
-        # Stream records in batches
-        offset = 0
-        while offset < len(records_data):
-            batch = records_data[offset : offset + batch_size]
-
+        # Stream records in batches, with view filters/sorts applied in SQL
+        async for rows in self._iter_export_rows(
+            db,
+            table_id,
+            fields,
+            linked_field_map,
+            batch_size,
+            flatten_linked_records,
+            view_filters,
+            view_sorts,
+            all_linked_records,
+        ):
             # Write records to CSV
-            for record_dict in batch:
-                data = record_dict.get("data", {})
-
-                row = await self._build_export_row(
-                    db, data, fields, linked_field_map, flatten_linked_records
-                )
-
+            for row in rows:
                 writer.writerow(row)
                 csv_data = output.getvalue()
                 if csv_data:
@@ -192,8 +206,6 @@ class ExportService:
                     output.seek(0)
                     output.truncate(0)
 
-            offset += len(batch)
-
     async def _stream_json(
         self,
         db: AsyncSession,
@@ -204,6 +216,7 @@ class ExportService:
         view_filters: Optional[list[dict]] = None,
         view_sorts: Optional[list[dict]] = None,
         include_attachments: bool = False,
+        all_linked_records: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         """Stream records as JSON array.
 
@@ -216,6 +229,7 @@ class ExportService:
             view_filters: Optional filters from view to apply.
             view_sorts: Optional sorts from view to apply.
             include_attachments: If True, include attachment files in export.
+            all_linked_records: If True, flattened columns list every linked record.
 
         Yields:
             JSON data chunks as bytes
@@ -229,26 +243,22 @@ class ExportService:
             db, fields, flatten_linked_records
         )
 
-        # Fetch all records and apply view filters/sorts if provided
-        records_data = await self._fetch_and_filter_records(
-            db, table_id, view_filters, view_sorts
-        )
-
         first_record = True
-        offset = 0
-
-        while offset < len(records_data):
-            batch = records_data[offset : offset + batch_size]
 
+        # Stream records in batches, with view filters/sorts applied in SQL
+        async for rows in self._iter_export_rows(
+            db,
+            table_id,
+            fields,
+            linked_field_map,
+            batch_size,
+            flatten_linked_records,
+            view_filters,
+            view_sorts,
+            all_linked_records,
+        ):
             # Convert records to JSON
-            for record_dict in batch:
-                data = record_dict.get("data", {})
-
-                # Build record object with field names, flattening linked records if enabled
-                record_obj = await self._build_export_row(
-                    db, data, fields, linked_field_map, flatten_linked_records
-                )
-
+            for record_obj in rows:
                 # Add comma separator if not first record
                 if not first_record:
                     yield b","
@@ -258,8 +268,6 @@ class ExportService:
                 record_json = json.dumps(record_obj, ensure_ascii=False)
                 yield record_json.encode("utf-8")
 
-            offset += len(batch)
-
         # End JSON array
         yield b"]"
 
@@ -273,6 +281,7 @@ class ExportService:
         view_filters: Optional[list[dict]] = None,
         view_sorts: Optional[list[dict]] = None,
         include_attachments: bool = False,
+        all_linked_records: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         """Stream records as Excel (.xlsx) file.
 
@@ -285,15 +294,16 @@ class ExportService:
             view_filters: Optional filters from view to apply.
             view_sorts: Optional sorts from view to apply.
             include_attachments: If True, include attachment files in export.
+            all_linked_records: If True, flattened columns list every linked record.
 
         Yields:
             Excel file data as bytes
 
         """
-        # Create workbook and worksheet
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = "Export"
+        # Write-only workbooks flush rows to a temporary file as they are
+        # appended instead of keeping every cell in memory
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Export")
 
         # Build field names, expanding linked records if flattening enabled
         field_names, linked_field_map = await self._build_export_field_names(
@@ -303,29 +313,28 @@ class ExportService:
         # Write headers
         worksheet.append(field_names)
 
-        # Fetch all records and apply view filters/sorts if provided
-        records_data = await self._fetch_and_filter_records(
-            db, table_id, view_filters, view_sorts
-        )
-
-        # Write all records to worksheet
-        for record_dict in records_data:
-            data = record_dict.get("data", {})
-
-            row_dict = await self._build_export_row(
-                db, data, fields, linked_field_map, flatten_linked_records
-            )
-
-            row = [row_dict.get(field_name, "") for field_name in field_names]
-            worksheet.append(row)
-
-        # Save workbook to BytesIO
-        output = BytesIO()
-        workbook.save(output)
-        output.seek(0)
-
-        # Yield the entire Excel file
-        yield output.read()
+        # Stream records in batches, with view filters/sorts applied in SQL
+        async for rows in self._iter_export_rows(
+            db,
+            table_id,
+            fields,
+            linked_field_map,
+            batch_size,
+            flatten_linked_records,
+            view_filters,
+            view_sorts,
+            all_linked_records,
+        ):
+            for row_dict in rows:
+                row = [row_dict.get(field_name, "") for field_name in field_names]
+                worksheet.append(row)
+
+        # Save workbook to a temporary file and yield it in chunks
+        with tempfile.TemporaryFile() as output:
+            workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(EXPORT_CHUNK_SIZE):
+                yield chunk
 
     async def _stream_xml(
         self,
@@ -337,6 +346,7 @@ class ExportService:
         view_filters: Optional[list[dict]] = None,
         view_sorts: Optional[list[dict]] = None,
         include_attachments: bool = False,
+        all_linked_records: bool = False,
     ) -> AsyncGenerator[bytes, None]:
         """Stream records as XML.
 
@@ -349,6 +359,7 @@ class ExportService:
             view_filters: Optional filters from view to apply.
             view_sorts: Optional sorts from view to apply.
             include_attachments: If True, include attachment files in export.
+            all_linked_records: If True, flattened columns list every linked record.
 
         Yields:
             XML data chunks as bytes
@@ -366,25 +377,20 @@ class ExportService:
             db, fields, flatten_linked_records
         )
 
-        # Fetch all records and apply view filters/sorts if provided
-        records_data = await self._fetch_and_filter_records(
-            db, table_id, view_filters, view_sorts
-        )
-
-        # Stream records in batches
-        offset = 0
-        while offset < len(records_data):
-            batch = records_data[offset : offset + batch_size]
-
+        # Stream records in batches, with view filters/sorts applied in SQL
+        async for rows in self._iter_export_rows(
+            db,
+            table_id,
+            fields,
+            linked_field_map,
+            batch_size,
+            flatten_linked_records,
+            view_filters,
+            view_sorts,
+            all_linked_records,
+        ):
             # Write records to XML
-            for record_dict in batch:
-                data = record_dict.get("data", {})
-
-                # Build row dict with flattened linked records if enabled
-                row_dict = await self._build_export_row(
-                    db, data, fields, linked_field_map, flatten_linked_records
-                )
-
+            for row_dict in rows:
                 # Create record element
                 record_elem = ET.Element("record")
 
@@ -407,11 +413,68 @@ class ExportService:
                 xml_string = ET.tostring(record_elem, encoding="unicode")
                 yield f"  {xml_string}\n".encode("utf-8")
 
-            offset += len(batch)
-
         # End XML document
         yield b"</records>\n"
 
+    async def _stream_columnar(
+        self,
+        db: AsyncSession,
+        table_id: UUID,
+        fields: list[Field],
+        batch_size: int,
+        flatten_linked_records: bool = False,
+        view_filters: Optional[list[dict]] = None,
+        view_sorts: Optional[list[dict]] = None,
+        include_attachments: bool = False,
+        all_linked_records: bool = False,
+        export_format: str = "parquet",
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream records as a Parquet or Arrow IPC file.
+
+        Column types are derived from the field types; each batch of
+        records is converted to an Arrow record batch and written out
+        before the next one is fetched.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+            fields: List of table fields
+            batch_size: Batch size for fetching records
+            flatten_linked_records: If True, fetch and embed linked record data.
+            view_filters: Optional filters from view to apply.
+            view_sorts: Optional sorts from view to apply.
+            include_attachments: If True, include attachment files in export.
+            all_linked_records: If True, flattened columns list every linked record.
+            export_format: "parquet" or "arrow"
+
+        Yields:
+            File data chunks as bytes
+
+        """
+        field_names, linked_field_map = await self._build_export_field_names(
+            db, fields, flatten_linked_records
+        )
+        writer = ColumnarExportWriter(
+            export_format, build_arrow_schema(fields, field_names, linked_field_map)
+        )
+
+        async for rows in self._iter_export_rows(
+            db,
+            table_id,
+            fields,
+            linked_field_map,
+            batch_size,
+            flatten_linked_records,
+            view_filters,
+            view_sorts,
+            all_linked_records,
+        ):
+            chunk = writer.write_rows(rows)
+            if chunk:
+                yield chunk
+
+        yield writer.close()
+
     async def _build_export_field_names(
         self,
         db: AsyncSession,
@@ -466,6 +529,64 @@ class ExportService:
 
         return field_names, linked_field_map
 
+    async def _iter_export_rows(
+        self,
+        db: AsyncSession,
+        table_id: UUID,
+        fields: list[Field],
+        linked_field_map: dict[str, Any],
+        batch_size: int,
+        flatten_linked_records: bool = False,
+        view_filters: Optional[list[dict]] = None,
+        view_sorts: Optional[list[dict]] = None,
+        all_linked_records: bool = False,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Stream export rows in batches.
+
+        When flattening, the linked records referenced by a batch are
+        prefetched before its rows are built, and kept in a bounded LRU
+        for the rest of the export.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+            fields: List of table fields
+            linked_field_map: Mapping of expanded field names to field info
+            batch_size: Number of records per batch
+            flatten_linked_records: If True, fetch and embed linked record data.
+            view_filters: Optional filters from view to apply.
+            view_sorts: Optional sorts from view to apply.
+            all_linked_records: If True, flattened columns list every linked record.
+
+        Yields:
+            Lists of row dicts with field names as keys
+
+        """
+        linked_records = self._new_linked_record_cache() if flatten_linked_records else None
+
+        async for batch in self._iter_record_batches(
+            db, table_id, view_filters, view_sorts, batch_size
+        ):
+            if linked_records is not None and linked_field_map:
+                await self._prefetch_linked_records(
+                    db, batch, fields, linked_field_map, linked_records, all_linked_records
+                )
+
+            rows = []
+            for record_dict in batch:
+                rows.append(
+                    await self._build_export_row(
+                        db,
+                        record_dict.get("data", {}),
+                        fields,
+                        linked_field_map,
+                        flatten_linked_records,
+                        linked_records,
+                        all_linked_records,
+                    )
+                )
+            yield rows
+
     async def _build_export_row(
         self,
         db: AsyncSession,
@@ -473,6 +594,8 @@ class ExportService:
         fields: list[Field],
         linked_field_map: dict[str, Any],
         flatten_linked_records: bool,
+        linked_records: Optional[LocalCache] = None,
+        all_linked_records: bool = False,
     ) -> dict[str, Any]:
         """Build export row dict, flattening linked records if enabled.
 
@@ -482,6 +605,8 @@ class ExportService:
             fields: List of table fields
             linked_field_map: Mapping of expanded field names to field info
             flatten_linked_records: Whether to flatten linked records
+            linked_records: Cache of linked record data, from ``_new_linked_record_cache``
+            all_linked_records: Whether to list every linked record or only the first
 
         Returns:
             Row dict with field names as keys
@@ -506,12 +631,18 @@ class ExportService:
 
                 if field.field_type == "linked_record" and linked_field_map:
                     # Fetch linked record data and expand it
-                    linked_records = await self._get_linked_records_data(
-                        db, value, field, linked_field_map, field.name
+                    linked_values = await self._get_linked_records_data(
+                        db,
+                        value,
+                        field,
+                        linked_field_map,
+                        field.name,
+                        linked_records,
+                        all_linked_records,
                     )
 
                     # Add expanded fields to row
-                    row.update(linked_records)
+                    row.update(linked_values)
                 else:
                     # Non-linked field: just add the value
                     if isinstance(value, (dict, list)):
@@ -527,6 +658,8 @@ class ExportService:
         field: Field,
         linked_field_map: dict[str, Any],
         field_name: str,
+        linked_records: Optional[LocalCache] = None,
+        all_linked_records: bool = False,
     ) -> dict[str, Any]:
         """Fetch and flatten linked record data.
 
@@ -536,45 +669,27 @@ class ExportService:
             field: The linked record field
             linked_field_map: Mapping of expanded field names
             field_name: Name of the linked record field
+            linked_records: Cache of linked record data; records missing from
+                it are loaded and added
+            all_linked_records: If True, join the values of every linked
+                record with ", " instead of using only the first
 
         Returns:
             Dict of flattened linked record data
 
         """
-        result = {}
-
-        # Parse linked record IDs
-        if isinstance(linked_record_ids, str):
-            try:
-                linked_record_ids = json.loads(linked_record_ids)
-            except (json.JSONDecodeError, TypeError):
-                linked_record_ids = []
-
-        if not linked_record_ids:
-            linked_record_ids = []
-
-        # Ensure it's a list
-        if isinstance(linked_record_ids, dict):
-            linked_record_ids = list(linked_record_ids.keys())
-        elif not isinstance(linked_record_ids, list):
-            linked_record_ids = [linked_record_ids] if linked_record_ids else []
-
-        if not linked_record_ids:
+        expanded = {
+            expanded_name: field_info
+            for expanded_name, field_info in linked_field_map.items()
+            if expanded_name.startswith(f"{field_name}.")
+        }
+        result = {expanded_name: "" for expanded_name in expanded}
+
+        record_ids = self._parse_linked_record_ids(linked_record_ids)
+        if not all_linked_records:
+            record_ids = record_ids[:1]
+        if not record_ids:
             # No linked records, return empty values for all expanded fields
-            for expanded_name, field_info in linked_field_map.items():
-                if expanded_name.startswith(f"{field_name}."):
-                    result[expanded_name] = ""
-            return result
-
-        # Get the first linked record (for single value exports)
-        # For multiple linked records, we could concatenate or create multiple rows
-        # For now, just use the first one
-        record_id = str(linked_record_ids[0]) if linked_record_ids else None
-
-        if not record_id:
-            for expanded_name in linked_field_map.keys():
-                if expanded_name.startswith(f"{field_name}."):
-                    result[expanded_name] = ""
             return result
 
         # Find the linked table ID from field map
@@ -585,113 +700,177 @@ class ExportService:
                 break
 
         if not linked_table_id:
-            return result
+            return {}
 
-        # Fetch the linked record
-        query = (
-            select(Record)
-            .where(Record.table_id == str(linked_table_id))
-            .where(Record.id == record_id)
-            .where(Record.deleted_at.is_(None))
+        if linked_records is None:
+            linked_records = self._new_linked_record_cache()
+        resolved = await self._resolve_linked_records(
+            db, str(linked_table_id), record_ids, linked_records
         )
-        record_result = await db.execute(query)
-        linked_record = record_result.scalar_one_or_none()
-
-        if not linked_record:
-            # Record not found, return empty values
-            for expanded_name in linked_field_map.keys():
-                if expanded_name.startswith(f"{field_name}."):
-                    result[expanded_name] = ""
-            return result
 
-        # Parse linked record data
-        try:
-            linked_data = (
-                json.loads(linked_record.data)
-                if isinstance(linked_record.data, str)
-                else linked_record.data
-            )
-        except (json.JSONDecodeError, TypeError):
-            linked_data = {}
+        # Records that no longer exist contribute no values
+        linked_rows = [resolved[record_id] for record_id in record_ids if resolved.get(record_id)]
+        if not linked_rows:
+            return result
 
         # Map linked record fields to expanded field names
-        for expanded_name, field_info in linked_field_map.items():
-            if expanded_name.startswith(f"{field_name}."):
-                linked_field = field_info["linked_field"]
-                linked_field_id = str(linked_field.id)
+        for expanded_name, field_info in expanded.items():
+            linked_field_id = str(field_info["linked_field"].id)
+            values = []
+            for linked_data in linked_rows:
                 value = linked_data.get(linked_field_id, "")
 
                 # Convert complex values to strings
                 if isinstance(value, (dict, list)):
                     value = json.dumps(value)
+                values.append(value)
 
-                result[expanded_name] = value
+            if all_linked_records:
+                result[expanded_name] = ", ".join(
+                    str(value) for value in values if value not in (None, "")
+                )
+            else:
+                result[expanded_name] = values[0]
 
         return result
 
-    async def _get_workspace(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-    ) -> Workspace:
-        """Get workspace by ID.
+    @staticmethod
+    def _parse_linked_record_ids(value: Any) -> list[str]:
+        """Normalize a linked record cell value to a list of record IDs.
 
         Args:
-            db: Database session
-            workspace_id: Workspace ID
+            value: Linked record value (list, dict keyed by ID, JSON string or single ID)
 
         Returns:
-            Workspace
+            List of record IDs
 
         """
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace not found")
-        return workspace
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except (json.JSONDecodeError, TypeError):
+                value = []
+
+        if not value:
+            return []
+        if isinstance(value, dict):
+            value = list(value.keys())
+        elif not isinstance(value, list):
+            value = [value]
+        return [str(record_id) for record_id in value if record_id]
+
+    @staticmethod
+    def _new_linked_record_cache() -> LocalCache:
+        """Create the LRU holding linked record data for one export.
+
+        Returns:
+            Cache of linked record data keyed by ``(table_id, record_id)``
+
+        """
+        return LocalCache(
+            "export_linked_records",
+            max_entries=settings.export_linked_record_cache_max_entries,
+            max_bytes=settings.export_linked_record_cache_max_bytes,
+            ttl=float("inf"),
+        )
 
-    async def _get_workspace_member(
+    async def _prefetch_linked_records(
         self,
         db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member.
+        batch: list[dict[str, Any]],
+        fields: list[Field],
+        linked_field_map: dict[str, Any],
+        linked_records: LocalCache,
+        all_linked_records: bool = False,
+    ) -> None:
+        """Load the linked records referenced by a batch with one query per linked table.
 
         Args:
             db: Database session
-            workspace_id: Workspace ID
-            user_id: User ID
-
-        Returns:
-            WorkspaceMember or None
+            batch: Record dicts about to be exported
+            fields: List of table fields
+            linked_field_map: Mapping of expanded field names to field info
+            linked_records: Cache to load the linked records into
+            all_linked_records: Whether every linked record is exported or only the first
 
         """
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        linked_tables = {
+            str(field_info["field"].id): str(field_info["linked_table_id"])
+            for field_info in linked_field_map.values()
+        }
+        ids_by_table: dict[str, dict[str, None]] = {}
+        for field in fields:
+            linked_table_id = linked_tables.get(str(field.id))
+            if field.field_type != "linked_record" or linked_table_id is None:
+                continue
+            table_ids = ids_by_table.setdefault(linked_table_id, {})
+            for record_dict in batch:
+                record_ids = self._parse_linked_record_ids(
+                    record_dict.get("data", {}).get(str(field.id))
+                )
+                if not all_linked_records:
+                    record_ids = record_ids[:1]
+                table_ids.update(dict.fromkeys(record_ids))
+
+        for linked_table_id, record_ids in ids_by_table.items():
+            if record_ids:
+                await self._resolve_linked_records(
+                    db, linked_table_id, list(record_ids), linked_records
+                )
 
-    async def _get_base(
+    async def _resolve_linked_records(
         self,
         db: AsyncSession,
-        base_id: str,
-    ) -> Base:
-        """Get base by ID.
+        linked_table_id: str,
+        record_ids: list[str],
+        linked_records: LocalCache,
+    ) -> dict[str, dict[str, Any]]:
+        """Get linked record data, loading records missing from the cache.
 
         Args:
             db: Database session
-            base_id: Base ID
+            linked_table_id: Table the records belong to
+            record_ids: Linked record IDs
+            linked_records: Cache of linked record data
 
         Returns:
-            Base
+            Mapping of record ID -> record data (empty for deleted or missing records)
 
         """
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base not found")
-        return base
+        resolved: dict[str, dict[str, Any]] = {}
+        missing = []
+        for record_id in record_ids:
+            data = linked_records.get((linked_table_id, record_id))
+            if data is None:
+                missing.append(record_id)
+            else:
+                resolved[record_id] = data
+        if not missing:
+            return resolved
+
+        query = select(Record.id, Record.data).where(
+            Record.table_id == linked_table_id,
+            Record.id.in_(missing),
+            Record.deleted_at.is_(None),
+        )
+        result = await db.execute(query)
+        for record_id, raw_data in result.all():
+            try:
+                data = json.loads(raw_data) if isinstance(raw_data, str) else raw_data
+            except (json.JSONDecodeError, TypeError):
+                data = {}
+            data = data or {}
+            resolved[str(record_id)] = data
+            size = len(raw_data) if isinstance(raw_data, str) else len(json.dumps(data, default=str))
+            linked_records.set((linked_table_id, str(record_id)), data, size=size)
+
+        # Remember missing records too, so they aren't queried again
+        for record_id in missing:
+            if record_id not in resolved:
+                resolved[record_id] = {}
+                linked_records.set((linked_table_id, record_id), {}, size=0)
+
+        return resolved
 
     async def _get_table_fields(
         self,
@@ -716,221 +895,93 @@ class ExportService:
         result = await db.execute(query)
         return list(result.scalars().all())
 
-    async def _fetch_and_filter_records(
+    async def _iter_record_batches(
         self,
         db: AsyncSession,
         table_id: UUID,
         view_filters: Optional[list[dict]] = None,
         view_sorts: Optional[list[dict]] = None,
-    ) -> list[dict[str, Any]]:
-        """Fetch all records and apply view filters and sorts.
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Stream records in batches with view filters and sorts applied in SQL.
+
+        Each batch is a keyset-paged query that resumes after the last row
+        of the previous batch, so only one batch is held in memory however
+        large the table is.
 
         Args:
             db: Database session
             table_id: Table ID
             view_filters: Optional filters from view to apply.
             view_sorts: Optional sorts from view to apply.
+            batch_size: Number of records per batch
 
-        Returns:
-            List of record dicts with applied filters and sorts
+        Yields:
+            Lists of record dicts, in view sort order
 
         """
-        # Fetch all records from the table
-        query = select(Record).where(
+        compiler = RecordQueryCompiler(indexed_fields=await get_indexed_fields(db, table_id))
+        conditions = [
             Record.table_id == str(table_id),
             Record.deleted_at.is_(None),
-        )
-        result = await db.execute(query)
-        records = result.scalars().all()
-
-        # Convert records to dict format
-        records_data = []
-        for record in records:
-            try:
-                data = json.loads(record.data) if isinstance(record.data, str) else record.data
-            except (json.JSONDecodeError, TypeError):
-                data = {}
-
-            record_dict = {
-                "id": str(record.id),
-                "table_id": str(record.table_id),
-                "data": data,
-                "created_at": record.created_at.isoformat() if record.created_at else None,
-                "updated_at": record.updated_at.isoformat() if record.updated_at else None,
-            }
-            records_data.append(record_dict)
-
-        # Apply view filters if provided
-        if view_filters:
-            records_data = self._apply_filters(records_data, view_filters)
-
-        # Apply view sorts if provided
-        if view_sorts:
-            records_data = self._apply_sorts(records_data, view_sorts)
-
-        return records_data
-
-    def _apply_filters(
-        self,
-        records: list[dict[str, Any]],
-        filters: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Apply filters to records.
-
-        Args:
-            records: List of record dicts
-            filters: List of filter conditions
-
-        Returns:
-            Filtered records
-
-        """
-        if not filters:
-            return records
-
-        filtered_records = []
-        for record in records:
-            if self._record_matches_filters(record, filters):
-                filtered_records.append(record)
-
-        return filtered_records
-
-    def _record_matches_filters(
-        self,
-        record: dict[str, Any],
-        filters: list[dict[str, Any]],
-    ) -> bool:
-        """Check if a record matches all filter conditions.
-
-        Args:
-            record: Record dict
-            filters: List of filter conditions
+        ]
+        filter_clause = compiler.compile_filters(view_filters)
+        if filter_clause is not None:
+            conditions.append(filter_clause)
 
-        Returns:
-            True if record matches filters
-
-        """
-        and_conditions = []
-        or_conditions = []
-
-        for filter_cond in filters:
-            field_id = str(filter_cond.get("field_id", ""))
-            operator = filter_cond.get("operator", "")
-            value = filter_cond.get("value")
-            conjunction = filter_cond.get("conjunction", "and")
-
-            # Get field value from record
-            field_value = record.get("data", {}).get(field_id)
-
-            # Evaluate condition
-            matches = self._evaluate_filter(field_value, operator, value)
-
-            if conjunction == "or":
-                or_conditions.append(matches)
-            else:
-                and_conditions.append(matches)
-
-        # All AND conditions must be true
-        all_ands = all(and_conditions) if and_conditions else True
-        # At least one OR condition must be true (if any OR conditions exist)
-        any_ors = any(or_conditions) if or_conditions else True
-
-        return all_ands and (any_ors if or_conditions else True)
-
-    def _evaluate_filter(
-        self,
-        field_value: Any,
-        operator: str,
-        filter_value: Any,
-    ) -> bool:
-        """Evaluate a single filter condition.
-
-        Args:
-            field_value: Value from record
-            operator: Filter operator
-            filter_value: Value to compare against
-
-        Returns:
-            True if condition matches
-
-        """
-        if operator == "equals":
-            return field_value == filter_value
-        elif operator == "not_equals":
-            return field_value != filter_value
-        elif operator == "contains":
-            return filter_value in str(field_value) if field_value else False
-        elif operator == "not_contains":
-            return filter_value not in str(field_value) if field_value else True
-        elif operator == "is_empty":
-            return field_value is None or field_value == "" or field_value == []
-        elif operator == "is_not_empty":
-            return field_value is not None and field_value != "" and field_value != []
-        elif operator == "gt":
-            return field_value > filter_value if field_value is not None else False
-        elif operator == "lt":
-            return field_value < filter_value if field_value is not None else False
-        elif operator == "gte":
-            return field_value >= filter_value if field_value is not None else False
-        elif operator == "lte":
-            return field_value <= filter_value if field_value is not None else False
-        elif operator == "in":
-            return field_value in filter_value if filter_value else False
-        elif operator == "not_in":
-            return field_value not in filter_value if filter_value else True
-        elif operator == "starts_with":
-            return str(field_value).startswith(str(filter_value)) if field_value else False
-        elif operator == "ends_with":
-            return str(field_value).endswith(str(filter_value)) if field_value else False
-        else:
-            # Unsupported operator, default to True
-            return True
+        query = (
+            select(Record)
+            .where(*conditions)
+            .order_by(*compiler.compile_order_by(view_sorts))
+            .limit(batch_size)
+        )
 
-    def _apply_sorts(
-        self,
-        records: list[dict[str, Any]],
-        sorts: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Apply sort rules to records.
+        cursor = None
+        while True:
+            page_query = query
+            if cursor is not None:
+                page_query = query.where(compiler.keyset_predicate(view_sorts, cursor))
+            result = await db.execute(page_query)
+            records = list(result.scalars().all())
+            if not records:
+                return
+
+            batch = [self._record_to_export_dict(record) for record in records]
+            cursor = compiler.encode_cursor(view_sorts, records[-1])
+            has_more = len(records) == batch_size
+
+            # Detach the page so the session doesn't accumulate the whole table
+            for record in records:
+                db.expunge(record)
+            del records
+
+            yield batch
+            if not has_more:
+                return
+
+    @staticmethod
+    def _record_to_export_dict(record: Record) -> dict[str, Any]:
+        """Convert a record to the dict format used by the exporters.
 
         Args:
-            records: List of record dicts
-            sorts: List of sort rules
+            record: Record model
 
         Returns:
-            Sorted records
+            Record dict with parsed data
 
         """
-        if not sorts:
-            return records
-
-        # Apply sorts in reverse order (last sort first) for stable multi-column sorting
-        for sort_rule in reversed(sorts):
-            field_id = str(sort_rule.get("field_id", ""))
-            direction = sort_rule.get("direction", "asc")
-
-            reverse = direction == "desc"
-
-            def sort_key(record: dict[str, Any]) -> tuple[int, Any]:
-                """Generate sort key handling None/missing values and type consistency.
-
-                Returns tuple of (is_none, value) where:
-                - is_none: 0 for non-None values, 1 for None/missing (sorts to end)
-                - value: the actual value for comparison
-
-                """
-                value = record.get("data", {}).get(field_id)
-
-                # Handle None or missing values - sort to end
-                if value is None or value == "":
-                    return (1, "")
-
-                # Return (0, value) for non-None values to sort them first
-                return (0, value)
-
-            records = sorted(records, key=sort_key, reverse=reverse)
+        try:
+            data = json.loads(record.data) if isinstance(record.data, str) else record.data
+        except (json.JSONDecodeError, TypeError):
+            data = {}
 
-        return records
+        return {
+            "id": str(record.id),
+            "table_id": str(record.table_id),
+            "data": data or {},
+            "created_at": record.created_at.isoformat() if record.created_at else None,
+            "updated_at": record.updated_at.isoformat() if record.updated_at else None,
+        }
 
     # ==========================================================================
     # Attachment Export Methods
@@ -964,16 +1015,7 @@ class ExportService:
             NotFoundError: If table or view not found
             PermissionDeniedError: If user doesn't have access to table
         """
-        # Verify table exists and user has access
-        table = await db.get(Table, str(table_id))
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
+        await require_table_access(db, table_id, user_id)
 
         # Get table fields
         fields = await self._get_table_fields(db, str(table_id))
@@ -995,15 +1037,12 @@ class ExportService:
             yield self._create_empty_zip()
             return
 
-        # Fetch all records with filters/sorts
-        records_data = await self._fetch_and_filter_records(
-            db, table_id, view_filters, view_sorts
-        )
-
-        # Extract all attachments
-        attachments = await self._extract_attachments_from_records(
-            records_data, attachment_fields
-        )
+        # Extract attachments batch by batch, keeping only their metadata
+        attachments = []
+        async for batch in self._iter_record_batches(db, table_id, view_filters, view_sorts):
+            attachments.extend(
+                await self._extract_attachments_from_records(batch, attachment_fields)
+            )
 
         if not attachments:
             yield self._create_empty_zip()
@@ -17,6 +17,8 @@ from pybase.models.field import Field, FieldType
 from pybase.models.table import Table
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.field import FieldCreate, FieldUpdate
+from pybase.services.field_index import is_indexable
+from pybase.services.field_index_builder import get_field_index_builder
 
 
 class FieldService:
@@ -41,7 +43,8 @@ class FieldService:
         Raises:
             NotFoundError: If table not found
             PermissionDeniedError: If user doesn't have access to table
-            ConflictError: If primary field already exists or field type invalid
+            ConflictError: If primary field already exists, field type invalid,
+                or indexing is requested for a type that can't be indexed
 
         """
         # Check if table exists
@@ -61,6 +64,8 @@ class FieldService:
             FieldType(field_data.field_type)
         except ValueError:
             raise ConflictError(f"Invalid field type: {field_data.field_type}")
+        if field_data.is_indexed and not is_indexable(field_data.field_type.value):
+            raise ConflictError(f"Fields of type '{field_data.field_type.value}' cannot be indexed")
 
         # Check primary field constraint
         if field_data.options and field_data.options.get("is_primary", False):
@@ -87,12 +92,19 @@ class FieldService:
             options=json.dumps(field_data.options) if field_data.options else "{}",
             is_required=field_data.is_required,
             is_unique=field_data.is_unique,
+            is_indexed=field_data.is_indexed,
             position=field_data.position if field_data.position else max_position + 1,
             is_primary=field_data.options.get("is_primary", False) if field_data.options else False,
         )
         db.add(field)
         await db.refresh(field)
 
+        # Build the expression index backing filters/sorts on this field
+        # once the field is committed
+        if field.is_indexed:
+            await db.flush()
+            get_field_index_builder().schedule(db, field.id)
+
         # Update table primary_field_id if this is primary
         if field.is_primary:
             table.primary_field_id = field.id
@@ -204,7 +216,8 @@ class FieldService:
         Raises:
             NotFoundError: If field not found
             PermissionDeniedError: If user doesn't have permission
-            ConflictError: If primary field constraint violated
+            ConflictError: If primary field constraint violated or the field
+                type can't be indexed
 
         """
         field = await self.get_field_by_id(db, field_id, user_id)
@@ -236,6 +249,12 @@ class FieldService:
             field.is_required = field_data.is_required
         if field_data.is_unique is not None:
             field.is_unique = field_data.is_unique
+        if field_data.is_indexed is not None and field_data.is_indexed != field.is_indexed:
+            if field_data.is_indexed:
+                if not is_indexable(field.field_type):
+                    raise ConflictError(f"Fields of type '{field.field_type}' cannot be indexed")
+            field.is_indexed = field_data.is_indexed
+            get_field_index_builder().schedule(db, field.id)
         if field_data.width is not None:
             field.width = field_data.width
         if field_data.is_visible is not None:
@@ -280,6 +299,9 @@ class FieldService:
             raise PermissionDeniedError("Only workspace owner can delete fields")
 
         field.soft_delete()
+        if field.is_indexed:
+            field.is_indexed = False
+            get_field_index_builder().schedule(db, field.id)
 
         # Clear table primary_field_id if this was primary
         if field.is_primary:
@@ -0,0 +1,157 @@
+"""
+Per-field expression indexes on record data.
+
+Fields marked ``is_indexed`` get a partial btree index on the typed
+expression ``RecordQueryCompiler`` uses for filters and sorts, scoped to
+the field's table and live records. The expression is shared with the
+compiler through ``typed_field_expression`` so the planner can match
+queries against the index.
+
+Index DDL runs with CONCURRENTLY, which cannot run inside a transaction
+and must not hold locks on ``records`` for a request. Services schedule
+builds with ``FieldIndexBuilder`` (``field_index_builder``), which runs
+them in the background once the request has committed.
+
+Fields with a unique constraint get a similar index on
+``unique_key_expression`` so ``ValidationService`` uniqueness lookups
+don't scan the table.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.exceptions import ConflictError
+from pybase.models.field import Field
+from pybase.services.record_query import (
+    INDEXABLE_FIELD_TYPES,
+    typed_field_expression,
+    unique_key_expression,
+)
+
+RECORDS_TABLE = "pybase.records"
+
+
+def _compile(expression) -> str:
+    """Render an expression as PostgreSQL DDL text."""
+    return str(
+        expression.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def field_index_name(field_id: str | UUID) -> str:
+    """Return the expression index name for a field.
+
+    Args:
+        field_id: Field ID
+
+    Returns:
+        Index name (fits PostgreSQL's 63 character identifier limit)
+
+    """
+    return f"ix_records_f_{UUID(str(field_id)).hex}"
+
+
+def is_indexable(field_type: str) -> bool:
+    """Check whether values of a field type can back an expression index."""
+    return field_type in INDEXABLE_FIELD_TYPES
+
+
+def _table_predicate(table_id: str | UUID) -> str:
+    """Build the partial index predicate limiting an index to a table's live records."""
+    return f"WHERE deleted_at IS NULL AND table_id = '{UUID(str(table_id))}'"
+
+
+def create_field_index_sql(field_id: str | UUID, field_type: str, table_id: str | UUID) -> str:
+    """Build the CREATE INDEX statement for a field.
+
+    Args:
+        field_id: Field ID
+        field_type: Field type value
+        table_id: ID of the field's table
+
+    Returns:
+        DDL statement (must run outside a transaction)
+
+    Raises:
+        ConflictError: If the field type cannot be indexed
+
+    """
+    if not is_indexable(field_type):
+        raise ConflictError(f"Fields of type '{field_type}' cannot be indexed")
+
+    expression = typed_field_expression(column("data", JSONB), str(field_id), field_type)
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {field_index_name(field_id)} "
+        f"ON {RECORDS_TABLE} (({_compile(expression)})) "
+        f"{_table_predicate(table_id)}"
+    )
+
+
+def drop_field_index_sql(field_id: str | UUID) -> str:
+    """Build the DROP INDEX statement for a field (must run outside a transaction)."""
+    return f"DROP INDEX CONCURRENTLY IF EXISTS pybase.{field_index_name(field_id)}"
+
+
+def unique_lookup_index_name(field_id: str | UUID) -> str:
+    """Return the unique-value lookup index name for a field."""
+    return f"ix_records_u_{UUID(str(field_id)).hex}"
+
+
+def create_unique_lookup_index_sql(
+    field_id: str | UUID, case_sensitive: bool, table_id: str | UUID
+) -> str:
+    """Build the CREATE INDEX statement backing unique constraint lookups.
+
+    The index is not UNIQUE: constraints can be disabled or pending,
+    tables may already hold duplicates, and batch updates need to swap
+    values between records, so uniqueness stays enforced by
+    ``ValidationService``.
+
+    Args:
+        field_id: Field ID
+        case_sensitive: Whether the constraint is case sensitive
+        table_id: ID of the field's table
+
+    Returns:
+        DDL statement (must run outside a transaction)
+
+    """
+    expression = unique_key_expression(column("data", JSONB), str(field_id), case_sensitive)
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {unique_lookup_index_name(field_id)} "
+        f"ON {RECORDS_TABLE} (({_compile(expression)})) "
+        f"{_table_predicate(table_id)}"
+    )
+
+
+def drop_unique_lookup_index_sql(field_id: str | UUID) -> str:
+    """Build the DROP INDEX statement for a unique lookup index (outside a transaction)."""
+    return f"DROP INDEX CONCURRENTLY IF EXISTS pybase.{unique_lookup_index_name(field_id)}"
+
+
+async def get_indexed_fields(db: AsyncSession, table_id: str | UUID) -> dict[str, str]:
+    """Get the indexed fields of a table.
+
+    Args:
+        db: Database session
+        table_id: Table ID
+
+    Returns:
+        Mapping of field ID -> field type, for use with ``RecordQueryCompiler``
+
+    """
+    result = await db.execute(
+        select(Field.__table__.c.id, Field.__table__.c.field_type).where(
+            Field.__table__.c.table_id == str(table_id),
+            Field.__table__.c.is_indexed.is_(True),
+            Field.__table__.c.deleted_at.is_(None),
+        )
+    )
+    return {str(field_id): field_type for field_id, field_type in result.all()}
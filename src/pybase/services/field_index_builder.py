@@ -0,0 +1,286 @@
+"""
+Background builds of per-field record indexes.
+
+``CREATE INDEX CONCURRENTLY`` cannot run inside a transaction, and a plain
+``CREATE INDEX`` in the request transaction blocks every write to
+``records`` until the request commits. Services therefore only schedule a
+field's index with ``FieldIndexBuilder.schedule``; once the request
+session commits, the field is queued and a background task brings its
+index in line with what the database holds, creating or dropping it
+concurrently:
+
+- ``FIELD_INDEX``: the expression index of a live field marked
+  ``is_indexed``
+- ``UNIQUE_LOOKUP_INDEX``: the lookup index of a field with a unique
+  constraint; scheduled with ``rebuild`` when its expression changes
+
+A rolled back request schedules nothing.
+
+Builds run one at a time on an autocommit connection, guarded by an
+advisory lock so workers do not build the same index twice. An index left
+invalid by an interrupted build is dropped and built again.
+"""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.config import settings
+from pybase.core.exceptions import ConflictError
+from pybase.core.logging import get_logger
+from pybase.db.session import AsyncSessionLocal, engine
+from pybase.models.field import Field
+from pybase.models.unique_constraint import UniqueConstraint
+from pybase.services.field_index import (
+    create_field_index_sql,
+    create_unique_lookup_index_sql,
+    drop_field_index_sql,
+    drop_unique_lookup_index_sql,
+    field_index_name,
+    is_indexable,
+    unique_lookup_index_name,
+)
+
+logger = get_logger(__name__)
+
+# Session.info keys of the builds scheduled by a session's transaction, and
+# whether the session's commit/rollback listeners are registered
+_SCHEDULED = "field_index_builds"
+_LISTENING = "field_index_listening"
+
+# Kinds of per-field indexes
+FIELD_INDEX = "field"
+UNIQUE_LOOKUP_INDEX = "unique"
+
+# Seconds to wait before retrying after a failed build
+RETRY_SECONDS = 30.0
+
+_INDEX_VALID_SQL = """
+SELECT i.indisvalid FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname = 'pybase' AND c.relname = $1
+"""
+
+
+class FieldIndexBuilder:
+    """Queue of fields whose index is (re)built or dropped in the background."""
+
+    def __init__(
+        self,
+        session_factory: Any = AsyncSessionLocal,
+        build_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize builder.
+
+        Args:
+            session_factory: Factory of database sessions for reading field state
+            build_timeout: Seconds one index build may take
+
+        """
+        self.session_factory = session_factory
+        self.build_timeout = build_timeout or settings.field_index_build_timeout
+        # (index kind, field ID) -> whether to rebuild an existing index
+        self._pending: OrderedDict[tuple[str, str], bool] = OrderedDict()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(
+        self,
+        db: AsyncSession,
+        field_id: str | UUID,
+        kind: str = FIELD_INDEX,
+        rebuild: bool = False,
+    ) -> None:
+        """Queue a field's index once the session's transaction commits.
+
+        Args:
+            db: Session of the request changing the field
+            field_id: Field ID
+            kind: FIELD_INDEX or UNIQUE_LOOKUP_INDEX
+            rebuild: Whether an existing index is outdated and must be rebuilt
+
+        """
+        if not db.info.get(_LISTENING):
+            event.listen(db.sync_session, "after_commit", self._after_commit)
+            event.listen(db.sync_session, "after_rollback", self._after_rollback)
+            db.info[_LISTENING] = True
+        db.info.setdefault(_SCHEDULED, []).append((kind, str(field_id), rebuild))
+
+    def enqueue(self, field_id: str | UUID, kind: str = FIELD_INDEX, rebuild: bool = False) -> None:
+        """Queue a field's index and make sure the builder is running.
+
+        Args:
+            field_id: Field ID
+            kind: FIELD_INDEX or UNIQUE_LOOKUP_INDEX
+            rebuild: Whether an existing index is outdated and must be rebuilt
+
+        """
+        key = (kind, str(field_id))
+        self._pending[key] = self._pending.get(key, False) or rebuild
+        self._ensure_started()
+        self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Reconcile every queued index."""
+        while self._pending:
+            (kind, field_id), rebuild = self._pending.popitem(last=False)
+            try:
+                if kind == UNIQUE_LOOKUP_INDEX:
+                    await self._reconcile_unique_lookup(field_id, rebuild)
+                else:
+                    await self._reconcile(field_id)
+            except Exception:
+                # Keep the index for the next flush
+                key = (kind, field_id)
+                self._pending[key] = self._pending.get(key, False) or rebuild
+                raise
+
+    async def stop(self) -> None:
+        """Stop the builder (application shutdown).
+
+        A build in progress is cancelled; its invalid index is dropped and
+        built again the next time the field is scheduled.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _after_commit(self, session: Any) -> None:
+        for kind, field_id, rebuild in session.info.pop(_SCHEDULED, ()):
+            self.enqueue(field_id, kind, rebuild)
+
+    def _after_rollback(self, session: Any) -> None:
+        session.info.pop(_SCHEDULED, None)
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Field index build failed: {e}")
+                # Retry after a pause rather than in a tight loop
+                await asyncio.sleep(RETRY_SECONDS)
+                self._wakeup.set()
+
+    async def _reconcile(self, field_id: str) -> None:
+        """Create or drop a field's index to match its committed state."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(
+                    Field.__table__.c.table_id,
+                    Field.__table__.c.field_type,
+                    Field.__table__.c.is_indexed,
+                    Field.__table__.c.deleted_at,
+                ).where(Field.__table__.c.id == field_id)
+            )
+            row = result.one_or_none()
+
+        name = field_index_name(field_id)
+        if (
+            row is not None
+            and row.is_indexed
+            and row.deleted_at is None
+            and is_indexable(row.field_type)
+        ):
+            await self._build(name, create_field_index_sql(field_id, row.field_type, row.table_id))
+        else:
+            await self._drop(name, drop_field_index_sql(field_id))
+
+    async def _reconcile_unique_lookup(self, field_id: str, rebuild: bool) -> None:
+        """Create, rebuild or drop a unique constraint's lookup index."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(
+                    Field.__table__.c.table_id,
+                    UniqueConstraint.__table__.c.case_sensitive,
+                )
+                .join(
+                    Field.__table__,
+                    Field.__table__.c.id == UniqueConstraint.__table__.c.field_id,
+                )
+                .where(UniqueConstraint.__table__.c.field_id == field_id)
+            )
+            row = result.one_or_none()
+
+        name = unique_lookup_index_name(field_id)
+        if row is not None:
+            await self._build(
+                name,
+                create_unique_lookup_index_sql(field_id, row.case_sensitive, row.table_id),
+                rebuild=rebuild,
+            )
+        else:
+            await self._drop(name, drop_unique_lookup_index_sql(field_id))
+
+    async def _build(self, name: str, create_sql: str, rebuild: bool = False) -> None:
+        """Build an index, replacing an outdated one or one left invalid by an interrupted build."""
+        async with self._ddl_connection(name) as conn:
+            valid = await conn.fetchval(_INDEX_VALID_SQL, name)
+            if valid and not rebuild:
+                return
+            if valid is not None:
+                await conn.execute(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS pybase.{name}",
+                    timeout=self.build_timeout,
+                )
+            await conn.execute(create_sql, timeout=self.build_timeout)
+            logger.info(f"Built record index {name}")
+
+    async def _drop(self, name: str, drop_sql: str) -> None:
+        """Drop an index if it exists."""
+        async with self._ddl_connection(name) as conn:
+            await conn.execute(drop_sql, timeout=self.build_timeout)
+
+    @asynccontextmanager
+    async def _ddl_connection(self, name: str) -> AsyncIterator[Any]:
+        """Yield a driver connection outside any transaction, locked for an index.
+
+        Raises:
+            ConflictError: If another worker is changing the index (the field
+                stays queued and is retried)
+
+        """
+        async with engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            conn = raw.driver_connection
+            if not await conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", name):
+                raise ConflictError(f"Record index {name} is being changed by another worker")
+            try:
+                yield conn
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock(hashtext($1))", name)
+
+
+_builder: Optional[FieldIndexBuilder] = None
+
+
+def get_field_index_builder() -> FieldIndexBuilder:
+    """Get the process-wide field index builder."""
+    global _builder
+    if _builder is None:
+        _builder = FieldIndexBuilder()
+    return _builder
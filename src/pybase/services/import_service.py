@@ -9,20 +9,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.exceptions import (
     ConflictError,
-    NotFoundError,
     PermissionDeniedError,
     ValidationError,
 )
-from pybase.models.base import Base
 from pybase.models.field import Field, FieldType
 from pybase.models.record import Record
-from pybase.models.table import Table
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.extraction import ImportRequest, ImportResponse
 from pybase.schemas.field import FieldCreate
 from pybase.schemas.record import RecordCreate
+from pybase.services.access import EDITOR_ROLES, require_table_access
 from pybase.services.field import FieldService
 from pybase.services.record import RecordService
+from pybase.services.validation import ValidationService
 
 
 class ImportService:
@@ -32,6 +30,7 @@ class ImportService:
         """Initialize import service with dependent services."""
         self.field_service = FieldService()
         self.record_service = RecordService()
+        self.validation_service = ValidationService()
 
     async def import_records(
         self,
@@ -57,24 +56,10 @@ class ImportService:
             ValidationError: If field mapping is invalid
 
         """
-        # Check if table exists
-        table = await db.get(Table, str(import_data.table_id))
-        if not table or table.is_deleted:
-            raise NotFoundError("Table", str(import_data.table_id))
-
-        # Check if user has access to workspace
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), user_id)
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
+        access = await require_table_access(db, import_data.table_id, user_id)
 
         # Check if user has edit permission
-        if member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
+        if not access.has_role(EDITOR_ROLES):
             raise PermissionDeniedError("Only owners, admins, and editors can import records")
 
         # Create missing fields if requested
@@ -104,21 +89,22 @@ class ImportService:
         errors = []
         created_records = []
 
-        # Validate and prepare all records first
-        for idx, record_data in enumerate(records_data):
-            try:
-                # Map source fields to target fields
-                mapped_data = self._map_record_data(
-                    record_data,
-                    import_data.field_mapping,
-                )
+        # Map source fields to target fields
+        mapped_rows = [
+            self._map_record_data(record_data, import_data.field_mapping)
+            for record_data in records_data
+        ]
 
-                # Validate record data against fields
-                await self._validate_record_data(
-                    db,
-                    str(import_data.table_id),
-                    mapped_data,
-                )
+        # Validate all rows in one pass (field metadata is loaded once)
+        row_errors = await self._validate_rows(db, str(import_data.table_id), mapped_rows)
+
+        # Prepare all valid records
+        for idx, (record_data, mapped_data) in enumerate(
+            zip(records_data, mapped_rows, strict=True)
+        ):
+            try:
+                if idx in row_errors:
+                    raise ConflictError(row_errors[idx])
 
                 # Create record object (don't commit yet)
                 record = Record(
@@ -558,123 +544,28 @@ class ImportService:
 
         return mapped_data
 
-    async def _get_base(self, db: AsyncSession, base_id: str) -> Base:
-        """Get base by ID.
-
-        Args:
-            db: Database session
-            base_id: Base ID
-
-        Returns:
-            Base
-
-        Raises:
-            NotFoundError: If base not found
-
-        """
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base", base_id)
-        return base
-
-    async def _get_workspace(self, db: AsyncSession, workspace_id: str) -> Workspace:
-        """Get workspace by ID.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-
-        Returns:
-            Workspace
-
-        Raises:
-            NotFoundError: If workspace not found
-
-        """
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace", workspace_id)
-        return workspace
-
-    async def _get_workspace_member(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-            user_id: User ID
-
-        Returns:
-            Workspace member or None if not found
-
-        """
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    async def _validate_record_data(
+    async def _validate_rows(
         self,
         db: AsyncSession,
         table_id: str,
-        data: dict[str, Any],
-    ) -> None:
-        """Validate record data against table fields.
+        rows: list[dict[str, Any]],
+    ) -> dict[int, str]:
+        """Validate mapped rows against table fields and unique constraints.
 
         Args:
             db: Database session
             table_id: Table ID
-            data: Record data (field_id -> value)
+            rows: Mapped record data (field_id -> value)
 
-        Raises:
-            ConflictError: If validation fails
+        Returns:
+            Mapping of row index -> error message, only for invalid rows
 
         """
-        # Get all fields for table
-        fields_query = select(Field).where(
-            Field.table_id == table_id,
-            Field.deleted_at.is_(None),
-        )
-        result = await db.execute(fields_query)
-        fields = result.scalars().all()
-        fields_dict = {str(f.id): f for f in fields}
-
-        # Validate each field in data
-        for field_id, value in data.items():
-            if field_id not in fields_dict:
-                raise ConflictError(f"Field {field_id} does not exist in table")
-
-            field = fields_dict[field_id]
-
-            # Check required fields
-            if field.is_required and value is None:
-                raise ConflictError(f"Field '{field.name}' is required")
-
-            # Validate using field handler if available
-            from pybase.fields import get_field_handler
-
-            handler = get_field_handler(field.field_type)
-            if handler:
-                # Parse field options
-                options = None
-                if field.options:
-                    try:
-                        options = json.loads(field.options)
-                    except (json.JSONDecodeError, TypeError):
-                        options = {}
-
-                # Validate value
-                try:
-                    handler.validate(value, options)
-                except ValueError as e:
-                    raise ConflictError(f"Invalid value for field '{field.name}': {e}")
+        row_errors = await self.validation_service.validate_records_batch(db, table_id, rows)
+        return {
+            idx: "; ".join(error["message"] for error in errors)
+            for idx, errors in row_errors.items()
+        }
 
     async def import_bom(
         self,
@@ -712,24 +603,10 @@ class ImportService:
             ValidationError: If field mapping is invalid
 
         """
-        # Check if table exists
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table", table_id)
-
-        # Check if user has access to workspace
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), user_id)
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
+        access = await require_table_access(db, table_id, user_id)
 
         # Check if user has edit permission
-        if member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
+        if not access.has_role(EDITOR_ROLES):
             raise PermissionDeniedError("Only owners, admins, and editors can import BOM data")
 
         # Create missing fields if requested
@@ -766,20 +643,14 @@ class ImportService:
         for batch_start in range(0, len(filtered_bom_data), batch_size):
             batch = filtered_bom_data[batch_start : batch_start + batch_size]
 
-            for idx, bom_item in enumerate(batch):
-                try:
-                    # Map BOM fields to table fields
-                    mapped_data = self._map_record_data(
-                        bom_item,
-                        field_mapping,
-                    )
+            # Map BOM fields to table fields and validate the batch in one pass
+            mapped_rows = [self._map_record_data(bom_item, field_mapping) for bom_item in batch]
+            row_errors = await self._validate_rows(db, table_id, mapped_rows)
 
-                    # Validate record data against fields
-                    await self._validate_record_data(
-                        db,
-                        table_id,
-                        mapped_data,
-                    )
+            for idx, (bom_item, mapped_data) in enumerate(zip(batch, mapped_rows, strict=True)):
+                try:
+                    if idx in row_errors:
+                        raise ConflictError(row_errors[idx])
 
                     # Create record object
                     record = Record(
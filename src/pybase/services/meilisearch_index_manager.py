@@ -34,6 +34,7 @@ class MeilisearchIndexManager:
         self,
         base_id: str,
         primary_key: str = "id",
+        index_name: Optional[str] = None,
     ) -> bool:
         """
         Create a Meilisearch index for a base.
@@ -41,6 +42,8 @@ class MeilisearchIndexManager:
         Args:
             base_id: Base ID
             primary_key: Primary key for documents (default: "id")
+            index_name: Index to create instead of the base's live index
+                (e.g. its shadow index)
 
         Returns:
             True if index was created or already exists, False on failure
@@ -48,29 +51,30 @@ class MeilisearchIndexManager:
         if not self.client:
             return False
 
-        index_name = self._get_base_index_name(base_id)
+        index_name = index_name or self._get_base_index_name(base_id)
 
         try:
             # Check if index exists
             self.client.get_index(index_name)
             # Index exists, update settings
-            return self._configure_base_index(base_id)
+            return self._configure_base_index(base_id, index_name)
         except MeilisearchApiError as e:
             # Index doesn't exist, create it
             if "index_not_found" in str(e) or e.code == "index_not_found":
                 try:
                     self.client.create_index(index_name, {"primaryKey": primary_key})
-                    return self._configure_base_index(base_id)
+                    return self._configure_base_index(base_id, index_name)
                 except MeilisearchApiError:
                     return False
             return False
 
-    def _configure_base_index(self, base_id: str) -> bool:
+    def _configure_base_index(self, base_id: str, index_name: Optional[str] = None) -> bool:
         """
         Configure index settings for faceted search.
 
         Args:
             base_id: Base ID
+            index_name: Index to configure instead of the base's live index
 
         Returns:
             True if configuration succeeded, False otherwise
@@ -78,7 +82,7 @@ class MeilisearchIndexManager:
         if not self.client:
             return False
 
-        index_name = self._get_base_index_name(base_id)
+        index_name = index_name or self._get_base_index_name(base_id)
 
         try:
             index = self.client.index(index_name)
@@ -155,12 +159,13 @@ class MeilisearchIndexManager:
         except MeilisearchApiError:
             return False
 
-    def delete_base_index(self, base_id: str) -> bool:
+    def delete_base_index(self, base_id: str, index_name: Optional[str] = None) -> bool:
         """
         Delete a Meilisearch index for a base.
 
         Args:
             base_id: Base ID
+            index_name: Index to delete instead of the base's live index
 
         Returns:
             True if index was deleted, False otherwise
@@ -168,7 +173,7 @@ class MeilisearchIndexManager:
         if not self.client:
             return False
 
-        index_name = self._get_base_index_name(base_id)
+        index_name = index_name or self._get_base_index_name(base_id)
 
         try:
             self.client.delete_index(index_name)
@@ -252,30 +257,97 @@ class MeilisearchIndexManager:
             # Process in batches
             for i in range(0, len(records), batch_size):
                 batch = records[i:i + batch_size]
-
-                # Prepare documents
-                documents = []
-                for record in batch:
-                    document = {
-                        "id": record["id"],
-                        "table_id": record["table_id"],
-                        "base_id": base_id,
-                        "table_name": record.get("table_name", ""),
-                        "values": self._prepare_values_for_indexing(
-                            record.get("values", {})
-                        ),
-                        "created_at": record.get("created_at"),
-                        "updated_at": record.get("updated_at"),
-                    }
-                    documents.append(document)
-
-                index.add_documents(documents)
+                index.add_documents([self._build_document(base_id, record) for record in batch])
 
             return True
 
         except MeilisearchApiError:
             return False
 
+    def add_documents(
+        self,
+        base_id: str,
+        records: List[Dict[str, Any]],
+        index_name: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Enqueue a batch of records for indexing without waiting for it.
+
+        Meilisearch indexes documents asynchronously; the returned task UID
+        can be passed to ``wait_for_task`` to learn when the batch is applied.
+
+        Args:
+            base_id: Base ID
+            records: List of record dictionaries (as for ``index_records_batch``)
+            index_name: Index to add to instead of the base's live index
+
+        Returns:
+            Meilisearch task UID, or None on failure
+        """
+        if not self.client or not records:
+            return None
+
+        index_name = index_name or self._get_base_index_name(base_id)
+
+        try:
+            index = self.client.index(index_name)
+            documents = [self._build_document(base_id, record) for record in records]
+            task = index.add_documents(documents)
+            return task.task_uid
+        except MeilisearchApiError:
+            return None
+
+    def wait_for_task(self, task_uid: int, timeout_ms: int = 60000) -> bool:
+        """
+        Wait until a Meilisearch task has been processed.
+
+        Args:
+            task_uid: Task UID returned by Meilisearch
+            timeout_ms: Maximum time to wait in milliseconds
+
+        Returns:
+            True if the task succeeded, False if it failed or timed out
+        """
+        if not self.client:
+            return False
+
+        try:
+            task = self.client.wait_for_task(task_uid, timeout_in_ms=timeout_ms)
+            return task.status == "succeeded"
+        except Exception:
+            return False
+
+    def swap_shadow_index(self, base_id: str) -> bool:
+        """
+        Atomically replace a base's live index with its shadow index.
+
+        After the swap the shadow index name holds the previous documents,
+        which are deleted.
+
+        Args:
+            base_id: Base ID
+
+        Returns:
+            True if the swap succeeded, False otherwise
+        """
+        if not self.client:
+            return False
+
+        live_name = self._get_base_index_name(base_id)
+        shadow_name = self.get_shadow_index_name(base_id)
+
+        try:
+            # Swapping needs both indexes to exist
+            if not self.create_base_index(base_id):
+                return False
+            task = self.client.swap_indexes([{"indexes": [live_name, shadow_name]}])
+            if not self.wait_for_task(task.task_uid):
+                return False
+            self.client.delete_index(shadow_name)
+            return True
+        except MeilisearchApiError:
+            return False
+
     def delete_record(self, base_id: str, record_id: str) -> bool:
         """
         Delete a record from the index.
@@ -299,6 +371,29 @@ class MeilisearchIndexManager:
         except MeilisearchApiError:
             return False
 
+    def delete_records_batch(self, base_id: str, record_ids: List[str]) -> bool:
+        """
+        Delete several records from the index in one request.
+
+        Args:
+            base_id: Base ID
+            record_ids: Record IDs
+
+        Returns:
+            True if deletion succeeded, False otherwise
+        """
+        if not self.client or not record_ids:
+            return False
+
+        index_name = self._get_base_index_name(base_id)
+
+        try:
+            index = self.client.index(index_name)
+            index.delete_documents(record_ids)
+            return True
+        except MeilisearchApiError:
+            return False
+
     def delete_all_records_in_table(self, base_id: str, table_id: str) -> bool:
         """
         Delete all records for a specific table from the index.
@@ -389,6 +484,40 @@ class MeilisearchIndexManager:
         """
         return f"pybase:base:{base_id}"
 
+    def get_shadow_index_name(self, base_id: str) -> str:
+        """
+        Get the name of the index a base is rebuilt into before a swap.
+
+        Args:
+            base_id: Base ID
+
+        Returns:
+            Index name string
+        """
+        return f"{self._get_base_index_name(base_id)}:shadow"
+
+    def _build_document(self, base_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Meilisearch document of a record dictionary.
+
+        Args:
+            base_id: Base ID
+            record: Record dictionary with id, table_id, table_name, values
+                and timestamps
+
+        Returns:
+            Document dictionary
+        """
+        return {
+            "id": record["id"],
+            "table_id": record["table_id"],
+            "base_id": base_id,
+            "table_name": record.get("table_name", ""),
+            "values": self._prepare_values_for_indexing(record.get("values", {})),
+            "created_at": record.get("created_at"),
+            "updated_at": record.get("updated_at"),
+        }
+
     def _prepare_values_for_indexing(self, values: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prepare field values for indexing in Meilisearch.
@@ -1,43 +1,58 @@
 """Record service for business logic."""
 
+import asyncio
 import json
 from datetime import datetime
 from logging import getLogger
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, cast, func, or_, select, text
+from sqlalchemy import event, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import JSONB
 
+from pybase.cache.chart_cache import ChartCache
 from pybase.cache.record_cache import RecordCache
 from pybase.core.exceptions import (
     ConflictError,
     NotFoundError,
-    PermissionDeniedError,
+    ValidationError,
 )
+from pybase.db.estimate import estimate_row_count
 from pybase.models.base import Base
-from pybase.models.chart import Chart
 from pybase.models.field import Field
 from pybase.models.record import Record
 from pybase.models.table import Table
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
-from pybase.realtime import get_connection_manager
+from pybase.models.workspace import WorkspaceMember
+from pybase.realtime import get_realtime_batcher
 from pybase.schemas.record import RecordCreate, RecordUpdate
 from pybase.schemas.realtime import ChartDataChangeEvent, EventType
-from pybase.schemas.view import FilterCondition, FilterOperator
+from pybase.schemas.view import FilterCondition
+from pybase.services.access import EDITOR_ROLES, require_table_access
+from pybase.services.chart import get_table_chart_ids
+from pybase.services.chart_snapshot import RecordChange, get_chart_snapshot_store
+from pybase.services.field_index import get_indexed_fields
+from pybase.services.record_query import RecordQueryCompiler
+from pybase.services.search_index_queue import get_search_index_queue
 from pybase.services.undo_redo import UndoRedoService
 from pybase.services.validation import ValidationService
 
 logger = getLogger(__name__)
 
+# Session.info keys of the cache invalidations waiting for a commit
+_PENDING = "record_cache_invalidations"
+_LISTENING = "record_cache_invalidation_listening"
+
+# Post-commit invalidations in flight, referenced until done
+_tasks: set[asyncio.Task] = set()
+
 
 class RecordService:
     """Service for record operations."""
 
     def __init__(self) -> None:
-        """Initialize record service with cache."""
+        """Initialize record service with caches."""
         self.cache = RecordCache()
+        self.chart_cache = ChartCache()
         self.undo_redo_service = UndoRedoService()
 
     async def trigger_indexing(
@@ -50,8 +65,9 @@ class RecordService:
         """
         Trigger Meilisearch indexing for a record.
 
-        This method triggers background indexing of a record for search.
-        It gracefully handles failures without affecting the main operation.
+        The record is queued on the search index queue, which indexes it in
+        the background (or removes it from the index once soft-deleted), so
+        the request never waits for the search engine.
 
         Args:
             db: Database session
@@ -60,27 +76,38 @@ class RecordService:
             operation: Operation type ("index", "update", "delete")
 
         """
-        try:
-            from pybase.services.search import get_search_service
+        await self.trigger_batch_indexing(db, base_id, [record_id], operation)
 
-            search_service = get_search_service(db)
+    async def trigger_batch_indexing(
+        self,
+        db: AsyncSession,
+        base_id: str,
+        record_ids: list[str],
+        operation: str = "index",
+    ) -> None:
+        """
+        Trigger Meilisearch indexing for several records.
 
-            if operation == "delete":
-                # For delete, we could implement deletion from index in the future
-                # For now, we'll re-index which will handle soft deletes
-                pass
+        Like ``trigger_indexing``, failures are logged and never raised.
 
-            # Trigger indexing asynchronously
-            await search_service.index_record(
-                base_id=base_id,
-                record_id=record_id,
-            )
+        Args:
+            db: Database session
+            base_id: Base ID containing the records
+            record_ids: Record IDs to index
+            operation: Operation type ("index", "update", "delete")
 
-            logger.debug(f"Triggered indexing for record {record_id} (operation: {operation})")
+        """
+        if not record_ids:
+            return
+
+        try:
+            get_search_index_queue().enqueue(base_id, record_ids)
+
+            logger.debug(f"Queued {len(record_ids)} records for indexing (operation: {operation})")
 
         except Exception as e:
             # Log but don't raise - indexing failures shouldn't break CRUD operations
-            logger.warning(f"Failed to trigger indexing for record {record_id}: {e}")
+            logger.warning(f"Failed to queue {len(record_ids)} records for indexing: {e}")
 
     async def create_record(
         self,
@@ -104,20 +131,10 @@ class RecordService:
             ConflictError: If field validation fails
 
         """
-        # Check if table exists
-        table = await db.get(Table, record_data.table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        # Check if user has access to workspace
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
+        access = await require_table_access(db, record_data.table_id, user_id)
 
         # Validate record data against fields
-        await self._validate_record_data(db, str(table.id), record_data.data)
+        await self._validate_record_data(db, access.table_id, record_data.data)
 
         # Create record
         record = Record(
@@ -143,8 +160,10 @@ class RecordService:
             after_data={"data": record_data.data, "row_height": record.row_height},
         )
 
-        # Invalidate cache for this table
-        await self.cache.invalidate_table_cache(str(record_data.table_id))
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(record_data.table_id), [(None, record_data.data)], db
+        )
 
         # Emit chart update events
         await self._emit_chart_update_events(db, str(record_data.table_id), str(user_id))
@@ -152,7 +171,7 @@ class RecordService:
         # Trigger search indexing
         await self.trigger_indexing(
             db=db,
-            base_id=str(base.id),
+            base_id=access.base_id,
             record_id=str(record.id),
             operation="index",
         )
@@ -183,70 +202,68 @@ class RecordService:
             ConflictError: If field validation fails for any record
 
         """
-        # Check if table exists
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        # Check if user has access to workspace (single check for all records)
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
-
-        # Validate all records data against fields
+        access = await require_table_access(db, table_id, user_id)
+
+        # Ensure table_id matches
         for idx, record_data in enumerate(records_data):
-            # Ensure table_id matches
             if str(record_data.table_id) != str(table_id):
                 raise ConflictError(f"Record at index {idx} has different table_id than specified")
 
-            # Validate record data
-            await self._validate_record_data(db, str(table.id), record_data.data)
-
-        # Create all records
-        created_records: list[Record] = []
-        for record_data in records_data:
-            record = Record(
-                table_id=table_id,
-                data=json.dumps(record_data.data),
-                created_by_id=str(user_id),
-                last_modified_by_id=str(user_id),
-                row_height=record_data.row_height if record_data.row_height else 32,
-            )
-            db.add(record)
-            created_records.append(record)
+        # Validate all records data against fields, loading the schema once
+        await self._validate_records_batch(
+            db, access.table_id, [record_data.data for record_data in records_data]
+        )
+
+        # Insert all records in one statement, returning generated columns
+        result = await db.execute(
+            insert(Record).returning(Record, sort_by_parameter_order=True),
+            [
+                {
+                    "table_id": str(table_id),
+                    "data": json.dumps(record_data.data),
+                    "created_by_id": str(user_id),
+                    "last_modified_by_id": str(user_id),
+                    "row_height": record_data.row_height if record_data.row_height else 32,
+                }
+                for record_data in records_data
+            ],
+        )
+        created_records: list[Record] = list(result.scalars().all())
+
+        # Log all create operations for undo/redo with a single insert
+        await self.undo_redo_service.log_operations_bulk(
+            db=db,
+            user_id=str(user_id),
+            operation_type=self.undo_redo_service.OPERATION_CREATE,
+            entity_type=self.undo_redo_service.ENTITY_RECORD,
+            entries=[
+                (
+                    str(record.id),
+                    None,
+                    {"data": record_data.data, "row_height": record.row_height},
+                )
+                for record, record_data in zip(created_records, records_data)
+            ],
+        )
 
         # Commit all records in a single transaction
         await db.commit()
 
-        # Refresh all records to get generated IDs and timestamps
-        for record in created_records:
-            await db.refresh(record)
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(table_id), [(None, record_data.data) for record_data in records_data]
+        )
 
         # Emit chart update events
         await self._emit_chart_update_events(db, str(table_id), str(user_id))
 
-        # Log operation for each record
-        for record in created_records:
-            await self.undo_redo_service.log_operation(
-                db=db,
-                user_id=str(user_id),
-                operation_type=self.undo_redo_service.OPERATION_CREATE,
-                entity_type=self.undo_redo_service.ENTITY_RECORD,
-                entity_id=str(record.id),
-                before_data=None,
-                after_data={"data": json.loads(record.data), "row_height": record.row_height},
-            )
-
-        # Trigger search indexing for all created records
-        for record in created_records:
-            await self.trigger_indexing(
-                db=db,
-                base_id=str(base.id),
-                record_id=str(record.id),
-                operation="index",
-            )
+        # Trigger search indexing for all created records in one batch
+        await self.trigger_batch_indexing(
+            db=db,
+            base_id=access.base_id,
+            record_ids=[str(record.id) for record in created_records],
+            operation="index",
+        )
 
         return created_records
 
@@ -274,21 +291,13 @@ class RecordService:
             ConflictError: If field validation fails for any record or record not in table
 
         """
-        # Check if table exists
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        # Check if user has edit permission in workspace (single check for all records)
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member or member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
-            raise PermissionDeniedError("Only owners, admins, and editors can update records")
+        access = await require_table_access(
+            db,
+            table_id,
+            user_id,
+            roles=EDITOR_ROLES,
+            message="Only owners, admins, and editors can update records",
+        )
 
         # Fetch and validate all records
         updated_records: list[Record] = []
@@ -303,10 +312,6 @@ class RecordService:
             if str(record.table_id) != str(table_id):
                 raise ConflictError(f"Record at index {idx} belongs to a different table")
 
-            # Validate record data against fields if provided
-            if update_data.data:
-                await self._validate_record_data(db, str(table.id), update_data.data)
-
             # Store before data for logging
             before_data_list.append(
                 {
@@ -317,6 +322,20 @@ class RecordService:
 
             updated_records.append(record)
 
+        # Validate record data against fields, ignoring the current values of
+        # records whose data is replaced in uniqueness checks (records only
+        # changing row height keep theirs)
+        await self._validate_records_batch(
+            db,
+            access.table_id,
+            [update_data.data or {} for _, update_data in updates],
+            exclude_record_ids=[
+                str(record.id)
+                for record, (_, update_data) in zip(updated_records, updates, strict=True)
+                if update_data.data is not None
+            ],
+        )
+
         # Update all records
         for record, (record_id, update_data) in zip(updated_records, updates):
             if update_data.data is not None:
@@ -332,6 +351,16 @@ class RecordService:
         for record in updated_records:
             await db.refresh(record)
 
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(table_id),
+            [
+                (before_data["data"], update_data.data)
+                for before_data, (_, update_data) in zip(before_data_list, updates)
+                if update_data.data is not None
+            ],
+        )
+
         # Emit chart update events
         await self._emit_chart_update_events(db, str(table_id), str(user_id))
 
@@ -352,14 +381,13 @@ class RecordService:
                 after_data=after_data,
             )
 
-        # Trigger search indexing for all updated records
-        for record in updated_records:
-            await self.trigger_indexing(
-                db=db,
-                base_id=str(base.id),
-                record_id=str(record.id),
-                operation="update",
-            )
+        # Trigger search indexing for all updated records in one batch
+        await self.trigger_batch_indexing(
+            db=db,
+            base_id=access.base_id,
+            record_ids=[str(record.id) for record in updated_records],
+            operation="update",
+        )
 
         return updated_records
 
@@ -387,21 +415,13 @@ class RecordService:
             ConflictError: If record not in table
 
         """
-        # Check if table exists
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        # Check if user has delete permission in workspace (single check for all records)
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member or member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
-            raise PermissionDeniedError("Only owners, admins, and editors can delete records")
+        access = await require_table_access(
+            db,
+            table_id,
+            user_id,
+            roles=EDITOR_ROLES,
+            message="Only owners, admins, and editors can delete records",
+        )
 
         # Fetch and validate all records
         deleted_records: list[Record] = []
@@ -429,6 +449,15 @@ class RecordService:
         for record in deleted_records:
             await db.refresh(record)
 
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(table_id),
+            [
+                (json.loads(record.data) if record.data else {}, None)
+                for record in deleted_records
+            ],
+        )
+
         # Emit chart update events
         await self._emit_chart_update_events(db, str(table_id), str(user_id))
 
@@ -447,14 +476,13 @@ class RecordService:
                 after_data=None,
             )
 
-        # Trigger search indexing for all deleted records
-        for record in deleted_records:
-            await self.trigger_indexing(
-                db=db,
-                base_id=str(base.id),
-                record_id=str(record.id),
-                operation="delete",
-            )
+        # Trigger search indexing for all deleted records in one batch
+        await self.trigger_batch_indexing(
+            db=db,
+            base_id=access.base_id,
+            record_ids=[str(record.id) for record in deleted_records],
+            operation="delete",
+        )
 
         return deleted_records
 
@@ -483,13 +511,10 @@ class RecordService:
         if not record or record.is_deleted:
             raise NotFoundError("Record not found")
 
-        # Check if user has access to workspace
-        table = await self._get_table(db, str(record.table_id))
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this record")
+        # Check if user has access to the record's table
+        await require_table_access(
+            db, record.table_id, user_id, message="You don't have access to this record"
+        )
 
         return record
 
@@ -574,6 +599,7 @@ class RecordService:
         """
         # Don't use cache when filters are applied as results vary
         use_cache = filters is None
+        cache_versions = None
 
         if use_cache:
             # Try to get from cache first
@@ -608,6 +634,10 @@ class RecordService:
                     "has_more": cached_result.get("has_more", False),
                 }
 
+            # Read before the query, so a write committed meanwhile isn't
+            # cached under the generation that follows it
+            cache_versions = await self.cache.get_versions(table_id_str, user_id)
+
         # Parse cursor if provided
         cursor_record_id = None
         cursor_created_at = None
@@ -633,8 +663,11 @@ class RecordService:
         query = query.where(Record.deleted_at.is_(None))
 
         # Apply additional filters if provided
+        indexed_fields: dict[str, str] = {}
         if filters:
-            query = self._apply_filters_to_query(query, filters)
+            if table_id:
+                indexed_fields = await get_indexed_fields(db, table_id)
+            query = self._apply_filters_to_query(query, filters, indexed_fields)
 
         # Apply cursor filtering for efficient pagination
         # We use both id and created_at for ordering to ensure consistent pagination
@@ -672,14 +705,14 @@ class RecordService:
         }
 
         # Cache the result only if no filters
-        if use_cache:
-            table_id_str = str(table_id) if table_id else None
+        if use_cache and cache_versions is not None:
             await self.cache.set_cached_records(
                 table_id=table_id_str,
                 user_id=user_id,
                 data=result_data,
                 cursor=cursor,
                 page_size=page_size,
+                versions=cache_versions,
             )
 
         return result_data
@@ -716,22 +749,19 @@ class RecordService:
             "row_height": record.row_height,
         }
 
-        # Check if user has edit permission in workspace
-        table = await self._get_table(db, str(record.table_id))
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member or member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
-            raise PermissionDeniedError("Only owners, admins, and editors can update records")
+        # Check if user has access to the record's table
+        access = await require_table_access(
+            db,
+            record.table_id,
+            user_id,
+            roles=EDITOR_ROLES,
+            message="Only owners, admins, and editors can update records",
+        )
 
         # Validate record data against fields if provided
         if record_data.data:
             await self._validate_record_data(
-                db, str(table.id), record_data.data, exclude_record_id=str(record.id)
+                db, access.table_id, record_data.data, exclude_record_id=str(record.id)
             )
 
         # Update fields
@@ -758,8 +788,12 @@ class RecordService:
             after_data=after_data,
         )
 
-        # Invalidate cache for this table
-        await self.cache.invalidate_table_cache(str(record.table_id))
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(record.table_id),
+            [(before_data["data"], after_data["data"])] if record_data.data is not None else [],
+            db,
+        )
 
         # Emit chart update events
         await self._emit_chart_update_events(db, str(record.table_id), str(user_id))
@@ -767,7 +801,7 @@ class RecordService:
         # Trigger search indexing
         await self.trigger_indexing(
             db=db,
-            base_id=str(base.id),
+            base_id=access.base_id,
             record_id=str(record.id),
             operation="update",
         )
@@ -794,17 +828,14 @@ class RecordService:
         """
         record = await self.get_record_by_id(db, record_id, user_id)
 
-        # Check if user has edit permission in workspace
-        table = await self._get_table(db, str(record.table_id))
-        base = await self._get_base(db, str(table.base_id))
-        workspace = await self._get_workspace(db, str(base.workspace_id))
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member or member.role not in [
-            WorkspaceRole.OWNER,
-            WorkspaceRole.ADMIN,
-            WorkspaceRole.EDITOR,
-        ]:
-            raise PermissionDeniedError("Only owners, admins, and editors can delete records")
+        # Check if user has access to the record's table
+        access = await require_table_access(
+            db,
+            record.table_id,
+            user_id,
+            roles=EDITOR_ROLES,
+            message="Only owners, admins, and editors can delete records",
+        )
 
         # Soft delete record with audit trail
 
@@ -827,8 +858,10 @@ class RecordService:
             after_data=None,
         )
 
-        # Invalidate cache for this table
-        await self.cache.invalidate_table_cache(str(record.table_id))
+        # Invalidate record and chart caches for this table
+        await self._invalidate_table_caches(
+            str(record.table_id), [(before_data["data"], None)], db
+        )
 
         # Emit chart update events
         await self._emit_chart_update_events(db, str(record.table_id), str(user_id))
@@ -836,95 +869,11 @@ class RecordService:
         # Trigger search indexing (will handle soft delete)
         await self.trigger_indexing(
             db=db,
-            base_id=str(base.id),
+            base_id=access.base_id,
             record_id=str(record.id),
             operation="delete",
         )
 
-    async def _get_workspace(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-    ) -> Workspace:
-        """Get workspace by ID.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-
-        Returns:
-            Workspace
-
-        """
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace not found")
-        return workspace
-
-    async def _get_workspace_member(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member.
-
-        Args:
-            db: Database session
-            workspace_id: Workspace ID
-            user_id: User ID
-
-        Returns:
-            WorkspaceMember or None
-
-        """
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    async def _get_base(
-        self,
-        db: AsyncSession,
-        base_id: str,
-    ) -> Base:
-        """Get base by ID.
-
-        Args:
-            db: Database session
-            base_id: Base ID
-
-        Returns:
-            Base
-
-        """
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base not found")
-        return base
-
-    async def _get_table(
-        self,
-        db: AsyncSession,
-        table_id: str,
-    ) -> Table:
-        """Get table by ID.
-
-        Args:
-            db: Database session
-            table_id: Table ID
-
-        Returns:
-            Table
-
-        """
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-        return table
-
     async def search_records(
         self,
         db: AsyncSession,
@@ -937,10 +886,11 @@ class RecordService:
     ) -> dict[str, Any]:
         """Search records with full-text search and optional filters.
 
-        Optimized for large datasets using:
-        - PostgreSQL full-text search with tsvector
-        - Efficient JSONB querying with GIN indexes
-        - Cursor-based pagination
+        Uses the generated ``search_vector`` column and the trigram index
+        on record values (see ``RecordQueryCompiler.compile_search``), so
+        neither the page nor the count scans every record of the table.
+        Results are ordered by relevance (``ts_rank``) and paginated with a
+        keyset cursor over (rank, id).
 
         Args:
             db: Database session
@@ -956,86 +906,60 @@ class RecordService:
                 - records: list of Record objects
                 - next_cursor: cursor for next page or None
                 - has_more: boolean indicating if there are more records
-                - total_matches: approximate total matches
+                - total_matches: approximate total matches (planner estimate
+                  unless all matches fit on the first page)
 
-        """
-        # Check user has access
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-
-        base = await self._get_base(db, table.base_id)
-        workspace = await self._get_workspace(db, base.workspace_id)
-        member = await self._get_workspace_member(db, str(workspace.id), str(user_id))
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
-
-        # Build base query with full-text search
-        # Cast data to JSONB for efficient querying
-        query = select(Record).where(Record.table_id == str(table_id))
-        query = query.where(Record.deleted_at.is_(None))
+        Raises:
+            NotFoundError: If table not found
+            PermissionDeniedError: If user doesn't have access
+            ValidationError: If the cursor is malformed
 
-        # Add full-text search using PostgreSQL's to_tsvector
-        # Search for the query in any value within the JSON data
-        search_pattern = f"%{search_query}%"
-        query = query.where(
-            or_(
-                cast(Record.data, JSONB).astext.ilike(search_pattern),
-            )
-        )
+        """
+        await require_table_access(db, table_id, user_id)
 
-        # Apply additional filters if provided
+        indexed_fields: dict[str, str] = {}
         if filters:
-            query = self._apply_filters_to_query(query, filters)
-
-        # Apply cursor for pagination
-        cursor_record_id = None
-        cursor_created_at = None
-
-        if cursor:
-            try:
-                parts = cursor.split(":")
-                if len(parts) == 2:
-                    cursor_record_id = parts[0]
-                    cursor_created_at = parts[1]
-            except (ValueError, AttributeError):
-                pass
-
-        if cursor_record_id and cursor_created_at:
-            query = query.where(
-                (Record.created_at > cursor_created_at)
-                | ((Record.created_at == cursor_created_at) & (Record.id > cursor_record_id))
-            )
-
-        # Order by created_at and id for consistent pagination
-        query = query.order_by(Record.created_at, Record.id)
-
-        # Get approximate count (faster than exact count for large datasets)
-        count_query = select(func.count()).select_from(Record)
-        count_query = count_query.where(Record.table_id == str(table_id))
-        count_query = count_query.where(Record.deleted_at.is_(None))
-        count_query = count_query.where(cast(Record.data, JSONB).astext.ilike(search_pattern))
+            indexed_fields = await get_indexed_fields(db, table_id)
+        compiler = RecordQueryCompiler(indexed_fields=indexed_fields)
+
+        conditions = [
+            Record.table_id == str(table_id),
+            Record.deleted_at.is_(None),
+            compiler.compile_search(search_query),
+        ]
         if filters:
-            count_query = self._apply_filters_to_query(count_query, filters)
+            filter_clause = compiler.compile_filters(filters)
+            if filter_clause is not None:
+                conditions.append(filter_clause)
 
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+        rank = compiler.search_rank(search_query)
+        query = select(Record, rank).where(*conditions)
+        if cursor:
+            query = query.where(compiler.search_keyset_predicate(search_query, cursor))
 
         # Fetch one extra record to determine if there are more results
-        query = query.limit(page_size + 1)
-        result = await db.execute(query)
-        records = list(result.scalars().all())
+        query = query.order_by(*compiler.compile_search_order_by(search_query))
+        result = await db.execute(query.limit(page_size + 1))
+        rows = result.all()
 
         # Determine if there are more records
-        has_more = len(records) > page_size
+        has_more = len(rows) > page_size
         if has_more:
-            records = records[:page_size]
+            rows = rows[:page_size]
+        records = [record for record, _ in rows]
 
         # Generate next cursor
         next_cursor = None
-        if has_more and records:
-            last_record = records[-1]
-            next_cursor = f"{last_record.id}:{last_record.created_at.isoformat()}"
+        if has_more and rows:
+            last_record, last_rank = rows[-1]
+            next_cursor = compiler.encode_search_cursor(last_rank, last_record)
+
+        # Exact when everything fit on the first page; otherwise ask the
+        # planner instead of counting every match
+        if not cursor and not has_more:
+            total = len(records)
+        else:
+            total = await estimate_row_count(db, select(Record.id).where(*conditions))
 
         return {
             "records": records,
@@ -1048,6 +972,7 @@ class RecordService:
         self,
         query: Any,
         filters: list[FilterCondition],
+        indexed_fields: Optional[dict[str, str]] = None,
     ) -> Any:
         """Apply filter conditions to a SQLAlchemy query.
 
@@ -1057,112 +982,16 @@ class RecordService:
         Args:
             query: SQLAlchemy query
             filters: List of filter conditions
+            indexed_fields: Indexed field ID -> field type, from ``get_indexed_fields``
 
         Returns:
             Query with filters applied
 
         """
-        for filter_cond in filters:
-            field_id_str = str(filter_cond.field_id)
-            jsonb_path = f"->{field_id_str}"
-
-            if filter_cond.operator == FilterOperator.EQUALS:
-                query = query.where(text(f"cast(data as jsonb){jsonb_path} = :value")).params(
-                    value=json.dumps(filter_cond.value)
-                )
-
-            elif filter_cond.operator == FilterOperator.NOT_EQUALS:
-                query = query.where(
-                    or_(
-                        text(f"cast(data as jsonb){jsonb_path} IS NULL"),
-                        text(f"cast(data as jsonb){jsonb_path} != :value"),
-                    )
-                ).params(value=json.dumps(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.CONTAINS:
-                # For text fields - case-insensitive contains
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str} ILIKE :value")
-                ).params(value=f"%{filter_cond.value}%")
-
-            elif filter_cond.operator == FilterOperator.NOT_CONTAINS:
-                query = query.where(
-                    or_(
-                        text(f"cast(data as jsonb)->>{field_id_str} IS NULL"),
-                        text(f"cast(data as jsonb)->>{field_id_str} NOT ILIKE :value"),
-                    )
-                ).params(value=f"%{filter_cond.value}%")
-
-            elif filter_cond.operator == FilterOperator.IS_EMPTY:
-                query = query.where(
-                    or_(
-                        text(f"cast(data as jsonb)->>{field_id_str} IS NULL"),
-                        text(f"cast(data as jsonb)->>{field_id_str} = ''"),
-                    )
-                )
-
-            elif filter_cond.operator == FilterOperator.IS_NOT_EMPTY:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str} IS NOT NULL")
-                ).where(text(f"cast(data as jsonb)->>{field_id_str} != ''"))
-
-            elif filter_cond.operator == FilterOperator.GREATER_THAN:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::float > :value")
-                ).params(value=float(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.LESS_THAN:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::float < :value")
-                ).params(value=float(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.GREATER_THAN_OR_EQUAL:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::float >= :value")
-                ).params(value=float(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.LESS_THAN_OR_EQUAL:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::float <= :value")
-                ).params(value=float(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.IN:
-                # Check if value is in the provided list
-                values_list = json.dumps(filter_cond.value)
-                query = query.where(text(f"cast(data as jsonb)->>{field_id_str} IN :value")).params(
-                    value=tuple(filter_cond.value)
-                )
-
-            elif filter_cond.operator == FilterOperator.NOT_IN:
-                query = query.where(
-                    or_(
-                        text(f"cast(data as jsonb)->>{field_id_str} IS NULL"),
-                        text(f"cast(data as jsonb)->>{field_id_str} NOT IN :value"),
-                    )
-                ).params(value=tuple(filter_cond.value))
-
-            elif filter_cond.operator == FilterOperator.STARTS_WITH:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str} ILIKE :value")
-                ).params(value=f"{filter_cond.value}%")
-
-            elif filter_cond.operator == FilterOperator.ENDS_WITH:
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str} ILIKE :value")
-                ).params(value=f"%{filter_cond.value}")
-
-            elif filter_cond.operator == FilterOperator.IS_BEFORE:
-                # For date fields
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::timestamp < :value")
-                ).params(value=filter_cond.value)
-
-            elif filter_cond.operator == FilterOperator.IS_AFTER:
-                # For date fields
-                query = query.where(
-                    text(f"cast(data as jsonb)->>{field_id_str}::timestamp > :value")
-                ).params(value=filter_cond.value)
-
+        compiler = RecordQueryCompiler(case_insensitive=True, indexed_fields=indexed_fields)
+        clause = compiler.compile_filters(filters)
+        if clause is not None:
+            query = query.where(clause)
         return query
 
     async def _validate_record_data(
@@ -1171,6 +1000,7 @@ class RecordService:
         table_id: str,
         data: dict[str, Any],
         exclude_record_id: Optional[str] = None,
+        check_unique: bool = True,
     ) -> None:
         """Validate record data against table fields.
 
@@ -1179,6 +1009,7 @@ class RecordService:
             table_id: Table ID
             data: Record data (field_id -> value)
             exclude_record_id: Optional record ID to exclude from uniqueness checks
+            check_unique: Check unique constraints (batch callers check them separately)
 
         Raises:
             ConflictError: If validation fails
@@ -1186,7 +1017,101 @@ class RecordService:
 
         """
         validation_service = ValidationService()
-        await validation_service.validate_record_data(db, table_id, data, exclude_record_id)
+        await validation_service.validate_record_data(
+            db, table_id, data, exclude_record_id, check_unique=check_unique
+        )
+
+    async def _validate_records_batch(
+        self,
+        db: AsyncSession,
+        table_id: str,
+        rows: list[dict[str, Any]],
+        exclude_record_ids: Optional[list[str]] = None,
+    ) -> None:
+        """Validate a batch of record data against table fields.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+            rows: Record data dicts (field_id -> value)
+            exclude_record_ids: Record IDs to exclude from uniqueness checks
+
+        Raises:
+            ValidationError: If any row fails field validation (errors carry the row index)
+            ConflictError: If any row violates a unique constraint
+
+        """
+        validation_service = ValidationService()
+        row_errors = await validation_service.validate_records_batch(
+            db, table_id, rows, exclude_record_ids, check_unique=False
+        )
+        if row_errors:
+            raise ValidationError(
+                message=f"Validation failed for {len(row_errors)} record(s)",
+                errors=[
+                    {"index": idx, **error}
+                    for idx, errors in row_errors.items()
+                    for error in errors
+                ],
+            )
+
+        await validation_service.validate_unique_batch(db, table_id, rows, exclude_record_ids)
+
+    async def _invalidate_table_caches(
+        self,
+        table_id: str,
+        changes: Optional[list[RecordChange]] = None,
+        db: Optional[AsyncSession] = None,
+    ) -> None:
+        """Bump the cache generations of a table after its records change.
+
+        The record changes are applied to the table's chart snapshots, so
+        chart reads stay O(groups) without a full recompute.
+
+        Args:
+            table_id: Table ID whose records changed
+            changes: (data before, data after) of each changed record,
+                None for a created or deleted record
+            db: Session holding the uncommitted changes; if given, the caches
+                are invalidated once its transaction commits
+
+        """
+        if db is not None:
+            self._invalidate_after_commit(db, table_id, changes or [])
+            return
+        await self.cache.invalidate_table_cache(table_id)
+        chart_version = await self.chart_cache.invalidate_table_cache(table_id)
+        get_chart_snapshot_store().apply_record_changes(table_id, chart_version, changes or [])
+
+    def _invalidate_after_commit(
+        self, db: AsyncSession, table_id: str, changes: list[RecordChange]
+    ) -> None:
+        """Invalidate a table's caches once the session commits.
+
+        Invalidating earlier would let a concurrent read cache the
+        pre-commit rows under the new generation, and apply changes to the
+        chart snapshots that a rollback would discard.
+        """
+        if not db.info.get(_LISTENING):
+            event.listen(db.sync_session, "after_commit", self._after_commit)
+            event.listen(db.sync_session, "after_rollback", self._after_rollback)
+            db.info[_LISTENING] = True
+        db.info.setdefault(_PENDING, []).append((table_id, changes))
+
+    def _after_commit(self, session: Any) -> None:
+        # One generation bump per table, carrying all of its changes
+        by_table: dict[str, list[RecordChange]] = {}
+        for table_id, changes in session.info.pop(_PENDING, ()):
+            by_table.setdefault(table_id, []).extend(changes)
+
+        loop = asyncio.get_running_loop()
+        for table_id, changes in by_table.items():
+            task = loop.create_task(self._invalidate_table_caches(table_id, changes))
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+
+    def _after_rollback(self, session: Any) -> None:
+        session.info.pop(_PENDING, None)
 
     async def _emit_chart_update_events(
         self,
@@ -1203,34 +1128,19 @@ class RecordService:
 
         """
         try:
-            manager = get_connection_manager()
-
-            # Find all charts associated with this table
-            query = select(Chart).where(
-                Chart.table_id == table_id,
-                Chart.deleted_at.is_(None),
-            )
-            result = await db.execute(query)
-
-            # Get chart IDs
-            chart_ids = []
-            charts = result.scalars().all()
-            chart_ids = [str(chart.id) for chart in charts]
-
+            chart_ids = await get_table_chart_ids(db, table_id)
             if not chart_ids:
                 return
 
-            # Broadcast chart data change event to table channel
-            event = ChartDataChangeEvent(
-                table_id=table_id,
-                chart_ids=chart_ids,
-                changed_by=user_id,
-            )
-
-            # Broadcast to table channel
-            await manager.broadcast_to_channel(
+            # Queued on the table channel; events for the same table within
+            # the batch window are merged into one
+            await get_realtime_batcher().emit(
                 f"table:{table_id}",
-                event,
+                ChartDataChangeEvent(
+                    table_id=table_id,
+                    chart_ids=chart_ids,
+                    changed_by=user_id,
+                ),
             )
 
         except Exception as e:
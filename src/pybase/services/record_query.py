@@ -0,0 +1,750 @@
+"""
+SQL compilation of view filters, sorts and search for record data.
+
+Translates the filter/sort structures stored on views (and the
+``FilterCondition``/``SortRule`` request schemas) into SQLAlchemy
+expressions over the JSONB record payload, so that filtering, ordering
+and pagination run inside PostgreSQL and only the requested page of
+records is materialized.
+"""
+
+import base64
+import json
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, NamedTuple
+
+from sqlalchemy import (
+    Boolean,
+    Float,
+    Numeric,
+    Text,
+    and_,
+    case,
+    cast,
+    false,
+    func,
+    literal,
+    or_,
+    true,
+)
+from sqlalchemy.dialects.postgresql import JSONB, REGCONFIG
+from sqlalchemy.sql.elements import ColumnElement
+
+from pybase.core.exceptions import ValidationError
+from pybase.models.record import SEARCH_TEXT_CONFIG, Record
+
+
+# Field types whose values can back a typed btree expression index
+NUMERIC_INDEX_FIELD_TYPES = frozenset(
+    {"number", "currency", "percent", "rating", "duration", "autonumber"}
+)
+BOOLEAN_INDEX_FIELD_TYPES = frozenset({"checkbox"})
+TEXT_INDEX_FIELD_TYPES = frozenset(
+    {"text", "single_select", "email", "url", "phone", "date", "datetime", "barcode"}
+)
+INDEXABLE_FIELD_TYPES = NUMERIC_INDEX_FIELD_TYPES | BOOLEAN_INDEX_FIELD_TYPES | TEXT_INDEX_FIELD_TYPES
+
+
+def _inline(value: str) -> ColumnElement[Any]:
+    """Render a constant inline so expressions can match expression indexes."""
+    return literal(value, Text, literal_execute=True)
+
+
+def typed_field_expression(
+    data: ColumnElement[Any],
+    field_id: str,
+    field_type: str,
+) -> ColumnElement[Any]:
+    """Build the typed scalar expression used for an indexed field.
+
+    The same expression is used for the expression index DDL and for
+    filters/sorts, so PostgreSQL can match queries to the index. Values
+    of the wrong JSON type (and empty strings) map to NULL.
+
+    Args:
+        data: JSONB record payload column
+        field_id: Field ID (key in the record payload)
+        field_type: Field type value
+
+    Returns:
+        SQL expression of type numeric, boolean or text
+
+    Raises:
+        ValueError: If the field type cannot be indexed
+
+    """
+    field_value = data.op("->", return_type=JSONB)(_inline(str(field_id)))
+    field_text = data.op("->>", return_type=Text)(_inline(str(field_id)))
+
+    if field_type in NUMERIC_INDEX_FIELD_TYPES:
+        return case(
+            (func.jsonb_typeof(field_value) == _inline("number"), cast(field_text, Numeric)),
+        )
+    if field_type in BOOLEAN_INDEX_FIELD_TYPES:
+        return case(
+            (func.jsonb_typeof(field_value) == _inline("boolean"), cast(field_text, Boolean)),
+        )
+    if field_type in TEXT_INDEX_FIELD_TYPES:
+        return func.nullif(field_text, _inline(""))
+    raise ValueError(f"Field type '{field_type}' cannot be indexed")
+
+
+def unique_key_expression(
+    data: ColumnElement[Any],
+    field_id: str,
+    case_sensitive: bool = True,
+) -> ColumnElement[Any]:
+    """Build the text key compared by unique constraints.
+
+    ``data ->> field_id``, lower-cased for case-insensitive constraints.
+    ``ValidationService`` computes the same key in Python, and the unique
+    lookup index is built on this expression.
+
+    Args:
+        data: JSONB record payload column
+        field_id: Field ID (key in the record payload)
+        case_sensitive: Whether the constraint is case sensitive
+
+    Returns:
+        Text SQL expression
+
+    """
+    field_text = data.op("->>", return_type=Text)(_inline(str(field_id)))
+    return field_text if case_sensitive else func.lower(field_text)
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the raw value of an enum member (or the value unchanged)."""
+    return getattr(value, "value", value)
+
+
+def normalize_filters(filters: Sequence[Any] | None) -> list[dict[str, Any]]:
+    """Normalize filter conditions to plain dicts.
+
+    Accepts the JSON dicts stored on ``View.filters`` as well as
+    ``FilterCondition`` models.
+
+    Args:
+        filters: Filter conditions (dicts or pydantic models)
+
+    Returns:
+        List of dicts with ``field_id``, ``operator``, ``value`` and ``conjunction``
+
+    """
+    normalized = []
+    for filter_cond in filters or []:
+        if hasattr(filter_cond, "model_dump"):
+            filter_cond = filter_cond.model_dump()
+        normalized.append(
+            {
+                "field_id": str(filter_cond.get("field_id", "")),
+                "operator": _enum_value(filter_cond.get("operator", "")),
+                "value": filter_cond.get("value"),
+                "conjunction": _enum_value(filter_cond.get("conjunction") or "and"),
+            }
+        )
+    return normalized
+
+
+def normalize_sorts(sorts: Sequence[Any] | None) -> list[dict[str, Any]]:
+    """Normalize sort rules to plain dicts.
+
+    Args:
+        sorts: Sort rules (dicts or ``SortRule`` models)
+
+    Returns:
+        List of dicts with ``field_id`` and ``direction``
+
+    """
+    normalized = []
+    for sort_rule in sorts or []:
+        if hasattr(sort_rule, "model_dump"):
+            sort_rule = sort_rule.model_dump()
+        normalized.append(
+            {
+                "field_id": str(sort_rule.get("field_id", "")),
+                "direction": _enum_value(sort_rule.get("direction") or "asc"),
+            }
+        )
+    return normalized
+
+
+class SortKey(NamedTuple):
+    """A single ORDER BY key used for sorting and keyset pagination."""
+
+    expression: ColumnElement[Any]
+    descending: bool
+    nullable: bool
+    # How to derive the key value from a record: "blank", "json", the
+    # indexed field type category ("numeric", "boolean", "text"),
+    # "created_at", "id" or "rank" (search relevance)
+    kind: str
+    field_id: str | None = None
+
+
+class RecordQueryCompiler:
+    """
+    Compile record filters, sorts and search into SQL expressions.
+
+    AND filter conditions must all match and, when OR conditions are
+    present, at least one of them must match. Empty values (missing, null
+    or ``""``) always sort last.
+
+    Scalar equality compiles to JSONB containment (``data @> {...}``) so the
+    GIN index on ``records.data`` applies. Fields marked as indexed compile
+    comparisons and sorts to the typed expression backing their btree
+    expression index.
+    """
+
+    def __init__(
+        self,
+        case_insensitive: bool = False,
+        indexed_fields: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize compiler.
+
+        Args:
+            case_insensitive: Use ILIKE instead of LIKE for text matching operators
+            indexed_fields: Mapping of indexed field ID -> field type
+
+        """
+        self.case_insensitive = case_insensitive
+        self.indexed_fields = {
+            str(field_id): field_type
+            for field_id, field_type in (indexed_fields or {}).items()
+            if field_type in INDEXABLE_FIELD_TYPES
+        }
+
+    # ==========================================================================
+    # Value Expressions
+    # ==========================================================================
+
+    @property
+    def data(self) -> ColumnElement[Any]:
+        """Record payload (JSONB column)."""
+        return Record.data  # type: ignore[return-value]
+
+    def field_value(self, field_id: str) -> ColumnElement[Any]:
+        """JSONB value of a field (``data -> field_id``)."""
+        return self.data.op("->", return_type=JSONB)(_inline(str(field_id)))
+
+    def field_text(self, field_id: str) -> ColumnElement[Any]:
+        """Text value of a field (``data ->> field_id``)."""
+        return self.data.op("->>", return_type=Text)(_inline(str(field_id)))
+
+    def typed_value(self, field_id: str) -> ColumnElement[Any] | None:
+        """Typed index expression for a field, or None if it isn't indexed."""
+        field_type = self.indexed_fields.get(str(field_id))
+        if field_type is None:
+            return None
+        return typed_field_expression(self.data, str(field_id), field_type)
+
+    def _index_category(self, field_id: str) -> str | None:
+        """Return "numeric", "boolean" or "text" for indexed fields."""
+        field_type = self.indexed_fields.get(str(field_id))
+        if field_type in NUMERIC_INDEX_FIELD_TYPES:
+            return "numeric"
+        if field_type in BOOLEAN_INDEX_FIELD_TYPES:
+            return "boolean"
+        if field_type in TEXT_INDEX_FIELD_TYPES:
+            return "text"
+        return None
+
+    def contains_value(self, field_id: str, value: Any) -> ColumnElement[bool]:
+        """GIN-indexable equality for scalar values (``data @> {field_id: value}``)."""
+        return self.data.bool_op("@>")(self.jsonb_literal({str(field_id): value}))
+
+    @staticmethod
+    def jsonb_literal(value: Any) -> ColumnElement[Any]:
+        """Bind a Python value as a JSONB literal."""
+        return cast(literal(json.dumps(value, default=str)), JSONB)
+
+    # ==========================================================================
+    # Filters
+    # ==========================================================================
+
+    def compile_filters(self, filters: Sequence[Any] | None) -> ColumnElement[bool] | None:
+        """Compile a list of filter conditions into a single WHERE clause.
+
+        Args:
+            filters: Filter conditions (dicts or ``FilterCondition`` models)
+
+        Returns:
+            Boolean SQL expression, or None if there are no filters
+
+        """
+        normalized = normalize_filters(filters)
+        if not normalized:
+            return None
+
+        and_conditions = []
+        or_conditions = []
+        for filter_cond in normalized:
+            condition = self.compile_condition(
+                filter_cond["field_id"],
+                filter_cond["operator"],
+                filter_cond["value"],
+            )
+            if filter_cond["conjunction"] == "or":
+                or_conditions.append(condition)
+            else:
+                and_conditions.append(condition)
+
+        clauses = list(and_conditions)
+        if or_conditions:
+            clauses.append(or_(*or_conditions))
+        return and_(*clauses)
+
+    def compile_condition(
+        self,
+        field_id: str,
+        operator: str,
+        value: Any,
+    ) -> ColumnElement[bool]:
+        """Compile a single filter condition.
+
+        Args:
+            field_id: Field ID (key in the record payload)
+            operator: Filter operator (``FilterOperator`` value)
+            value: Value to compare against
+
+        Returns:
+            Boolean SQL expression
+
+        """
+        operator = _enum_value(operator)
+        field_value = self.field_value(field_id)
+        field_text = self.field_text(field_id)
+        is_blank = self._is_blank(field_value)
+
+        if operator == "equals":
+            if value is None:
+                return self._is_null(field_value)
+            return self._equals(field_id, value)
+
+        if operator == "not_equals":
+            if value is None:
+                return ~self._is_null(field_value)
+            return field_value.is_distinct_from(self.jsonb_literal(value))
+
+        if operator == "contains":
+            return and_(~is_blank, self._like(field_text, "contains", value))
+
+        if operator == "not_contains":
+            return or_(is_blank, ~self._like(field_text, "contains", value))
+
+        if operator == "starts_with":
+            return and_(~is_blank, self._like(field_text, "startswith", value))
+
+        if operator == "ends_with":
+            return and_(~is_blank, self._like(field_text, "endswith", value))
+
+        if operator == "is_empty":
+            return or_(is_blank, field_value == cast(literal("[]"), JSONB))
+
+        if operator == "is_not_empty":
+            return and_(~is_blank, field_value != cast(literal("[]"), JSONB))
+
+        if operator in ("gt", "lt", "gte", "lte"):
+            return self._compare(field_id, operator, value)
+
+        if operator == "between":
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                return true()
+            return and_(
+                self._compare(field_id, "gte", value[0]),
+                self._compare(field_id, "lte", value[1]),
+            )
+
+        if operator == "in":
+            if not value:
+                return false()
+            values = value if isinstance(value, (list, tuple)) else [value]
+            return or_(*[self._equals(field_id, v) for v in values])
+
+        if operator == "not_in":
+            if not value:
+                return true()
+            values = value if isinstance(value, (list, tuple)) else [value]
+            return or_(
+                field_value.is_(None),
+                field_value.not_in([self.jsonb_literal(v) for v in values]),
+            )
+
+        if operator in ("is_before", "is_after"):
+            if value is None:
+                return false()
+            if self._index_category(field_id) == "text":
+                typed = self.typed_value(field_id)
+                return typed < str(value) if operator == "is_before" else typed > str(value)
+            comparison = field_text < str(value) if operator == "is_before" else field_text > str(value)
+            return and_(~is_blank, comparison)
+
+        # Unsupported operator - matches everything, like the in-memory evaluator
+        return true()
+
+    def _equals(self, field_id: str, value: Any) -> ColumnElement[bool]:
+        """Equality against a non-null value, using an index where possible."""
+        category = self._index_category(field_id)
+        if category == "numeric" and _is_number(value):
+            return self.typed_value(field_id) == value
+        if category == "text" and isinstance(value, str) and value:
+            return self.typed_value(field_id) == value
+        if isinstance(value, (str, int, float, bool)):
+            return self.contains_value(field_id, value)
+        return self.field_value(field_id) == self.jsonb_literal(value)
+
+    def _is_null(self, field_value: ColumnElement[Any]) -> ColumnElement[bool]:
+        """Missing key or JSON null."""
+        return or_(field_value.is_(None), field_value == cast(literal("null"), JSONB))
+
+    def _is_blank(self, field_value: ColumnElement[Any]) -> ColumnElement[bool]:
+        """Missing key, JSON null or empty string."""
+        return or_(
+            field_value.is_(None),
+            field_value.in_([cast(literal("null"), JSONB), cast(literal('""'), JSONB)]),
+        )
+
+    def _like(
+        self,
+        field_text: ColumnElement[Any],
+        method: str,
+        value: Any,
+    ) -> ColumnElement[bool]:
+        """Build an escaped (I)LIKE pattern match."""
+        if self.case_insensitive:
+            method = f"i{method}"
+        return getattr(field_text, method)(str(value), autoescape=True)
+
+    def _compare(self, field_id: str, operator: str, value: Any) -> ColumnElement[bool]:
+        """Compare a field against a value of the same JSON type.
+
+        Values of a different JSON type never match, mirroring the
+        in-memory evaluator which cannot order mismatched Python types.
+        """
+        if value is None:
+            return false()
+
+        typed = self.typed_value(field_id)
+        category = self._index_category(field_id)
+        typed_target: Any = None
+        if category == "numeric":
+            typed_target = _to_decimal(value)
+        elif category == "text" and isinstance(value, str):
+            typed_target = value
+        if typed is not None and typed_target is not None:
+            return {
+                "gt": typed > typed_target,
+                "lt": typed < typed_target,
+                "gte": typed >= typed_target,
+                "lte": typed <= typed_target,
+            }[operator]
+
+        candidates = [value]
+        if isinstance(value, str):
+            # Numeric strings from query params also match number fields
+            try:
+                candidates.append(float(value))
+            except ValueError:
+                pass
+
+        field_value = self.field_value(field_id)
+        clauses = []
+        for candidate in candidates:
+            target = self.jsonb_literal(candidate)
+            comparison = {
+                "gt": field_value > target,
+                "lt": field_value < target,
+                "gte": field_value >= target,
+                "lte": field_value <= target,
+            }[operator]
+            clauses.append(
+                and_(func.jsonb_typeof(field_value) == func.jsonb_typeof(target), comparison)
+            )
+        return or_(*clauses)
+
+    # ==========================================================================
+    # Search
+    # ==========================================================================
+
+    def compile_search(self, search: str) -> ColumnElement[bool]:
+        """Match records whose field values contain the search text.
+
+        A record matches if its ``search_vector`` matches the words of the
+        query (``websearch_to_tsquery`` syntax) or if the concatenated
+        field values contain the text as a substring. Both conditions are
+        backed by GIN indexes (tsvector and trigram). Only values are
+        searched, so field IDs in the JSON keys never produce false
+        positives.
+
+        Args:
+            search: Search text (case-insensitive)
+
+        Returns:
+            Boolean SQL expression
+
+        """
+        return or_(
+            Record.search_vector.bool_op("@@")(self.search_query(search)),
+            self.search_text.icontains(search, autoescape=True),
+        )
+
+    @property
+    def search_text(self) -> ColumnElement[Any]:
+        """Concatenated field values (the trigram index expression)."""
+        return func.record_search_text(self.data, type_=Text)
+
+    @staticmethod
+    def search_query(search: str) -> ColumnElement[Any]:
+        """Parse search text into a tsquery (``websearch_to_tsquery``)."""
+        return func.websearch_to_tsquery(cast(_inline(SEARCH_TEXT_CONFIG), REGCONFIG), search)
+
+    def search_rank(self, search: str) -> ColumnElement[float]:
+        """Relevance of a record for the search text (``ts_rank``).
+
+        Records matching only as a substring rank 0.
+        """
+        return func.ts_rank(Record.search_vector, self.search_query(search), type_=Float)
+
+    def search_sort_keys(self, search: str) -> list[SortKey]:
+        """Sort keys of ranked search results: rank descending, then ID."""
+        return [
+            SortKey(self.search_rank(search), True, False, "rank"),
+            SortKey(Record.id, False, False, "id"),
+        ]
+
+    def compile_search_order_by(self, search: str) -> list[ColumnElement[Any]]:
+        """Compile the ORDER BY of ranked search results."""
+        return [
+            key.expression.desc() if key.descending else key.expression.asc()
+            for key in self.search_sort_keys(search)
+        ]
+
+    @staticmethod
+    def encode_search_cursor(rank: float, record: Record) -> str:
+        """Encode the position of a ranked search result as a keyset cursor.
+
+        Args:
+            rank: Rank of the last result of the page
+            record: Last record of the page
+
+        Returns:
+            URL-safe cursor string
+
+        """
+        payload = json.dumps([float(rank), str(record.id)]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def search_keyset_predicate(self, search: str, cursor: str) -> ColumnElement[bool]:
+        """Build the WHERE clause selecting search results after a cursor.
+
+        Args:
+            search: Search text the cursor was produced with
+            cursor: Cursor from ``encode_search_cursor``
+
+        Returns:
+            Boolean SQL expression
+
+        Raises:
+            ValidationError: If the cursor is malformed
+
+        """
+        return _keyset_predicate(self.search_sort_keys(search), cursor)
+
+    # ==========================================================================
+    # Sorting and Keyset Pagination
+    # ==========================================================================
+
+    def sort_keys(self, sorts: Sequence[Any] | None) -> list[SortKey]:
+        """Build the ordered list of sort keys.
+
+        Each sort rule on a non-indexed field yields a "blank" flag (so
+        empty values sort last in both directions) followed by the JSONB
+        value. Indexed fields sort on their typed expression with NULLS
+        LAST. ``created_at`` and ``id`` are appended as tie-breakers to make
+        the order total.
+
+        Args:
+            sorts: Sort rules (dicts or ``SortRule`` models)
+
+        Returns:
+            List of sort keys
+
+        """
+        keys: list[SortKey] = []
+        for sort_rule in normalize_sorts(sorts):
+            field_id = sort_rule["field_id"]
+            descending = sort_rule["direction"] == "desc"
+            category = self._index_category(field_id)
+            if category is not None:
+                keys.append(
+                    SortKey(self.typed_value(field_id), descending, True, category, field_id)
+                )
+                continue
+
+            field_value = self.field_value(field_id)
+            keys.append(SortKey(self._is_blank(field_value), False, False, "blank", field_id))
+            keys.append(
+                SortKey(
+                    func.coalesce(field_value, cast(literal("null"), JSONB)),
+                    descending,
+                    False,
+                    "json",
+                    field_id,
+                )
+            )
+        keys.append(SortKey(Record.created_at, False, False, "created_at"))
+        keys.append(SortKey(Record.id, False, False, "id"))
+        return keys
+
+    def compile_order_by(self, sorts: Sequence[Any] | None) -> list[ColumnElement[Any]]:
+        """Compile sort rules into ORDER BY expressions.
+
+        Args:
+            sorts: Sort rules (dicts or ``SortRule`` models)
+
+        Returns:
+            List of ORDER BY expressions
+
+        """
+        order_by = []
+        for key in self.sort_keys(sorts):
+            expr = key.expression.desc() if key.descending else key.expression.asc()
+            order_by.append(expr.nulls_last() if key.nullable else expr)
+        return order_by
+
+    def encode_cursor(self, sorts: Sequence[Any] | None, record: Record) -> str:
+        """Encode the sort-key values of a record as an opaque keyset cursor.
+
+        Args:
+            sorts: Sort rules the page was ordered by
+            record: Last record of the page
+
+        Returns:
+            URL-safe cursor string
+
+        """
+        data = record.get_all_values()
+        values: list[Any] = []
+        for key in self.sort_keys(sorts):
+            if key.kind == "created_at":
+                values.append(record.created_at.isoformat() if record.created_at else None)
+            elif key.kind == "id":
+                values.append(str(record.id))
+            else:
+                values.append(_key_value(key.kind, data.get(key.field_id)))
+        payload = json.dumps(values, default=str).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    def keyset_predicate(self, sorts: Sequence[Any] | None, cursor: str) -> ColumnElement[bool]:
+        """Build the WHERE clause selecting rows after a keyset cursor.
+
+        Args:
+            sorts: Sort rules the cursor was produced with
+            cursor: Cursor from ``encode_cursor``
+
+        Returns:
+            Boolean SQL expression
+
+        Raises:
+            ValidationError: If the cursor is malformed or doesn't match the sorts
+
+        """
+        return _keyset_predicate(self.sort_keys(sorts), cursor)
+
+
+def _keyset_predicate(keys: Sequence[SortKey], cursor: str) -> ColumnElement[bool]:
+    """Build the "row comes after cursor" clause for a list of sort keys."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValidationError("Invalid cursor")
+
+    bound: list[Any] = []
+    for key, value in zip(keys, values, strict=True):
+        try:
+            bound.append(_bind_key_value(key.kind, value))
+        except (TypeError, ValueError, InvalidOperation) as e:
+            raise ValidationError("Invalid cursor") from e
+
+    # Lexicographic "row comes after cursor" with per-key direction
+    clauses = []
+    for idx, key in enumerate(keys):
+        prefix = [_key_equals(keys[j], bound[j]) for j in range(idx)]
+        clauses.append(and_(*prefix, _key_after(key, bound[idx])))
+    return or_(*clauses)
+
+
+def _is_number(value: Any) -> bool:
+    """Check for a JSON number (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_decimal(value: Any) -> Decimal | None:
+    """Coerce a numeric filter value (or numeric string) to Decimal."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _key_value(kind: str, value: Any) -> Any:
+    """Compute a sort-key value in Python the same way SQL does."""
+    if kind == "blank":
+        return value is None or value == ""
+    if kind == "json":
+        return value
+    if kind == "numeric":
+        return value if _is_number(value) else None
+    if kind == "boolean":
+        return value if isinstance(value, bool) else None
+    if kind == "text":
+        if value is None or value == "":
+            return None
+        return value if isinstance(value, str) else json.dumps(value)
+    return value
+
+
+def _bind_key_value(kind: str, value: Any) -> Any:
+    """Convert a decoded cursor value to a bindable SQL value."""
+    if kind == "blank":
+        return literal(bool(value))
+    if kind == "json":
+        return RecordQueryCompiler.jsonb_literal(value)
+    if kind == "created_at":
+        return datetime.fromisoformat(value)
+    if kind == "id":
+        return str(value)
+    if kind == "rank":
+        return float(value)
+    if value is None:
+        return None
+    if kind == "numeric":
+        return Decimal(str(value))
+    if kind == "boolean":
+        return bool(value)
+    return str(value)
+
+
+def _key_equals(key: SortKey, value: Any) -> ColumnElement[bool]:
+    """Key equals the cursor value (NULL-aware for nullable keys)."""
+    if value is None:
+        return key.expression.is_(None)
+    return key.expression == value
+
+
+def _key_after(key: SortKey, value: Any) -> ColumnElement[bool]:
+    """Key sorts strictly after the cursor value."""
+    if value is None:
+        # NULLs sort last, nothing comes after them within this key
+        return false()
+    step = key.expression < value if key.descending else key.expression > value
+    if key.nullable:
+        return or_(step, key.expression.is_(None))
+    return step
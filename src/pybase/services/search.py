@@ -208,48 +208,66 @@ class SearchService:
         limit: int = 20,
         offset: int = 0,
     ) -> SearchResponse:
-        """Fallback database search using PostgreSQL FTS."""
-        from pybase.models.record import Record
-        from pybase.models.base import Base
-
-        stmt = select(Record).join(Base, Base.id == Record.table_id).where(Base.id == UUID(base_id))
+        """Fallback database search using PostgreSQL FTS.
 
+        Matches the generated ``search_vector`` column and the trigram
+        index on record values, ranks results with ``ts_rank`` and reports
+        the planner's row estimate instead of counting every match.
+        """
+        from pybase.db.estimate import estimate_row_count
+        from pybase.models.record import Record
+        from pybase.models.table import Table
+        from pybase.services.record_query import RecordQueryCompiler
+
+        compiler = RecordQueryCompiler()
+        conditions = [
+            Table.base_id == UUID(base_id),
+            Table.deleted_at.is_(None),
+            Record.deleted_at.is_(None),
+            compiler.compile_search(query),
+        ]
         if table_id:
-            stmt = stmt.where(Record.table_id == UUID(table_id))
-
-        result = await self.db.execute(stmt)
-        records = result.scalars().all()
+            conditions.append(Record.table_id == UUID(table_id))
+
+        stmt = (
+            select(Record, Table.name, compiler.search_rank(query))
+            .join(Table, Table.id == Record.table_id)
+            .where(*conditions)
+            .order_by(*compiler.compile_search_order_by(query))
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = (await self.db.execute(stmt)).all()
 
         results = []
-        for rank, record in enumerate(records[offset : offset + limit], start=1):
-            record_values = record.values or {}
-            matches_query = False
-
-            for value in record_values.values():
-                if isinstance(value, str) and query.lower() in value.lower():
-                    matches_query = True
-                    break
-
-            if matches_query:
-                results.append(
-                    SearchResult(
-                        record_id=str(record.id),
-                        table_id=str(record.table_id),
-                        base_id=base_id,
-                        table_name="Table",
-                        fields=record_values,
-                        score=1.0,
-                        rank=rank,
-                        highlights=None,
-                        created_at=record.created_at.isoformat() if record.created_at else None,
-                        updated_at=record.updated_at.isoformat() if record.updated_at else None,
-                    )
+        for rank, (record, table_name, score) in enumerate(rows, start=offset + 1):
+            results.append(
+                SearchResult(
+                    record_id=str(record.id),
+                    table_id=str(record.table_id),
+                    base_id=base_id,
+                    table_name=table_name,
+                    fields=record.get_all_values(),
+                    score=float(score),
+                    rank=rank,
+                    highlights=None,
+                    created_at=record.created_at.isoformat() if record.created_at else None,
+                    updated_at=record.updated_at.isoformat() if record.updated_at else None,
                 )
+            )
+
+        if offset == 0 and len(rows) < limit:
+            total = len(rows)
+        else:
+            total = await estimate_row_count(
+                self.db,
+                select(Record.id).join(Table, Table.id == Record.table_id).where(*conditions),
+            )
 
         metadata = SearchMetadata(
             query=query,
-            total_results=len(results),
-            total_results_filtered=len(results),
+            total_results=total,
+            total_results_filtered=total,
             facets_computed=0,
             execution_time_ms=0,
             filters_applied=table_id is not None,
@@ -361,61 +379,43 @@ class SearchService:
         base_id: str,
         table_id: str,
         batch_size: int = 1000,
+        resume: bool = True,
     ) -> bool:
         """
-        Index all records in a table.
+        Index all live records in a table.
+
+        Runs a keyset-paged reindex job (see ``SearchReindexer``) that removes
+        soft-deleted records from the index and, if interrupted, resumes
+        from its checkpoint on the next call.
 
         Args:
             base_id: Base ID
             table_id: Table ID
             batch_size: Number of records to index per batch
+            resume: Continue an unfinished reindex of the table
 
         Returns:
             True if all records were indexed successfully, False otherwise
         """
-        from pybase.models.record import Record
         from pybase.models.table import Table
-        from pybase.services.meilisearch_index_manager import get_index_manager
+        from pybase.services.search_reindex import REINDEX_COMPLETED, SearchReindexer
 
         if not self.client:
             return False
 
         try:
-            # Fetch table
-            table_stmt = select(Table).where(Table.id == UUID(table_id))
-            table_result = await self.db.execute(table_stmt)
-            table = table_result.scalar_one_or_none()
-
+            table = await self.db.get(Table, table_id)
             if not table or str(table.base_id) != base_id:
                 return False
 
-            # Fetch all records in table
-            record_stmt = select(Record).where(Record.table_id == UUID(table_id))
-            record_result = await self.db.execute(record_stmt)
-            records = record_result.scalars().all()
-
-            if not records:
-                return True
-
-            # Prepare records for batch indexing
-            records_data = []
-            for record in records:
-                records_data.append({
-                    "id": str(record.id),
-                    "table_id": str(table.id),
-                    "table_name": table.name,
-                    "values": record.get_all_values(),
-                    "created_at": record.created_at.isoformat() if record.created_at else None,
-                    "updated_at": record.updated_at.isoformat() if record.updated_at else None,
-                })
-
-            # Index records in batch
-            index_manager = get_index_manager()
-            return index_manager.index_records_batch(
+            checkpoint = await SearchReindexer(self.db).reindex(
                 base_id=base_id,
-                records=records_data,
+                table_ids=[str(table.id)],
                 batch_size=batch_size,
+                resume=resume,
+                scope=str(table.id),
             )
+            return checkpoint.status == REINDEX_COMPLETED
 
         except Exception:
             return False
@@ -0,0 +1,291 @@
+"""
+In-process outbox for Meilisearch record indexing.
+
+Record writes only enqueue record IDs, so request latency does not depend
+on the search engine. A background task drains the queue every
+``search_index_flush_seconds`` (or as soon as a full batch is pending),
+loads the current state of the queued records in one query per base and
+sends them to Meilisearch in bulk, off the event loop.
+
+Repeated writes to a record before a flush coalesce into a single entry.
+The consumer indexes what the database holds at flush time: live records
+are (re)indexed, soft-deleted ones are removed from the index. Records
+not found yet (e.g. the writing transaction has not committed) are retried
+and removed from the index after ``search_index_max_attempts`` flushes.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from pybase.core.config import settings
+from pybase.core.logging import get_logger
+from pybase.db.session import AsyncSessionLocal
+from pybase.metrics import search_index_counter
+from pybase.models.record import Record
+from pybase.models.table import Table
+from pybase.services.meilisearch_index_manager import (
+    MEILISEARCH_AVAILABLE,
+    MeilisearchIndexManager,
+    get_index_manager,
+)
+
+logger = get_logger(__name__)
+
+
+class SearchIndexQueue:
+    """Coalescing queue of records waiting to be (re)indexed, drained in bulk."""
+
+    def __init__(
+        self,
+        index_manager: Optional[MeilisearchIndexManager] = None,
+        session_factory: Any = AsyncSessionLocal,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        """Initialize queue.
+
+        Args:
+            index_manager: Meilisearch index manager, created from settings if not given
+            session_factory: Factory of database sessions for the consumer
+            flush_interval: Seconds between flushes
+            batch_size: Records per Meilisearch request; a full batch flushes early
+            max_pending: Maximum queued records before the oldest are dropped
+            max_attempts: Flushes a record that cannot be found is retried for
+
+        """
+        self._index_manager = index_manager
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval or settings.search_index_flush_seconds
+        self.batch_size = batch_size or settings.search_index_batch_size
+        self.max_pending = max_pending or settings.search_index_max_pending
+        self.max_attempts = max_attempts or settings.search_index_max_attempts
+        # (base_id, record_id) -> number of flushes the record was not found in
+        self._pending: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def index_manager(self) -> MeilisearchIndexManager:
+        """Meilisearch index manager, created on first use."""
+        if self._index_manager is None:
+            if settings.meilisearch_url:
+                self._index_manager = get_index_manager(
+                    settings.meilisearch_url, settings.meilisearch_api_key
+                )
+            else:
+                self._index_manager = get_index_manager()
+        return self._index_manager
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Meilisearch client is available."""
+        return MEILISEARCH_AVAILABLE or self._index_manager is not None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, base_id: str, record_ids: list[str]) -> None:
+        """Queue records for indexing and make sure the consumer is running.
+
+        Records already queued keep their place, so a record updated many
+        times between flushes is indexed once.
+
+        Args:
+            base_id: Base ID containing the records
+            record_ids: Record IDs that were created, updated or deleted
+
+        """
+        if not self.enabled or not record_ids:
+            return
+
+        for record_id in record_ids:
+            key = (str(base_id), str(record_id))
+            event = "coalesced" if key in self._pending else "enqueued"
+            self._pending[key] = 0
+            search_index_counter.labels(event=event).inc()
+
+        # Bound memory if Meilisearch is unreachable for a long time; the
+        # periodic refresh_search_indexes task repairs dropped records
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            search_index_counter.labels(event="dropped").inc()
+
+        self._ensure_started()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Index everything currently queued."""
+        while self._pending:
+            batch = self._take_batch()
+            retry = await self._index_batch(batch)
+            for key, attempts in retry.items():
+                # A newer write re-queued the record already
+                self._pending.setdefault(key, attempts)
+            if retry:
+                break
+
+    async def stop(self) -> None:
+        """Stop the consumer after indexing what is queued (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush search index queue on shutdown: {e}")
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep consuming; the records stay queued for the next flush
+                logger.warning(f"Search index flush failed: {e}")
+
+    def _take_batch(self) -> dict[tuple[str, str], int]:
+        batch = {}
+        while self._pending and len(batch) < self.batch_size:
+            key, attempts = self._pending.popitem(last=False)
+            batch[key] = attempts
+        return batch
+
+    async def _index_batch(
+        self, batch: dict[tuple[str, str], int]
+    ) -> dict[tuple[str, str], int]:
+        """Index a batch of queued records.
+
+        Args:
+            batch: Queued (base_id, record_id) keys with their attempt counts
+
+        Returns:
+            Entries to queue again (records not found yet, or failed requests)
+
+        """
+        by_base: dict[str, list[str]] = {}
+        for base_id, record_id in batch:
+            by_base.setdefault(base_id, []).append(record_id)
+
+        retry: dict[tuple[str, str], int] = {}
+        for base_id, record_ids in by_base.items():
+            try:
+                documents, deleted = await self._load(base_id, record_ids)
+            except Exception as e:
+                logger.warning(f"Failed to load {len(record_ids)} records for indexing: {e}")
+                for record_id in record_ids:
+                    retry[(base_id, record_id)] = batch[(base_id, record_id)]
+                continue
+
+            found = {document["id"] for document in documents} | set(deleted)
+            for record_id in record_ids:
+                if record_id in found:
+                    continue
+                attempts = batch[(base_id, record_id)] + 1
+                if attempts < self.max_attempts:
+                    retry[(base_id, record_id)] = attempts
+                else:
+                    # Gone for good (hard-deleted or rolled back)
+                    deleted.append(record_id)
+
+            if documents:
+                ok = await asyncio.to_thread(
+                    self.index_manager.index_records_batch,
+                    base_id,
+                    documents,
+                    self.batch_size,
+                )
+                indexed = [document["id"] for document in documents]
+                self._record_result(ok, "indexed", base_id, indexed, batch, retry)
+            if deleted:
+                ok = await asyncio.to_thread(
+                    self.index_manager.delete_records_batch, base_id, deleted
+                )
+                self._record_result(ok, "deleted", base_id, deleted, batch, retry)
+
+        return retry
+
+    async def _load(
+        self, base_id: str, record_ids: list[str]
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Load the current state of queued records of a base.
+
+        Returns:
+            Tuple of (documents of live records, IDs of soft-deleted records)
+
+        """
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(Record, Table.name)
+                .join(Table, Table.id == Record.table_id)
+                .where(Record.id.in_([UUID(record_id) for record_id in record_ids]))
+                .where(Table.base_id == UUID(base_id))
+            )
+            rows = result.all()
+
+        documents = []
+        deleted = []
+        for record, table_name in rows:
+            if record.deleted_at is not None:
+                deleted.append(str(record.id))
+                continue
+            documents.append({
+                "id": str(record.id),
+                "table_id": str(record.table_id),
+                "table_name": table_name,
+                "values": record.get_all_values(),
+                "created_at": record.created_at.isoformat() if record.created_at else None,
+                "updated_at": record.updated_at.isoformat() if record.updated_at else None,
+            })
+        return documents, deleted
+
+    @staticmethod
+    def _record_result(
+        ok: bool,
+        event: str,
+        base_id: str,
+        record_ids: list[str],
+        batch: dict[tuple[str, str], int],
+        retry: dict[tuple[str, str], int],
+    ) -> None:
+        if ok:
+            search_index_counter.labels(event=event).inc(len(record_ids))
+            return
+        search_index_counter.labels(event="failed").inc(len(record_ids))
+        logger.warning(f"Meilisearch rejected {len(record_ids)} {event} records of base {base_id}")
+        for record_id in record_ids:
+            retry[(base_id, record_id)] = batch.get((base_id, record_id), 0)
+
+
+_queue: Optional[SearchIndexQueue] = None
+
+
+def get_search_index_queue() -> SearchIndexQueue:
+    """Get the process-wide search index queue."""
+    global _queue
+    if _queue is None:
+        _queue = SearchIndexQueue()
+    return _queue
@@ -0,0 +1,423 @@
+"""
+Resumable full reindex of tables into Meilisearch.
+
+Records are read in keyset-paged batches (``Record.id > last_id``), so only
+a few pages are held in memory however large a table is. Each page is sent
+to Meilisearch as its own task, with at most
+``search_reindex_max_in_flight`` tasks unfinished at a time, and the next
+page is read from the database while earlier pages are being indexed.
+
+Once every page up to a record has been applied, the job's checkpoint
+(table position, last record ID, progress counts) is persisted in Redis.
+A failed or interrupted job resumes from its checkpoint instead of
+starting over.
+
+In shadow mode the base is rebuilt into a separate index that is swapped
+with the live index atomically at the end, so searches keep working (on
+the old documents) during the rebuild and documents of hard-deleted
+records disappear; records written during the rebuild are queued for
+indexing again after the swap. Otherwise pages are upserted into the live index and
+soft-deleted records of each table are removed from it.
+"""
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+import redis.asyncio as redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.config import settings
+from pybase.core.exceptions import ValidationError
+from pybase.core.logging import get_logger
+from pybase.db.base import utc_now
+from pybase.metrics import search_reindex_counter
+from pybase.models.record import Record
+from pybase.models.table import Table
+from pybase.services.meilisearch_index_manager import MeilisearchIndexManager, get_index_manager
+from pybase.services.search_index_queue import get_search_index_queue
+
+logger = get_logger(__name__)
+
+REINDEX_RUNNING = "running"
+REINDEX_COMPLETED = "completed"
+REINDEX_FAILED = "failed"
+
+# Checkpoints of finished or abandoned jobs expire after a week
+CHECKPOINT_TTL = 7 * 24 * 3600
+
+
+class ReindexError(Exception):
+    """A reindex batch could not be applied; the job can be resumed."""
+
+
+@dataclass
+class ReindexCheckpoint:
+    """Persisted progress of a reindex job."""
+
+    base_id: str
+    table_ids: list[str]
+    # "all" for a whole-base job, else the ID of the single table reindexed
+    scope: str = "all"
+    shadow: bool = False
+    status: str = REINDEX_RUNNING
+    # Position in table_ids and last record ID applied in that table
+    table_position: int = 0
+    last_record_id: Optional[str] = None
+    indexed: int = 0
+    removed: int = 0
+    total: int = 0
+    error: Optional[str] = None
+    started_at: str = field(default_factory=lambda: utc_now().isoformat())
+    updated_at: str = field(default_factory=lambda: utc_now().isoformat())
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the records indexed so far."""
+        if self.status == REINDEX_COMPLETED:
+            return 1.0
+        return min(self.indexed / self.total, 1.0) if self.total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form, including the computed progress."""
+        return {**asdict(self), "progress": self.progress}
+
+
+class ReindexCheckpointStore:
+    """Redis storage of reindex checkpoints."""
+
+    KEY_PREFIX = "search:reindex"
+
+    def __init__(self) -> None:
+        """Initialize store."""
+        self._redis: Optional[redis.Redis] = None
+
+    async def get_redis(self) -> Optional[redis.Redis]:
+        """Get or create the Redis connection."""
+        if self._redis is None:
+            try:
+                self._redis = redis.from_url(
+                    settings.redis_url,
+                    max_connections=settings.redis_max_connections,
+                    decode_responses=True,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis: {e}")
+                self._redis = None
+        return self._redis
+
+    def key(self, base_id: str, scope: str) -> str:
+        """Checkpoint key of a job."""
+        return f"{self.KEY_PREFIX}:{base_id}:{scope}"
+
+    async def load(self, base_id: str, scope: str) -> Optional[ReindexCheckpoint]:
+        """Load a job checkpoint.
+
+        Args:
+            base_id: Base ID
+            scope: Table ID, or "all" for a whole-base job
+
+        Returns:
+            Checkpoint, or None if there is none (or Redis is unavailable)
+
+        """
+        try:
+            redis_client = await self.get_redis()
+            if not redis_client:
+                return None
+            data = await redis_client.get(self.key(base_id, scope))
+            return ReindexCheckpoint(**json.loads(data)) if data else None
+        except Exception as e:
+            logger.warning(f"Error loading reindex checkpoint: {e}")
+            return None
+
+    async def save(self, checkpoint: ReindexCheckpoint) -> None:
+        """Persist a job checkpoint.
+
+        Args:
+            checkpoint: Checkpoint to save
+
+        """
+        checkpoint.updated_at = utc_now().isoformat()
+        try:
+            redis_client = await self.get_redis()
+            if not redis_client:
+                return
+            await redis_client.setex(
+                self.key(checkpoint.base_id, checkpoint.scope),
+                CHECKPOINT_TTL,
+                json.dumps(asdict(checkpoint)),
+            )
+        except Exception as e:
+            logger.warning(f"Error saving reindex checkpoint: {e}")
+
+
+class SearchReindexer:
+    """Runs keyset-paged, resumable reindex jobs."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        index_manager: Optional[MeilisearchIndexManager] = None,
+        checkpoints: Optional[ReindexCheckpointStore] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> None:
+        """Initialize reindexer.
+
+        Args:
+            db: Database session
+            index_manager: Meilisearch index manager
+            checkpoints: Checkpoint store
+            max_in_flight: Maximum Meilisearch batches awaiting completion
+
+        """
+        self.db = db
+        self.index_manager = index_manager or get_index_manager()
+        self.checkpoints = checkpoints or ReindexCheckpointStore()
+        self.max_in_flight = max_in_flight or settings.search_reindex_max_in_flight
+
+    async def reindex(
+        self,
+        base_id: str,
+        table_ids: list[str],
+        batch_size: int = 1000,
+        shadow: bool = False,
+        resume: bool = True,
+        scope: str = "all",
+    ) -> ReindexCheckpoint:
+        """Reindex the records of tables, resuming an unfinished job if any.
+
+        Args:
+            base_id: Base ID
+            table_ids: Tables to reindex (all tables of the base for a shadow job)
+            batch_size: Records per page and Meilisearch batch
+            shadow: Rebuild into a shadow index and swap it in when done
+            resume: Continue from the checkpoint of an unfinished job
+            scope: Job identity within the base: "all", or a table ID
+
+        Returns:
+            Final checkpoint; its status is "completed" or "failed"
+
+        Raises:
+            ValidationError: If a shadow job does not cover the whole base
+
+        """
+        if shadow and scope != "all":
+            # The shadow index replaces the whole base index
+            raise ValidationError("Shadow reindexing requires a whole-base job")
+
+        checkpoint = ReindexCheckpoint(
+            base_id=base_id, table_ids=table_ids, scope=scope, shadow=shadow
+        )
+        previous = await self.checkpoints.load(base_id, scope)
+        resuming = (
+            resume
+            and previous is not None
+            and previous.status != REINDEX_COMPLETED
+            and previous.table_ids == table_ids
+            and previous.shadow == shadow
+        )
+        if resuming:
+            checkpoint = previous
+            checkpoint.status = REINDEX_RUNNING
+            checkpoint.error = None
+            logger.info(
+                f"Resuming reindex of base {base_id} at table {checkpoint.table_position} "
+                f"({checkpoint.indexed}/{checkpoint.total} records)"
+            )
+        else:
+            checkpoint.total = await self._count_records(table_ids)
+
+        index_name = None
+        if shadow:
+            index_name = self.index_manager.get_shadow_index_name(base_id)
+            if not resuming:
+                await asyncio.to_thread(self.index_manager.delete_base_index, base_id, index_name)
+            await asyncio.to_thread(
+                self.index_manager.create_base_index, base_id, "id", index_name
+            )
+        await self.checkpoints.save(checkpoint)
+
+        try:
+            while checkpoint.table_position < len(table_ids):
+                table_id = table_ids[checkpoint.table_position]
+                await self._index_table(checkpoint, table_id, batch_size, index_name)
+                if not shadow:
+                    await self._remove_deleted(checkpoint, table_id, batch_size)
+                checkpoint.table_position += 1
+                checkpoint.last_record_id = None
+                await self.checkpoints.save(checkpoint)
+
+            if shadow:
+                swapped = await asyncio.to_thread(self.index_manager.swap_shadow_index, base_id)
+                if not swapped:
+                    raise ReindexError("Failed to swap the shadow index in")
+                await self._requeue_changed(checkpoint)
+
+            checkpoint.status = REINDEX_COMPLETED
+            logger.info(f"Reindexed {checkpoint.indexed} records of base {base_id}")
+
+        except Exception as e:
+            checkpoint.status = REINDEX_FAILED
+            checkpoint.error = str(e)
+            search_reindex_counter.labels(event="failed").inc()
+            logger.error(f"Reindex of base {base_id} failed, resumable from checkpoint: {e}")
+
+        await self.checkpoints.save(checkpoint)
+        return checkpoint
+
+    async def _index_table(
+        self,
+        checkpoint: ReindexCheckpoint,
+        table_id: str,
+        batch_size: int,
+        index_name: Optional[str],
+    ) -> None:
+        """Index the live records of a table from the checkpoint on.
+
+        Pages are read while up to ``max_in_flight`` earlier pages are being
+        indexed; the checkpoint only advances past pages Meilisearch applied.
+        """
+        table = await self.db.get(Table, table_id)
+        if table is None:
+            return
+
+        in_flight: deque[tuple[asyncio.Task, Optional[str], int]] = deque()
+        try:
+            async for records in self._iter_pages(table_id, checkpoint.last_record_id, batch_size):
+                documents = [{**record, "table_name": table.name} for record in records]
+                task = asyncio.create_task(self._send(checkpoint.base_id, documents, index_name))
+                in_flight.append((task, records[-1]["id"], len(documents)))
+                while len(in_flight) > self.max_in_flight:
+                    await self._acknowledge(checkpoint, in_flight.popleft())
+
+            while in_flight:
+                await self._acknowledge(checkpoint, in_flight.popleft())
+        finally:
+            # Stop pages behind a failed one; their results are discarded
+            for task, _, _ in in_flight:
+                task.cancel()
+            await asyncio.gather(*(task for task, _, _ in in_flight), return_exceptions=True)
+
+    async def _acknowledge(
+        self,
+        checkpoint: ReindexCheckpoint,
+        entry: tuple[asyncio.Task, Optional[str], int],
+    ) -> None:
+        """Wait for the oldest in-flight page and advance the checkpoint past it."""
+        task, last_record_id, count = entry
+        await task
+        checkpoint.last_record_id = last_record_id
+        checkpoint.indexed += count
+        search_reindex_counter.labels(event="indexed").inc(count)
+        await self.checkpoints.save(checkpoint)
+
+    async def _send(
+        self,
+        base_id: str,
+        documents: list[dict[str, Any]],
+        index_name: Optional[str],
+    ) -> None:
+        """Send a page to Meilisearch and wait until it is applied."""
+        task_uid = await asyncio.to_thread(
+            self.index_manager.add_documents, base_id, documents, index_name
+        )
+        if task_uid is None:
+            raise ReindexError("Meilisearch rejected a reindex batch")
+        if not await asyncio.to_thread(self.index_manager.wait_for_task, task_uid):
+            raise ReindexError(f"Meilisearch task {task_uid} did not succeed")
+
+    async def _remove_deleted(
+        self,
+        checkpoint: ReindexCheckpoint,
+        table_id: str,
+        batch_size: int,
+    ) -> None:
+        """Remove the soft-deleted records of a table from the live index."""
+        last_id = None
+        while True:
+            query = (
+                select(Record.id)
+                .where(Record.table_id == table_id, Record.deleted_at.is_not(None))
+                .order_by(Record.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(Record.id > last_id)
+            record_ids = [str(record_id) for record_id in (await self.db.execute(query)).scalars()]
+            if not record_ids:
+                return
+
+            deleted = await asyncio.to_thread(
+                self.index_manager.delete_records_batch, checkpoint.base_id, record_ids
+            )
+            if not deleted:
+                raise ReindexError("Meilisearch rejected removing deleted records")
+            checkpoint.removed += len(record_ids)
+            search_reindex_counter.labels(event="removed").inc(len(record_ids))
+            last_id = record_ids[-1]
+
+    async def _requeue_changed(self, checkpoint: ReindexCheckpoint) -> None:
+        """Queue records written during a shadow rebuild for indexing.
+
+        Writes made while the shadow index was built went to the old live
+        index, and pages already copied may hold their previous version.
+        """
+        started_at = datetime.fromisoformat(checkpoint.started_at)
+        result = await self.db.execute(
+            select(Record.id).where(
+                Record.table_id.in_(checkpoint.table_ids),
+                Record.updated_at >= started_at,
+            )
+        )
+        record_ids = [str(record_id) for record_id in result.scalars().all()]
+        get_search_index_queue().enqueue(checkpoint.base_id, record_ids)
+
+    async def _iter_pages(self, table_id: str, after_id: Optional[str], batch_size: int):
+        """Yield pages of live records of a table in ID order, after ``after_id``."""
+        query = (
+            select(Record)
+            .where(Record.table_id == table_id, Record.deleted_at.is_(None))
+            .order_by(Record.id)
+            .limit(batch_size)
+        )
+        while True:
+            page_query = query if after_id is None else query.where(Record.id > after_id)
+            records = list((await self.db.execute(page_query)).scalars().all())
+            if not records:
+                return
+
+            page = [
+                {
+                    "id": str(record.id),
+                    "table_id": str(record.table_id),
+                    "values": record.get_all_values(),
+                    "created_at": record.created_at.isoformat() if record.created_at else None,
+                    "updated_at": record.updated_at.isoformat() if record.updated_at else None,
+                }
+                for record in records
+            ]
+            after_id = page[-1]["id"]
+
+            # Detach the page so the session doesn't accumulate the whole table
+            for record in records:
+                self.db.expunge(record)
+
+            yield page
+            if len(records) < batch_size:
+                return
+
+    async def _count_records(self, table_ids: list[str]) -> int:
+        """Number of live records in the tables, for progress reporting."""
+        if not table_ids:
+            return 0
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(Record)
+            .where(Record.table_id.in_(table_ids), Record.deleted_at.is_(None))
+        )
+        return int(result.scalar() or 0)
@@ -16,6 +16,7 @@ from pybase.models.field import Field
 from pybase.models.table import Table
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.table import TableCreate, TableUpdate
+from pybase.services.access import invalidate_access
 
 
 class TableService:
@@ -243,6 +244,7 @@ class TableService:
             raise PermissionDeniedError("Only workspace owner can delete tables")
 
         table.is_deleted = True
+        await invalidate_access("table", table_id, db)
 
     async def _get_workspace(
         self,
@@ -1,5 +1,6 @@
 """Trash service for managing deleted records."""
 
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -7,20 +8,23 @@ from uuid import UUID
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pybase.cache.chart_cache import ChartCache
 from pybase.cache.record_cache import RecordCache
 from pybase.core.exceptions import NotFoundError, PermissionDeniedError
 from pybase.models.base import Base
 from pybase.models.record import Record
 from pybase.models.table import Table
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from pybase.services.chart_snapshot import get_chart_snapshot_store
 
 
 class TrashService:
     """Service for trash bin operations."""
 
     def __init__(self) -> None:
-        """Initialize trash service with cache."""
+        """Initialize trash service with caches."""
         self.cache = RecordCache()
+        self.chart_cache = ChartCache()
 
     async def list_trash(
         self,
@@ -151,8 +155,9 @@ class TrashService:
         # Restore record
         record.restore()
 
-        # Invalidate cache for this table
+        # Invalidate caches for this table
         await self.cache.invalidate_table_cache(str(record.table_id))
+        await self._invalidate_chart_caches(str(record.table_id), [record])
 
         return record
 
@@ -214,10 +219,14 @@ class TrashService:
         for record in restored_records:
             await db.refresh(record)
 
-        # Invalidate cache for affected tables
+        # Invalidate caches for affected tables
         table_ids = set(str(record.table_id) for record in restored_records)
         for table_id in table_ids:
             await self.cache.invalidate_table_cache(table_id)
+            await self._invalidate_chart_caches(
+                table_id,
+                [record for record in restored_records if str(record.table_id) == table_id],
+            )
 
         return restored_records
 
@@ -465,3 +474,17 @@ class TrashService:
         if not table or table.is_deleted:
             raise NotFoundError("Table not found")
         return table
+
+    async def _invalidate_chart_caches(self, table_id: str, restored: list[Record]) -> None:
+        """Bump the chart generation of a table and add restored records to its snapshots.
+
+        Args:
+            table_id: Table ID whose records were restored
+            restored: Restored records of the table
+        """
+        chart_version = await self.chart_cache.invalidate_table_cache(table_id)
+        get_chart_snapshot_store().apply_record_changes(
+            table_id,
+            chart_version,
+            [(None, json.loads(record.data) if record.data else {}) for record in restored],
+        )
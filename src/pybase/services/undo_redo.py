@@ -4,7 +4,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from sqlalchemy import and_, delete, desc, func, select
+from sqlalchemy import and_, delete, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.exceptions import ConflictError, NotFoundError, PermissionDeniedError
@@ -66,23 +66,7 @@ class UndoRedoService:
             ConflictError: If operation type or entity type is invalid
 
         """
-        # Validate operation type
-        valid_operations = [
-            self.OPERATION_CREATE,
-            self.OPERATION_UPDATE,
-            self.OPERATION_DELETE,
-        ]
-        if operation_type not in valid_operations:
-            raise ConflictError(f"Invalid operation type: {operation_type}")
-
-        # Validate entity type
-        valid_entities = [
-            self.ENTITY_RECORD,
-            self.ENTITY_FIELD,
-            self.ENTITY_VIEW,
-        ]
-        if entity_type not in valid_entities:
-            raise ConflictError(f"Invalid entity type: {entity_type}")
+        self._validate_operation(operation_type, entity_type)
 
         # Check if user exceeded operation limit
         await self._enforce_operation_limit(db, user_id)
@@ -105,6 +89,85 @@ class UndoRedoService:
 
         return operation_log
 
+    async def log_operations_bulk(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        operation_type: str,
+        entity_type: str,
+        entries: list[tuple[str, Optional[dict[str, Any]], Optional[dict[str, Any]]]],
+    ) -> int:
+        """Log many operations of the same kind with a single INSERT.
+
+        Only the newest ``MAX_OPERATIONS_PER_USER`` entries are kept, matching
+        what logging them one by one would leave after pruning.
+
+        Args:
+            db: Database session
+            user_id: User ID performing the operations
+            operation_type: Type of operation (create, update, delete)
+            entity_type: Type of entity (record, field, view)
+            entries: (entity_id, before_data, after_data) tuples, oldest first
+
+        Returns:
+            Number of operation logs inserted
+
+        Raises:
+            ConflictError: If operation type or entity type is invalid
+
+        """
+        self._validate_operation(operation_type, entity_type)
+        if not entries:
+            return 0
+
+        entries = entries[-self.MAX_OPERATIONS_PER_USER:]
+        await self._enforce_operation_limit(db, user_id, incoming=len(entries))
+
+        await db.execute(
+            insert(OperationLog),
+            [
+                {
+                    "user_id": user_id,
+                    "operation_type": operation_type,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "before_data": json.dumps(before_data) if before_data is not None else None,
+                    "after_data": json.dumps(after_data) if after_data is not None else None,
+                }
+                for entity_id, before_data, after_data in entries
+            ],
+        )
+        return len(entries)
+
+    def _validate_operation(self, operation_type: str, entity_type: str) -> None:
+        """Validate operation and entity types.
+
+        Args:
+            operation_type: Type of operation
+            entity_type: Type of entity
+
+        Raises:
+            ConflictError: If operation type or entity type is invalid
+
+        """
+        # Validate operation type
+        valid_operations = [
+            self.OPERATION_CREATE,
+            self.OPERATION_UPDATE,
+            self.OPERATION_DELETE,
+        ]
+        if operation_type not in valid_operations:
+            raise ConflictError(f"Invalid operation type: {operation_type}")
+
+        # Validate entity type
+        valid_entities = [
+            self.ENTITY_RECORD,
+            self.ENTITY_FIELD,
+            self.ENTITY_VIEW,
+        ]
+        if entity_type not in valid_entities:
+            raise ConflictError(f"Invalid entity type: {entity_type}")
+
     async def get_user_operations(
         self,
         db: AsyncSession,
@@ -274,12 +337,14 @@ class UndoRedoService:
         self,
         db: AsyncSession,
         user_id: str,
+        incoming: int = 1,
     ) -> None:
         """Enforce maximum operations per user by deleting oldest.
 
         Args:
             db: Database session
             user_id: User ID
+            incoming: Number of operations about to be logged
 
         """
         # Count user's operations
@@ -289,9 +354,9 @@ class UndoRedoService:
         count = result.scalar() or 0
 
         # If over limit, delete oldest operations
-        if count >= self.MAX_OPERATIONS_PER_USER:
+        if count + incoming > self.MAX_OPERATIONS_PER_USER:
             # Get operations to delete (oldest ones)
-            excess = count - self.MAX_OPERATIONS_PER_USER + 1
+            excess = count + incoming - self.MAX_OPERATIONS_PER_USER
 
             # Subquery to find oldest operations
             subquery = (
@@ -1,6 +1,7 @@
 """Validation service for data integrity checks."""
 
 import json
+from collections.abc import Collection, Sequence
 from typing import Any, Optional
 
 from sqlalchemy import select
@@ -12,6 +13,22 @@ from pybase.fields import get_field_handler
 from pybase.models.field import Field
 from pybase.models.record import Record
 from pybase.models.unique_constraint import UniqueConstraint, UniqueConstraintStatus
+from pybase.services.record_query import unique_key_expression
+
+# Maximum number of values per uniqueness lookup query
+UNIQUE_LOOKUP_CHUNK_SIZE = 1000
+
+
+def _jsonb_key_order(value: Any) -> Any:
+    """Order object keys the way jsonb stores them (shorter keys first, then bytewise)."""
+    if isinstance(value, dict):
+        return {
+            key: _jsonb_key_order(value[key])
+            for key in sorted(value, key=lambda key: (len(key.encode()), key.encode()))
+        }
+    if isinstance(value, list):
+        return [_jsonb_key_order(item) for item in value]
+    return value
 
 
 class ValidationService:
@@ -23,6 +40,7 @@ class ValidationService:
         table_id: str,
         data: dict[str, Any],
         exclude_record_id: Optional[str] = None,
+        check_unique: bool = True,
     ) -> None:
         """Validate record data against table fields and constraints.
 
@@ -32,6 +50,8 @@ class ValidationService:
             data: Record data (field_id -> value)
             exclude_record_id: Optional record ID to exclude from uniqueness checks
                 (for updates, exclude the current record)
+            check_unique: Check unique constraints. Batch callers pass False and
+                call ``validate_unique_batch`` once for all rows instead.
 
         Raises:
             ValidationError: If validation fails with detailed error messages
@@ -39,98 +59,34 @@ class ValidationService:
 
         """
         # Get all fields for table
-        fields_query = select(Field).options(
-            load_only(Field.id, Field.name, Field.field_type, Field.is_required, Field.is_unique, Field.options)
-        ).where(
-            Field.table_id == table_id,
-            Field.deleted_at.is_(None),
-        )
-        result = await db.execute(fields_query)
-        fields = result.scalars().all()
-        fields_dict = {str(f.id): f for f in fields}
+        fields_dict = await self._load_fields(db, table_id)
 
         # Get unique constraints for fields in this table
-        field_ids = list(fields_dict.keys())
-        if not field_ids:
+        if not fields_dict:
             return
-
-        constraints_query = select(UniqueConstraint).where(
-            UniqueConstraint.field_id.in_(field_ids),
-            UniqueConstraint.status == UniqueConstraintStatus.ACTIVE.value,
-        )
-        constraints_result = await db.execute(constraints_query)
-        constraints = constraints_result.scalars().all()
-        constraints_dict = {str(c.field_id): c for c in constraints}
+        constraints_dict = await self._load_unique_constraints(db, list(fields_dict.keys()))
 
         # Collect all validation errors
         validation_errors = []
+        options_cache: dict[str, Optional[dict[str, Any]]] = {}
 
         # Validate each field in data
         for field_id, value in data.items():
-            if field_id not in fields_dict:
-                validation_errors.append({
-                    "field_id": field_id,
-                    "message": f"Field {field_id} does not exist in table",
-                })
-                continue
-
-            field = fields_dict[field_id]
-
-            # Check if field is editable
-            if not field.is_editable:
-                validation_errors.append({
-                    "field_id": field_id,
-                    "field_name": field.name,
-                    "message": f"Field '{field.name}' is not editable",
-                })
-                continue
-
-            # Check required fields
-            if field.is_required and (value is None or value == ""):
-                validation_errors.append({
-                    "field_id": field_id,
-                    "field_name": field.name,
-                    "message": f"Field '{field.name}' is required",
-                })
+            error = self._validate_field_value(field_id, value, fields_dict, options_cache)
+            if error:
+                validation_errors.append(error)
                 continue
 
-            # Validate using field handler if available and value is not None
-            if value is not None and value != "":
-                handler = get_field_handler(field.field_type)
-                if handler:
-                    # Parse field options
-                    options = None
-                    if field.options:
-                        try:
-                            options = json.loads(field.options)
-                        except (json.JSONDecodeError, TypeError):
-                            options = {}
-
-                    # Validate value
-                    try:
-                        handler.validate(value, options)
-                    except ValueError as e:
-                        validation_errors.append({
-                            "field_id": field_id,
-                            "field_name": field.name,
-                            "message": f"Invalid value for field '{field.name}': {e}",
-                        })
-
             # Check unique constraints
-            if field_id in constraints_dict:
+            if check_unique and field_id in constraints_dict:
                 constraint = constraints_dict[field_id]
                 is_duplicate = await self._check_unique_constraint(
                     db, table_id, field_id, value, exclude_record_id, constraint
                 )
                 if is_duplicate:
-                    field_name = field.name
-                    error_msg = f"Value '{value}' for field '{field_name}' already exists"
-                    if constraint.error_message:
-                        error_msg = constraint.error_message.format(
-                            field_name=field_name,
-                            value=value,
-                        )
-                    raise ConflictError(error_msg)
+                    raise ConflictError(
+                        self._unique_error_message(constraint, fields_dict[field_id].name, value)
+                    )
 
         # Raise validation error if any errors found
         if validation_errors:
@@ -139,6 +95,186 @@ class ValidationService:
                 errors=validation_errors,
             )
 
+    async def validate_records_batch(
+        self,
+        db: AsyncSession,
+        table_id: str,
+        rows: Sequence[dict[str, Any]],
+        exclude_record_ids: Optional[Collection[str]] = None,
+        check_unique: bool = True,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Validate many rows against the table schema in one pass.
+
+        Field metadata and unique constraints are loaded once for the
+        batch, field options are parsed once per field, and uniqueness is
+        checked with ``find_unique_violations``.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+            rows: Record data dicts (field_id -> value)
+            exclude_record_ids: Record IDs to ignore in uniqueness checks
+                (the records being updated by the batch)
+            check_unique: Include unique constraint violations
+
+        Returns:
+            Mapping of row index -> list of errors, only for rows with errors.
+            Errors have the same shape as ``ValidationError`` details from
+            ``validate_record_data``.
+
+        """
+        row_errors: dict[int, list[dict[str, Any]]] = {}
+        if not rows:
+            return row_errors
+
+        fields_dict = await self._load_fields(db, table_id)
+        options_cache: dict[str, Optional[dict[str, Any]]] = {}
+
+        for idx, data in enumerate(rows):
+            for field_id, value in data.items():
+                error = self._validate_field_value(field_id, value, fields_dict, options_cache)
+                if error:
+                    row_errors.setdefault(idx, []).append(error)
+
+        if check_unique and fields_dict:
+            # Only check values of rows that are otherwise valid
+            valid_rows = [
+                {} if idx in row_errors else data for idx, data in enumerate(rows)
+            ]
+            violations = await self.find_unique_violations(
+                db, table_id, valid_rows, exclude_record_ids
+            )
+            for violation in violations:
+                row_errors.setdefault(violation["index"], []).append({
+                    "field_id": violation["field_id"],
+                    "field_name": violation["field_name"],
+                    "message": violation["message"],
+                })
+
+        return dict(sorted(row_errors.items()))
+
+    async def _load_fields(self, db: AsyncSession, table_id: str) -> dict[str, Field]:
+        """Load the live fields of a table keyed by field ID.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+
+        Returns:
+            Mapping of field ID -> Field
+
+        """
+        fields_query = select(Field).options(
+            load_only(
+                Field.id,
+                Field.name,
+                Field.field_type,
+                Field.is_required,
+                Field.is_unique,
+                Field.is_computed,
+                Field.is_locked,
+                Field.options,
+            )
+        ).where(
+            Field.table_id == table_id,
+            Field.deleted_at.is_(None),
+        )
+        result = await db.execute(fields_query)
+        return {str(f.id): f for f in result.scalars().all()}
+
+    async def _load_unique_constraints(
+        self,
+        db: AsyncSession,
+        field_ids: list[str],
+    ) -> dict[str, UniqueConstraint]:
+        """Load active unique constraints keyed by field ID.
+
+        Args:
+            db: Database session
+            field_ids: Field IDs to load constraints for
+
+        Returns:
+            Mapping of field ID -> UniqueConstraint
+
+        """
+        constraints_query = select(UniqueConstraint).where(
+            UniqueConstraint.field_id.in_(field_ids),
+            UniqueConstraint.status == UniqueConstraintStatus.ACTIVE.value,
+        )
+        constraints_result = await db.execute(constraints_query)
+        return {str(c.field_id): c for c in constraints_result.scalars().all()}
+
+    def _validate_field_value(
+        self,
+        field_id: str,
+        value: Any,
+        fields_dict: dict[str, Field],
+        options_cache: dict[str, Optional[dict[str, Any]]],
+    ) -> Optional[dict[str, Any]]:
+        """Validate a single value against its field definition.
+
+        Args:
+            field_id: Field ID
+            value: Value to validate
+            fields_dict: Table fields keyed by ID
+            options_cache: Parsed field options, filled in as fields are seen
+
+        Returns:
+            Error dict, or None if the value is valid
+
+        """
+        if field_id not in fields_dict:
+            return {
+                "field_id": field_id,
+                "message": f"Field {field_id} does not exist in table",
+            }
+
+        field = fields_dict[field_id]
+
+        # Check if field is editable
+        if not field.is_editable:
+            return {
+                "field_id": field_id,
+                "field_name": field.name,
+                "message": f"Field '{field.name}' is not editable",
+            }
+
+        # Check required fields
+        if field.is_required and (value is None or value == ""):
+            return {
+                "field_id": field_id,
+                "field_name": field.name,
+                "message": f"Field '{field.name}' is required",
+            }
+
+        # Validate using field handler if available and value is not None
+        if value is None or value == "":
+            return None
+        handler = get_field_handler(field.field_type)
+        if not handler:
+            return None
+
+        if field_id not in options_cache:
+            options_cache[field_id] = self._parse_field_options(field)
+        try:
+            handler.validate(value, options_cache[field_id])
+        except ValueError as e:
+            return {
+                "field_id": field_id,
+                "field_name": field.name,
+                "message": f"Invalid value for field '{field.name}': {e}",
+            }
+        return None
+
+    def _parse_field_options(self, field: Field) -> Optional[dict[str, Any]]:
+        """Parse a field's JSON options (None when unset, {} when invalid)."""
+        if not field.options:
+            return None
+        try:
+            return json.loads(field.options)
+        except (json.JSONDecodeError, TypeError):
+            return {}
+
     async def _check_unique_constraint(
         self,
         db: AsyncSession,
@@ -162,68 +298,206 @@ class ValidationService:
             True if value violates uniqueness, False otherwise
 
         """
-        if value is None or value == "":
+        key = self._unique_key(value, constraint.case_sensitive)
+        if key is None:
             # Null values are not considered for unique constraints
             return False
 
-        # Get all records for the table
-        records_query = select(Record).where(
+        existing = await self._find_existing_unique_keys(
+            db,
+            table_id,
+            field_id,
+            {key},
+            [exclude_record_id] if exclude_record_id else None,
+            constraint,
+        )
+        return key in existing
+
+    async def _find_existing_unique_keys(
+        self,
+        db: AsyncSession,
+        table_id: str,
+        field_id: str,
+        keys: Collection[str],
+        exclude_record_ids: Optional[Collection[str]],
+        constraint: UniqueConstraint,
+    ) -> set[str]:
+        """Find which unique keys are already used by live records.
+
+        Runs one ``IN (...)`` lookup per chunk of keys against the
+        constraint's lookup index instead of scanning the table.
+
+        Args:
+            db: Database session
+            table_id: Table ID
+            field_id: Field ID to check
+            keys: Keys from ``_unique_key`` to look up
+            exclude_record_ids: Record IDs to ignore (records being updated)
+            constraint: UniqueConstraint with configuration
+
+        Returns:
+            Subset of keys that already exist
+
+        """
+        if not keys:
+            return set()
+
+        key_expr = unique_key_expression(Record.data, field_id, constraint.case_sensitive)
+        base_query = select(key_expr).distinct().where(
             Record.table_id == table_id,
             Record.deleted_at.is_(None),
         )
+        if exclude_record_ids:
+            base_query = base_query.where(Record.id.not_in(list(exclude_record_ids)))
+
+        key_list = list(keys)
+        existing: set[str] = set()
+        for start in range(0, len(key_list), UNIQUE_LOOKUP_CHUNK_SIZE):
+            chunk = key_list[start:start + UNIQUE_LOOKUP_CHUNK_SIZE]
+            result = await db.execute(base_query.where(key_expr.in_(chunk)))
+            existing.update(result.scalars().all())
+        return existing
+
+    async def find_unique_violations(
+        self,
+        db: AsyncSession,
+        table_id: str,
+        rows: Sequence[dict[str, Any]],
+        exclude_record_ids: Optional[Collection[str]] = None,
+    ) -> list[dict[str, Any]]:
+        """Find unique constraint violations for a batch of rows.
 
-        # Exclude current record if updating
-        if exclude_record_id:
-            records_query = records_query.where(Record.id != exclude_record_id)
+        Duplicates within the batch are detected in memory; duplicates
+        against existing records take one lookup query per constrained
+        field (per chunk of values), so the work is O(batch) rather than
+        O(batch x table).
 
-        result = await db.execute(records_query)
-        records = result.scalars().all()
+        Args:
+            db: Database session
+            table_id: Table ID
+            rows: Record data dicts (field_id -> value)
+            exclude_record_ids: Record IDs to ignore in existing data
+                (the records being updated by the batch)
 
-        # Check if any record has the same value for this field
-        for record in records:
-            try:
-                record_data = json.loads(record.data)
-                record_value = record_data.get(field_id)
+        Returns:
+            List of violations, each with ``index``, ``field_id``,
+            ``field_name``, ``value`` and ``message``, ordered by row index
 
-                # Compare values based on case sensitivity setting
-                if self._values_equal(record_value, value, constraint.case_sensitive):
-                    return True
-            except (json.JSONDecodeError, TypeError):
-                continue
+        """
+        constrained_ids = {field_id for row in rows for field_id in row}
+        if not constrained_ids:
+            return []
 
-        return False
+        constraints_query = select(UniqueConstraint).where(
+            UniqueConstraint.field_id.in_(list(constrained_ids)),
+            UniqueConstraint.status == UniqueConstraintStatus.ACTIVE.value,
+        )
+        constraints_result = await db.execute(constraints_query)
+        constraints = constraints_result.scalars().all()
+        if not constraints:
+            return []
 
-    def _values_equal(
+        fields_query = select(Field).options(load_only(Field.id, Field.name)).where(
+            Field.id.in_([str(c.field_id) for c in constraints]),
+        )
+        fields_result = await db.execute(fields_query)
+        field_names = {str(f.id): f.name for f in fields_result.scalars().all()}
+
+        violations: list[dict[str, Any]] = []
+        for constraint in constraints:
+            field_id = str(constraint.field_id)
+
+            # Map each key to the rows using it; later rows duplicate the first
+            rows_by_key: dict[str, list[int]] = {}
+            for idx, row in enumerate(rows):
+                if field_id not in row:
+                    continue
+                key = self._unique_key(row[field_id], constraint.case_sensitive)
+                if key is not None:
+                    rows_by_key.setdefault(key, []).append(idx)
+
+            existing = await self._find_existing_unique_keys(
+                db, table_id, field_id, rows_by_key.keys(), exclude_record_ids, constraint
+            )
+
+            for key, indexes in rows_by_key.items():
+                duplicate_indexes = indexes if key in existing else indexes[1:]
+                for idx in duplicate_indexes:
+                    value = rows[idx][field_id]
+                    field_name = field_names.get(field_id, field_id)
+                    violations.append({
+                        "index": idx,
+                        "field_id": field_id,
+                        "field_name": field_name,
+                        "value": value,
+                        "message": self._unique_error_message(constraint, field_name, value),
+                    })
+
+        violations.sort(key=lambda v: v["index"])
+        return violations
+
+    async def validate_unique_batch(
         self,
-        value1: Any,
-        value2: Any,
-        case_sensitive: bool,
-    ) -> bool:
-        """Compare two values with optional case-insensitive comparison.
+        db: AsyncSession,
+        table_id: str,
+        rows: Sequence[dict[str, Any]],
+        exclude_record_ids: Optional[Collection[str]] = None,
+    ) -> None:
+        """Validate unique constraints for a batch of rows.
 
         Args:
-            value1: First value
-            value2: Second value
-            case_sensitive: Whether comparison should be case-sensitive
+            db: Database session
+            table_id: Table ID
+            rows: Record data dicts (field_id -> value)
+            exclude_record_ids: Record IDs to ignore in existing data
 
-        Returns:
-            True if values are equal, False otherwise
+        Raises:
+            ConflictError: If any row violates a unique constraint
 
         """
-        # Handle None values
-        if value1 is None and value2 is None:
-            return True
-        if value1 is None or value2 is None:
-            return False
+        violations = await self.find_unique_violations(db, table_id, rows, exclude_record_ids)
+        if violations:
+            first = violations[0]
+            raise ConflictError(f"Record at index {first['index']}: {first['message']}")
+
+    def _unique_key(self, value: Any, case_sensitive: bool) -> Optional[str]:
+        """Convert a value to the text key compared by unique constraints.
 
-        # Convert to strings for comparison if needed
-        str1 = str(value1)
-        str2 = str(value2)
+        Mirrors ``data ->> field_id`` so Python-side keys match the SQL
+        lookup expression.
+
+        Args:
+            value: Field value
+            case_sensitive: Whether the constraint is case sensitive
 
-        if case_sensitive:
-            return str1 == str2
+        Returns:
+            Key string, or None for values exempt from uniqueness
+
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, bool):
+            key = "true" if value else "false"
+        elif isinstance(value, str):
+            key = value
+        elif isinstance(value, (dict, list)):
+            key = json.dumps(
+                _jsonb_key_order(value), separators=(", ", ": "), ensure_ascii=False
+            )
         else:
-            return str1.lower() == str2.lower()
+            key = str(value)
+        return key if case_sensitive else key.lower()
+
+    def _unique_error_message(
+        self,
+        constraint: UniqueConstraint,
+        field_name: str,
+        value: Any,
+    ) -> str:
+        """Format the unique violation message for a constraint."""
+        if constraint.error_message:
+            return constraint.error_message.format(field_name=field_name, value=value)
+        return f"Value '{value}' for field '{field_name}' already exists"
 
     async def validate_field_update(
         self,
@@ -13,11 +13,11 @@ from pybase.core.exceptions import (
     PermissionDeniedError,
     ValidationError,
 )
-from pybase.models.base import Base
-from pybase.models.table import Table
 from pybase.models.view import View, ViewType
-from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.schemas.view import ViewCreate, ViewUpdate, ViewDuplicate
+from pybase.services.access import ADMIN_ROLES, require_table_access
+from pybase.services.field_index import get_indexed_fields
+from pybase.services.record_query import RecordQueryCompiler
 
 
 class ViewService:
@@ -45,7 +45,7 @@ class ViewService:
 
         """
         # Check if table exists and user has access
-        table = await self._get_table_with_access(db, str(view_data.table_id), user_id)
+        await require_table_access(db, view_data.table_id, user_id)
 
         # Determine position (append to end)
         max_position_query = select(func.max(View.position)).where(
@@ -125,7 +125,7 @@ class ViewService:
             raise NotFoundError("View not found")
 
         # Check user access to table
-        await self._get_table_with_access(db, view.table_id, user_id)
+        await require_table_access(db, view.table_id, user_id)
 
         # Personal views are only visible to creator
         if view.is_personal and view.created_by_id != user_id:
@@ -159,7 +159,7 @@ class ViewService:
 
         """
         # Check user access to table
-        await self._get_table_with_access(db, str(table_id), user_id)
+        await require_table_access(db, str(table_id), user_id)
 
         offset = (page - 1) * page_size
 
@@ -230,11 +230,9 @@ class ViewService:
             # Allow creator to modify
             if view.created_by_id != user_id:
                 # Check if user is workspace admin
-                table = await self._get_table(db, view.table_id)
-                base = await self._get_base(db, table.base_id)
-                member = await self._get_workspace_member(db, base.workspace_id, user_id)
-                if not member or member.role not in [WorkspaceRole.OWNER, WorkspaceRole.ADMIN]:
-                    raise PermissionDeniedError("This view is locked")
+                await require_table_access(
+                    db, view.table_id, user_id, roles=ADMIN_ROLES, message="This view is locked"
+                )
 
         # If setting as default, unset other defaults
         if view_data.is_default:
@@ -317,11 +315,13 @@ class ViewService:
         # Personal views can be deleted by creator
         # Other views require workspace admin/owner
         if view.created_by_id != user_id:
-            table = await self._get_table(db, view.table_id)
-            base = await self._get_base(db, table.base_id)
-            member = await self._get_workspace_member(db, base.workspace_id, user_id)
-            if not member or member.role not in [WorkspaceRole.OWNER, WorkspaceRole.ADMIN]:
-                raise PermissionDeniedError("Only view creator or workspace admin can delete views")
+            await require_table_access(
+                db,
+                view.table_id,
+                user_id,
+                roles=ADMIN_ROLES,
+                message="Only view creator or workspace admin can delete views",
+            )
 
         # If deleting default view, set another as default
         if view.is_default:
@@ -401,7 +401,7 @@ class ViewService:
             Default view
 
         """
-        await self._get_table_with_access(db, table_id, user_id)
+        await require_table_access(db, table_id, user_id)
 
         # Find default view
         query = select(View).where(
@@ -449,7 +449,7 @@ class ViewService:
             Reordered views
 
         """
-        await self._get_table_with_access(db, table_id, user_id)
+        await require_table_access(db, table_id, user_id)
 
         # Update positions
         for position, view_id in enumerate(view_ids):
@@ -561,74 +561,146 @@ class ViewService:
             NotFoundError: If view not found
             PermissionDeniedError: If user doesn't have access
 
+        """
+        result = await self.get_view_data_page(
+            db=db,
+            view_id=view_id,
+            user_id=user_id,
+            page=page,
+            page_size=page_size,
+            override_filters=override_filters,
+            override_sorts=override_sorts,
+            search=search,
+        )
+        return result["records"], result["total"]
+
+    async def get_view_data_page(
+        self,
+        db: AsyncSession,
+        view_id: str,
+        user_id: str,
+        page: int = 1,
+        page_size: int = 100,
+        override_filters: Optional[list] = None,
+        override_sorts: Optional[list] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Get one page of view data with filters, sorts and search run in SQL.
+
+        Filters, search and sorts are compiled to JSONB expressions so that
+        only the requested page of records is loaded. When ``cursor`` is
+        given, keyset pagination is used instead of ``page``.
+
+        Args:
+            db: Database session
+            view_id: View ID
+            user_id: User ID
+            page: Page number (1-indexed), ignored when cursor is given
+            page_size: Number of records per page
+            override_filters: Additional filters to apply
+            override_sorts: Override view sorts
+            search: Search query across all fields
+            cursor: Keyset cursor returned as ``next_cursor`` by a previous call
+
+        Returns:
+            Dictionary with:
+                - records: list of record dicts
+                - total: total number of matching records
+                - next_cursor: keyset cursor for the next page or None
+                - has_more: boolean indicating if there are more records
+
+        Raises:
+            NotFoundError: If view not found
+            PermissionDeniedError: If user doesn't have access
+            ValidationError: If cursor is invalid
+
         """
         from pybase.models.record import Record
 
         # Get view and verify access
         view = await self.get_view_by_id(db, view_id, user_id)
 
-        # Get all records from the table
-        query = select(Record).where(
+        compiler = RecordQueryCompiler(
+            indexed_fields=await get_indexed_fields(db, view.table_id),
+        )
+        conditions = [
             Record.table_id == view.table_id,
             Record.deleted_at.is_(None),
-        )
-        result = await db.execute(query)
-        records = result.scalars().all()
-
-        # Convert records to dict format
-        records_data = []
-        for record in records:
-            try:
-                data = json.loads(record.data) if isinstance(record.data, str) else record.data
-            except (json.JSONDecodeError, TypeError):
-                data = {}
-
-            record_dict = {
-                "id": str(record.id),
-                "table_id": str(record.table_id),
-                "data": data,
-                "row_height": record.row_height or 32,
-                "created_by_id": str(record.created_by_id) if record.created_by_id else None,
-                "last_modified_by_id": str(record.last_modified_by_id) if record.last_modified_by_id else None,
-                "created_at": record.created_at.isoformat() if record.created_at else None,
-                "updated_at": record.updated_at.isoformat() if record.updated_at else None,
-            }
-            records_data.append(record_dict)
+        ]
 
         # Apply view filters
         filters = view.get_filters_list() if hasattr(view, "get_filters_list") else []
-        if filters:
-            records_data = self._apply_filters(records_data, filters)
+        view_filter_clause = compiler.compile_filters(filters)
+        if view_filter_clause is not None:
+            conditions.append(view_filter_clause)
 
         # Apply additional filters if provided
-        if override_filters:
-            override_filters_list = [f.model_dump() for f in override_filters]
-            records_data = self._apply_filters(records_data, override_filters_list)
+        override_filter_clause = compiler.compile_filters(override_filters)
+        if override_filter_clause is not None:
+            conditions.append(override_filter_clause)
 
         # Apply search if provided
         if search:
-            records_data = self._apply_search(records_data, search)
+            conditions.append(compiler.compile_search(search))
 
-        # Apply sorts
-        sorts = override_sorts if override_sorts is not None else (view.get_sorts_list() if hasattr(view, "get_sorts_list") else [])
-        if sorts:
-            if override_sorts:
-                sorts = [s.model_dump() for s in sorts]
-            records_data = self._apply_sorts(records_data, sorts)
+        # Resolve sorts
+        if override_sorts is not None:
+            sorts = override_sorts
+        else:
+            sorts = view.get_sorts_list() if hasattr(view, "get_sorts_list") else []
 
         # Get total count after filtering
-        total = len(records_data)
+        count_query = select(func.count()).select_from(Record).where(*conditions)
+        total = (await db.execute(count_query)).scalar() or 0
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        records_data = records_data[offset : offset + page_size]
+        # Fetch the requested page only (one extra row to detect more results)
+        query = select(Record).where(*conditions).order_by(*compiler.compile_order_by(sorts))
+        if cursor:
+            query = query.where(compiler.keyset_predicate(sorts, cursor))
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size + 1)
+        result = await db.execute(query)
+        records = list(result.scalars().all())
+
+        has_more = len(records) > page_size
+        if has_more:
+            records = records[:page_size]
 
-        return records_data, total
+        next_cursor = None
+        if has_more and records:
+            next_cursor = compiler.encode_cursor(sorts, records[-1])
+
+        return {
+            "records": [self._record_to_dict(record) for record in records],
+            "total": total,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
 
     # ==========================================================================
     # Helper Methods
     # ==========================================================================
 
+    def _record_to_dict(self, record: Any) -> dict[str, Any]:
+        """Convert a Record to the dict format returned by view data endpoints."""
+        try:
+            data = json.loads(record.data) if isinstance(record.data, str) else record.data
+        except (json.JSONDecodeError, TypeError):
+            data = {}
+
+        return {
+            "id": str(record.id),
+            "table_id": str(record.table_id),
+            "data": data,
+            "row_height": record.row_height or 32,
+            "created_by_id": str(record.created_by_id) if record.created_by_id else None,
+            "last_modified_by_id": str(record.last_modified_by_id) if record.last_modified_by_id else None,
+            "created_at": record.created_at.isoformat() if record.created_at else None,
+            "updated_at": record.updated_at.isoformat() if record.updated_at else None,
+        }
+
     def _filter_form_data(
         self,
         data: dict[str, Any],
@@ -693,199 +765,6 @@ class ViewService:
 
         return filtered_data
 
-    def _apply_filters(
-        self,
-        records: list[dict[str, Any]],
-        filters: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Apply filters to records.
-
-        Args:
-            records: List of record dicts
-            filters: List of filter conditions
-
-        Returns:
-            Filtered records
-
-        """
-        if not filters:
-            return records
-
-        filtered_records = []
-        for record in records:
-            if self._record_matches_filters(record, filters):
-                filtered_records.append(record)
-
-        return filtered_records
-
-    def _record_matches_filters(
-        self,
-        record: dict[str, Any],
-        filters: list[dict[str, Any]],
-    ) -> bool:
-        """Check if a record matches all filter conditions.
-
-        Args:
-            record: Record dict
-            filters: List of filter conditions
-
-        Returns:
-            True if record matches filters
-
-        """
-        and_conditions = []
-        or_conditions = []
-
-        for filter_cond in filters:
-            field_id = str(filter_cond.get("field_id", ""))
-            operator = filter_cond.get("operator", "")
-            value = filter_cond.get("value")
-            conjunction = filter_cond.get("conjunction", "and")
-
-            # Get field value from record
-            field_value = record.get("data", {}).get(field_id)
-
-            # Evaluate condition
-            matches = self._evaluate_filter(field_value, operator, value)
-
-            if conjunction == "or":
-                or_conditions.append(matches)
-            else:
-                and_conditions.append(matches)
-
-        # All AND conditions must be true
-        all_ands = all(and_conditions) if and_conditions else True
-        # At least one OR condition must be true (if any OR conditions exist)
-        any_ors = any(or_conditions) if or_conditions else True
-
-        return all_ands and (any_ors if or_conditions else True)
-
-    def _evaluate_filter(
-        self,
-        field_value: Any,
-        operator: str,
-        filter_value: Any,
-    ) -> bool:
-        """Evaluate a single filter condition.
-
-        Args:
-            field_value: Value from record
-            operator: Filter operator
-            filter_value: Value to compare against
-
-        Returns:
-            True if condition matches
-
-        """
-        if operator == "equals":
-            return field_value == filter_value
-        elif operator == "not_equals":
-            return field_value != filter_value
-        elif operator == "contains":
-            return filter_value in str(field_value) if field_value else False
-        elif operator == "not_contains":
-            return filter_value not in str(field_value) if field_value else True
-        elif operator == "is_empty":
-            return field_value is None or field_value == "" or field_value == []
-        elif operator == "is_not_empty":
-            return field_value is not None and field_value != "" and field_value != []
-        elif operator == "gt":
-            return field_value > filter_value if field_value is not None else False
-        elif operator == "lt":
-            return field_value < filter_value if field_value is not None else False
-        elif operator == "gte":
-            return field_value >= filter_value if field_value is not None else False
-        elif operator == "lte":
-            return field_value <= filter_value if field_value is not None else False
-        elif operator == "in":
-            return field_value in filter_value if filter_value else False
-        elif operator == "not_in":
-            return field_value not in filter_value if filter_value else True
-        elif operator == "starts_with":
-            return str(field_value).startswith(str(filter_value)) if field_value else False
-        elif operator == "ends_with":
-            return str(field_value).endswith(str(filter_value)) if field_value else False
-        else:
-            # Unsupported operator, default to True
-            return True
-
-    def _apply_search(
-        self,
-        records: list[dict[str, Any]],
-        search: str,
-    ) -> list[dict[str, Any]]:
-        """Apply search query to records.
-
-        Args:
-            records: List of record dicts
-            search: Search query
-
-        Returns:
-            Filtered records
-
-        """
-        if not search:
-            return records
-
-        search_lower = search.lower()
-        filtered_records = []
-
-        for record in records:
-            # Search across all field values
-            data = record.get("data", {})
-            for value in data.values():
-                if search_lower in str(value).lower():
-                    filtered_records.append(record)
-                    break
-
-        return filtered_records
-
-    def _apply_sorts(
-        self,
-        records: list[dict[str, Any]],
-        sorts: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Apply sort rules to records.
-
-        Args:
-            records: List of record dicts
-            sorts: List of sort rules
-
-        Returns:
-            Sorted records
-
-        """
-        if not sorts:
-            return records
-
-        # Apply sorts in reverse order (last sort first) for stable multi-column sorting
-        for sort_rule in reversed(sorts):
-            field_id = str(sort_rule.get("field_id", ""))
-            direction = sort_rule.get("direction", "asc")
-
-            reverse = direction == "desc"
-
-            def sort_key(record: dict[str, Any]) -> tuple[int, Any]:
-                """Generate sort key handling None/missing values and type consistency.
-
-                Returns tuple of (is_none, value) where:
-                - is_none: 0 for non-None values, 1 for None/missing (sorts to end)
-                - value: the actual value for comparison
-
-                """
-                value = record.get("data", {}).get(field_id)
-
-                # Handle None or missing values - sort to end
-                if value is None or value == "":
-                    return (1, "")
-
-                # Return (0, value) for non-None values to sort them first
-                return (0, value)
-
-            records = sorted(records, key=sort_key, reverse=reverse)
-
-        return records
-
     def _get_type_config(self, view_data: ViewCreate) -> Optional[str]:
         """Extract and serialize type-specific config."""
         config = None
@@ -955,52 +834,3 @@ class ViewService:
         next_view = result.scalar_one_or_none()
         if next_view:
             next_view.is_default = True
-
-    async def _get_table_with_access(
-        self,
-        db: AsyncSession,
-        table_id: str,
-        user_id: str,
-    ) -> Table:
-        """Get table and verify user access."""
-        table = await self._get_table(db, table_id)
-        base = await self._get_base(db, table.base_id)
-        member = await self._get_workspace_member(db, base.workspace_id, user_id)
-        if not member:
-            raise PermissionDeniedError("You don't have access to this table")
-        return table
-
-    async def _get_table(self, db: AsyncSession, table_id: str) -> Table:
-        """Get table by ID."""
-        table = await db.get(Table, table_id)
-        if not table or table.is_deleted:
-            raise NotFoundError("Table not found")
-        return table
-
-    async def _get_base(self, db: AsyncSession, base_id: str) -> Base:
-        """Get base by ID."""
-        base = await db.get(Base, base_id)
-        if not base or base.is_deleted:
-            raise NotFoundError("Base not found")
-        return base
-
-    async def _get_workspace(self, db: AsyncSession, workspace_id: str) -> Workspace:
-        """Get workspace by ID."""
-        workspace = await db.get(Workspace, workspace_id)
-        if not workspace or workspace.is_deleted:
-            raise NotFoundError("Workspace not found")
-        return workspace
-
-    async def _get_workspace_member(
-        self,
-        db: AsyncSession,
-        workspace_id: str,
-        user_id: str,
-    ) -> Optional[WorkspaceMember]:
-        """Get workspace member."""
-        query = select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == user_id,
-        )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
@@ -17,6 +17,7 @@ from pybase.models.workspace import (
     WorkspaceRole,
 )
 from pybase.schemas.workspace import WorkspaceCreate, WorkspaceUpdate
+from pybase.services.access import invalidate_access
 
 
 class WorkspaceService:
@@ -202,6 +203,7 @@ class WorkspaceService:
             raise PermissionDeniedError("Only the workspace owner can delete it")
 
         workspace.soft_delete()
+        await invalidate_access("workspace", workspace_id, db)
 
     async def add_member(
         self,
@@ -254,6 +256,7 @@ class WorkspaceService:
         )
         db.add(new_member)
         await db.refresh(new_member)
+        await invalidate_access("workspace", workspace_id, db)
 
         return new_member
 
@@ -298,6 +301,7 @@ class WorkspaceService:
 
         member.role = role
         await db.refresh(member)
+        await invalidate_access("workspace", workspace_id, db)
 
         return member
 
@@ -336,6 +340,7 @@ class WorkspaceService:
             raise PermissionDeniedError("Cannot remove workspace owner")
 
         await db.delete(member)
+        await invalidate_access("workspace", workspace_id, db)
 
     async def list_workspace_members(
         self,
@@ -0,0 +1,80 @@
+"""Integration tests for reranking ANN index candidates against the database."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.db.ann_index import CADVectorIndex, IVFIndex
+from pybase.db.vector_search import VectorSearchParams, VectorSearchService
+from pybase.models.cad_model import CADModel, CADModelEmbedding
+from pybase.models.user import User
+
+
+async def _create_model(
+    db_session: AsyncSession,
+    user: User,
+    latent: np.ndarray,
+    material: str,
+    category: str,
+    brep: np.ndarray | None = None,
+) -> CADModel:
+    model = CADModel(
+        user_id=str(user.id),
+        file_name=f"{category}.step",
+        file_type="step",
+        material=material,
+        mass_kg=1.5,
+        category_label=category,
+        deepsdf_latent=latent.tolist(),
+    )
+    db_session.add(model)
+    await db_session.flush()
+    if brep is not None:
+        db_session.add(
+            CADModelEmbedding(cad_model_id=str(model.id), brep_graph_embedding=brep.tolist())
+        )
+    await db_session.commit()
+    return model
+
+
+class TestANNMultiModalSearch:
+    """Tests for the ANN path's reranking query on the real schema."""
+
+    @pytest.mark.asyncio
+    async def test_reranks_filters_and_skips_deleted(
+        self, db_session: AsyncSession, test_user: User, tmp_path
+    ):
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=256)
+        bracket = await _create_model(db_session, test_user, query, "steel", "bracket", brep=query)
+        flange = await _create_model(db_session, test_user, query * 1.01, "steel", "flange")
+        deleted = await _create_model(db_session, test_user, query, "steel", "bracket")
+        deleted.deleted_at = datetime.now(timezone.utc)
+        await db_session.commit()
+
+        models = [bracket, flange, deleted]
+        index = CADVectorIndex(path=tmp_path, nprobe=64, reload_interval=3600)
+        index.indexes["sdf_latent"].base = IVFIndex.build(
+            [str(model.id) for model in models],
+            np.array([model.deepsdf_latent for model in models]),
+            nlist=1,
+        )
+        service = VectorSearchService(db_session, ann_index=index)
+
+        results = await service.multi_modal_search(
+            VectorSearchParams(query_vector=query, min_similarity=0.5)
+        )
+
+        assert [str(result.model_id) for result in results] == [str(bracket.id), str(flange.id)]
+        # The B-Rep embedding matches the query; the flange has none (0.5)
+        assert results[0].similarity == pytest.approx(1.0)
+        assert results[1].similarity == pytest.approx(0.7 + 0.3 * 0.5)
+        assert results[0].part_family == "bracket"
+
+        results = await service.multi_modal_search(
+            VectorSearchParams(query_vector=query, min_similarity=0.5, part_family_filter="flange")
+        )
+
+        assert [str(result.model_id) for result in results] == [str(flange.id)]
@@ -0,0 +1,117 @@
+"""
+Recall/latency benchmark of the in-process CAD vector index against pgvector.
+
+Loads the same vectors into a pgvector HNSW index (the path
+``VectorSearchService`` falls back to) and into the in-process IVF index,
+then compares both against exact search:
+
+- recall@10 of the in-process index is at least that of pgvector HNSW
+  minus 0.05, and at least 0.9
+- median query latency of the in-process index is below pgvector's
+
+Skipped when the test database has no pgvector extension. Tune size with
+VECTOR_BENCH_ROWS (default 20000).
+"""
+
+import os
+import statistics
+import time
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.config import settings
+from pybase.db.ann_index import IVFIndex
+
+DIM = 256
+ROWS = int(os.environ.get("VECTOR_BENCH_ROWS", "20000"))
+QUERIES = 100
+K = 10
+
+
+def _dataset(n: int, seed: int) -> np.ndarray:
+    """Clustered unit vectors shaped like DeepSDF latents."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, n // 100), DIM))
+    vectors = centers[rng.integers(0, len(centers), n)] + 0.4 * rng.normal(size=(n, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _vector_literal(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{value:.6f}" for value in vector) + "]"
+
+
+def _recall(found: list[list[int]], truth: np.ndarray) -> float:
+    hits = sum(len(set(ids) & set(row.tolist())) for ids, row in zip(found, truth, strict=True))
+    return hits / (K * len(found))
+
+
+@pytest.mark.asyncio
+async def test_vector_index_recall_and_latency_vs_pgvector(db_session: AsyncSession):
+    """In-process ANN index should match pgvector recall at lower latency."""
+    try:
+        await db_session.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    except Exception:
+        pytest.skip("pgvector extension not available")
+
+    vectors = _dataset(ROWS, seed=0)
+    queries = _dataset(QUERIES, seed=1)
+    truth = np.argsort(-(queries @ vectors.T), axis=1)[:, :K]
+
+    # pgvector HNSW path
+    await db_session.execute(
+        text(f"CREATE TEMP TABLE ann_bench (id integer PRIMARY KEY, v vector({DIM}))")
+    )
+    for start in range(0, ROWS, 1000):
+        await db_session.execute(
+            text("INSERT INTO ann_bench (id, v) VALUES (:id, CAST(:v AS vector))"),
+            [
+                {"id": i, "v": _vector_literal(vectors[i])}
+                for i in range(start, min(start + 1000, ROWS))
+            ],
+        )
+    await db_session.execute(
+        text(
+            "CREATE INDEX ON ann_bench USING hnsw (v vector_cosine_ops) "
+            "WITH (m = 16, ef_construction = 100)"
+        )
+    )
+    await db_session.execute(text("ANALYZE ann_bench"))
+    await db_session.execute(text("SET LOCAL hnsw.ef_search = 100"))
+
+    pg_found, pg_latency = [], []
+    for query in queries:
+        started = time.perf_counter()
+        result = await db_session.execute(
+            text("SELECT id FROM ann_bench ORDER BY v <=> CAST(:q AS vector) LIMIT :k"),
+            {"q": _vector_literal(query), "k": K},
+        )
+        pg_found.append([row.id for row in result])
+        pg_latency.append(time.perf_counter() - started)
+
+    # In-process IVF path
+    started = time.perf_counter()
+    index = IVFIndex.build([str(i) for i in range(ROWS)], vectors)
+    build_seconds = time.perf_counter() - started
+
+    ann_found, ann_latency = [], []
+    for query in queries:
+        started = time.perf_counter()
+        found = index.search(query, K, nprobe=settings.vector_index_nprobe)
+        ann_latency.append(time.perf_counter() - started)
+        ann_found.append([int(model_id) for model_id, _ in found])
+
+    pg_recall, ann_recall = _recall(pg_found, truth), _recall(ann_found, truth)
+    pg_p50 = statistics.median(pg_latency) * 1000
+    ann_p50 = statistics.median(ann_latency) * 1000
+
+    print(f"\nVector index benchmark ({ROWS} x {DIM}, k={K}):")
+    print(f"  pgvector HNSW: recall@{K}={pg_recall:.3f}, p50={pg_p50:.2f}ms")
+    print(f"  in-process IVF: recall@{K}={ann_recall:.3f}, p50={ann_p50:.2f}ms, "
+          f"build={build_seconds:.1f}s")
+
+    assert ann_recall >= 0.9
+    assert ann_recall >= pg_recall - 0.05
+    assert ann_p50 < pg_p50
@@ -141,9 +141,10 @@ async def test_records(
 
     records = []
     for data in records_data:
+        # Record data is keyed by field ID
         record = Record(
             table_id=test_table.id,
-            data=json.dumps(data),
+            data=json.dumps({str(test_fields[name].id): value for name, value in data.items()}),
         )
         db_session.add(record)
         records.append(record)
@@ -10,7 +10,6 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pybase.core.exceptions import (
-    ConflictError,
     NotFoundError,
     PermissionDeniedError,
     ValidationError,
@@ -751,43 +750,43 @@ def test_map_record_data_missing_source_fields(import_service: ImportService) ->
 
 
 @pytest.mark.asyncio
-async def test_validate_record_data_success(
+async def test_validate_rows_success(
     db_session: AsyncSession,
     test_table: Table,
     test_field: Field,
     import_service: ImportService,
 ) -> None:
-    """Test successful record data validation."""
-    data = {str(test_field.id): "test value"}
+    """Test successful row validation."""
+    rows = [{str(test_field.id): "test value"}]
 
-    # Should not raise any exception
-    await import_service._validate_record_data(
+    row_errors = await import_service._validate_rows(
         db_session,
         str(test_table.id),
-        data,
+        rows,
     )
+    assert row_errors == {}
 
 
 @pytest.mark.asyncio
-async def test_validate_record_data_invalid_field_id(
+async def test_validate_rows_invalid_field_id(
     db_session: AsyncSession,
     test_table: Table,
     import_service: ImportService,
 ) -> None:
     """Test validation with invalid field ID."""
-    data = {str(uuid4()): "test value"}
+    rows = [{str(uuid4()): "test value"}]
 
-    with pytest.raises(ConflictError) as exc_info:
-        await import_service._validate_record_data(
-            db_session,
-            str(test_table.id),
-            data,
-        )
-    assert "does not exist in table" in str(exc_info.value)
+    row_errors = await import_service._validate_rows(
+        db_session,
+        str(test_table.id),
+        rows,
+    )
+    assert list(row_errors) == [0]
+    assert "does not exist in table" in row_errors[0]
 
 
 @pytest.mark.asyncio
-async def test_validate_record_data_required_field_missing(
+async def test_validate_rows_required_field_missing(
     db_session: AsyncSession,
     test_table: Table,
     import_service: ImportService,
@@ -803,12 +802,12 @@ async def test_validate_record_data_required_field_missing(
     await db_session.commit()
     await db_session.refresh(required_field)
 
-    data = {str(required_field.id): None}
+    rows = [{str(required_field.id): "present"}, {str(required_field.id): None}]
 
-    with pytest.raises(ConflictError) as exc_info:
-        await import_service._validate_record_data(
-            db_session,
-            str(test_table.id),
-            data,
-        )
-    assert "is required" in str(exc_info.value)
+    row_errors = await import_service._validate_rows(
+        db_session,
+        str(test_table.id),
+        rows,
+    )
+    assert list(row_errors) == [1]
+    assert "is required" in row_errors[1]
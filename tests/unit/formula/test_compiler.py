@@ -0,0 +1,89 @@
+"""Unit tests for FormulaCompiler."""
+
+from datetime import date
+
+import pytest
+from pybase.formula.compiler import FormulaCompiler, compile_formula, evaluate_many
+from pybase.formula.evaluator import FormulaEvaluator
+from pybase.formula.parser import BinaryOpNode, FormulaParser, NumberNode
+
+FORMULAS = [
+    "42",
+    '"hello"',
+    "TRUE",
+    "BLANK()",
+    "{a} + {b}",
+    "{a} - {b} * 2",
+    "{a} / {b}",
+    "{a} / 0",
+    "{a} % {b}",
+    "{a} ^ 2",
+    "-{a}",
+    "-{name}",
+    '{name} & " " & {missing}',
+    "{a} = {b}",
+    "{a} != {b}",
+    "{a} < {b}",
+    "{a} >= {b}",
+    "{a} > 1 AND {b} > 1",
+    "{a} > 100 OR NOT {flag}",
+    'IF({a} > {b}, "big", "small")',
+    "ROUND({a} / 3, 2)",
+    "CONCAT({name}, {a})",
+    "UPPER({name})",
+    "NOSUCHFUNCTION({a})",
+    "{day} + 1",
+    "{day} - {day}",
+]
+
+ROWS = [
+    {"a": 10, "b": 4, "name": "bolt", "flag": True, "day": date(2026, 1, 1)},
+    {"a": 3.5, "b": 3.5, "name": "nut", "flag": False, "day": date(2026, 2, 28)},
+    {"a": None, "b": 2, "name": None, "flag": None, "day": None},
+    {"a": "7", "b": "x", "name": "", "flag": 0, "day": None},
+]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return FormulaParser()
+
+
+class TestFormulaCompiler:
+    """Tests for FormulaCompiler class."""
+
+    @pytest.mark.parametrize("formula", FORMULAS)
+    def test_matches_evaluator(self, parser, formula):
+        """Test compiled formulas give the same results as the tree-walker."""
+        ast = parser.parse(formula)
+        compiled = FormulaCompiler().compile(ast)
+        evaluator = FormulaEvaluator()
+
+        for row in ROWS:
+            assert compiled(row) == evaluator.evaluate(ast, row)
+
+    def test_unknown_operator(self):
+        """Test unknown operators are rejected at compile time."""
+        with pytest.raises(ValueError):
+            FormulaCompiler().compile(BinaryOpNode("<>", NumberNode(1), NumberNode(2)))
+
+
+class TestCompileFormula:
+    """Tests for the cached compile_formula entry point."""
+
+    def test_cached_by_formula_text(self):
+        """Test the same formula text returns the same compiled function."""
+        assert compile_formula("{x} * 3") is compile_formula("{x} * 3")
+
+    def test_cache_is_bounded(self):
+        """Test the compiled formula cache has a maximum size."""
+        assert compile_formula.cache_info().maxsize is not None
+
+    def test_invalid_formula(self):
+        """Test invalid formulas raise ValueError."""
+        with pytest.raises(ValueError):
+            compile_formula("{x} + +")
+
+    def test_evaluate_many(self):
+        """Test evaluating a formula over several records."""
+        assert evaluate_many("{x} * 2", [{"x": 1}, {"x": 2}, {}]) == [2.0, 4.0, None]
@@ -0,0 +1,137 @@
+"""Unit tests for VectorizedEvaluator."""
+
+from datetime import date
+
+import pytest
+from pybase.fields.types.formula import FormulaFieldHandler
+from pybase.formula import vectorized
+from pybase.formula.evaluator import FormulaEvaluator
+from pybase.formula.parser import FormulaParser
+from pybase.formula.vectorized import VectorizedEvaluator
+
+FORMULAS = [
+    "42",
+    '"text"',
+    "{qty}",
+    "{name}",
+    "{qty} * {cost}",
+    "{qty} + {cost}",
+    "{qty} - {cost}",
+    "{qty} / {cost}",
+    "{qty} % {cost}",
+    "{qty} ^ 2",
+    "-{qty}",
+    "-{name}",
+    "{qty} = {cost}",
+    "{qty} != {cost}",
+    "{qty} < {cost}",
+    "{qty} <= {cost}",
+    "{qty} > {cost}",
+    "{qty} >= {cost}",
+    "{qty} > 2 AND {active}",
+    "{qty} > 2 OR NOT {active}",
+    "{active} + 1",
+    "{mixed} * 2",
+    "{mixed} & {name}",
+    '{name} & "-" & {qty}',
+    "ROUND({qty} * {cost}, 2)",
+    "ROUND({cost}, {qty})",
+    "ROUND({name}, 1)",
+    'IF({qty} > 2, {qty} * {cost}, 0)',
+    'IF({active}, "yes", "no")',
+    "IF({qty} > 2, {qty})",
+    "ABS({cost})",
+    "SQRT({cost})",
+    "INT({cost})",
+    "MOD({qty}, 3)",
+    "SUM({qty}, {cost}, 1)",
+    "AVG({qty}, {cost})",
+    "MIN({qty}, {cost})",
+    "MAX({qty}, {cost})",
+    "AND({qty}, {active})",
+    "OR({qty}, {active})",
+    "NOT({qty})",
+    "UPPER({name})",
+    "LEN({name}) + {qty}",
+    "NOSUCHFUNCTION({qty})",
+    "{day} + {qty}",
+    "{day} - {day}",
+]
+
+ROWS = [
+    {"qty": 3, "cost": 2.5, "active": True, "name": "bolt", "mixed": 4, "day": date(2026, 1, 1)},
+    {"qty": 0, "cost": 0, "active": False, "name": "", "mixed": "4", "day": date(2026, 3, 1)},
+    {"qty": None, "cost": -4.35, "active": None, "name": None, "mixed": None, "day": None},
+    {"qty": 7, "cost": None, "active": True, "name": "nut", "mixed": "x", "day": None},
+    {"qty": -2, "cost": 4.35, "active": False, "name": "washer", "mixed": 1.5, "day": None},
+]
+
+
+def _scalar(ast, rows):
+    evaluator = FormulaEvaluator()
+    results = []
+    for row in rows:
+        try:
+            results.append(evaluator.evaluate(ast, row))
+        except Exception:
+            results.append(None)
+    return results
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return FormulaParser()
+
+
+class TestVectorizedEvaluator:
+    """Tests for VectorizedEvaluator class."""
+
+    @pytest.mark.parametrize("formula", FORMULAS)
+    def test_matches_scalar_evaluator(self, parser, formula):
+        """Test column results equal per-row FormulaEvaluator results."""
+        ast = parser.parse(formula)
+
+        assert VectorizedEvaluator().evaluate(ast, ROWS) == _scalar(ast, ROWS)
+
+    def test_keeps_field_values_unchanged(self, parser):
+        """Test plain field references return the original values."""
+        result = VectorizedEvaluator().evaluate(parser.parse("{qty}"), ROWS)
+
+        assert result == [3, 0, None, 7, -2]
+        assert isinstance(result[0], int)
+
+    def test_failing_rows_yield_none(self, parser):
+        """Test a row whose evaluation raises yields None without failing the batch."""
+        rows = [{"x": 2.0}, {"x": 1e300}]
+
+        result = VectorizedEvaluator().evaluate(parser.parse("{x} ^ 10"), rows)
+
+        assert result == [1024.0, None]
+
+    def test_empty_rows(self, parser):
+        """Test evaluating over no records."""
+        assert VectorizedEvaluator().evaluate(parser.parse("{a} * 2"), []) == []
+
+    def test_without_numpy(self, parser, monkeypatch):
+        """Test per-row fallback when NumPy is not installed."""
+        monkeypatch.setattr(vectorized, "NUMPY_AVAILABLE", False)
+        ast = parser.parse("{qty} * {cost}")
+
+        assert VectorizedEvaluator().evaluate(ast, ROWS) == _scalar(ast, ROWS)
+
+
+class TestComputeMany:
+    """Tests for FormulaFieldHandler.compute_many."""
+
+    def test_matches_compute(self):
+        """Test batch results equal per-record compute results."""
+        formula = "{qty} * {cost}"
+        options = {"result_type": "number", "precision": 1}
+
+        expected = [FormulaFieldHandler.compute(formula, row, options) for row in ROWS]
+
+        assert FormulaFieldHandler.compute_many(formula, ROWS, options) == expected
+
+    def test_invalid_formula(self):
+        """Test invalid formulas yield None for every record."""
+        assert FormulaFieldHandler.compute_many("{a} + +", ROWS[:2]) == [None, None]
@@ -0,0 +1,217 @@
+"""
+Unit tests for single-query table access resolution and its cache.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.cache import access_cache
+from pybase.cache.access_cache import AccessCache
+from pybase.core.exceptions import NotFoundError, PermissionDeniedError
+from pybase.models.workspace import WorkspaceRole
+from pybase.services.access import (
+    EDITOR_ROLES,
+    get_table_access,
+    invalidate_access,
+    require_table_access,
+)
+
+
+class FakePubSub:
+    """In-memory stand-in for the realtime Redis pub/sub manager."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+        self.stopped_handlers: list = []
+        self.published: list[tuple[str, dict]] = []
+
+    def on_message(self, channel: str, handler) -> None:
+        self.handlers.setdefault(channel, []).append(handler)
+
+    def off_message(self, channel: str, handler) -> None:
+        if handler in self.handlers.get(channel, []):
+            self.handlers[channel].remove(handler)
+
+    def on_listener_stopped(self, handler) -> None:
+        self.stopped_handlers.append(handler)
+
+    def off_listener_stopped(self, handler) -> None:
+        if handler in self.stopped_handlers:
+            self.stopped_handlers.remove(handler)
+
+    async def subscribe(self, channel: str) -> bool:
+        return True
+
+    async def start_listener(self) -> bool:
+        return True
+
+    async def publish(self, channel: str, message: dict) -> bool:
+        self.published.append((channel, message))
+        return True
+
+    def deliver(self, channel: str, message: dict) -> None:
+        """Simulate a message published by another worker."""
+        for handler in self.handlers.get(channel, []):
+            handler(message)
+
+
+class FakeSession:
+    """Session returning one access row per execute call."""
+
+    def __init__(self, row) -> None:
+        self.row = row
+        self.queries: list = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return SimpleNamespace(first=lambda: self.row)
+
+
+def _row(role="editor", table_deleted=None, base_deleted=None, workspace_deleted=None):
+    return SimpleNamespace(
+        Table=SimpleNamespace(is_deleted=table_deleted is not None),
+        base_id="b1",
+        base_deleted_at=base_deleted,
+        workspace_id="w1",
+        workspace_deleted_at=workspace_deleted,
+        role=role,
+    )
+
+
+@pytest.fixture(autouse=True)
+def pubsub(monkeypatch) -> FakePubSub:
+    """Isolate the access cache and pub/sub manager per test."""
+    fake = FakePubSub()
+    monkeypatch.setattr("pybase.realtime.redis_pubsub.get_pubsub_manager", lambda: fake)
+    monkeypatch.setattr(access_cache.invalidations, "subscribed", False)
+    access_cache.local_access.clear()
+    yield fake
+    access_cache.local_access.clear()
+
+
+class TestTableAccess:
+    """Tests for resolving table access."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_chain_in_one_query(self):
+        db = FakeSession(_row(role="editor"))
+
+        access = await get_table_access(db, "t1", "u1")
+
+        assert len(db.queries) == 1
+        assert (access.table_id, access.base_id, access.workspace_id) == ("t1", "b1", "w1")
+        assert access.role == WorkspaceRole.EDITOR
+        assert access.has_role(EDITOR_ROLES)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            (None, "Table not found"),
+            (_row(table_deleted=datetime.now(timezone.utc)), "Table not found"),
+            (_row(base_deleted=datetime.now(timezone.utc)), "Base not found"),
+            (_row(workspace_deleted=datetime.now(timezone.utc)), "Workspace not found"),
+        ],
+    )
+    async def test_missing_or_deleted_chain(self, row, message):
+        with pytest.raises(NotFoundError, match=message):
+            await get_table_access(FakeSession(row), "t1", "u1")
+
+    @pytest.mark.asyncio
+    async def test_require_checks_membership_and_role(self):
+        with pytest.raises(PermissionDeniedError, match="You don't have access"):
+            await require_table_access(FakeSession(_row(role=None)), "t1", "u1")
+
+        with pytest.raises(PermissionDeniedError, match="editors only"):
+            await require_table_access(
+                FakeSession(_row(role="viewer")),
+                "t2",
+                "u1",
+                roles=EDITOR_ROLES,
+                message="editors only",
+            )
+
+
+class TestAccessCache:
+    """Tests for caching and invalidating resolutions."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_checks_skip_the_database(self):
+        db = FakeSession(_row())
+
+        await get_table_access(db, "t1", "u1")
+        await get_table_access(db, "t1", "u1")
+
+        assert len(db.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_everywhere(self, pubsub):
+        db = FakeSession(_row(role="viewer"))
+        await get_table_access(db, "t1", "u1")
+
+        db.row = _row(role="admin")
+        await invalidate_access("workspace", "w1")
+
+        assert (await get_table_access(db, "t1", "u1")).role == WorkspaceRole.ADMIN
+        assert pubsub.published == [
+            (
+                AccessCache.INVALIDATION_CHANNEL,
+                {"event": "invalidate", "scope": "workspace", "id": "w1"},
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_change_invalidated_again_after_commit(self, pubsub):
+        db = FakeSession(_row(role="viewer"))
+        session = AsyncSession()
+
+        await invalidate_access("workspace", "w1", session)
+        # Resolved by a concurrent request before the change commits
+        await get_table_access(db, "t1", "u1")
+        db.row = _row(role="admin")
+        await session.commit()
+        await asyncio.sleep(0)
+
+        assert (await get_table_access(db, "t1", "u1")).role == WorkspaceRole.ADMIN
+        assert len(pubsub.published) == 2
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_change_not_invalidated_again(self, pubsub):
+        session = AsyncSession()
+
+        await session.begin()
+        await invalidate_access("workspace", "w1", session)
+        await session.rollback()
+        await session.commit()
+        await asyncio.sleep(0)
+
+        assert len(pubsub.published) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_from_another_worker(self, pubsub):
+        db = FakeSession(_row(role="editor"))
+        await get_table_access(db, "t1", "u1")
+
+        pubsub.deliver(
+            AccessCache.INVALIDATION_CHANNEL, {"event": "invalidate", "scope": "user", "id": "u1"}
+        )
+        await get_table_access(db, "t1", "u1")
+
+        assert len(db.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_not_cached_without_subscription(self, pubsub, monkeypatch):
+        async def unavailable(channel: str) -> bool:
+            return False
+
+        monkeypatch.setattr(pubsub, "subscribe", unavailable)
+        db = FakeSession(_row())
+
+        await get_table_access(db, "t1", "u1")
+        await get_table_access(db, "t1", "u1")
+
+        assert len(db.queries) == 2
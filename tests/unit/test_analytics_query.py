@@ -0,0 +1,146 @@
+"""
+Unit tests for SQL compilation of analytics aggregations.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from pybase.core.exceptions import ValidationError
+from pybase.services.analytics_query import (
+    AnalyticsQueryCompiler,
+    normalize_analytics_filters,
+    to_python_number,
+)
+
+
+def _sql(clause) -> str:
+    """Render a clause as PostgreSQL with inline parameters."""
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+@pytest.fixture
+def compiler() -> AnalyticsQueryCompiler:
+    return AnalyticsQueryCompiler()
+
+
+class TestAggregates:
+    """Tests for aggregate expressions."""
+
+    @pytest.mark.parametrize(
+        ("aggregation_type", "expected"),
+        [
+            ("sum", "sum(CASE WHEN"),
+            ("avg", "avg(CASE WHEN"),
+            ("min", "min(CASE WHEN"),
+            ("max", "max(CASE WHEN"),
+            ("median", "percentile_cont(0.5) WITHIN GROUP (ORDER BY CASE WHEN"),
+            ("distinct_count", "count(DISTINCT CASE WHEN"),
+            ("count", "count(*)"),
+        ],
+    )
+    def test_aggregate_functions(self, compiler, aggregation_type, expected):
+        sql = _sql(compiler.aggregate(aggregation_type, "cost"))
+
+        assert sql.startswith(expected)
+
+    def test_numeric_value_accepts_numbers_and_numeric_strings(self, compiler):
+        sql = _sql(compiler.numeric("cost"))
+
+        assert "jsonb_typeof(records.data -> 'cost') = 'number'" in sql
+        assert "jsonb_typeof(records.data -> 'cost') = 'string'" in sql
+        assert "CAST(records.data ->> 'cost' AS NUMERIC)" in sql
+
+    def test_invalid_aggregation_type(self, compiler):
+        with pytest.raises(ValidationError):
+            compiler.aggregate("mode", "cost")
+
+    def test_value_key_required(self, compiler):
+        with pytest.raises(ValidationError):
+            compiler.aggregate("sum", None)
+
+    def test_cell_filter(self, compiler):
+        cell = compiler.aggregate("count", None, where=compiler.is_present("status"))
+
+        assert _sql(cell).startswith("count(*) FILTER (WHERE")
+
+
+class TestQueries:
+    """Tests for the aggregate, group and pivot queries."""
+
+    def test_aggregate_query_filters_in_sql(self, compiler):
+        query = compiler.aggregate_query(
+            "tbl",
+            "cost",
+            "sum",
+            [{"field_id": "fld", "operator": "greater_than", "value": 10}],
+        )
+        sql = _sql(query)
+
+        assert "records.table_id = 'tbl'" in sql
+        assert "records.deleted_at IS NULL" in sql
+        assert "(records.data -> 'fld') > CAST('10' AS JSONB)" in sql
+        assert "AS value_count" in sql
+
+    def test_group_query(self, compiler):
+        sql = _sql(compiler.group_query("tbl", "status", "cost", "avg", limit=10))
+
+        assert "GROUP BY CASE WHEN" in sql
+        assert "sum(count(*)) OVER () AS record_count" in sql
+        assert 'ORDER BY coalesce(avg(' in sql
+        assert sql.rstrip().endswith("LIMIT 10")
+
+    def test_group_key_renders_inline(self, compiler):
+        """Select-list and GROUP BY expressions must compile identically."""
+        query = compiler.group_query("tbl", "status", None, "count")
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        group_expr = sql.split(' AS "group"')[0].removeprefix("SELECT ")
+
+        assert f"GROUP BY {group_expr}" in sql
+
+    def test_pivot_query_uses_filter_per_column(self, compiler):
+        query = compiler.pivot_query(
+            "tbl", "status", "priority", ["High", None], "cost", "sum"
+        )
+        sql = _sql(query)
+
+        assert "= CAST('\"High\"' AS JSONB)) AS c0" in sql
+        assert "END IS NULL) AS c1" in sql
+        assert sql.count("FILTER (WHERE") == 2
+
+    def test_statistics_query(self, compiler):
+        sql = _sql(compiler.statistics_query("tbl", "cost"))
+
+        for column in ("count", "numeric_count", "sum", "avg", "min", "max", "median", "distinct_count"):
+            assert f"AS {column}" in sql
+
+    def test_most_common_query(self, compiler):
+        sql = _sql(compiler.most_common_query("tbl", "status"))
+
+        assert "ORDER BY count(*) DESC" in sql
+        assert sql.rstrip().endswith("LIMIT 5")
+
+
+class TestHelpers:
+    """Tests for filter normalization and result conversion."""
+
+    def test_normalize_analytics_filters(self):
+        filters = normalize_analytics_filters(
+            [
+                {"field_id": "a", "operator": "less_than", "value": 3},
+                {"field_id": "b", "value": "x"},
+            ]
+        )
+
+        assert filters == [
+            {"field_id": "a", "operator": "lt", "value": 3, "conjunction": "and"},
+            {"field_id": "b", "operator": "equals", "value": "x", "conjunction": "and"},
+        ]
+
+    def test_to_python_number(self):
+        assert to_python_number(Decimal("2.5")) == 2.5
+        assert to_python_number(3) == 3
+        assert to_python_number(None) is None
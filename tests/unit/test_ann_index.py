@@ -0,0 +1,214 @@
+"""
+Unit tests for the in-process CAD vector index.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from pybase.db.ann_index import CADVectorIndex, IVFIndex
+from pybase.db.vector_search import VectorSearchParams, VectorSearchService
+
+DIM = 32
+
+
+def _clustered(n: int, seed: int = 0) -> np.ndarray:
+    """Vectors drawn around a few dozen directions, like real embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(40, DIM))
+    return (centers[rng.integers(0, 40, n)] + 0.3 * rng.normal(size=(n, DIM))).astype(np.float32)
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> set[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return set(np.argsort(-(unit @ (query / np.linalg.norm(query))))[:k].tolist())
+
+
+class TestIVFIndex:
+    """Tests for building and querying the IVF index."""
+
+    def test_recall_against_exact_search(self):
+        vectors = _clustered(4000)
+        ids = [str(i) for i in range(len(vectors))]
+        index = IVFIndex.build(ids, vectors)
+        queries = _clustered(50, seed=1)
+
+        hits = 0
+        for query in queries:
+            found = index.search(query / np.linalg.norm(query), k=10, nprobe=8)
+            hits += len({int(model_id) for model_id, _ in found} & _exact(vectors, query, 10))
+
+        assert hits / (10 * len(queries)) >= 0.9
+
+    def test_results_are_sorted_and_excluded_ids_skipped(self):
+        vectors = _clustered(200)
+        index = IVFIndex.build([str(i) for i in range(200)], vectors, nlist=4)
+        query = vectors[7] / np.linalg.norm(vectors[7])
+
+        found = index.search(query, k=5, nprobe=4)
+        assert found[0][0] == "7"
+        assert [s for _, s in found] == sorted((s for _, s in found), reverse=True)
+
+        assert "7" not in dict(index.search(query, k=5, nprobe=4, exclude={"7"}))
+
+    def test_save_and_memory_mapped_load(self, tmp_path):
+        vectors = _clustered(100)
+        index = IVFIndex.build([str(i) for i in range(100)], vectors, nlist=4)
+        index.save(tmp_path)
+
+        loaded = IVFIndex.load(tmp_path)
+
+        assert isinstance(loaded.vectors, np.memmap)
+        query = vectors[3] / np.linalg.norm(vectors[3])
+        assert loaded.search(query, 3, 4) == index.search(query, 3, 4)
+
+
+class TestCADVectorIndex:
+    """Tests for incremental updates and snapshots."""
+
+    def _index(self, tmp_path) -> CADVectorIndex:
+        return CADVectorIndex(
+            path=tmp_path, nprobe=4, rebuild_fraction=0.5, max_staleness=3600, reload_interval=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_delta_updates_are_searchable_and_folded_on_rebuild(self, tmp_path):
+        index = self._index(tmp_path)
+        vectors = _clustered(20)
+        for i, vector in enumerate(vectors):
+            index.indexes["fused"].upsert(str(i), vector)
+
+        assert index.search("fused", vectors[5], 1)[0][0] == "5"
+
+        await index.rebuild(["fused"])
+        assert index.indexes["fused"].pending == 0
+        assert len(index.indexes["fused"].base) == 20
+
+        index.update_model("5", {"fused": None})
+        assert "5" not in dict(index.search("fused", vectors[5], 20))
+
+    @pytest.mark.asyncio
+    async def test_other_processes_load_new_snapshots(self, tmp_path):
+        writer = self._index(tmp_path)
+        vectors = _clustered(10)
+        for i, vector in enumerate(vectors):
+            writer.indexes["text"].upsert(str(i), vector)
+        await writer.rebuild(["text"])
+
+        reader = self._index(tmp_path)
+
+        assert reader.is_ready("text")
+        assert not reader.is_ready("image")
+        assert reader.search("text", vectors[2], 1)[0][0] == "2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_keep_each_others_changes(self, tmp_path):
+        vectors = _clustered(12)
+        first = self._index(tmp_path)
+        for i, vector in enumerate(vectors[:10]):
+            first.indexes["text"].upsert(str(i), vector)
+        await first.rebuild(["text"])
+        second = self._index(tmp_path)
+        second.load()
+
+        first.indexes["text"].upsert("10", vectors[10])
+        first.indexes["text"].remove("3")
+        second.indexes["text"].upsert("11", vectors[11])
+        await first.rebuild(["text"])
+        await second.rebuild(["text"])
+
+        reader = self._index(tmp_path)
+        reader.load()
+        ids = {str(model_id) for model_id in reader.indexes["text"].base.ids}
+        assert ids == {str(i) for i in range(12)} - {"3"}
+
+    @pytest.mark.asyncio
+    async def test_maintenance_rebuilds_stale_deltas(self, tmp_path):
+        index = CADVectorIndex(
+            path=tmp_path, nprobe=4, rebuild_fraction=0.5, max_staleness=0, reload_interval=0.01
+        )
+        index.indexes["fused"].upsert("a", _clustered(1)[0])
+
+        index.start()
+        try:
+            for _ in range(100):
+                if index.indexes["fused"].pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await index.stop()
+
+        assert index.indexes["fused"].pending == 0
+        assert len(index.indexes["fused"].base) == 1
+
+    def test_dimension_mismatch(self, tmp_path):
+        index = self._index(tmp_path)
+        index.indexes["fused"].base = IVFIndex.build(["a"], np.ones((1, DIM)))
+
+        with pytest.raises(ValueError):
+            index.search("fused", np.ones(DIM + 1), 1)
+
+
+class FakeSession:
+    """Session recording the reranking query."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.params: list[dict] = []
+
+    async def execute(self, sql, params=None):
+        self.params.append(params)
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+
+class TestVectorSearchServiceANN:
+    """Tests for answering multi-modal search from the ANN index."""
+
+    def _service(self, tmp_path, rows: list, count: int = 50) -> tuple:
+        index = CADVectorIndex(path=tmp_path, nprobe=64, reload_interval=3600)
+        vectors = np.random.default_rng(0).normal(size=(count, 256))
+        index.indexes["sdf_latent"].base = IVFIndex.build(
+            [str(uuid4()) for _ in range(count)], vectors, nlist=1
+        )
+        session = FakeSession(rows)
+        return VectorSearchService(session, ann_index=index), session, vectors
+
+    def _row(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            model_id=uuid4(),
+            part_family=None,
+            material="steel",
+            mass_kg=1.0,
+            shape_similarity=0.9,
+            shape_rank=1,
+            composite_score=0.9,
+        )
+
+    @pytest.mark.asyncio
+    async def test_candidates_come_from_index(self, tmp_path):
+        service, session, vectors = self._service(tmp_path, [self._row()])
+
+        results = await service.multi_modal_search(
+            VectorSearchParams(query_vector=vectors[0], min_similarity=0.5)
+        )
+
+        assert len(results) == 1
+        params = session.params[0]
+        assert params["similarities"][0] == pytest.approx(1.0)
+        assert all(similarity > 0.5 for similarity in params["similarities"])
+
+    @pytest.mark.asyncio
+    async def test_filtered_shortfall_falls_back_to_pgvector(self, tmp_path, monkeypatch):
+        service, session, vectors = self._service(tmp_path, [], count=20)
+        monkeypatch.setattr(VectorSearchService, "CANDIDATE_POOL", 20)
+
+        await service.multi_modal_search(
+            VectorSearchParams(query_vector=vectors[0], min_similarity=-1.0, material_filter="Ti")
+        )
+
+        # Reranking query, then the pgvector query
+        assert len(session.params) == 2
+        assert "model_ids" not in session.params[1]
@@ -0,0 +1,319 @@
+"""
+Unit tests for the authentication fast path: principal cache, token
+blacklist filter and buffered API key usage.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from pybase.api import deps
+from pybase.cache import auth_cache
+from pybase.cache.auth_cache import BloomFilter, PrincipalCache, TokenBlacklistFilter
+from pybase.core.security import TokenPayload
+from pybase.db.base import utc_now
+from pybase.services.api_key_usage import APIKeyUsageBuffer
+
+
+class FakePubSub:
+    """In-memory stand-in for the realtime Redis pub/sub manager."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+        self.stopped_handlers: list = []
+        self.published: list[tuple[str, dict]] = []
+
+    def on_message(self, channel: str, handler) -> None:
+        self.handlers.setdefault(channel, []).append(handler)
+
+    def off_message(self, channel: str, handler) -> None:
+        if handler in self.handlers.get(channel, []):
+            self.handlers[channel].remove(handler)
+
+    def on_listener_stopped(self, handler) -> None:
+        self.stopped_handlers.append(handler)
+
+    def off_listener_stopped(self, handler) -> None:
+        if handler in self.stopped_handlers:
+            self.stopped_handlers.remove(handler)
+
+    async def subscribe(self, channel: str) -> bool:
+        return True
+
+    async def start_listener(self) -> bool:
+        return True
+
+    async def publish(self, channel: str, message: dict) -> bool:
+        self.published.append((channel, message))
+        return True
+
+    def deliver(self, channel: str, message: dict) -> None:
+        """Simulate a message published by another worker."""
+        for handler in self.handlers.get(channel, []):
+            handler(message)
+
+
+class FakeRedis:
+    """Redis client holding a set of keys."""
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = keys
+
+    async def scan_iter(self, match: str, count: int = 10):
+        prefix = match.rstrip("*")
+        for key in self.keys:
+            if key.startswith(prefix):
+                yield key
+
+
+class FakeSession:
+    """Session returning preset objects and recording queries."""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.queries: list = []
+        self.merged: list = []
+
+    async def execute(self, query, params=None):
+        self.queries.append(query)
+        value = self.results.pop(0) if self.results else None
+        return SimpleNamespace(scalar_one_or_none=lambda: value)
+
+    async def merge(self, instance, load=True):
+        self.merged.append((instance, load))
+        return instance
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user(user_id: str = "u1") -> SimpleNamespace:
+    return SimpleNamespace(id=user_id, email=f"{user_id}@example.com")
+
+
+@pytest.fixture(autouse=True)
+def pubsub(monkeypatch) -> FakePubSub:
+    """Isolate the principal cache, blacklist filter and pub/sub manager per test."""
+    fake = FakePubSub()
+    monkeypatch.setattr("pybase.realtime.redis_pubsub.get_pubsub_manager", lambda: fake)
+    monkeypatch.setattr(auth_cache.invalidations, "subscribed", False)
+    # Users are rebuilt from plain column dicts
+    monkeypatch.setattr(deps, "_user_columns", lambda user: dict(vars(user)))
+    monkeypatch.setattr(deps, "User", lambda **columns: SimpleNamespace(**columns))
+    monkeypatch.setattr(deps, "make_transient_to_detached", lambda instance: None)
+    monkeypatch.setattr(deps, "_load_active_user", _load_from_session)
+    auth_cache.local_principals.clear()
+    auth_cache.blacklist_filter.reset()
+    yield fake
+    auth_cache.local_principals.clear()
+    auth_cache.blacklist_filter.reset()
+
+
+async def _load_from_session(db, user_id):
+    return (await db.execute(("user", user_id))).scalar_one_or_none()
+
+
+class TestBloomFilter:
+    """Tests for the bloom filter."""
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(1000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+
+
+class TestTokenBlacklistFilter:
+    """Tests for syncing and consulting the blacklist filter."""
+
+    @pytest.mark.asyncio
+    async def test_unsynced_filter_defers_to_redis(self):
+        blacklist = TokenBlacklistFilter(capacity=100, error_rate=0.01)
+
+        assert not await blacklist.excludes(FakeRedis([]), "session:blacklist", "a")
+
+    @pytest.mark.asyncio
+    async def test_sync_and_live_updates(self, pubsub):
+        blacklist = TokenBlacklistFilter(capacity=100, error_rate=0.001)
+        redis = FakeRedis(["session:blacklist:old", "session:user:u1:s1"])
+
+        await blacklist.sync(redis, "session:blacklist")
+
+        assert not await blacklist.excludes(redis, "session:blacklist", "old")
+        assert await blacklist.excludes(redis, "session:blacklist", "new")
+
+        blacklist.add("new")
+        assert not await blacklist.excludes(redis, "session:blacklist", "new")
+
+    @pytest.mark.asyncio
+    async def test_resync_forgets_expired_entries(self):
+        clock = FakeClock()
+        blacklist = TokenBlacklistFilter(
+            capacity=100, error_rate=0.001, resync_interval=60, clock=clock
+        )
+        redis = FakeRedis(["session:blacklist:a"])
+        await blacklist.sync(redis, "session:blacklist")
+
+        redis.keys = []
+        clock.now = 61
+        await blacklist.excludes(redis, "session:blacklist", "a")
+        await blacklist._sync_task
+
+        assert await blacklist.excludes(redis, "session:blacklist", "a")
+
+
+class TestPrincipalCache:
+    """Tests for serving authenticated users from the principal cache."""
+
+    @pytest.fixture
+    def token(self, monkeypatch):
+        payload = TokenPayload(
+            sub="u1",
+            exp=utc_now() + timedelta(minutes=5),
+            iat=utc_now(),
+            type="access",
+            jti="jti-1",
+        )
+
+        async def verify(token, token_type="access"):
+            return payload
+
+        monkeypatch.setattr(deps, "verify_token", verify)
+        return HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_user_query(self, token):
+        db = FakeSession(_user())
+
+        first = await deps.get_current_user(db, token)
+        second = await deps.get_current_user(db, token)
+
+        assert len(db.queries) == 1
+        assert first.id == second.id == "u1"
+        assert db.merged[0][1] is False
+
+    @pytest.mark.asyncio
+    async def test_user_invalidation_reaches_other_workers(self, token, pubsub):
+        db = FakeSession(_user(), _user())
+        await deps.get_current_user(db, token)
+
+        pubsub.deliver(
+            PrincipalCache.INVALIDATION_CHANNEL,
+            {"event": "invalidate", "scope": "user", "id": "u1"},
+        )
+        await deps.get_current_user(db, token)
+
+        assert len(db.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_blacklisting_drops_token_and_updates_filter(self, token, pubsub):
+        db = FakeSession(_user(), _user())
+        await deps.get_current_user(db, token)
+        auth_cache.blacklist_filter._filter = BloomFilter(100, 0.001)
+
+        await PrincipalCache().invalidate("jwt", "jti-1")
+
+        assert "jti-1" in auth_cache.blacklist_filter._filter
+        assert len(auth_cache.local_principals) == 0
+        assert pubsub.published == [
+            (
+                PrincipalCache.INVALIDATION_CHANNEL,
+                {"event": "invalidate", "scope": "jwt", "id": "jti-1"},
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_api_key_skips_hash_check(self, monkeypatch):
+        checks = []
+        valid_key = "pb_abcdefghijklmnop"
+
+        def verify(key, hashed):
+            checks.append(key)
+            return key == valid_key
+
+        monkeypatch.setattr(deps, "verify_api_key", verify)
+        usage = APIKeyUsageBuffer(flush_interval=60)
+        monkeypatch.setattr(usage, "_ensure_started", lambda: None)
+        monkeypatch.setattr(deps, "get_api_key_usage_buffer", lambda: usage)
+        api_key = SimpleNamespace(id="k1", user_id="u1", hashed_key="h", expires_at=None)
+        api_key.is_expired = False
+        db = FakeSession(api_key, _user(), api_key)
+
+        for _ in range(3):
+            user = await deps.get_user_from_api_key(db, valid_key)
+
+        assert user.id == "u1"
+        assert len(checks) == 1
+        assert len(db.queries) == 2
+        assert len(usage) == 1
+
+        # A different key with the same prefix is checked again
+        assert await deps.get_user_from_api_key(db, "pb_abcdefghijXXXXXX") is None
+        assert len(checks) == 2
+
+
+class TestAPIKeyUsageBuffer:
+    """Tests for batching API key usage writes."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_one_bulk_update(self):
+        executed = []
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, statement, rows):
+                executed.append(rows)
+
+            async def commit(self):
+                pass
+
+        usage = APIKeyUsageBuffer(session_factory=Session, flush_interval=60)
+        usage._ensure_started = lambda: None
+        usage.record("k1", "10.0.0.1")
+        usage.record("k1")
+        usage.record("k2")
+
+        await usage.flush()
+
+        assert len(executed) == 1
+        rows = {row["id"]: row for row in executed[0]}
+        assert set(rows) == {"k1", "k2"}
+        assert rows["k1"]["last_used_ip"] == "10.0.0.1"
+        assert "last_used_ip" not in rows["k2"]
+        assert len(usage) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_usage(self):
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self, statement, rows):
+                raise RuntimeError("database unavailable")
+
+        usage = APIKeyUsageBuffer(session_factory=Session, flush_interval=60)
+        usage._ensure_started = lambda: None
+        usage.record("k1")
+
+        with pytest.raises(RuntimeError):
+            await usage.flush()
+
+        assert len(usage) == 1
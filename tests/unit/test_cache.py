@@ -0,0 +1,416 @@
+"""Unit tests for the record and chart caches."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pybase.cache import record_cache
+from pybase.cache.chart_cache import ChartCache
+from pybase.cache.local_cache import LocalCache
+from pybase.cache.record_cache import RecordCache
+
+
+class FakePipeline:
+    """Non-transactional pipeline over FakeRedis."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list[str] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def incr(self, key: str) -> None:
+        self.commands.append(key)
+
+    async def execute(self) -> list[int]:
+        return [await self.redis.incr(key) for key in self.commands]
+
+
+class FakeRedis:
+    """Dict-backed subset of the redis.asyncio client used by the caches."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def mget(self, *keys):
+        if len(keys) == 1 and isinstance(keys[0], list):
+            keys = keys[0]
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def scan_iter(self, match: str):
+        raise AssertionError("invalidation must not scan the keyspace")
+
+
+class FakePubSub:
+    """Pub/sub manager delivering published messages to local handlers."""
+
+    def __init__(self, available: bool = False) -> None:
+        self.available = available
+        self.handlers: dict[str, list] = {}
+        self.stopped_handlers: list = []
+        self.published: list[tuple[str, dict]] = []
+
+    def on_message(self, channel, handler) -> None:
+        self.handlers.setdefault(channel, []).append(handler)
+
+    def off_message(self, channel, handler=None) -> None:
+        self.handlers.pop(channel, None)
+
+    def on_listener_stopped(self, handler) -> None:
+        self.stopped_handlers.append(handler)
+
+    def off_listener_stopped(self, handler) -> None:
+        if handler in self.stopped_handlers:
+            self.stopped_handlers.remove(handler)
+
+    async def subscribe(self, channel: str) -> bool:
+        return self.available
+
+    async def start_listener(self) -> bool:
+        return True
+
+    async def publish(self, channel: str, message: dict) -> bool:
+        self.published.append((channel, message))
+        return True
+
+    def deliver(self, channel: str, message: dict) -> None:
+        """Simulate a message published by another worker."""
+        for handler in self.handlers.get(channel, []):
+            handler(message)
+
+
+@pytest.fixture(autouse=True)
+def pubsub(monkeypatch) -> FakePubSub:
+    """Isolate the local page tier and pub/sub manager per test."""
+    fake = FakePubSub()
+    monkeypatch.setattr("pybase.realtime.redis_pubsub.get_pubsub_manager", lambda: fake)
+    monkeypatch.setattr(record_cache.invalidations, "subscribed", False)
+    record_cache.local_pages.clear()
+    yield fake
+    record_cache.local_pages.clear()
+
+
+def _record_cache() -> tuple[RecordCache, FakeRedis]:
+    cache = RecordCache()
+    cache._redis = FakeRedis()
+    return cache, cache._redis
+
+
+def _page(record_id: str = "r1") -> dict:
+    record = SimpleNamespace(
+        id=record_id,
+        table_id="t1",
+        data=json.dumps({"f": 1}),
+        created_at=SimpleNamespace(isoformat=lambda: "2026-01-01T00:00:00"),
+        updated_at=SimpleNamespace(isoformat=lambda: "2026-01-01T00:00:00"),
+        row_height=32,
+    )
+    return {"records": [record], "next_cursor": None, "has_more": False}
+
+
+class TestRecordCacheVersioning:
+    """Test generation-based invalidation of record list entries."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test cached pages are returned until invalidated."""
+        cache, _ = _record_cache()
+
+        assert await cache.set_cached_records("t1", "u1", _page())
+        cached = await cache.get_cached_records("t1", "u1")
+
+        assert cached["records"][0]["id"] == "r1"
+
+    @pytest.mark.asyncio
+    async def test_table_invalidation_bumps_version(self):
+        """Test invalidating a table hides its entries without deleting keys."""
+        cache, redis = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+        await cache.set_cached_records("t2", "u1", _page("r2"))
+        keys_before = set(redis.store)
+
+        await cache.invalidate_table_cache("t1")
+
+        assert await cache.get_cached_records("t1", "u1") is None
+        assert (await cache.get_cached_records("t2", "u1"))["records"][0]["id"] == "r2"
+        assert keys_before <= set(redis.store)
+        assert redis.store[cache.table_version_key("t1")] == "1"
+
+    @pytest.mark.asyncio
+    async def test_table_invalidation_hides_cross_table_queries(self):
+        """Test writes to any table invalidate queries not scoped to a table."""
+        cache, _ = _record_cache()
+        await cache.set_cached_records(None, "u1", _page())
+
+        await cache.invalidate_table_cache("t1")
+
+        assert await cache.get_cached_records(None, "u1") is None
+
+    @pytest.mark.asyncio
+    async def test_user_invalidation(self):
+        """Test invalidating a user only hides that user's entries."""
+        cache, _ = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+        await cache.set_cached_records("t1", "u2", _page())
+
+        await cache.invalidate_user_cache("u1")
+
+        assert await cache.get_cached_records("t1", "u1") is None
+        assert await cache.get_cached_records("t1", "u2") is not None
+
+    @pytest.mark.asyncio
+    async def test_repopulates_at_new_version(self):
+        """Test entries written after invalidation are served again."""
+        cache, _ = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page("old"))
+        await cache.invalidate_table_cache("t1")
+
+        await cache.set_cached_records("t1", "u1", _page("new"))
+
+        assert (await cache.get_cached_records("t1", "u1"))["records"][0]["id"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_page_loaded_before_write_not_cached_after_it(self, pubsub):
+        """Test pages are stored under the generations read before loading them."""
+        pubsub.available = True
+        cache, _ = _record_cache()
+        versions = await cache.get_versions("t1", "u1")
+        # A write commits while the page is being loaded
+        await cache.invalidate_table_cache("t1")
+
+        await cache.set_cached_records("t1", "u1", _page("stale"), versions=versions)
+
+        assert await cache.get_cached_records("t1", "u1") is None
+
+
+class TestChartCacheVersioning:
+    """Test generation-based invalidation of chart data entries."""
+
+    @staticmethod
+    def _cache() -> ChartCache:
+        cache = ChartCache()
+        cache._redis = FakeRedis()
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_table_invalidation(self):
+        """Test table writes invalidate charts built on that table."""
+        cache = self._cache()
+        await cache.set_cached_chart_data("c1", {"chart_type": "bar"}, table_id="t1")
+        await cache.set_cached_chart_data("c2", {"chart_type": "bar"}, table_id="t2")
+
+        await cache.invalidate_table_cache("t1")
+
+        assert await cache.get_cached_chart_data("c1", table_id="t1") is None
+        assert await cache.get_cached_chart_data("c2", table_id="t2") is not None
+
+    @pytest.mark.asyncio
+    async def test_chart_invalidation(self):
+        """Test invalidating a chart covers every data request variant."""
+        cache = self._cache()
+        request = {"limit": 10}
+        await cache.set_cached_chart_data("c1", {"chart_type": "bar"}, table_id="t1")
+        await cache.set_cached_chart_data("c1", {"chart_type": "bar"}, request, table_id="t1")
+
+        await cache.invalidate_chart_cache("c1")
+
+        assert await cache.get_cached_chart_data("c1", table_id="t1") is None
+        assert await cache.get_cached_chart_data("c1", request, table_id="t1") is None
+
+    @pytest.mark.asyncio
+    async def test_table_version(self):
+        """Test table invalidation returns the new generation."""
+        cache = self._cache()
+
+        assert await cache.get_table_version("t1") == 0
+        assert await cache.invalidate_table_cache("t1") == 1
+        assert await cache.get_table_version("t1") == 1
+
+
+class TestLocalCache:
+    """Test the in-process LRU tier."""
+
+    @staticmethod
+    def _cache(**kwargs) -> LocalCache:
+        options = {"max_entries": 3, "max_bytes": 100, "ttl": 10}
+        options.update(kwargs)
+        return LocalCache("test", **options)
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted past max_entries."""
+        cache = self._cache()
+        for key in "abc":
+            cache.set(key, key.upper(), 1)
+        cache.get("a")
+
+        cache.set("d", "D", 1)
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+
+    def test_evicts_by_size(self):
+        """Test entries are evicted until the total size fits max_bytes."""
+        cache = self._cache(max_entries=10)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 30)
+
+        cache.set("c", 3, 50)
+
+        assert cache.get("a") is None
+        assert cache.size == 80
+        assert not cache.set("huge", 4, 101)
+
+    def test_expires_after_ttl(self):
+        """Test entries are dropped once their TTL has passed."""
+        now = [0.0]
+        cache = self._cache(clock=lambda: now[0])
+        cache.set("a", 1, 1)
+
+        now[0] = 10.0
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_tag(self):
+        """Test invalidating a tag drops only the entries carrying it."""
+        cache = self._cache()
+        cache.set("a", 1, 1, tags=("table:t1", "user:u1"))
+        cache.set("b", 2, 1, tags=("table:t2", "user:u1"))
+
+        assert cache.invalidate_tag("table:t1") == 1
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.invalidate_tag("user:u1") == 1
+        assert cache.size == 0
+
+    def test_rejects_value_loaded_before_invalidation(self):
+        """Test set ignores values read before a concurrent invalidation."""
+        cache = self._cache()
+        generation = cache.generation
+        cache.invalidate_tag("table:t1")
+
+        assert not cache.set("a", 1, 1, generation=generation)
+        assert cache.get("a") is None
+
+    def test_tagged(self):
+        """Test tagged returns live values without touching LRU order."""
+        now = [0.0]
+        cache = self._cache(clock=lambda: now[0])
+        cache.set("a", 1, 1, tags=("table:t1",))
+        now[0] = 5.0
+        cache.set("b", 2, 1, tags=("table:t1",))
+        cache.set("c", 3, 1, tags=("table:t2",))
+
+        assert sorted(cache.tagged("table:t1")) == [1, 2]
+        now[0] = 10.0
+        assert cache.tagged("table:t1") == [2]
+
+
+class TestRecordCacheLocalTier:
+    """Test the in-process tier in front of Redis."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_redis(self, pubsub):
+        """Test repeat reads are served without touching Redis."""
+        pubsub.available = True
+        cache, redis = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+        redis.store.clear()
+
+        cached = await cache.get_cached_records("t1", "u1")
+
+        assert cached["records"][0]["id"] == "r1"
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_local_tier(self, pubsub):
+        """Test pages read from Redis are kept locally."""
+        pubsub.available = True
+        cache, redis = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+        record_cache.local_pages.clear()
+
+        await cache.get_cached_records("t1", "u1")
+        redis.store.clear()
+
+        assert await cache.get_cached_records("t1", "u1") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_published(self, pubsub):
+        """Test invalidations drop local pages and notify other workers."""
+        pubsub.available = True
+        cache, _ = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+
+        await cache.invalidate_table_cache("t1")
+
+        assert pubsub.published == [
+            (RecordCache.INVALIDATION_CHANNEL, {"event": "invalidate", "scope": "table", "id": "t1"})
+        ]
+        assert len(record_cache.local_pages) == 0
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_drops_local_pages(self, pubsub):
+        """Test messages from other workers drop matching local pages."""
+        pubsub.available = True
+        cache, redis = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+        await cache.set_cached_records(None, "u2", _page())
+        redis.store.clear()
+
+        pubsub.deliver(
+            RecordCache.INVALIDATION_CHANNEL,
+            {"event": "invalidate", "scope": "table", "id": "t1"},
+        )
+
+        assert await cache.get_cached_records("t1", "u1") is None
+        assert await cache.get_cached_records(None, "u2") is None
+
+    @pytest.mark.asyncio
+    async def test_local_tier_disabled_without_subscription(self, pubsub):
+        """Test pages are not kept locally if invalidations can't be received."""
+        cache, _ = _record_cache()
+
+        await cache.set_cached_records("t1", "u1", _page())
+
+        assert len(record_cache.local_pages) == 0
+
+    @pytest.mark.asyncio
+    async def test_listener_stop_drops_local_tier(self, pubsub):
+        """Test local pages are dropped and unused until the worker resubscribes."""
+        pubsub.available = True
+        cache, redis = _record_cache()
+        await cache.set_cached_records("t1", "u1", _page())
+
+        # Invalidations published from now on would be missed
+        pubsub.available = False
+        for handler in list(pubsub.stopped_handlers):
+            handler()
+        await cache.set_cached_records("t1", "u1", _page())
+
+        assert len(record_cache.local_pages) == 0
+
+        pubsub.available = True
+        await cache.set_cached_records("t1", "u1", _page())
+        redis.store.clear()
+
+        assert await cache.get_cached_records("t1", "u1") is not None
@@ -0,0 +1,169 @@
+"""
+Unit tests for incrementally maintained chart snapshots.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pybase.cache.local_cache import LocalCache
+from pybase.services.chart_snapshot import AggregateBucket, ChartSnapshot, ChartSnapshotStore
+
+
+class FakeChartCache:
+    """Chart cache stand-in holding table generations."""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+
+    async def get_table_version(self, table_id: str) -> int:
+        return self.version
+
+
+class FakeResult:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+
+    def all(self) -> list:
+        return self.rows
+
+
+class FakeSession:
+    """Session returning canned query rows."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.executed = 0
+
+    async def execute(self, query) -> FakeResult:
+        self.executed += 1
+        return FakeResult(self.rows)
+
+
+# Chart data configuration of the snapshot store tests
+CONFIG = {"x_field_id": "x", "y_field_id": "y", "aggregation": "sum"}
+
+
+def _store(version: int = 1) -> ChartSnapshotStore:
+    cache = LocalCache("test", max_entries=10, max_bytes=1_000_000, ttl=60)
+    return ChartSnapshotStore(cache=cache, chart_cache=FakeChartCache(version))
+
+
+class TestAggregateBucket:
+    """Tests for per-group aggregate state."""
+
+    def test_sum_and_avg_count_numeric_values(self):
+        bucket = AggregateBucket("a")
+        for value in (2, "3", None, "n/a", True):
+            bucket.add(value)
+
+        assert bucket.value("count") == 5
+        assert bucket.value("sum") == 5.0
+        assert bucket.value("avg") == 2.5
+
+    def test_min_max_after_removal(self):
+        bucket = AggregateBucket("a", track_values=True)
+        for value in (1, 5, 5, 9):
+            bucket.add(value)
+
+        bucket.add(9, -1)
+        bucket.add(1, -1)
+
+        assert bucket.value("min") == 5
+        assert bucket.value("max") == 5
+
+        bucket.add(5, -2)
+
+        assert bucket.value("min") is None
+        assert bucket.value("max") is None
+
+    def test_distinct_count(self):
+        bucket = AggregateBucket("a", track_distinct=True)
+        for value in ("x", "x", ["y"], None):
+            bucket.add(value)
+
+        bucket.add("x", -1)
+
+        assert bucket.value("distinct_count") == 2
+
+
+class TestChartSnapshot:
+    """Tests for applying record deltas to a snapshot."""
+
+    def test_apply_changes(self):
+        snapshot = ChartSnapshot("status", "cost", "sum", table_version=1)
+        snapshot.apply_changes(
+            [
+                (None, {"status": "open", "cost": 10}),
+                (None, {"status": "open", "cost": 5}),
+                (None, {"cost": 1}),
+            ]
+        )
+
+        snapshot.apply_changes(
+            [
+                ({"status": "open", "cost": 10}, {"status": "done", "cost": 10}),
+                ({"cost": 1}, None),
+            ]
+        )
+
+        assert snapshot.record_count == 2
+        assert snapshot.chart_data(10)["data"] == [
+            {"label": "done", "value": 10.0},
+            {"label": "open", "value": 5.0},
+        ]
+
+    def test_chart_data_orders_by_value_and_limits(self):
+        snapshot = ChartSnapshot("status", None, "count", table_version=1)
+        snapshot.apply_changes(
+            [(None, {"status": status}) for status in ("b", "a", "a", None, "c")]
+        )
+
+        data = snapshot.chart_data(3)
+
+        assert data["labels"] == ["a", "(empty)", "b"]
+        assert data["total_records"] == 5
+
+
+class TestChartSnapshotStore:
+    """Tests for snapshot rebuilds and version gating."""
+
+    def test_supports(self):
+        assert ChartSnapshotStore.supports(CONFIG, [])
+        assert not ChartSnapshotStore.supports(CONFIG, [{"field_id": "x"}])
+        assert not ChartSnapshotStore.supports({**CONFIG, "aggregation": "median"}, [])
+        assert not ChartSnapshotStore.supports({**CONFIG, "series": [{}]}, [])
+
+    @pytest.mark.asyncio
+    async def test_builds_once_and_applies_deltas(self):
+        store = _store(version=1)
+        db = FakeSession([SimpleNamespace(group="open", count=2, numeric_count=2, sum=15)])
+
+        data = await store.get_chart_data(db, "c1", "t1", CONFIG, table_version=1)
+        assert data["data"] == [{"label": "open", "value": 15.0}]
+
+        store.apply_record_changes("t1", 2, [(None, {"x": "open", "y": 5})])
+        data = await store.get_chart_data(db, "c1", "t1", CONFIG, table_version=2)
+
+        assert data["data"] == [{"label": "open", "value": 20.0}]
+        assert db.executed == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_deltas_from_other_versions(self):
+        store = _store(version=1)
+        db = FakeSession([SimpleNamespace(group="open", count=1, numeric_count=1, sum=1)])
+        await store.get_chart_data(db, "c1", "t1", CONFIG, table_version=1)
+
+        store.apply_record_changes("t1", 3, [(None, {"x": "open", "y": 5})])
+        await store.get_chart_data(db, "c1", "t1", CONFIG, table_version=3)
+
+        assert db.executed == 2
+
+    @pytest.mark.asyncio
+    async def test_not_cached_when_table_changes_during_build(self):
+        store = _store(version=2)
+        db = FakeSession([])
+
+        await store.get_chart_data(db, "c1", "t1", CONFIG, table_version=1)
+
+        assert len(store.cache) == 0
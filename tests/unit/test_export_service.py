@@ -9,6 +9,8 @@ import csv
 import json
 import zipfile
 from io import BytesIO, StringIO
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from xml.etree import ElementTree as ET
 
 import pytest
@@ -20,7 +22,7 @@ from pybase.models.base import Base
 from pybase.models.field import Field, FieldType
 from pybase.models.record import Record
 from pybase.models.table import Table
-from pybase.models.view import View, FilterCondition, Sort
+from pybase.models.view import View
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.models.user import User
 from pybase.services.export_service import ExportService
@@ -672,6 +674,193 @@ class TestViewSorts:
         assert data_rows[2] == ["Charlie"]
 
 
+class TestBatchedStreaming:
+    """Test records are streamed in keyset-paged batches."""
+
+    @pytest.mark.asyncio
+    async def test_export_pages_across_batches(self, export_service, db_session, test_user):
+        """Test export spanning several batches keeps view sort order without gaps."""
+        # Setup
+        workspace = Workspace(owner_id=test_user.id, name="Test Workspace")
+        db_session.add(workspace)
+        await db_session.commit()
+        await db_session.refresh(workspace)
+
+        member = WorkspaceMember(
+            workspace_id=workspace.id,
+            user_id=test_user.id,
+            role=WorkspaceRole.OWNER
+        )
+        db_session.add(member)
+        await db_session.commit()
+
+        base = Base(workspace_id=workspace.id, name="Test Base")
+        db_session.add(base)
+        await db_session.commit()
+        await db_session.refresh(base)
+
+        table = Table(base_id=base.id, name="Test Table")
+        db_session.add(table)
+        await db_session.commit()
+        await db_session.refresh(table)
+
+        field = Field(
+            table_id=table.id,
+            name="Name",
+            field_type=FieldType.TEXT.value
+        )
+        db_session.add(field)
+        await db_session.commit()
+        await db_session.refresh(field)
+
+        names = ["Alice", "Bob", "Charlie", "Dave", "Eve"]
+        for name in names:
+            db_session.add(Record(
+                table_id=table.id,
+                data=f'{{"{field.id}": "{name}"}}',
+                created_by_id=test_user.id,
+                last_modified_by_id=test_user.id
+            ))
+        await db_session.commit()
+
+        view = View(
+            table_id=table.id,
+            name="Sorted View",
+            sorts=json.dumps([{
+                "field_id": str(field.id),
+                "direction": "desc"
+            }])
+        )
+        db_session.add(view)
+        await db_session.commit()
+        await db_session.refresh(view)
+
+        # Export with a batch size that doesn't divide the record count
+        chunks = []
+        async for chunk in export_service.export_records(
+            db=db_session,
+            table_id=table.id,
+            user_id=str(test_user.id),
+            format="json",
+            batch_size=2,
+            view_id=view.id
+        ):
+            chunks.append(chunk)
+
+        data = json.loads(b''.join(chunks).decode('utf-8'))
+        assert [row["Name"] for row in data] == list(reversed(names))
+
+    @pytest.mark.asyncio
+    async def test_excel_export_streams_batches(self, export_service, monkeypatch):
+        """Test Excel export writes every batch and yields the file in chunks."""
+        fields = [SimpleNamespace(id="fld_name", name="Name", field_type="text")]
+
+        async def fake_batches(db, table_id, view_filters, view_sorts, batch_size):
+            for start in range(0, 5, batch_size):
+                yield [
+                    {"id": str(i), "data": {"fld_name": f"Row {i}"}}
+                    for i in range(start, min(start + batch_size, 5))
+                ]
+
+        monkeypatch.setattr(export_service, "_iter_record_batches", fake_batches)
+        monkeypatch.setattr("pybase.services.export_service.EXPORT_CHUNK_SIZE", 1024)
+
+        chunks = [
+            chunk
+            async for chunk in export_service._stream_excel(None, uuid4(), fields, 2)
+        ]
+
+        assert len(chunks) > 1
+        sheet = load_workbook(BytesIO(b''.join(chunks))).active
+        rows = [row[0] for row in sheet.iter_rows(values_only=True)]
+        assert rows == ["Name"] + [f"Row {i}" for i in range(5)]
+
+
+class TestColumnarExport:
+    """Test Parquet and Arrow IPC export."""
+
+    @pytest.fixture
+    def typed_fields(self):
+        return [
+            SimpleNamespace(id="fld_name", name="Name", field_type="text"),
+            SimpleNamespace(id="fld_price", name="Price", field_type="currency"),
+            SimpleNamespace(id="fld_done", name="Done", field_type="checkbox"),
+            SimpleNamespace(id="fld_due", name="Due", field_type="date"),
+            SimpleNamespace(id="fld_tags", name="Tags", field_type="multi_select"),
+        ]
+
+    @pytest.fixture
+    def typed_batches(self, export_service, monkeypatch):
+        async def fake_batches(db, table_id, view_filters, view_sorts, batch_size):
+            for start in range(0, 5, batch_size):
+                yield [
+                    {
+                        "id": str(i),
+                        "data": {
+                            "fld_name": f"Row {i}",
+                            "fld_price": i * 1.5,
+                            "fld_done": i % 2 == 0,
+                            "fld_due": f"2024-01-0{i + 1}",
+                            "fld_tags": ["a", "b"] if i else "",
+                        },
+                    }
+                    for i in range(start, min(start + batch_size, 5))
+                ]
+
+        monkeypatch.setattr(export_service, "_iter_record_batches", fake_batches)
+
+    @pytest.mark.asyncio
+    async def test_parquet_export_uses_field_types(self, export_service, typed_fields, typed_batches):
+        """Test Parquet columns are typed from the table's fields."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        chunks = [
+            chunk
+            async for chunk in export_service._stream_columnar(
+                None, uuid4(), typed_fields, 2, export_format="parquet"
+            )
+        ]
+
+        table = pq.read_table(BytesIO(b''.join(chunks)))
+        assert table.schema.field("Price").type == pa.float64()
+        assert table.schema.field("Done").type == pa.bool_()
+        assert table.schema.field("Due").type == pa.date32()
+        assert table.schema.field("Tags").type == pa.list_(pa.string())
+        assert table.column("Name").to_pylist() == [f"Row {i}" for i in range(5)]
+        assert table.column("Price").to_pylist() == [i * 1.5 for i in range(5)]
+        assert table.column("Tags").to_pylist() == [None] + [["a", "b"]] * 4
+
+    @pytest.mark.asyncio
+    async def test_arrow_export_writes_record_batches(self, export_service, typed_fields, typed_batches):
+        """Test Arrow IPC export writes one record batch per fetched batch."""
+        ipc = pytest.importorskip("pyarrow.ipc")
+
+        chunks = [
+            chunk
+            async for chunk in export_service._stream_columnar(
+                None, uuid4(), typed_fields, 2, export_format="arrow"
+            )
+        ]
+
+        assert len(chunks) > 1
+        reader = ipc.open_file(BytesIO(b''.join(chunks)))
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+        assert table.column("Done").to_pylist() == [True, False, True, False, True]
+
+    def test_unconvertible_values_export_as_null(self):
+        """Test values that don't fit a column's type become null."""
+        pytest.importorskip("pyarrow")
+        from pybase.services.export_columnar import ColumnarExportWriter, build_arrow_schema
+
+        fields = [SimpleNamespace(id="fld_qty", name="Qty", field_type="number")]
+        writer = ColumnarExportWriter("arrow", build_arrow_schema(fields, ["Qty"], {}))
+
+        batch = writer.to_record_batch([{"Qty": "12"}, {"Qty": "n/a"}, {"Qty": ""}])
+        assert batch.column(0).to_pylist() == [12.0, None, None]
+
+
 class TestLinkedRecordFlattening:
     """Test linked record flattening."""
 
@@ -772,6 +961,100 @@ class TestLinkedRecordFlattening:
         assert any("Category" in col for col in header)
 
 
+class TestLinkedRecordPrefetch:
+    """Test batched linked record loading for flattened exports."""
+
+    @pytest.fixture
+    def linked_setup(self):
+        """Table with one linked record field pointing at a customers table."""
+        link_field = SimpleNamespace(id="fld_customer", name="Customer", field_type="linked_record")
+        name_field = SimpleNamespace(id="fld_name", name="Name", field_type="text")
+        linked_field_map = {
+            "Customer.Name": {
+                "field": link_field,
+                "linked_field": name_field,
+                "linked_table_id": "tbl_customers",
+            }
+        }
+        return [link_field], linked_field_map
+
+    @staticmethod
+    def _mock_db(rows):
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = rows
+        mock_db.execute.return_value = mock_result
+        return mock_db
+
+    @pytest.mark.asyncio
+    async def test_prefetch_uses_one_query_per_linked_table(self, export_service, linked_setup):
+        """Test a batch's linked records are loaded with a single query."""
+        fields, linked_field_map = linked_setup
+        mock_db = self._mock_db([
+            ("rec_a", '{"fld_name": "Acme"}'),
+            ("rec_b", '{"fld_name": "Globex"}'),
+        ])
+        batch = [
+            {"data": {"fld_customer": ["rec_a"]}},
+            {"data": {"fld_customer": ["rec_b"]}},
+            {"data": {"fld_customer": ["rec_a"]}},
+        ]
+        cache = export_service._new_linked_record_cache()
+
+        await export_service._prefetch_linked_records(
+            mock_db, batch, fields, linked_field_map, cache
+        )
+        rows = [
+            await export_service._build_export_row(
+                mock_db, record["data"], fields, linked_field_map, True, cache
+            )
+            for record in batch
+        ]
+
+        assert mock_db.execute.await_count == 1
+        assert [row["Customer.Name"] for row in rows] == ["Acme", "Globex", "Acme"]
+
+    @pytest.mark.asyncio
+    async def test_cached_records_are_not_queried_again(self, export_service, linked_setup):
+        """Test linked records cached by an earlier batch skip the query."""
+        fields, linked_field_map = linked_setup
+        mock_db = self._mock_db([("rec_a", '{"fld_name": "Acme"}')])
+        batch = [{"data": {"fld_customer": ["rec_a", "rec_missing"]}}]
+        cache = export_service._new_linked_record_cache()
+
+        for _ in range(2):
+            await export_service._prefetch_linked_records(
+                mock_db, batch, fields, linked_field_map, cache, all_linked_records=True
+            )
+
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_all_linked_records(self, export_service, linked_setup):
+        """Test every linked record is emitted when requested."""
+        fields, linked_field_map = linked_setup
+        mock_db = self._mock_db([
+            ("rec_a", '{"fld_name": "Acme"}'),
+            ("rec_b", '{"fld_name": "Globex"}'),
+        ])
+        data = {"fld_customer": ["rec_a", "rec_deleted", "rec_b"]}
+        cache = export_service._new_linked_record_cache()
+
+        row = await export_service._build_export_row(
+            mock_db, data, fields, linked_field_map, True, cache, all_linked_records=True
+        )
+
+        assert row == {"Customer.Name": "Acme, Globex"}
+
+    def test_parse_linked_record_ids(self, export_service):
+        """Test linked record values are normalized to lists of IDs."""
+        assert export_service._parse_linked_record_ids(["a", "b"]) == ["a", "b"]
+        assert export_service._parse_linked_record_ids('["a"]') == ["a"]
+        assert export_service._parse_linked_record_ids({"a": {}, "b": {}}) == ["a", "b"]
+        assert export_service._parse_linked_record_ids("") == []
+        assert export_service._parse_linked_record_ids(None) == []
+
+
 class TestAttachmentExport:
     """Test attachment export and ZIP creation."""
 
@@ -0,0 +1,208 @@
+"""
+Unit tests for per-field expression index DDL.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pybase.core.exceptions import ConflictError
+from pybase.db.types import JSONBText
+from pybase.services.field_index import (
+    create_field_index_sql,
+    create_unique_lookup_index_sql,
+    drop_field_index_sql,
+    drop_unique_lookup_index_sql,
+    field_index_name,
+    unique_lookup_index_name,
+)
+from pybase.services.field_index_builder import UNIQUE_LOOKUP_INDEX, FieldIndexBuilder
+
+FIELD_ID = "1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+TABLE_ID = "6fa459ea-ee8a-3ca4-894e-db77e160355e"
+
+
+def test_index_name_fits_identifier_limit():
+    name = field_index_name(FIELD_ID)
+
+    assert name == "ix_records_f_1b4e28ba2fa111d2883f0016d3cca427"
+    assert len(name) <= 63
+
+
+def test_create_numeric_index():
+    sql = create_field_index_sql(FIELD_ID, "number", TABLE_ID)
+
+    assert sql.startswith(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {field_index_name(FIELD_ID)} ON pybase.records"
+    )
+    assert f"CAST(data ->> '{FIELD_ID}' AS NUMERIC)" in sql
+    assert sql.endswith(f"WHERE deleted_at IS NULL AND table_id = '{TABLE_ID}'")
+
+
+def test_create_index_rejects_malformed_table_id():
+    with pytest.raises(ValueError):
+        create_field_index_sql(FIELD_ID, "number", "x' OR '1'='1")
+
+
+def test_create_index_rejects_unindexable_type():
+    with pytest.raises(ConflictError):
+        create_field_index_sql(FIELD_ID, "attachment", TABLE_ID)
+
+
+def test_drop_index():
+    assert drop_field_index_sql(FIELD_ID) == (
+        f"DROP INDEX CONCURRENTLY IF EXISTS pybase.{field_index_name(FIELD_ID)}"
+    )
+
+
+def test_unique_lookup_index_scoped_to_table():
+    sql = create_unique_lookup_index_sql(FIELD_ID, False, TABLE_ID)
+
+    assert unique_lookup_index_name(FIELD_ID) == "ix_records_u_1b4e28ba2fa111d2883f0016d3cca427"
+    assert sql.startswith(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {unique_lookup_index_name(FIELD_ID)}"
+    )
+    assert f"lower(data ->> '{FIELD_ID}')" in sql
+    assert sql.endswith(f"WHERE deleted_at IS NULL AND table_id = '{TABLE_ID}'")
+
+
+def test_index_names_ignore_uuid_formatting():
+    assert field_index_name(FIELD_ID.upper()) == field_index_name(FIELD_ID)
+    assert unique_lookup_index_name(f"{{{FIELD_ID}}}") == unique_lookup_index_name(FIELD_ID)
+
+
+def test_jsonb_text_round_trip():
+    column_type = JSONBText()
+    bind = column_type.bind_processor(None)
+    result = column_type.result_processor(None, None)
+
+    assert bind('{"a": 1}') == '{"a": 1}'
+    assert bind({"a": 1}) == '{"a": 1}'
+    assert result({"a": 1}) == '{"a": 1}'
+    assert result(None) is None
+
+
+class FakeConnection:
+    """Driver connection recording DDL."""
+
+    def __init__(self, valid) -> None:
+        self.valid = valid
+        self.executed: list[str] = []
+
+    async def fetchval(self, query, *args):
+        return self.valid
+
+    async def execute(self, query, *args, timeout=None):
+        self.executed.append(query)
+
+
+def _builder(row, valid=None):
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, query):
+            return SimpleNamespace(one_or_none=lambda: row)
+
+    builder = FieldIndexBuilder(session_factory=Session, build_timeout=60)
+    conn = FakeConnection(valid)
+
+    @asynccontextmanager
+    async def ddl_connection(name):
+        yield conn
+
+    builder._ddl_connection = ddl_connection
+    return builder, conn
+
+
+def _field_row(**overrides):
+    row = {"table_id": TABLE_ID, "field_type": "number", "is_indexed": True, "deleted_at": None}
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestFieldIndexBuilder:
+    """Tests for building field indexes outside the request transaction."""
+
+    @pytest.mark.asyncio
+    async def test_builds_after_commit_only(self, monkeypatch):
+        builder = FieldIndexBuilder()
+        monkeypatch.setattr(builder, "_ensure_started", lambda: None)
+        builder._wakeup = asyncio.Event()
+
+        committed = AsyncSession()
+        builder.schedule(committed, FIELD_ID)
+        assert len(builder) == 0
+        await committed.commit()
+        assert len(builder) == 1
+
+        rolled_back = AsyncSession()
+        builder.schedule(rolled_back, TABLE_ID, UNIQUE_LOOKUP_INDEX)
+        await rolled_back.begin()
+        await rolled_back.rollback()
+        await rolled_back.commit()
+        assert len(builder) == 1
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_index_concurrently(self):
+        builder, conn = _builder(_field_row())
+
+        await builder._reconcile(FIELD_ID)
+
+        assert conn.executed == [create_field_index_sql(FIELD_ID, "number", TABLE_ID)]
+
+    @pytest.mark.asyncio
+    async def test_replaces_invalid_index(self):
+        builder, conn = _builder(_field_row(), valid=False)
+
+        await builder._reconcile(FIELD_ID)
+
+        assert conn.executed[0].startswith("DROP INDEX CONCURRENTLY")
+        assert conn.executed[1] == create_field_index_sql(FIELD_ID, "number", TABLE_ID)
+
+    @pytest.mark.asyncio
+    async def test_keeps_valid_index(self):
+        builder, conn = _builder(_field_row(), valid=True)
+
+        await builder._reconcile(FIELD_ID)
+
+        assert conn.executed == []
+
+    @pytest.mark.asyncio
+    async def test_drops_index_of_deleted_or_unindexed_field(self):
+        for row in (_field_row(is_indexed=False), _field_row(deleted_at="now"), None):
+            builder, conn = _builder(row)
+
+            await builder._reconcile(FIELD_ID)
+
+            assert conn.executed == [drop_field_index_sql(FIELD_ID)]
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_unique_lookup_index_on_expression_change(self):
+        row = SimpleNamespace(table_id=TABLE_ID, case_sensitive=True)
+        builder, conn = _builder(row, valid=True)
+        builder._ensure_started = lambda: None
+        builder._wakeup = asyncio.Event()
+
+        builder.enqueue(FIELD_ID, UNIQUE_LOOKUP_INDEX)
+        builder.enqueue(FIELD_ID, UNIQUE_LOOKUP_INDEX, rebuild=True)
+        await builder.flush()
+
+        assert conn.executed == [
+            f"DROP INDEX CONCURRENTLY IF EXISTS pybase.{unique_lookup_index_name(FIELD_ID)}",
+            create_unique_lookup_index_sql(FIELD_ID, True, TABLE_ID),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_drops_unique_lookup_index_without_constraint(self):
+        builder, conn = _builder(None)
+
+        await builder._reconcile_unique_lookup(FIELD_ID, rebuild=False)
+
+        assert conn.executed == [drop_unique_lookup_index_sql(FIELD_ID)]
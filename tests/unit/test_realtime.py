@@ -1,15 +1,17 @@
 """Unit tests for realtime WebSocket connection manager with Redis pub/sub."""
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
-from pybase.realtime.manager import ConnectionManager, Connection
+from pybase.realtime.manager import SLOW_CONSUMER_CLOSE_CODE, ConnectionManager, Connection
 from pybase.schemas.realtime import (
     ConnectEvent,
     DisconnectEvent,
+    PongEvent,
     SubscribedEvent,
     EventType,
 )
@@ -27,6 +29,8 @@ def mock_websocket():
     ws = MagicMock()
     ws.accept = AsyncMock()
     ws.send_json = AsyncMock()
+    ws.send_text = AsyncMock()
+    ws.close = AsyncMock()
     return ws
 
 
@@ -139,7 +143,8 @@ class TestRedisPubSub:
             assert connection_manager._instance_id is not None
             assert connection_manager._redis_listener_started is True
             mock_redis_pubsub.start_listener.assert_called_once()
-            mock_redis_pubsub.on_message.assert_called_once()
+            # Channels are only subscribed once they have local subscribers
+            mock_redis_pubsub.on_message.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ensure_redis_returns_none_when_unavailable(
@@ -163,15 +168,14 @@ class TestRedisPubSub:
             "Test User",
         )
         channel = "table:test-uuid"
-        await connection_manager.subscribe(connection.connection_id, channel)
 
         # Mock Redis pub/sub manager
         with patch(
             "pybase.realtime.manager.get_pubsub_manager",
             return_value=mock_redis_pubsub,
         ):
-            # Initialize Redis
-            await connection_manager._ensure_redis()
+            # Subscribing initializes Redis
+            await connection_manager.subscribe(connection.connection_id, channel)
 
             # Create event to broadcast
             event = ConnectEvent(connection_id=connection.connection_id, user_id=user_id)
@@ -251,9 +255,10 @@ class TestRedisPubSub:
 
             # Handle message
             await connection_manager._handle_redis_message(message)
+            await connection_manager.flush()
 
             # Verify both local connections received the message
-            assert mock_websocket.send_json.call_count >= 2
+            assert mock_websocket.send_text.call_count >= 2
 
     @pytest.mark.asyncio
     async def test_startup_initializes_redis(self, connection_manager, mock_redis_pubsub):
@@ -331,7 +336,8 @@ class TestRedisPubSub:
             await connection_manager._ensure_redis()
 
             # Reset mock to track new calls
-            mock_websocket.send_json.reset_mock()
+            await connection_manager.flush()
+            mock_websocket.send_text.reset_mock()
 
             # Create message that excludes conn1
             event = ConnectEvent(connection_id=str(uuid4()), user_id=user_id1)
@@ -344,11 +350,64 @@ class TestRedisPubSub:
 
             # Handle message
             await connection_manager._handle_redis_message(message)
+            await connection_manager.flush()
+
+            # Only conn2 receives the relayed frame
+            assert mock_websocket.send_text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_subscriptions_follow_local_interest(
+        self, connection_manager, mock_websocket, mock_redis_pubsub
+    ):
+        """Test that Redis channels are subscribed only while they have local subscribers."""
+        with patch(
+            "pybase.realtime.manager.get_pubsub_manager",
+            return_value=mock_redis_pubsub,
+        ):
+            conn1 = await connection_manager.connect(mock_websocket, str(uuid4()), "User 1")
+            conn2 = await connection_manager.connect(mock_websocket, str(uuid4()), "User 2")
+
+            await connection_manager.subscribe(conn1.connection_id, "table:a")
+            await connection_manager.subscribe(conn2.connection_id, "table:a")
+            await connection_manager.subscribe(conn2.connection_id, "table:b")
+
+            assert [c.args[0] for c in mock_redis_pubsub.subscribe.call_args_list] == [
+                "realtime:table:a",
+                "realtime:table:b",
+            ]
+            mock_redis_pubsub.on_message.assert_any_call(
+                "realtime:table:a", connection_manager._handle_redis_message
+            )
+
+            await connection_manager.unsubscribe(conn1.connection_id, "table:a")
+            mock_redis_pubsub.unsubscribe.assert_not_called()
+
+            await connection_manager.disconnect(conn2.connection_id)
+            assert sorted(c.args[0] for c in mock_redis_pubsub.unsubscribe.call_args_list) == [
+                "realtime:table:a",
+                "realtime:table:b",
+            ]
+            assert connection_manager.get_stats()["redis_channels"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_redis_subscribe_is_retried(
+        self, connection_manager, mock_websocket, mock_redis_pubsub
+    ):
+        """Test that a channel whose Redis subscribe failed is subscribed on the next try."""
+        mock_redis_pubsub.subscribe = AsyncMock(side_effect=[False, True])
+        with patch(
+            "pybase.realtime.manager.get_pubsub_manager",
+            return_value=mock_redis_pubsub,
+        ):
+            conn1 = await connection_manager.connect(mock_websocket, str(uuid4()), "User 1")
+            conn2 = await connection_manager.connect(mock_websocket, str(uuid4()), "User 2")
+
+            await connection_manager.subscribe(conn1.connection_id, "table:a")
+            assert connection_manager.get_stats()["redis_channels"] == 0
 
-            # Count how many times send_json was called (should be 1 for conn2 only)
-            # Note: The connect/disconnect events also trigger send_json, so we check
-            # that at least the broadcast happened
-            assert mock_websocket.send_json.call_count >= 1
+            await connection_manager.subscribe(conn2.connection_id, "table:a")
+            assert connection_manager.get_stats()["redis_channels"] == 1
+            assert mock_redis_pubsub.subscribe.call_count == 2
 
     @pytest.mark.asyncio
     async def test_get_stats(self, connection_manager, mock_websocket):
@@ -369,3 +428,177 @@ class TestRedisPubSub:
         assert stats["total_users"] == 2
         assert channel in stats["channels"]
         assert stats["channels"][channel] == 2
+
+
+class BlockingWebSocket:
+    """WebSocket whose sends wait until released."""
+
+    def __init__(self) -> None:
+        self.accept = AsyncMock()
+        self.close = AsyncMock()
+        self.sent: list[str] = []
+        self.released = asyncio.Event()
+
+    async def send_text(self, frame: str) -> None:
+        await self.released.wait()
+        self.sent.append(frame)
+
+
+class TestSendQueues:
+    """Test suite for per-connection send queues and slow consumers."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, connection_manager):
+        channel = "table:test-uuid"
+        sockets = []
+        for _ in range(3):
+            ws = MagicMock()
+            ws.accept = AsyncMock()
+            ws.send_text = AsyncMock()
+            conn = await connection_manager.connect(ws, str(uuid4()), "User")
+            await connection_manager.subscribe(conn.connection_id, channel)
+            sockets.append(ws)
+        await connection_manager.flush()
+
+        with patch("pybase.realtime.manager.REDIS_AVAILABLE", False):
+            sent = await connection_manager.broadcast_to_channel(
+                channel, ConnectEvent(connection_id="c", user_id="u")
+            )
+        await connection_manager.flush()
+
+        assert sent == 3
+        frames = [ws.send_text.call_args[0][0] for ws in sockets]
+        assert all(frame is frames[0] for frame in frames)
+        assert '"type":"connect"' in frames[0]
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_stall_channel(self, connection_manager, mock_websocket):
+        channel = "table:test-uuid"
+        slow_ws = BlockingWebSocket()
+        slow = await connection_manager.connect(slow_ws, str(uuid4()), "Slow")
+        fast = await connection_manager.connect(mock_websocket, str(uuid4()), "Fast")
+        await connection_manager.subscribe(slow.connection_id, channel)
+        await connection_manager.subscribe(fast.connection_id, channel)
+
+        with patch("pybase.realtime.manager.REDIS_AVAILABLE", False):
+            await connection_manager.broadcast_to_channel(
+                channel, ConnectEvent(connection_id="c", user_id="u")
+            )
+        await fast.send_queue.join()
+
+        # connect, subscribed and broadcast frames reached the fast client
+        assert mock_websocket.send_text.call_count == 3
+        assert slow_ws.sent == []
+
+        slow_ws.released.set()
+        await connection_manager.flush()
+        assert len(slow_ws.sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_frame(self, connection_manager):
+        connection_manager._send_queue_size = 2
+        ws = BlockingWebSocket()
+        conn = await connection_manager.connect(ws, str(uuid4()), "Slow")
+        # Let the writer take the connect frame and block on it
+        await asyncio.sleep(0)
+
+        for i in range(5):
+            await connection_manager.send_to_connection(
+                conn.connection_id, PongEvent(request_id=str(i))
+            )
+
+        ws.released.set()
+        await connection_manager.flush()
+
+        request_ids = [json.loads(frame)["request_id"] for frame in ws.sent[1:]]
+        assert request_ids == ["3", "4"]
+        assert conn.connection_id in connection_manager._connections
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_with_policy(self, connection_manager):
+        connection_manager._send_queue_size = 2
+        connection_manager._slow_consumer_policy = "disconnect"
+        ws = BlockingWebSocket()
+        conn = await connection_manager.connect(ws, str(uuid4()), "Slow")
+        await asyncio.sleep(0)
+
+        results = [
+            await connection_manager.send_to_connection(conn.connection_id, PongEvent())
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        assert results == [True, True, False]
+        assert conn.connection_id not in connection_manager._connections
+        ws.close.assert_called_once()
+        assert ws.close.call_args.kwargs["code"] == SLOW_CONSUMER_CLOSE_CODE
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_disconnects(self, connection_manager):
+        connection_manager._send_timeout = 0.01
+        ws = BlockingWebSocket()
+        conn = await connection_manager.connect(ws, str(uuid4()), "Stuck")
+
+        for _ in range(20):
+            await asyncio.sleep(0.005)
+            if conn.connection_id not in connection_manager._connections:
+                break
+
+        assert conn.connection_id not in connection_manager._connections
+        assert connection_manager.get_stats()["queued_frames"] == 0
+
+
+class TestRedisMessageDispatch:
+    """Test suite for dispatching Redis messages to registered handlers."""
+
+    @pytest.mark.asyncio
+    async def test_exact_and_pattern_handlers(self):
+        from pybase.realtime.redis_pubsub import RedisPubSubManager
+
+        pubsub = RedisPubSubManager()
+        exact, pattern, other = [], [], []
+        pubsub.on_message("realtime:table:a", exact.append)
+        pubsub.on_message("cache:*", pattern.append)
+        pubsub.on_message("realtime:table:b", other.append)
+
+        for _ in range(3):
+            await pubsub._handle_message(
+                {"type": "message", "channel": "realtime:table:a", "data": '{"n": 1}'}
+            )
+        await pubsub._handle_message(
+            {"type": "message", "channel": "cache:access:invalidate", "data": '{"n": 2}'}
+        )
+        await pubsub._handle_message(
+            {
+                "type": "pmessage",
+                "pattern": "cache:*",
+                "channel": "cache:auth:invalidate",
+                "data": '{"n": 3}',
+            }
+        )
+
+        # Registered handler lists are not extended by dispatching
+        assert exact == [{"n": 1}] * 3
+        assert pattern == [{"n": 2}, {"n": 3}]
+        assert other == []
+
+        pubsub.off_message("cache:*", pattern.append)
+        assert not pubsub._handler_patterns
+
+    @pytest.mark.asyncio
+    async def test_listener_stop_handlers(self):
+        from pybase.realtime.redis_pubsub import RedisPubSubManager
+
+        pubsub = RedisPubSubManager()
+        stopped = []
+        pubsub.on_listener_stopped(lambda: stopped.append(1))
+
+        async def unavailable():
+            return None
+
+        # The listener exits at once without a PubSub connection
+        pubsub.get_pubsub = unavailable
+        await pubsub._listener()
+
+        assert stopped == [1]
+        assert not pubsub.is_listening
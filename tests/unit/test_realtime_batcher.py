@@ -0,0 +1,225 @@
+"""
+Unit tests for realtime event batching and the table -> chart IDs cache.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from pybase.cache import table_charts_cache
+from pybase.cache.table_charts_cache import TableChartsCache
+from pybase.realtime.batcher import RealtimeBatcher
+from pybase.schemas.realtime import (
+    ChartDataChangeEvent,
+    EventType,
+    FieldReorderedEvent,
+    RecordBatchChangeEvent,
+    RecordChangeEvent,
+)
+from pybase.services.chart import get_table_chart_ids, invalidate_table_charts
+
+
+class RecordingManager:
+    """Connection manager recording broadcasts."""
+
+    def __init__(self) -> None:
+        self.broadcasts: list[tuple[str, object]] = []
+
+    async def broadcast_to_channel(self, channel: str, event) -> None:
+        self.broadcasts.append((channel, event))
+
+
+class FakePubSub:
+    """In-memory stand-in for the realtime Redis pub/sub manager."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+        self.stopped_handlers: list = []
+        self.published: list[tuple[str, dict]] = []
+
+    def on_message(self, channel: str, handler) -> None:
+        self.handlers.setdefault(channel, []).append(handler)
+
+    def off_message(self, channel: str, handler) -> None:
+        if handler in self.handlers.get(channel, []):
+            self.handlers[channel].remove(handler)
+
+    def on_listener_stopped(self, handler) -> None:
+        self.stopped_handlers.append(handler)
+
+    def off_listener_stopped(self, handler) -> None:
+        if handler in self.stopped_handlers:
+            self.stopped_handlers.remove(handler)
+
+    async def subscribe(self, channel: str) -> bool:
+        return True
+
+    async def start_listener(self) -> bool:
+        return True
+
+    async def publish(self, channel: str, message: dict) -> bool:
+        self.published.append((channel, message))
+        return True
+
+    def deliver(self, channel: str, message: dict) -> None:
+        """Simulate a message published by another worker."""
+        for handler in self.handlers.get(channel, []):
+            handler(message)
+
+
+class FakeSession:
+    """Session returning preset chart IDs and counting queries."""
+
+    def __init__(self, *results: list[str]) -> None:
+        self.results = list(results)
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        chart_ids = self.results.pop(0)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: chart_ids))
+
+
+def _updated(record_id: str, user_id: str = "u1") -> RecordChangeEvent:
+    return RecordChangeEvent(
+        event=EventType.RECORD_UPDATED,
+        table_id="t1",
+        record_id=record_id,
+        data={"id": record_id},
+        changed_by=user_id,
+    )
+
+
+@pytest.fixture
+def pubsub(monkeypatch) -> FakePubSub:
+    """Isolate the table charts cache and pub/sub manager per test."""
+    fake = FakePubSub()
+    monkeypatch.setattr("pybase.realtime.redis_pubsub.get_pubsub_manager", lambda: fake)
+    monkeypatch.setattr(table_charts_cache.invalidations, "subscribed", False)
+    table_charts_cache.local_table_charts.clear()
+    yield fake
+    table_charts_cache.local_table_charts.clear()
+
+
+class TestRealtimeBatcher:
+    """Tests for merging events per channel."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_edit_becomes_one_batch_event(self):
+        manager = RecordingManager()
+        batcher = RealtimeBatcher(manager, window=60)
+
+        for i in range(5000):
+            await batcher.emit("table:t1", _updated(f"rec{i}"))
+            await batcher.emit(
+                "table:t1",
+                ChartDataChangeEvent(table_id="t1", chart_ids=["c1", "c2"], changed_by="u1"),
+            )
+        assert manager.broadcasts == []
+
+        await batcher.flush()
+
+        assert len(manager.broadcasts) == 2
+        (_, records), (_, charts) = manager.broadcasts
+        assert isinstance(records, RecordBatchChangeEvent)
+        assert records.event == EventType.RECORD_BATCH_UPDATED
+        assert records.count == 5000
+        assert records.record_ids[:2] == ["rec0", "rec1"]
+        assert charts.chart_ids == ["c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_merging_keeps_kinds_users_and_order_apart(self):
+        manager = RecordingManager()
+        batcher = RealtimeBatcher(manager, window=60)
+        reordered = FieldReorderedEvent(table_id="t1", field_order=["f2", "f1"], changed_by="u1")
+
+        await batcher.emit("table:t1", _updated("a"))
+        await batcher.emit("table:t1", reordered)
+        await batcher.emit("table:t1", _updated("a"))
+        await batcher.emit("table:t1", _updated("b", user_id="u2"))
+        await batcher.emit(
+            "table:t1",
+            RecordBatchChangeEvent(
+                event=EventType.RECORD_BATCH_DELETED,
+                table_id="t1",
+                record_ids=["c", "d"],
+                count=2,
+                changed_by="u1",
+            ),
+        )
+        await batcher.emit(
+            "table:t1",
+            ChartDataChangeEvent(table_id="t1", chart_ids=["c1"], changed_by="u1"),
+        )
+        await batcher.emit(
+            "table:t1",
+            ChartDataChangeEvent(table_id="t1", chart_ids=["c2", "c1"], changed_by="u1"),
+        )
+        await batcher.flush()
+
+        events = [event for _, event in manager.broadcasts]
+        # A record updated twice by one user is still a single record change
+        assert isinstance(events[0], RecordChangeEvent)
+        assert events[0].record_id == "a"
+        assert events[1] is reordered
+        assert events[2].changed_by == "u2"
+        assert events[3].event == EventType.RECORD_BATCH_DELETED
+        assert events[3].record_ids == ["c", "d"]
+        assert events[4].chart_ids == ["c1", "c2"]
+        assert len(events) == 5
+
+    @pytest.mark.asyncio
+    async def test_window_flushes_each_channel(self):
+        manager = RecordingManager()
+        batcher = RealtimeBatcher(manager, window=0.01)
+
+        await batcher.emit("table:t1", _updated("a"))
+        await batcher.emit("table:t2", _updated("b"))
+        await asyncio.sleep(0.05)
+
+        assert sorted(channel for channel, _ in manager.broadcasts) == ["table:t1", "table:t2"]
+        assert len(batcher) == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_window_broadcasts_immediately(self):
+        manager = RecordingManager()
+        batcher = RealtimeBatcher(manager, window=0)
+
+        await batcher.emit("table:t1", _updated("a"))
+
+        assert len(manager.broadcasts) == 1
+
+
+class TestTableChartIds:
+    """Tests for caching the charts built on a table."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_skip_query(self, pubsub):
+        db = FakeSession(["c1", "c2"])
+
+        assert await get_table_chart_ids(db, "t1") == ["c1", "c2"]
+        assert await get_table_chart_ids(db, "t1") == ["c1", "c2"]
+        assert db.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_chart_changes_invalidate_every_worker(self, pubsub):
+        db = FakeSession(["c1"], ["c1", "c2"], ["c2"])
+        await get_table_chart_ids(db, "t1")
+
+        await invalidate_table_charts("t1")
+        assert await get_table_chart_ids(db, "t1") == ["c1", "c2"]
+        assert pubsub.published == [
+            (
+                TableChartsCache.INVALIDATION_CHANNEL,
+                {"event": "invalidate", "scope": "table", "id": "t1"},
+            )
+        ]
+
+        # Published by another worker
+        pubsub.deliver(
+            TableChartsCache.INVALIDATION_CHANNEL,
+            {"event": "invalidate", "scope": "table", "id": "t1"},
+        )
+        assert await get_table_chart_ids(db, "t1") == ["c2"]
+        assert db.queries == 3
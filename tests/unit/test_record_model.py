@@ -0,0 +1,60 @@
+"""
+Unit tests for Record field value access and parse caching.
+"""
+
+import json
+from unittest import mock
+
+from pybase.models.record import Record
+
+
+def _record(data: dict) -> Record:
+    return Record(table_id="00000000-0000-0000-0000-000000000000", data=json.dumps(data))
+
+
+def test_data_parsed_once_per_instance():
+    record = _record({"a": 1, "b": "x"})
+
+    with mock.patch("pybase.models.record.json.loads", wraps=json.loads) as loads:
+        for _ in range(5):
+            assert record.get_all_values() == {"a": 1, "b": "x"}
+            assert record.get_field_value("a") == 1
+
+    assert loads.call_count == 1
+
+
+def test_assigning_data_invalidates_cache():
+    record = _record({"a": 1})
+    record.get_all_values()
+
+    record.data = json.dumps({"a": 2})
+
+    assert record.get_field_value("a") == 2
+
+
+def test_set_field_value_serializes_lazily():
+    record = _record({"a": 1})
+
+    record.set_field_value("b", 2)
+
+    assert record.get_field_value("b") == 2
+    assert json.loads(record.data) == {"a": 1}
+
+    record.sync_data()
+
+    assert json.loads(record.data) == {"a": 1, "b": 2}
+
+
+def test_get_all_values_returns_copy():
+    record = _record({"a": 1})
+
+    record.get_all_values()["a"] = 99
+
+    assert record.get_field_value("a") == 1
+
+
+def test_invalid_json_yields_empty_values():
+    record = Record(table_id="00000000-0000-0000-0000-000000000000", data="not json")
+
+    assert record.get_all_values() == {}
+    assert record.get_field_value("a") is None
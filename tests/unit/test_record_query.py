@@ -0,0 +1,335 @@
+"""
+Unit tests for SQL compilation of record filters, sorts and search.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from pybase.core.exceptions import ValidationError
+from pybase.db.estimate import Explain, estimate_row_count
+from pybase.models.record import Record
+from pybase.schemas.view import Conjunction, FilterCondition, FilterOperator, SortRule
+from pybase.services.record_query import (
+    RecordQueryCompiler,
+    normalize_filters,
+    normalize_sorts,
+    typed_field_expression,
+)
+
+
+def _sql(clause) -> str:
+    """Render a clause as PostgreSQL with inline parameters."""
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+def _record(data: dict) -> SimpleNamespace:
+    """Build a record stand-in exposing what cursor encoding reads."""
+    return SimpleNamespace(
+        id=str(uuid4()),
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        get_all_values=lambda: data,
+    )
+
+
+class TestNormalization:
+    """Tests for filter/sort normalization."""
+
+    def test_normalize_filter_models_and_dicts(self):
+        field_id = uuid4()
+        filters = normalize_filters(
+            [
+                FilterCondition(
+                    field_id=field_id,
+                    operator=FilterOperator.EQUALS,
+                    value="x",
+                    conjunction=Conjunction.OR,
+                ),
+                {"field_id": "field1", "operator": "gt", "value": 3},
+            ]
+        )
+
+        assert filters[0] == {
+            "field_id": str(field_id),
+            "operator": "equals",
+            "value": "x",
+            "conjunction": "or",
+        }
+        assert filters[1]["conjunction"] == "and"
+
+    def test_normalize_sorts(self):
+        field_id = uuid4()
+        sorts = normalize_sorts([SortRule(field_id=field_id), {"field_id": "f", "direction": "desc"}])
+
+        assert sorts == [
+            {"field_id": str(field_id), "direction": "asc"},
+            {"field_id": "f", "direction": "desc"},
+        ]
+
+
+class TestCompileFilters:
+    """Tests for filter compilation."""
+
+    def test_no_filters(self):
+        assert RecordQueryCompiler().compile_filters([]) is None
+
+    def test_field_id_is_quoted_literal(self):
+        clause = RecordQueryCompiler().compile_condition("it's", "contains", "A")
+
+        assert "->> 'it''s'" in _sql(clause)
+
+    def test_equals_uses_containment(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "equals", 5))
+
+        assert sql == "records.data @> CAST('{\"f1\": 5}' AS JSONB)"
+
+    def test_equals_non_scalar_compares_jsonb(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "equals", ["a"]))
+
+        assert "(records.data -> 'f1') = CAST('[\"a\"]' AS JSONB)" in sql
+
+    def test_contains_is_escaped_and_case_sensitive_by_default(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "contains", "50%"))
+
+        assert " LIKE " in sql
+        assert "ILIKE" not in sql
+        assert "'50/%%'" in sql
+
+    def test_contains_case_insensitive(self):
+        compiler = RecordQueryCompiler(case_insensitive=True)
+        sql = _sql(compiler.compile_condition("f1", "contains", "abc"))
+
+        assert "ILIKE" in sql
+
+    def test_comparison_requires_matching_json_type(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "gt", 25))
+
+        assert "jsonb_typeof" in sql
+        assert "> CAST('25' AS JSONB)" in sql
+
+    def test_negations_match_missing_values(self):
+        compiler = RecordQueryCompiler()
+
+        assert _sql(compiler.compile_condition("f1", "not_equals", "Active")) == (
+            "(records.data -> 'f1') IS DISTINCT FROM CAST('\"Active\"' AS JSONB)"
+        )
+        not_contains = _sql(compiler.compile_condition("f1", "not_contains", "World"))
+        assert not_contains.startswith("(records.data -> 'f1') IS NULL OR ")
+        assert "NOT LIKE '%%' || 'World' || '%%'" in not_contains
+        not_in = _sql(compiler.compile_condition("f1", "not_in", ["Active"]))
+        assert not_in == (
+            "(records.data -> 'f1') IS NULL OR "
+            "((records.data -> 'f1') NOT IN (CAST('\"Active\"' AS JSONB)))"
+        )
+
+    def test_prefix_and_suffix_skip_empty_values(self):
+        compiler = RecordQueryCompiler()
+        starts = _sql(compiler.compile_condition("f1", "starts_with", "Al"))
+        ends = _sql(compiler.compile_condition("f1", "ends_with", "ie"))
+
+        assert starts.startswith("NOT (") and starts.endswith("LIKE 'Al' || '%%' ESCAPE '/')")
+        assert ends.startswith("NOT (") and ends.endswith("LIKE '%%' || 'ie' ESCAPE '/')")
+
+    @pytest.mark.parametrize("operator, sql_operator", [("lt", "<"), ("gte", ">="), ("lte", "<=")])
+    def test_comparison_operators(self, operator, sql_operator):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", operator, 30))
+
+        assert sql == (
+            "jsonb_typeof(records.data -> 'f1') = jsonb_typeof(CAST('30' AS JSONB)) "
+            f"AND (records.data -> 'f1') {sql_operator} CAST('30' AS JSONB)"
+        )
+
+    def test_empty_checks_cover_null_blank_and_empty_list(self):
+        compiler = RecordQueryCompiler()
+        is_empty = _sql(compiler.compile_condition("f1", "is_empty", None))
+        is_not_empty = _sql(compiler.compile_condition("f1", "is_not_empty", None))
+
+        assert "IN (CAST('null' AS JSONB), CAST('\"\"' AS JSONB))" in is_empty
+        assert is_empty.endswith("OR (records.data -> 'f1') = CAST('[]' AS JSONB)")
+        assert is_not_empty.startswith("NOT (")
+        assert is_not_empty.endswith("AND (records.data -> 'f1') != CAST('[]' AS JSONB)")
+
+    def test_in_matches_any_value_by_containment(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "in", ["Active", "Pending"]))
+
+        assert sql == (
+            "(records.data @> CAST('{\"f1\": \"Active\"}' AS JSONB)) "
+            "OR (records.data @> CAST('{\"f1\": \"Pending\"}' AS JSONB))"
+        )
+
+    def test_in_with_empty_list_matches_nothing(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "in", []))
+
+        assert sql == "false"
+
+    def test_unsupported_operator_matches_everything(self):
+        sql = _sql(RecordQueryCompiler().compile_condition("f1", "is_today", None))
+
+        assert sql == "true"
+
+    def test_and_or_conjunctions(self):
+        sql = _sql(
+            RecordQueryCompiler().compile_filters(
+                [
+                    {"field_id": "a", "operator": "equals", "value": 1},
+                    {"field_id": "b", "operator": "equals", "value": 2, "conjunction": "or"},
+                    {"field_id": "c", "operator": "equals", "value": 3, "conjunction": "or"},
+                ]
+            )
+        )
+
+        assert sql.startswith("(records.data @> CAST('{\"a\": 1}' AS JSONB)) AND (")
+        assert " OR " in sql
+
+    def test_only_or_conjunctions(self):
+        sql = _sql(
+            RecordQueryCompiler().compile_filters(
+                [
+                    {"field_id": "a", "operator": "equals", "value": 1, "conjunction": "or"},
+                    {"field_id": "b", "operator": "equals", "value": 2, "conjunction": "or"},
+                ]
+            )
+        )
+
+        assert sql == (
+            "(records.data @> CAST('{\"a\": 1}' AS JSONB)) "
+            "OR (records.data @> CAST('{\"b\": 2}' AS JSONB))"
+        )
+
+    def test_search_uses_indexed_expressions(self):
+        sql = _sql(RecordQueryCompiler().compile_search("50% bolt"))
+
+        assert "records.search_vector @@ websearch_to_tsquery(CAST('simple' AS REGCONFIG)" in sql
+        assert "record_search_text(records.data) ILIKE" in sql
+        assert "50/%" in sql
+
+
+class TestSortingAndCursor:
+    """Tests for ORDER BY and keyset cursor compilation."""
+
+    def test_order_by_blanks_last_with_tiebreakers(self):
+        order_by = RecordQueryCompiler().compile_order_by([{"field_id": "f1", "direction": "desc"}])
+        sql = [_sql(expr) for expr in order_by]
+
+        assert len(sql) == 4
+        assert sql[0].endswith("ASC")
+        assert sql[1].startswith("coalesce") and sql[1].endswith("DESC")
+        assert sql[2] == "records.created_at ASC"
+        assert sql[3] == "records.id ASC"
+
+    def test_multiple_sorts_in_order(self):
+        order_by = RecordQueryCompiler().compile_order_by(
+            [{"field_id": "status", "direction": "asc"}, {"field_id": "age", "direction": "desc"}]
+        )
+        sql = [_sql(expr) for expr in order_by]
+
+        assert sql[1] == "coalesce(records.data -> 'status', CAST('null' AS JSONB)) ASC"
+        assert sql[3] == "coalesce(records.data -> 'age', CAST('null' AS JSONB)) DESC"
+        assert sql[4:] == ["records.created_at ASC", "records.id ASC"]
+
+    def test_no_sorts_orders_by_creation(self):
+        sql = [_sql(expr) for expr in RecordQueryCompiler().compile_order_by([])]
+
+        assert sql == ["records.created_at ASC", "records.id ASC"]
+
+    def test_cursor_round_trip(self):
+        compiler = RecordQueryCompiler()
+        sorts = [{"field_id": "f1", "direction": "asc"}]
+        record = _record({"f1": "abc"})
+
+        cursor = compiler.encode_cursor(sorts, record)
+        sql = _sql(compiler.keyset_predicate(sorts, cursor))
+
+        assert "CAST('\"abc\"' AS JSONB)" in sql
+        assert record.id.replace("-", "") in sql
+
+    def test_cursor_mismatched_sorts(self):
+        compiler = RecordQueryCompiler()
+        cursor = compiler.encode_cursor([], _record({}))
+
+        with pytest.raises(ValidationError):
+            compiler.keyset_predicate([{"field_id": "f1"}], cursor)
+
+    def test_search_order_and_cursor(self):
+        compiler = RecordQueryCompiler()
+        order_by = [_sql(expr) for expr in compiler.compile_search_order_by("bolt")]
+
+        assert order_by[0].startswith("ts_rank(records.search_vector") and "DESC" in order_by[0]
+        assert order_by[1] == "records.id ASC"
+
+        record = _record({})
+        cursor = compiler.encode_search_cursor(0.25, record)
+        sql = _sql(compiler.search_keyset_predicate("bolt", cursor))
+        assert ") < 0.25 OR " in sql
+        assert "AND records.id > " in sql
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValidationError):
+            RecordQueryCompiler().keyset_predicate([], "not-a-cursor")
+
+
+class TestIndexedFields:
+    """Tests for typed expressions on indexed fields."""
+
+    def test_typed_numeric_expression(self):
+        sql = _sql(typed_field_expression(Record.__table__.c.data, "f1", "number"))
+
+        assert sql == (
+            "CASE WHEN (jsonb_typeof(records.data -> 'f1') = 'number') "
+            "THEN CAST(records.data ->> 'f1' AS NUMERIC) END"
+        )
+
+    def test_typed_text_expression(self):
+        sql = _sql(typed_field_expression(Record.__table__.c.data, "f1", "text"))
+
+        assert sql == "nullif(records.data ->> 'f1', '')"
+
+    def test_unindexable_type(self):
+        with pytest.raises(ValueError):
+            typed_field_expression(Record.__table__.c.data, "f1", "attachment")
+
+    def test_indexed_comparison_uses_typed_expression(self):
+        compiler = RecordQueryCompiler(indexed_fields={"f1": "number"})
+        sql = _sql(compiler.compile_condition("f1", "gte", "2.5"))
+
+        assert sql.startswith("CASE WHEN")
+        assert sql.endswith(">= 2.5")
+
+    def test_indexed_sort_is_nulls_last(self):
+        compiler = RecordQueryCompiler(indexed_fields={"f1": "number"})
+        sql = [_sql(expr) for expr in compiler.compile_order_by([{"field_id": "f1", "direction": "desc"}])]
+
+        assert len(sql) == 3
+        assert sql[0].endswith("DESC NULLS LAST")
+
+    def test_indexed_cursor_with_null_value(self):
+        compiler = RecordQueryCompiler(indexed_fields={"f1": "number"})
+        sorts = [{"field_id": "f1"}]
+
+        cursor = compiler.encode_cursor(sorts, _record({"f1": "not a number"}))
+        sql = _sql(compiler.keyset_predicate(sorts, cursor))
+
+        assert "IS NULL" in sql
+
+
+class TestEstimate:
+    """Tests for planner row estimates."""
+
+    def test_explain_wraps_statement(self):
+        sql = _sql(Explain(select(Record.id).where(Record.table_id == "t")))
+
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT records.id")
+
+    @pytest.mark.asyncio
+    async def test_estimate_reads_plan_rows(self):
+        class Session:
+            async def execute(self, statement):
+                return SimpleNamespace(scalar=lambda: '[{"Plan": {"Plan Rows": 42}}]')
+
+        assert await estimate_row_count(Session(), select(Record.id)) == 42
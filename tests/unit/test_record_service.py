@@ -2,16 +2,20 @@
 Unit tests for RecordService filter and search functionality.
 """
 
+import asyncio
+from types import SimpleNamespace
 from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pybase.core.exceptions import ValidationError
 from pybase.models.base import Base
 from pybase.models.field import Field, FieldType
 from pybase.models.record import Record
 from pybase.models.table import Table
 from pybase.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
 from pybase.models.user import User
+from pybase.schemas.record import RecordUpdate
 from pybase.services.record import RecordService
 from pybase.schemas.view import FilterCondition, FilterOperator, Conjunction
 
@@ -854,3 +858,98 @@ async def test_batch_delete_records_sets_deleted_by_id(
     for record in deleted_records:
         assert record.deleted_at is not None
         assert record.deleted_by_id == str(test_user.id)
+
+
+def _tracked_service(monkeypatch) -> tuple[RecordService, list[str], list[tuple]]:
+    """Service whose cache invalidations and chart snapshot updates are recorded."""
+    service = RecordService()
+    invalidated: list[str] = []
+    applied: list[tuple] = []
+
+    async def invalidate_table_cache(table_id: str) -> None:
+        invalidated.append(table_id)
+
+    async def invalidate_chart_cache(table_id: str) -> int:
+        return 1
+
+    def apply_record_changes(table_id, table_version, changes) -> None:
+        applied.append((table_id, changes))
+
+    monkeypatch.setattr(service.cache, "invalidate_table_cache", invalidate_table_cache)
+    monkeypatch.setattr(service.chart_cache, "invalidate_table_cache", invalidate_chart_cache)
+    monkeypatch.setattr(
+        "pybase.services.record.get_chart_snapshot_store",
+        lambda: SimpleNamespace(apply_record_changes=apply_record_changes),
+    )
+    return service, invalidated, applied
+
+
+@pytest.mark.asyncio
+async def test_caches_invalidated_after_commit(monkeypatch) -> None:
+    """Test single-record writes reach the caches and chart snapshots once committed."""
+    service, invalidated, applied = _tracked_service(monkeypatch)
+    session = AsyncSession()
+
+    await service._invalidate_table_caches("t1", [(None, {"f": 1})], session)
+    await service._invalidate_table_caches("t1", [({"f": 1}, None)], session)
+    assert invalidated == []
+    assert applied == []
+
+    await session.commit()
+    await asyncio.sleep(0)
+
+    assert invalidated == ["t1"]
+    assert applied == [("t1", [(None, {"f": 1}), ({"f": 1}, None)])]
+
+
+@pytest.mark.asyncio
+async def test_caches_not_invalidated_after_rollback(monkeypatch) -> None:
+    """Test rolled back writes leave the caches and chart snapshots alone."""
+    service, invalidated, applied = _tracked_service(monkeypatch)
+    session = AsyncSession()
+
+    await session.begin()
+    await service._invalidate_table_caches("t1", [(None, {"f": 1})], session)
+    await session.rollback()
+    await session.commit()
+    await asyncio.sleep(0)
+
+    assert invalidated == []
+    assert applied == []
+
+
+@pytest.mark.asyncio
+async def test_batch_update_keeps_unchanged_values_in_unique_checks(monkeypatch) -> None:
+    """Test only records whose data is replaced are excluded from uniqueness checks."""
+    records = {
+        record_id: SimpleNamespace(
+            id=record_id, table_id="t1", data="{}", row_height=32, is_deleted=False
+        )
+        for record_id in ("r1", "r2")
+    }
+
+    async def get(model, record_id):
+        return records[record_id]
+
+    async def require_table_access(*args, **kwargs):
+        return SimpleNamespace(table_id="t1", base_id="b1")
+
+    excluded: list[list[str]] = []
+
+    async def validate_records_batch(db, table_id, rows, exclude_record_ids):
+        excluded.append(exclude_record_ids)
+        raise ValidationError("stop")
+
+    service = RecordService()
+    monkeypatch.setattr("pybase.services.record.require_table_access", require_table_access)
+    monkeypatch.setattr(service, "_validate_records_batch", validate_records_batch)
+
+    with pytest.raises(ValidationError):
+        await service.batch_update_records(
+            SimpleNamespace(get=get),
+            "u1",
+            "t1",
+            [("r1", RecordUpdate(data={"f": 1})), ("r2", RecordUpdate(row_height=64))],
+        )
+
+    assert excluded == [["r1"]]
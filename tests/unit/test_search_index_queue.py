@@ -0,0 +1,142 @@
+"""
+Unit tests for the coalescing search index queue.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from pybase.services.search_index_queue import SearchIndexQueue
+
+BASE_ID = str(uuid4())
+
+
+class FakeIndexManager:
+    """Index manager stand-in recording bulk requests."""
+
+    def __init__(self, ok: bool = True) -> None:
+        self.ok = ok
+        self.indexed: list[list[str]] = []
+        self.deleted: list[list[str]] = []
+
+    def index_records_batch(self, base_id, records, batch_size=1000) -> bool:
+        self.indexed.append([record["id"] for record in records])
+        return self.ok
+
+    def delete_records_batch(self, base_id, record_ids) -> bool:
+        self.deleted.append(list(record_ids))
+        return self.ok
+
+
+class FakeSession:
+    """Session returning the stored (record, table name) rows that were queried."""
+
+    def __init__(self, records: dict) -> None:
+        self.records = records
+        self.queries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, query):
+        self.queries += 1
+        rows = [(record, "Parts") for record in self.records.values()]
+        return SimpleNamespace(all=lambda: rows)
+
+
+def _record(deleted: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=str(uuid4()),
+        table_id=str(uuid4()),
+        deleted_at=datetime(2026, 1, 1) if deleted else None,
+        created_at=None,
+        updated_at=None,
+        get_all_values=lambda: {"name": "bolt"},
+    )
+
+
+def _queue(records: dict, manager: FakeIndexManager, **kwargs) -> tuple:
+    session = FakeSession(records)
+    options = {"flush_interval": 60, "batch_size": 100, "max_pending": 1000, "max_attempts": 2}
+    options.update(kwargs)
+    queue = SearchIndexQueue(index_manager=manager, session_factory=lambda: session, **options)
+    return queue, session
+
+
+class TestSearchIndexQueue:
+    """Tests for queueing, coalescing and bulk indexing."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_repeated_writes(self):
+        record = _record()
+        manager = FakeIndexManager()
+        queue, session = _queue({record.id: record}, manager)
+
+        for _ in range(3):
+            queue.enqueue(BASE_ID, [record.id])
+        assert len(queue) == 1
+
+        await queue.flush()
+        await queue.stop()
+
+        assert manager.indexed == [[record.id]]
+        assert session.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_soft_deleted_records_are_removed(self):
+        live, deleted = _record(), _record(deleted=True)
+        manager = FakeIndexManager()
+        queue, _ = _queue({live.id: live, deleted.id: deleted}, manager)
+
+        queue.enqueue(BASE_ID, [live.id, deleted.id])
+        await queue.stop()
+
+        assert manager.indexed == [[live.id]]
+        assert manager.deleted == [[deleted.id]]
+
+    @pytest.mark.asyncio
+    async def test_missing_records_are_retried_then_removed(self):
+        manager = FakeIndexManager()
+        queue, _ = _queue({}, manager)
+        record_id = str(uuid4())
+
+        queue.enqueue(BASE_ID, [record_id])
+        await queue.flush()
+        assert len(queue) == 1
+        assert manager.deleted == []
+
+        await queue.flush()
+        await queue.stop()
+
+        assert len(queue) == 0
+        assert manager.deleted == [[record_id]]
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_stay_queued(self):
+        record = _record()
+        manager = FakeIndexManager(ok=False)
+        queue, _ = _queue({record.id: record}, manager)
+
+        queue.enqueue(BASE_ID, [record.id])
+        await queue.flush()
+
+        assert len(queue) == 1
+        manager.ok = True
+        await queue.stop()
+        assert len(queue) == 0
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest_past_max_pending(self):
+        queue, _ = _queue({}, FakeIndexManager(), max_pending=2)
+        first, *rest = [str(uuid4()) for _ in range(3)]
+
+        queue.enqueue(BASE_ID, [first, *rest])
+        keys = list(queue._pending)
+        await queue.stop()
+
+        assert keys == [(BASE_ID, record_id) for record_id in rest]
@@ -0,0 +1,151 @@
+"""
+Unit tests for resumable search reindex jobs.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from pybase.core.exceptions import ValidationError
+from pybase.services.search_reindex import (
+    REINDEX_COMPLETED,
+    REINDEX_FAILED,
+    ReindexCheckpoint,
+    SearchReindexer,
+)
+
+BASE_ID = str(uuid4())
+TABLE_ID = str(uuid4())
+
+
+class FakeIndexManager:
+    """Index manager stand-in; tasks listed in ``failing`` do not succeed."""
+
+    def __init__(self, failing: tuple[int, ...] = ()) -> None:
+        self.failing = set(failing)
+        self.batches: list[list[str]] = []
+        self.swapped = False
+
+    def add_documents(self, base_id, records, index_name=None):
+        self.batches.append([record["id"] for record in records])
+        return len(self.batches)
+
+    def wait_for_task(self, task_uid, timeout_ms=60000):
+        return task_uid not in self.failing
+
+    def get_shadow_index_name(self, base_id):
+        return f"pybase:base:{base_id}:shadow"
+
+    def delete_base_index(self, base_id, index_name=None):
+        return True
+
+    def create_base_index(self, base_id, primary_key="id", index_name=None):
+        return True
+
+    def swap_shadow_index(self, base_id):
+        self.swapped = True
+        return True
+
+
+class FakeCheckpointStore:
+    """In-memory checkpoint store."""
+
+    def __init__(self) -> None:
+        self.saved: dict[tuple[str, str], dict] = {}
+
+    async def load(self, base_id, scope):
+        data = self.saved.get((base_id, scope))
+        return ReindexCheckpoint(**data) if data else None
+
+    async def save(self, checkpoint):
+        self.saved[(checkpoint.base_id, checkpoint.scope)] = dict(vars(checkpoint))
+
+
+class FakeSession:
+    async def get(self, model, table_id):
+        return SimpleNamespace(name="Parts")
+
+
+RECORD_IDS = [f"{i:04d}" for i in range(10)]
+
+
+def _reindexer(manager: FakeIndexManager, store: FakeCheckpointStore) -> SearchReindexer:
+    reindexer = SearchReindexer(
+        FakeSession(), index_manager=manager, checkpoints=store, max_in_flight=2
+    )
+
+    async def iter_pages(table_id, after_id, batch_size):
+        remaining = [record_id for record_id in RECORD_IDS if record_id > (after_id or "")]
+        for i in range(0, len(remaining), batch_size):
+            page = remaining[i:i + batch_size]
+            yield [{"id": record_id, "table_id": table_id} for record_id in page]
+
+    async def count_records(table_ids):
+        return len(RECORD_IDS)
+
+    async def noop(*args):
+        return None
+
+    reindexer._iter_pages = iter_pages
+    reindexer._count_records = count_records
+    reindexer._remove_deleted = noop
+    reindexer._requeue_changed = noop
+    return reindexer
+
+
+class TestSearchReindexer:
+    """Tests for paging, checkpoints and resuming."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_all_pages(self):
+        manager, store = FakeIndexManager(), FakeCheckpointStore()
+
+        checkpoint = await _reindexer(manager, store).reindex(BASE_ID, [TABLE_ID], batch_size=3)
+
+        assert checkpoint.status == REINDEX_COMPLETED
+        assert checkpoint.indexed == checkpoint.total == 10
+        assert [len(batch) for batch in manager.batches] == [3, 3, 3, 1]
+        assert checkpoint.progress == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_keeps_last_applied_checkpoint(self):
+        manager, store = FakeIndexManager(failing=(2,)), FakeCheckpointStore()
+
+        checkpoint = await _reindexer(manager, store).reindex(BASE_ID, [TABLE_ID], batch_size=3)
+
+        assert checkpoint.status == REINDEX_FAILED
+        assert checkpoint.last_record_id == "0002"
+        assert checkpoint.indexed == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self):
+        store = FakeCheckpointStore()
+        await _reindexer(FakeIndexManager(failing=(2,)), store).reindex(
+            BASE_ID, [TABLE_ID], batch_size=3
+        )
+
+        manager = FakeIndexManager()
+        checkpoint = await _reindexer(manager, store).reindex(BASE_ID, [TABLE_ID], batch_size=3)
+
+        assert checkpoint.status == REINDEX_COMPLETED
+        assert manager.batches[0][0] == "0003"
+        assert checkpoint.indexed == 10
+
+    @pytest.mark.asyncio
+    async def test_shadow_job_swaps_index(self):
+        manager, store = FakeIndexManager(), FakeCheckpointStore()
+
+        checkpoint = await _reindexer(manager, store).reindex(
+            BASE_ID, [TABLE_ID], batch_size=5, shadow=True
+        )
+
+        assert checkpoint.status == REINDEX_COMPLETED
+        assert manager.swapped
+
+    @pytest.mark.asyncio
+    async def test_shadow_job_requires_whole_base(self):
+        reindexer = _reindexer(FakeIndexManager(), FakeCheckpointStore())
+
+        with pytest.raises(ValidationError):
+            await reindexer.reindex(BASE_ID, [TABLE_ID], shadow=True, scope=TABLE_ID)
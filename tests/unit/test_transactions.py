@@ -14,12 +14,29 @@ from pybase.models.field import Field, FieldType
 from pybase.models.record import Record
 from pybase.models.table import Table
 from pybase.models.unique_constraint import UniqueConstraint, UniqueConstraintStatus
-from pybase.models.workspace import Workspace
+from pybase.models.workspace import Workspace, WorkspaceRole
 from pybase.models.user import User
+from pybase.services.access import TableAccess
 from pybase.services.record import RecordService
 from pybase.services.validation import ValidationService
 
 
+def _mock_table_access(monkeypatch, denied: bool = False) -> AsyncMock:
+    """Stub the table access check RecordService runs before each operation."""
+    access = TableAccess(
+        table_id="table-1",
+        base_id="base-1",
+        workspace_id="workspace-1",
+        role=WorkspaceRole.EDITOR,
+    )
+    check = AsyncMock(
+        return_value=access,
+        side_effect=PermissionDeniedError("You don't have access") if denied else None,
+    )
+    monkeypatch.setattr("pybase.services.record.require_table_access", check)
+    return check
+
+
 class TestGetDbDependency:
     """Test get_db() dependency transaction management."""
 
@@ -90,7 +107,7 @@ class TestRecordServiceRollback:
     """Test RecordService transaction rollback behavior."""
 
     @pytest.mark.asyncio
-    async def test_create_record_rolls_back_on_validation_error(self):
+    async def test_create_record_rolls_back_on_validation_error(self, monkeypatch):
         """Test that record creation rolls back on validation error."""
         service = RecordService()
         db = AsyncMock()
@@ -100,19 +117,8 @@ class TestRecordServiceRollback:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        # Mock base and workspace to exist
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_workspace.id = "workspace-1"
-
-        # Mock workspace member to exist
-        mock_member = Mock()
-
-        # Patch internal helper methods
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        # Patch the table access check
+        _mock_table_access(monkeypatch)
 
         # Patch _validate_record_data to raise ValidationError
         service._validate_record_data = AsyncMock(
@@ -134,7 +140,7 @@ class TestRecordServiceRollback:
         db.add.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_create_record_does_not_manually_commit(self):
+    async def test_create_record_does_not_manually_commit(self, monkeypatch):
         """Test that create_record does not manually commit."""
         service = RecordService()
         db = AsyncMock()
@@ -144,15 +150,7 @@ class TestRecordServiceRollback:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-
-        mock_member = Mock()
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
         service._validate_record_data = AsyncMock()
 
         from pybase.schemas.record import RecordCreate
@@ -175,7 +173,7 @@ class TestRecordServiceRollback:
             assert not db.commit.called, "create_record should not manually commit"
 
     @pytest.mark.asyncio
-    async def test_update_record_rolls_back_on_validation_error(self):
+    async def test_update_record_rolls_back_on_validation_error(self, monkeypatch):
         """Test that record update rolls back on validation error."""
         service = RecordService()
         db = AsyncMock()
@@ -187,19 +185,7 @@ class TestRecordServiceRollback:
         mock_record.data = '{"old": "value"}'
         db.get = AsyncMock(return_value=mock_record)
 
-        # Mock table, base, workspace, member
-        mock_table = Mock()
-        mock_table.base_id = "base-1"
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-        mock_member.role = "editor"  # Need proper role
-
-        service._get_table = AsyncMock(return_value=mock_table)
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
         service.get_record_by_id = AsyncMock(return_value=mock_record)
 
         # Patch validation to raise error
@@ -221,7 +207,7 @@ class TestRecordServiceRollback:
         assert mock_record.data == '{"old": "value"}' or mock_record.data != json.dumps({"field-1": "new value"})
 
     @pytest.mark.asyncio
-    async def test_delete_record_rolls_back_on_permission_error(self):
+    async def test_delete_record_rolls_back_on_permission_error(self, monkeypatch):
         """Test that record deletion rolls back on permission error."""
         service = RecordService()
         db = AsyncMock()
@@ -233,20 +219,10 @@ class TestRecordServiceRollback:
         mock_record.deleted_at = None
         db.get = AsyncMock(return_value=mock_record)
 
-        # Mock table, base, workspace
-        mock_table = Mock()
-        mock_table.base_id = "base-1"
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-
-        service._get_table = AsyncMock(return_value=mock_table)
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
         service.get_record_by_id = AsyncMock(return_value=mock_record)
 
         # Mock no workspace member (permission denied)
-        service._get_workspace_member = AsyncMock(return_value=None)
+        _mock_table_access(monkeypatch, denied=True)
 
         # Attempt to delete
         with pytest.raises(PermissionDeniedError):
@@ -262,7 +238,7 @@ class TestMultiRecordTransactionRollback:
     """Test rollback scenarios with multiple record operations."""
 
     @pytest.mark.asyncio
-    async def test_bulk_create_rolls_back_all_on_one_error(self):
+    async def test_bulk_create_rolls_back_all_on_one_error(self, monkeypatch):
         """Test that bulk create rolls back all records if one fails."""
         service = RecordService()
         db = AsyncMock()
@@ -272,14 +248,7 @@ class TestMultiRecordTransactionRollback:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
 
         # Make second record fail validation
         call_count = 0
@@ -320,7 +289,7 @@ class TestMultiRecordTransactionRollback:
         assert not db.commit.called
 
     @pytest.mark.asyncio
-    async def test_bulk_update_rolls_back_all_on_one_error(self):
+    async def test_bulk_update_rolls_back_all_on_one_error(self, monkeypatch):
         """Test that bulk update rolls back all if one fails."""
         service = RecordService()
         db = AsyncMock()
@@ -332,19 +301,7 @@ class TestMultiRecordTransactionRollback:
             Mock(id="record-3", is_deleted=False, table_id="table-1", data='{"field-1": "old-3"}'),
         ]
 
-        # Mock table, base, workspace, member
-        mock_table = Mock()
-        mock_table.base_id = "base-1"
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-        mock_member.role = "editor"
-
-        service._get_table = AsyncMock(return_value=mock_table)
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
 
         # Make second update fail
         call_count = 0
@@ -418,12 +375,9 @@ class TestValidationServiceTransactionBehavior:
         service = ValidationService()
         db = AsyncMock()
 
-        # Mock a record with conflicting value
-        mock_record = Mock()
-        mock_record.data = '{"field-1": "duplicate-value"}'
-
+        # Mock the lookup finding the conflicting value
         mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_record])
+        mock_scalars.all = Mock(return_value=["duplicate-value"])
         mock_result = Mock()
         mock_result.scalars = Mock(return_value=mock_scalars)
         db.execute = AsyncMock(return_value=mock_result)
@@ -497,7 +451,7 @@ class TestNestedServiceCalls:
     """Test transaction behavior with nested service calls."""
 
     @pytest.mark.asyncio
-    async def test_nested_service_calls_share_transaction(self):
+    async def test_nested_service_calls_share_transaction(self, monkeypatch):
         """Test that nested service calls share the same transaction."""
         record_service = RecordService()
         db = AsyncMock()
@@ -509,18 +463,7 @@ class TestNestedServiceCalls:
         mock_record.data = '{"old": "value"}'
         db.get = AsyncMock(return_value=mock_record)
 
-        mock_table = Mock()
-        mock_table.base_id = "base-1"
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-        mock_member.role = "editor"
-
-        record_service._get_table = AsyncMock(return_value=mock_table)
-        record_service._get_base = AsyncMock(return_value=mock_base)
-        record_service._get_workspace = AsyncMock(return_value=mock_workspace)
-        record_service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
         record_service._validate_record_data = AsyncMock()
         record_service.get_record_by_id = AsyncMock(return_value=mock_record)
 
@@ -538,7 +481,7 @@ class TestNestedServiceCalls:
         assert not db.commit.called
 
     @pytest.mark.asyncio
-    async def test_nested_call_rollback_outer_transaction(self):
+    async def test_nested_call_rollback_outer_transaction(self, monkeypatch):
         """Test that error in nested call rolls back entire transaction."""
         record_service = RecordService()
         db = AsyncMock()
@@ -550,20 +493,10 @@ class TestNestedServiceCalls:
         mock_record.data = '{"old": "value"}'
         db.get = AsyncMock(return_value=mock_record)
 
-        # Mock helpers to succeed
-        mock_table = Mock()
-        mock_table.base_id = "base-1"
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-
-        record_service._get_table = AsyncMock(return_value=mock_table)
-        record_service._get_base = AsyncMock(return_value=mock_base)
-        record_service._get_workspace = AsyncMock(return_value=mock_workspace)
         record_service.get_record_by_id = AsyncMock(return_value=mock_record)
 
         # Mock member check to fail (permission denied)
-        record_service._get_workspace_member = AsyncMock(return_value=None)
+        _mock_table_access(monkeypatch, denied=True)
 
         from pybase.schemas.record import RecordUpdate
 
@@ -583,7 +516,7 @@ class TestConcurrentOperations:
     """Test transaction behavior with concurrent operations."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_creates_with_conflict(self):
+    async def test_concurrent_creates_with_conflict(self, monkeypatch):
         """Test handling of concurrent creates with conflicting unique values."""
         service = RecordService()
         db = AsyncMock()
@@ -593,14 +526,7 @@ class TestConcurrentOperations:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
 
         # First validation succeeds, second fails due to race condition
         call_count = 0
@@ -637,7 +563,7 @@ class TestTransactionIsolation:
     """Test transaction isolation levels and visibility."""
 
     @pytest.mark.asyncio
-    async def test_uncommitted_changes_not_visible(self):
+    async def test_uncommitted_changes_not_visible(self, monkeypatch):
         """Test that uncommitted changes are not visible to other queries."""
         # This tests the conceptual behavior - actual isolation depends on DB
         service = RecordService()
@@ -648,14 +574,7 @@ class TestTransactionIsolation:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
         service._validate_record_data = AsyncMock()
 
         from pybase.schemas.record import RecordCreate
@@ -680,7 +599,7 @@ class TestTransactionIsolation:
             # (this is conceptual - actual behavior depends on transaction isolation)
 
     @pytest.mark.asyncio
-    async def test_service_methods_never_call_commit(self):
+    async def test_service_methods_never_call_commit(self, monkeypatch):
         """Test that service methods never manually call commit."""
         service = RecordService()
         db = AsyncMock()
@@ -690,15 +609,7 @@ class TestTransactionIsolation:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-        mock_member.role = "editor"
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
         service._validate_record_data = AsyncMock()
 
         # Test create_record
@@ -714,7 +625,7 @@ class TestTransactionIsolation:
             assert not db.commit.called
 
     @pytest.mark.asyncio
-    async def test_service_methods_never_call_rollback(self):
+    async def test_service_methods_never_call_rollback(self, monkeypatch):
         """Test that service methods never manually call rollback."""
         service = RecordService()
         db = AsyncMock()
@@ -724,15 +635,7 @@ class TestTransactionIsolation:
         mock_table.is_deleted = False
         db.get = AsyncMock(return_value=mock_table)
 
-        mock_base = Mock()
-        mock_base.workspace_id = "workspace-1"
-        mock_workspace = Mock()
-        mock_member = Mock()
-        mock_member.role = "editor"
-
-        service._get_base = AsyncMock(return_value=mock_base)
-        service._get_workspace = AsyncMock(return_value=mock_workspace)
-        service._get_workspace_member = AsyncMock(return_value=mock_member)
+        _mock_table_access(monkeypatch)
 
         # Make validation fail
         service._validate_record_data = AsyncMock(side_effect=ValidationError("Failed"))
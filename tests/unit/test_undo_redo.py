@@ -0,0 +1,88 @@
+"""Unit tests for bulk operation logging in UndoRedoService."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pybase.core.exceptions import ConflictError
+from pybase.services.undo_redo import UndoRedoService
+
+
+def _mock_db(existing_count: int = 0) -> AsyncMock:
+    """Session whose count query returns existing_count."""
+    db = AsyncMock()
+    count_result = MagicMock()
+    count_result.scalar.return_value = existing_count
+    db.execute = AsyncMock(return_value=count_result)
+    return db
+
+
+class TestLogOperationsBulk:
+    """Test log_operations_bulk method."""
+
+    @pytest.mark.asyncio
+    async def test_single_insert_for_all_entries(self):
+        """Test all entries are written with one executemany INSERT."""
+        service = UndoRedoService()
+        db = _mock_db()
+
+        inserted = await service.log_operations_bulk(
+            db,
+            "user-1",
+            service.OPERATION_CREATE,
+            service.ENTITY_RECORD,
+            [(f"record-{i}", None, {"data": {"f": i}}) for i in range(3)],
+        )
+
+        assert inserted == 3
+        # Count query + insert
+        assert db.execute.await_count == 2
+        params = db.execute.await_args_list[-1].args[1]
+        assert [p["entity_id"] for p in params] == ["record-0", "record-1", "record-2"]
+        assert json.loads(params[0]["after_data"]) == {"data": {"f": 0}}
+        assert params[0]["before_data"] is None
+
+    @pytest.mark.asyncio
+    async def test_keeps_newest_entries_within_limit(self):
+        """Test only the newest MAX_OPERATIONS_PER_USER entries are logged."""
+        service = UndoRedoService()
+        db = _mock_db(existing_count=10)
+        total = service.MAX_OPERATIONS_PER_USER + 20
+
+        inserted = await service.log_operations_bulk(
+            db,
+            "user-1",
+            service.OPERATION_CREATE,
+            service.ENTITY_RECORD,
+            [(f"record-{i}", None, None) for i in range(total)],
+        )
+
+        assert inserted == service.MAX_OPERATIONS_PER_USER
+        # Count query + prune of existing operations + insert
+        assert db.execute.await_count == 3
+        params = db.execute.await_args_list[-1].args[1]
+        assert params[0]["entity_id"] == "record-20"
+
+    @pytest.mark.asyncio
+    async def test_empty_entries(self):
+        """Test nothing is written for an empty batch."""
+        service = UndoRedoService()
+        db = _mock_db()
+
+        inserted = await service.log_operations_bulk(
+            db, "user-1", service.OPERATION_CREATE, service.ENTITY_RECORD, []
+        )
+
+        assert inserted == 0
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_operation_type(self):
+        """Test invalid operation types are rejected."""
+        service = UndoRedoService()
+
+        with pytest.raises(ConflictError):
+            await service.log_operations_bulk(
+                _mock_db(), "user-1", "rename", service.ENTITY_RECORD, [("r", None, None)]
+            )
@@ -12,62 +12,37 @@ from pybase.models.unique_constraint import UniqueConstraint, UniqueConstraintSt
 from pybase.services.validation import ValidationService
 
 
-class TestValuesEqual:
-    """Test _values_equal method."""
+class TestUniqueKey:
+    """Test _unique_key method."""
 
-    def test_values_equal_both_none(self):
-        """Test comparison when both values are None."""
+    def test_unique_key_exempt_values(self):
+        """Test null and empty values have no key."""
         service = ValidationService()
-        result = service._values_equal(None, None, case_sensitive=True)
-        assert result is True
-
-    def test_values_equal_one_none(self):
-        """Test comparison when one value is None."""
-        service = ValidationService()
-        result = service._values_equal(None, "test", case_sensitive=True)
-        assert result is False
-
-        result = service._values_equal("test", None, case_sensitive=True)
-        assert result is False
-
-    def test_values_equal_case_sensitive_true(self):
-        """Test case-sensitive comparison."""
-        service = ValidationService()
-        result = service._values_equal("Test", "Test", case_sensitive=True)
-        assert result is True
-
-        result = service._values_equal("Test", "test", case_sensitive=True)
-        assert result is False
+        assert service._unique_key(None, case_sensitive=True) is None
+        assert service._unique_key("", case_sensitive=True) is None
 
-    def test_values_equal_case_sensitive_false(self):
-        """Test case-insensitive comparison."""
+    def test_unique_key_case_sensitivity(self):
+        """Test keys are lowercased only for case-insensitive constraints."""
         service = ValidationService()
-        result = service._values_equal("Test", "test", case_sensitive=False)
-        assert result is True
-
-        result = service._values_equal("Test", "TEST", case_sensitive=False)
-        assert result is True
+        assert service._unique_key("Test", case_sensitive=True) == "Test"
+        assert service._unique_key("Test", case_sensitive=False) == "test"
 
-        result = service._values_equal("Test", "Other", case_sensitive=False)
-        assert result is False
-
-    def test_values_equal_numeric_conversion(self):
-        """Test comparison with numeric values."""
+    def test_unique_key_matches_json_text(self):
+        """Test keys match the ``data ->> field_id`` text of non-string values."""
         service = ValidationService()
-        result = service._values_equal(123, "123", case_sensitive=True)
-        assert result is True
+        assert service._unique_key(123, case_sensitive=True) == "123"
+        assert service._unique_key(True, case_sensitive=True) == "true"
+        assert service._unique_key(["a"], case_sensitive=True) == '["a"]'
 
-        result = service._values_equal(123.5, "123.5", case_sensitive=True)
-        assert result is True
-
-    def test_values_equal_boolean_conversion(self):
-        """Test comparison with boolean values."""
+    def test_unique_key_matches_jsonb_text_of_composites(self):
+        """Test composite keys use jsonb's spacing, key order and unescaped text."""
         service = ValidationService()
-        result = service._values_equal(True, "True", case_sensitive=True)
-        assert result is True
-
-        result = service._values_equal(False, "False", case_sensitive=True)
-        assert result is True
+        assert service._unique_key(["a", 1], case_sensitive=True) == '["a", 1]'
+        assert (
+            service._unique_key({"bb": {"c": 1, "a": 2}, "a": "é"}, case_sensitive=True)
+            == '{"a": "é", "bb": {"a": 2, "c": 1}}'
+        )
+        assert service._unique_key({"aa": 1, "b": 2}, case_sensitive=True) == '{"b": 2, "aa": 1}'
 
 
 class TestCheckUniqueConstraint:
@@ -113,13 +88,9 @@ class TestCheckUniqueConstraint:
         service = ValidationService()
         db = AsyncMock()
 
-        # Mock database query result
-        mock_record = MagicMock()
-        mock_record.data = json.dumps({"field-1": "other-value"})
-
-        # Create mock result chain: result.scalars().all()
+        # Mock lookup query finding no matching keys
         mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_record]
+        mock_scalars.all.return_value = []
 
         mock_result = MagicMock()
         mock_result.scalars.return_value = mock_scalars
@@ -144,13 +115,9 @@ class TestCheckUniqueConstraint:
         service = ValidationService()
         db = AsyncMock()
 
-        # Mock database query result with duplicate
-        mock_record = MagicMock()
-        mock_record.data = json.dumps({"field-1": "test-value"})
-
-        # Create mock result chain: result.scalars().all()
+        # Mock lookup query finding the duplicate key
         mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_record]
+        mock_scalars.all.return_value = ["test-value"]
 
         mock_result = MagicMock()
         mock_result.scalars.return_value = mock_scalars
@@ -175,13 +142,9 @@ class TestCheckUniqueConstraint:
         service = ValidationService()
         db = AsyncMock()
 
-        # Mock database query result with different case
-        mock_record = MagicMock()
-        mock_record.data = json.dumps({"field-1": "TEST-VALUE"})
-
-        # Create mock result chain: result.scalars().all()
+        # Mock lookup query finding the lower-cased key of "TEST-VALUE"
         mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [mock_record]
+        mock_scalars.all.return_value = ["test-value"]
 
         mock_result = MagicMock()
         mock_result.scalars.return_value = mock_scalars
@@ -263,6 +226,117 @@ class TestCheckUniqueConstraint:
         # Should skip invalid JSON and return False (no duplicate found)
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_check_unique_case_insensitive_uses_lower(self):
+        """Test case-insensitive lookups compare lower-cased keys in SQL."""
+        service = ValidationService()
+        db = AsyncMock()
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        db.execute = AsyncMock(return_value=mock_result)
+
+        result = await service._check_unique_constraint(
+            db=db,
+            table_id="table-1",
+            field_id="field-1",
+            value="Test-Value",
+            exclude_record_id=None,
+            constraint=MagicMock(case_sensitive=False),
+        )
+
+        assert result is False
+        query = db.execute.call_args[0][0]
+        compiled = query.compile(compile_kwargs={"literal_binds": True})
+        assert "lower(" in str(compiled)
+        assert "'test-value'" in str(compiled)
+
+
+class TestFindUniqueViolations:
+    """Test batch unique constraint checks."""
+
+    def _execute_side_effect(self, constraints, fields, existing_keys):
+        """Return constraints, fields and existing keys for successive queries."""
+        results = []
+        for rows in (constraints, fields, existing_keys):
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = rows
+            results.append(result)
+        return AsyncMock(side_effect=results)
+
+    def _constraint(self, case_sensitive=True, error_message=None):
+        constraint = MagicMock()
+        constraint.field_id = "field-1"
+        constraint.case_sensitive = case_sensitive
+        constraint.error_message = error_message
+        return constraint
+
+    def _field(self):
+        field = MagicMock()
+        field.id = "field-1"
+        field.name = "SKU"
+        return field
+
+    @pytest.mark.asyncio
+    async def test_in_batch_duplicates(self):
+        """Test duplicates inside the batch are reported after the first row."""
+        service = ValidationService()
+        db = AsyncMock()
+        db.execute = self._execute_side_effect(
+            [self._constraint(case_sensitive=False)], [self._field()], []
+        )
+
+        violations = await service.find_unique_violations(
+            db,
+            "table-1",
+            [{"field-1": "A-1"}, {"field-1": "b-2"}, {"field-1": "a-1"}],
+        )
+
+        assert [v["index"] for v in violations] == [2]
+        assert violations[0]["field_name"] == "SKU"
+
+    @pytest.mark.asyncio
+    async def test_existing_duplicates_single_lookup(self):
+        """Test duplicates of existing values use one lookup for the batch."""
+        service = ValidationService()
+        db = AsyncMock()
+        db.execute = self._execute_side_effect([self._constraint()], [self._field()], ["b-2"])
+
+        violations = await service.find_unique_violations(
+            db,
+            "table-1",
+            [{"field-1": "a-1"}, {"field-1": "b-2"}, {"field-1": None}],
+        )
+
+        assert [v["index"] for v in violations] == [1]
+        assert db.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_validate_unique_batch_raises(self):
+        """Test batch validation raises ConflictError with the row index."""
+        service = ValidationService()
+        db = AsyncMock()
+        db.execute = self._execute_side_effect(
+            [self._constraint(error_message="SKU {value} is already taken")],
+            [self._field()],
+            ["a-1"],
+        )
+
+        with pytest.raises(ConflictError) as exc_info:
+            await service.validate_unique_batch(db, "table-1", [{"field-1": "a-1"}])
+
+        assert "index 0" in str(exc_info.value)
+        assert "SKU a-1 is already taken" in str(exc_info.value)
+
+    def test_unique_key_matches_json_text(self):
+        """Test Python keys mirror PostgreSQL ->> text output."""
+        service = ValidationService()
+
+        assert service._unique_key(True, case_sensitive=True) == "true"
+        assert service._unique_key(12, case_sensitive=True) == "12"
+        assert service._unique_key("AbC", case_sensitive=False) == "abc"
+        assert service._unique_key("", case_sensitive=True) is None
+
 
 class TestValidateRecordData:
     """Test validate_record_data method."""
@@ -711,6 +785,105 @@ class TestValidateRecordData:
             mock_handler.validate.assert_not_called()
 
 
+class TestValidateRecordsBatch:
+    """Test validate_records_batch method."""
+
+    def _create_mock_field(self, field_id="field-1", name="Test Field", **kwargs):
+        """Helper to create a mock field."""
+        mock_field = MagicMock()
+        mock_field.id = field_id
+        mock_field.name = name
+        mock_field.field_type = kwargs.get("field_type", FieldType.TEXT.value)
+        mock_field.is_required = kwargs.get("is_required", False)
+        mock_field.is_editable = kwargs.get("is_editable", True)
+        mock_field.options = kwargs.get("options")
+        return mock_field
+
+    def _mock_fields_query(self, db, fields):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = fields
+        db.execute = AsyncMock(return_value=mock_result)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test an empty batch makes no queries."""
+        service = ValidationService()
+        db = AsyncMock()
+
+        assert await service.validate_records_batch(db, "table-1", []) == {}
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_per_row_errors_with_single_schema_load(self):
+        """Test errors are reported per row and fields are loaded once."""
+        service = ValidationService()
+        db = AsyncMock()
+        self._mock_fields_query(
+            db, [self._create_mock_field(name="Name", is_required=True)]
+        )
+
+        row_errors = await service.validate_records_batch(
+            db,
+            "table-1",
+            [{"field-1": "ok"}, {"field-1": ""}, {"missing": 1}, {"field-1": "fine"}],
+            check_unique=False,
+        )
+
+        assert list(row_errors) == [1, 2]
+        assert "is required" in row_errors[1][0]["message"]
+        assert "does not exist" in row_errors[2][0]["message"]
+        assert db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_field_options_parsed_once(self):
+        """Test field options are parsed once for the whole batch."""
+        service = ValidationService()
+        db = AsyncMock()
+        self._mock_fields_query(
+            db, [self._create_mock_field(options=json.dumps({"max_length": 5}))]
+        )
+
+        with patch("pybase.services.validation.get_field_handler") as mock_get_handler:
+            mock_get_handler.return_value = MagicMock()
+            with patch.object(
+                service, "_parse_field_options", wraps=service._parse_field_options
+            ) as parse_options:
+                row_errors = await service.validate_records_batch(
+                    db,
+                    "table-1",
+                    [{"field-1": f"v{i}"} for i in range(10)],
+                    check_unique=False,
+                )
+
+        assert row_errors == {}
+        assert parse_options.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unique_violations_reported_per_row(self):
+        """Test unique violations are merged into per-row errors."""
+        service = ValidationService()
+        db = AsyncMock()
+        self._mock_fields_query(db, [self._create_mock_field()])
+
+        violation = {
+            "index": 1,
+            "field_id": "field-1",
+            "field_name": "Test Field",
+            "value": "dup",
+            "message": "Value 'dup' for field 'Test Field' already exists",
+        }
+        with patch.object(
+            service, "find_unique_violations", AsyncMock(return_value=[violation])
+        ) as find_violations:
+            row_errors = await service.validate_records_batch(
+                db, "table-1", [{"field-1": "a"}, {"field-1": "dup"}]
+            )
+
+        assert list(row_errors) == [1]
+        assert "already exists" in row_errors[1][0]["message"]
+        find_violations.assert_awaited_once()
+
+
 class TestValidateFieldUpdate:
     """Test validate_field_update method."""
 
@@ -0,0 +1,155 @@
+"""
+Unit tests for the near-duplicate aware vector search cache.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pybase.cache.local_cache import LocalCache
+from pybase.db.vector_cache import VectorQueryCache
+from pybase.db.vector_search import VectorSearchResult, VectorSearchService
+
+DIM = 256
+
+
+class FakeSession:
+    """Session recording statements and returning preset rows."""
+
+    def __init__(self, rows: list | None = None) -> None:
+        self.rows = rows or []
+        self.statements: list[tuple[str, dict]] = []
+
+    async def execute(self, sql, params=None):
+        self.statements.append((str(sql), params))
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(clock: FakeClock | None = None, **kwargs) -> VectorQueryCache:
+    clock = clock or FakeClock()
+    options = {"tolerance": 0.99, "signature_bits": 16, "probe_bits": 2}
+    options.update(kwargs)
+    return VectorQueryCache(
+        local=LocalCache("test", max_entries=100, max_bytes=10**7, ttl=60, clock=clock),
+        stats_flush_interval=30,
+        clock=clock,
+        **options,
+    )
+
+
+def _near(vector: np.ndarray, noise: float, seed: int = 1) -> np.ndarray:
+    return vector + noise * np.random.default_rng(seed).normal(size=vector.shape)
+
+
+class TestVectorQueryCache:
+    """Tests for near-duplicate lookups and batched statistics."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_query_hits_locally(self):
+        cache = _cache()
+        session = FakeSession()
+        vector = np.random.default_rng(0).normal(size=DIM)
+        await cache.put(session, "s", vector, ["a", "b"], [0.1, 0.2])
+        session.statements.clear()
+
+        # Scaled and slightly perturbed query
+        cached = await cache.get(session, "s", 3 * _near(vector, 0.01))
+
+        assert cached is not None
+        assert cached.model_ids == ["a", "b"]
+        assert session.statements == []
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_query_and_other_scope_miss(self):
+        cache = _cache()
+        session = FakeSession()
+        rng = np.random.default_rng(0)
+        vector = rng.normal(size=DIM)
+        await cache.put(session, "s", vector, ["a"], [0.1])
+
+        assert await cache.get(session, "s", rng.normal(size=DIM)) is None
+        assert await cache.get(session, "other", vector) is None
+
+    def test_probes_include_flipped_signatures(self):
+        cache = _cache(probe_bits=2)
+        vector = np.random.default_rng(0).normal(size=DIM)
+        vector /= np.linalg.norm(vector)
+
+        hashes = cache.probe_hashes("s", vector)
+
+        assert len(hashes) == 4
+        assert len(set(hashes)) == 4
+        assert cache.probe_hashes("s", vector) == hashes
+
+    @pytest.mark.asyncio
+    async def test_database_layer_checks_tolerance(self):
+        vector = np.random.default_rng(0).normal(size=DIM)
+        unit = vector / np.linalg.norm(vector)
+        query_hash = _cache().probe_hashes("s", unit)[0]
+        row = SimpleNamespace(
+            query_hash=query_hash,
+            query_vector=unit.tolist(),
+            result_ids=["a"],
+            result_distances=[0.1],
+        )
+        session = FakeSession([row])
+
+        cached = await _cache().get(session, "s", vector)
+
+        assert cached is not None and cached.model_ids == ["a"]
+        sql, params = session.statements[0]
+        assert "ANY(:hashes)" in sql
+        assert query_hash in params["hashes"]
+        assert not any("UPDATE" in sql for sql, _ in session.statements)
+
+        far = FakeSession([SimpleNamespace(**{**vars(row), "query_vector": (-unit).tolist()})])
+        assert await _cache().get(far, "s", vector) is None
+
+    @pytest.mark.asyncio
+    async def test_access_statistics_are_batched(self):
+        clock = FakeClock()
+        cache = _cache(clock)
+        session = FakeSession()
+        vector = np.random.default_rng(0).normal(size=DIM)
+        await cache.put(session, "s", vector, ["a"], [0.1])
+        session.statements.clear()
+
+        for _ in range(5):
+            await cache.get(session, "s", vector)
+        assert session.statements == []
+
+        clock.now = 31
+        await cache.get(session, "s", vector)
+
+        assert len(session.statements) == 1
+        sql, params = session.statements[0]
+        assert "UPDATE vector_search_cache" in sql
+        assert params["hits"] == [6]
+
+
+class TestVectorSearchServiceCache:
+    """Tests for the service's cache entry points."""
+
+    @pytest.mark.asyncio
+    async def test_cache_round_trip(self):
+        session = FakeSession()
+        service = VectorSearchService(session, ann_index=None, query_cache=_cache())
+        vector = np.random.default_rng(0).normal(size=DIM)
+
+        await service.cache_results(
+            vector, [VectorSearchResult(model_id="a", similarity=0.9)], scope="text"
+        )
+        results = await service.check_cache(_near(vector, 0.001), limit=5, scope="text")
+
+        assert [r.model_id for r in results] == ["a"]
+        assert results[0].similarity == pytest.approx(0.9)
+        assert await service.check_cache(vector, scope="image") is None
@@ -2,7 +2,7 @@
 """
 Celery worker for background export tasks.
 
-This worker handles data export including CSV, Excel, JSON, and XML formats
+This worker handles data export including CSV, Excel, JSON, XML, Parquet and Arrow formats
 with support for field selection, filtering, and scheduled exports.
 """
 
@@ -61,7 +61,7 @@ async def _upload_export_to_storage(file_path: str, export_format: str) -> tuple
 
     Args:
         file_path: Path to exported file
-        export_format: Export format (csv, xlsx, json, xml)
+        export_format: Export format (csv, xlsx, json, xml, parquet, arrow)
 
     Returns:
         Tuple of (download_url, storage_path)
@@ -133,7 +133,7 @@ def export_data(
         job_id: ExportJob ID for database tracking
         table_id: Table ID to export
         user_id: User ID requesting export
-        export_format: Export format (csv, xlsx, json, xml)
+        export_format: Export format (csv, xlsx, json, xml, parquet, arrow)
         options: Export options (field_ids, view_id, include_attachments, etc.)
 
     Returns:
@@ -303,7 +303,7 @@ def export_data_scheduled(
         self: Celery task instance (for retry support)
         table_id: Table ID to export
         user_id: User ID requesting export
-        export_format: Export format (csv, xlsx, json, xml)
+        export_format: Export format (csv, xlsx, json, xml, parquet, arrow)
         schedule: Cron schedule expression
         options: Export options (field_ids, view_id, include_attachments, etc.)
         storage_config: Storage configuration (S3, SFTP, etc.)
@@ -397,7 +397,7 @@ def export_data_background(
         job_id: ExportJob ID for database tracking
         table_id: Table ID to export
         user_id: User ID requesting export
-        export_format: Export format (csv, xlsx, json, xml)
+        export_format: Export format (csv, xlsx, json, xml, parquet, arrow)
         options: Export options (field_ids, view_id, include_attachments, etc.)
 
     Returns:
@@ -710,6 +710,8 @@ def _get_content_type(filename: str) -> str:
         ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         ".json": "application/json",
         ".xml": "application/xml",
+        ".parquet": "application/vnd.apache.parquet",
+        ".arrow": "application/vnd.apache.arrow.file",
         ".zip": "application/zip",
     }
     return content_types.get(ext, "application/octet-stream")